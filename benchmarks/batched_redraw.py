@@ -0,0 +1,72 @@
+"""
+Sending the canvas changes of one redraw to Tcl, one call per change
+compared with batched_redraw, which collects them and runs them in a
+single call
+
+  python -m benchmarks.batched_redraw
+
+Runs without a display, the canvas is a Tcl procedure which does
+nothing, so this times only the Python to Tcl calls and not the canvas
+work itself, which is the same in both modes
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from timeit import repeat
+from types import SimpleNamespace
+
+from tksheet.main_table import MainTable
+
+FRAME_ROWS, FRAME_COLUMNS = 100, 30
+
+
+class StubCanvas:
+    """
+    The MainTable canvas methods the redraw uses, on a canvas command which
+    does nothing
+    """
+
+    coords = tk.Canvas.coords
+    itemconfig = tk.Canvas.itemconfig
+    _configure = tk.Misc._configure
+    _options = tk.Misc._options
+    canvas_coords = MainTable.canvas_coords
+    canvas_itemconfig = MainTable.canvas_itemconfig
+    start_tcl_batch = MainTable.start_tcl_batch
+    run_tcl_batch = MainTable.run_tcl_batch
+
+    def __init__(self, batched: bool) -> None:
+        self.tk = tk.Tcl().tk
+        self._w = ".sheet"
+        self.tk.eval(f"proc {self._w} args {{}}")
+        self.PAR = SimpleNamespace(ops=SimpleNamespace(batched_redraw=batched))
+        self.tcl_batch = None
+
+
+def frame(canvas: StubCanvas) -> None:
+    # a highlight and a text item moved and configured for each cell
+    canvas.start_tcl_batch()
+    iid = 0
+    for r in range(FRAME_ROWS):
+        y = r * 23
+        for c in range(FRAME_COLUMNS):
+            x = c * 120
+            canvas.canvas_coords(iid, x, y, x + 120, y + 23)
+            canvas.canvas_itemconfig(iid, fill="#ffffff", outline="", state="normal")
+            canvas.canvas_coords(iid + 1, x + 3, y + 11)
+            canvas.canvas_itemconfig(iid + 1, text=f"cell {r} {c}", fill="black", anchor="w", state="normal")
+            iid += 2
+    canvas.run_tcl_batch()
+
+
+def main() -> None:
+    print(f"{FRAME_ROWS} x {FRAME_COLUMNS} cells, {FRAME_ROWS * FRAME_COLUMNS * 4:,} commands per frame, ms per frame")
+    for name, batched in (("separate calls", False), ("batched", True)):
+        canvas = StubCanvas(batched)
+        best = min(repeat(lambda canvas=canvas: frame(canvas), number=1, repeat=10))
+        print(f"  {name:<15} {best * 1000:.2f}")
+
+
+if __name__ == "__main__":
+    main()
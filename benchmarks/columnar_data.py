@@ -0,0 +1,78 @@
+"""
+Memory and speed of a 1M x 50 sheet of floats stored as a list of lists
+compared with ColumnarData
+
+  python -m benchmarks.columnar_data
+  python -m benchmarks.columnar_data lists
+  python -m benchmarks.columnar_data columnar
+
+Without an argument each store is measured in its own process so that
+the memory of one doesn't count towards the other. Memory is the growth
+of the peak resident set size while building the data, it is read with
+the resource module and isn't shown on Windows where there is none. The
+list of lists needs about 2 GB
+"""
+
+from __future__ import annotations
+
+import random
+import subprocess
+import sys
+from array import array
+from time import perf_counter
+
+from tksheet.data_sources import ColumnarData, VirtualData
+from tksheet.sorting import sort_rows_by_column
+
+ROWS, COLUMNS = 1_000_000, 50
+
+
+def peak_mb() -> float | None:
+    try:
+        from resource import RUSAGE_SELF, getrusage
+    except ImportError:
+        return None
+    # kilobytes on Linux, bytes on macOS
+    return getrusage(RUSAGE_SELF).ru_maxrss / (1e6 if sys.platform == "darwin" else 1e3)
+
+
+def run(store: str) -> None:
+    random.seed(0)
+    before = peak_mb()
+    if store == "lists":
+        data = [[random.random() for _ in range(COLUMNS)] for _ in range(ROWS)]
+    else:
+        data = VirtualData(ColumnarData(array("d", (random.random() for _ in range(ROWS))) for _ in range(COLUMNS)))
+    if before is not None:
+        print(f"  {store:<10} memory {peak_mb() - before:,.0f} MB")
+
+    start = perf_counter()
+    for r in range(0, ROWS, 100):
+        row = data[r]
+        for c in range(COLUMNS):
+            row[c]
+    print(f"  {store:<10} {ROWS // 100 * COLUMNS:,} cell reads {perf_counter() - start:.2f} s")
+
+    start = perf_counter()
+    if isinstance(data, VirtualData):
+        data.prefetch(range(500_000, 500_050))
+    for r in range(500_000, 500_050):
+        list(data[r])
+    print(f"  {store:<10} 50 visible rows {(perf_counter() - start) * 1000:.2f} ms")
+
+    start = perf_counter()
+    sort_rows_by_column(data, 7)
+    print(f"  {store:<10} sort by a column {perf_counter() - start:.2f} s")
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        run(sys.argv[1])
+        return
+    print(f"{ROWS:,} x {COLUMNS} floats")
+    for store in ("lists", "columnar"):
+        subprocess.run([sys.executable, "-m", "benchmarks.columnar_data", store], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Looking up the dropdown, checkbox, format, highlight, align and note
+options of every visible cell for one redraw
+
+  python -m benchmarks.options_lookup
+  python -m benchmarks.options_lookup dicts stores
+
+Times each way of looking up the options on each type of store, or on
+the stores given:
+
+- per key, the cell, row then column lookup for each key, which is how
+  the redraw read options before resolved_options()
+- per cell, resolving each cell once with resolved_options()
+- per frame, resolved_options_area() which the redraw uses
+
+Stores are plain dicts, which is how options were stored before
+OptionStore, OptionStores, and OptionStores with range options
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from collections.abc import Callable
+from timeit import repeat
+from types import SimpleNamespace
+
+from tksheet.main_table import MainTable
+from tksheet.option_store import OptionStore, RangeOptions
+
+ROWS, COLUMNS = 25_000, 20
+FRAME_ROWS, FRAME_COLUMNS = 60, 20
+KEYS = ("dropdown", "checkbox", "format", "highlight", "align", "note")
+
+random.seed(0)
+cell_options = {(r, c): {"highlight": ("red", None, False)} for r in range(ROWS) for c in range(COLUMNS) if (r + c) % 2}
+row_options = {r: {"align": "w"} for r in range(0, ROWS, 4)}
+col_options = {c: {"format": {}} for c in range(0, COLUMNS, 3)}
+ranges = [(r, 0, r + 10, COLUMNS, "highlight", ("blue", None, False)) for r in random.sample(range(ROWS - 10), 200)]
+frames = [random.randrange(ROWS - FRAME_ROWS) for _ in range(100)]
+
+
+def store(name: str) -> SimpleNamespace:
+    if name == "dicts":
+        return SimpleNamespace(
+            cell_options=cell_options,
+            row_options=row_options,
+            col_options=col_options,
+            range_options=RangeOptions(),
+        )
+    return SimpleNamespace(
+        cell_options=OptionStore(cell_options, cells=True),
+        row_options=OptionStore(row_options),
+        col_options=OptionStore(col_options),
+        range_options=RangeOptions(ranges if name == "ranges" else ()),
+    )
+
+
+def per_key(mt: SimpleNamespace) -> None:
+    for start in frames:
+        for datarn in range(start, start + FRAME_ROWS):
+            for datacn in range(FRAME_COLUMNS):
+                for key in KEYS:
+                    if (datarn, datacn) in mt.cell_options and key in mt.cell_options[(datarn, datacn)]:
+                        mt.cell_options[(datarn, datacn)][key]
+                    elif datarn in mt.row_options and key in mt.row_options[datarn]:
+                        mt.row_options[datarn][key]
+                    elif datacn in mt.col_options and key in mt.col_options[datacn]:
+                        mt.col_options[datacn][key]
+
+
+def per_cell(mt: SimpleNamespace) -> None:
+    for start in frames:
+        for datarn in range(start, start + FRAME_ROWS):
+            for datacn in range(FRAME_COLUMNS):
+                options = MainTable.resolved_options(mt, datarn, datacn)
+                for key in KEYS:
+                    options.get(key)
+
+
+def per_frame(mt: SimpleNamespace) -> None:
+    for start in frames:
+        for options in MainTable.resolved_options_area(
+            mt, range(start, start + FRAME_ROWS), range(FRAME_COLUMNS)
+        ).values():
+            for key in KEYS:
+                options.get(key)
+
+
+LOOKUPS: dict[str, Callable[[SimpleNamespace], None]] = {
+    "per key": per_key,
+    "per cell": per_cell,
+    "per frame": per_frame,
+}
+# range options are only read by resolving cells
+STORES = {"dicts": ("per key", "per cell"), "stores": tuple(LOOKUPS), "ranges": ("per cell", "per frame")}
+
+
+def main() -> None:
+    names = sys.argv[1:] or list(STORES)
+    print(f"{len(cell_options):,} cell options, {FRAME_ROWS} x {FRAME_COLUMNS} cells per frame, ms per frame")
+    for name in names:
+        mt = store(name)
+        for label in STORES[name]:
+            best = min(repeat(lambda func=LOOKUPS[label], mt=mt: func(mt), number=1, repeat=5)) / len(frames)
+            print(f"  {name:<10} {label:<10} {best * 1000:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tksheet.colors import color_map
+from tksheet.other_classes import ColorCache
+
+
+def old_blend(high_bg: str, sel_bg: str) -> str:
+    """
+    How the table, index and header blended a highlight with a
+    selection color before ColorCache
+    """
+    if not high_bg.startswith("#"):
+        high_bg = color_map[high_bg]
+    if not sel_bg.startswith("#"):
+        sel_bg = color_map[sel_bg]
+    return (
+        f"#{int((int(high_bg[1:3], 16) + int(sel_bg[1:3], 16)) / 2):02X}"
+        + f"{int((int(high_bg[3:5], 16) + int(sel_bg[3:5], 16)) / 2):02X}"
+        + f"{int((int(high_bg[5:], 16) + int(sel_bg[5:], 16)) / 2):02X}"
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_blends_match_the_old_math(seed):
+    rng = random.Random(seed)
+    # "#ANTIQUEWHITE" is in the map but would be taken for a hex color
+    names = [name for name in color_map if not name.startswith("#")]
+    cache = ColorCache(maxsize=50)
+
+    def color() -> str:
+        if rng.random() < 0.5:
+            return rng.choice(names)
+        return f"#{rng.randrange(0x1000000):06x}" if rng.random() < 0.5 else f"#{rng.randrange(0x1000000):06X}"
+
+    for _ in range(300):
+        high_bg, sel_bg = color(), color()
+        assert cache.blend(high_bg, sel_bg) == old_blend(high_bg, sel_bg)
+        assert cache.hex(high_bg) == (high_bg if high_bg.startswith("#") else color_map[high_bg])
+    # the caches are emptied rather than growing past maxsize
+    assert len(cache.blends) <= 50
+    assert len(cache.hexes) <= 50
+    assert len(cache.tups) <= 50
+
+
+def test_tup_and_clear():
+    cache = ColorCache()
+    assert cache.tup("#FF8000") == (255, 128, 0)
+    assert cache.tup("white") == (255, 255, 255)
+    assert cache.blend("black", "white") == "#7F7F7F"
+    cache.clear()
+    assert not cache.hexes and not cache.tups and not cache.blends
@@ -0,0 +1,114 @@
+import csv
+from mmap import mmap
+
+import pytest
+
+from tksheet.data_sources import CSVFileData
+
+
+def write_csv(path, rows, **kwargs) -> str:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f, **kwargs).writerows(rows)
+    return str(path)
+
+
+@pytest.fixture
+def rows():
+    return [[f"{r}", f"{r * 2}", "a\nb" if r % 3 == 0 else "x"] for r in range(500)]
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_rows_match_file(tmp_path, rows, background):
+    source = CSVFileData(write_csv(tmp_path / "a.csv", rows), background=background)
+    if source.thread is not None:
+        source.thread.join()
+    assert source.done and source.progress() == 100
+    assert source.row_count() == 500
+    assert source.column_count() == 3
+    assert source.get_rows(0, 500) == rows
+    assert source.get_cell(3, 2) == "a\nb"
+    source.close()
+
+
+def test_header_bom_and_short_rows(tmp_path):
+    path = tmp_path / "a.csv"
+    path.write_bytes(b"\xef\xbb\xbfa,b,c\n1,2\n3,4,5\n")
+    source = CSVFileData(str(path), header=True)
+    assert source.header == ["a", "b", "c"]
+    assert source.get_rows(0, 2) == [["1", "2", ""], ["3", "4", "5"]]
+    assert source.get_cell(0, 2) == ""
+    source.close()
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "a.csv"
+    path.write_bytes(b"")
+    source = CSVFileData(str(path))
+    assert source.row_count() == 0
+    assert source.column_count() == 0
+    source.close()
+
+
+def test_edits_and_save(tmp_path, rows):
+    path = write_csv(tmp_path / "a.csv", rows)
+    source = CSVFileData(path, header=True)
+    source.set_cell(0, 1, "edited")
+    assert source.get_cell(0, 1) == "edited"
+    with open(path, encoding="utf-8") as f:
+        assert "edited" not in f.read()
+    other = str(tmp_path / "b.csv")
+    source.save(other)
+    assert CSVFileData(other, header=True).get_rows(0, 1)[0][1] == "edited"
+    source.save()
+    assert not source.edits
+    assert source.header == rows[0]
+    assert source.get_rows(0, 1)[0][1] == "edited"
+    source.close()
+
+
+def test_close_closes_map(tmp_path, rows):
+    source = CSVFileData(write_csv(tmp_path / "a.csv", rows), background=True)
+    source.close()
+    assert source.thread is None
+    assert isinstance(source.mm, mmap) and source.mm.closed
+    # closing again does nothing
+    source.close()
+
+
+def test_background_guesses_columns_without_waiting(tmp_path):
+    # 2MB in the first 1000 rows, more than is indexed before the thread starts
+    value = "\n".join("x" * 99 for _ in range(20))
+    rows = [*([f"{r}", value] for r in range(1000)), *([f"{r}", "", "", ""] for r in range(1000))]
+    source = CSVFileData(write_csv(tmp_path / "a.csv", rows), background=True)
+    assert source.sampled < 1000
+    assert source.column_count() == 2
+    source.thread.join()
+    assert not source.guess_columns()
+    assert source.sampled == 1000
+    assert source.column_count() == 2
+    assert source.row_count() == 2000
+    assert source.get_cell(1, 1) == value
+    source.close()
+
+
+def test_guess_widens_columns(tmp_path):
+    rows = [["1", "2"], *([f"{r}", "", "", ""] for r in range(10))]
+    path = write_csv(tmp_path / "a.csv", rows)
+    source = CSVFileData(path, background=True)
+    assert source.thread is None
+    assert source.column_count() == 4
+    source.close()
+    # as if the first row was all that had been indexed
+    source = CSVFileData(path)
+    source.sampled, source.columns = 1, 2
+    assert source.guess_columns()
+    assert source.column_count() == 4
+    source.close()
+
+
+def test_given_columns_are_kept(tmp_path, rows):
+    source = CSVFileData(write_csv(tmp_path / "a.csv", rows), columns=2)
+    assert source.column_count() == 2
+    assert not source.guess_columns()
+    assert source.get_rows(0, 1) == [rows[0][:2]]
+    source.close()
@@ -0,0 +1,231 @@
+import random
+from array import array
+from copy import deepcopy
+from types import SimpleNamespace
+
+import pytest
+
+from tksheet.data_sources import ColumnarData, DataSource, VirtualData, column_buffer
+from tksheet.functions import get_new_indexes, move_elements_by_mapping
+from tksheet.main_table import MainTable
+from tksheet.sorting import sort_columns_by_row, sort_rows_by_column
+
+
+class ReadOnlySource:
+    def __init__(self, rows: int = 20, columns: int = 4) -> None:
+        self.data = [[r * columns + c for c in range(columns)] for r in range(rows)]
+        self.columns = columns
+        self.calls = []
+
+    def row_count(self) -> int:
+        return len(self.data)
+
+    def column_count(self) -> int:
+        return self.columns
+
+    def get_cell(self, r: int, c: int):
+        return self.data[r][c]
+
+    def get_rows(self, start: int, stop: int):
+        self.calls.append((start, stop))
+        return [row[:] for row in self.data[start:stop]]
+
+
+class ListSource(ReadOnlySource):
+    def set_cell(self, r: int, c: int, value) -> None:
+        self.data[r][c] = value
+
+
+def test_reads_like_a_list_of_lists():
+    source = ListSource()
+    data = VirtualData(source)
+    assert isinstance(source, DataSource)
+    assert len(data) == 20
+    assert len(data[0]) == 4
+    assert data[2][3] == source.data[2][3]
+    assert data[-1][-1] == source.data[-1][-1]
+    assert list(data[5]) == source.data[5]
+    assert data[5][1:3] == source.data[5][1:3]
+    assert [list(row) for row in data[3:6]] == source.data[3:6]
+    assert [list(row) for row in data] == source.data
+    with pytest.raises(IndexError):
+        data[20]
+    with pytest.raises(IndexError):
+        data[0][4]
+
+
+def test_rows_and_columns_cant_be_added_or_deleted():
+    data = VirtualData(ListSource())
+    for call in (
+        lambda: data.append([1]),
+        lambda: data.insert(0, [1]),
+        lambda: data.extend([[1]]),
+        lambda: data.pop(),
+        lambda: data[0].append(1),
+        lambda: data[0].insert(0, 1),
+        lambda: data[0].extend([1]),
+        lambda: data[0].pop(),
+    ):
+        with pytest.raises(TypeError):
+            call()
+    data.extend([])
+    data[0].extend([])
+
+
+def test_sheet_refuses_to_add_or_delete_rows_and_columns():
+    MT = SimpleNamespace(
+        data=VirtualData(ListSource()),
+        saved_row_heights={1: 30},
+        saved_column_widths={1: 120},
+        displayed_rows=[0, 2, 3],
+        displayed_columns=[0, 1, 3],
+        all_rows_displayed=False,
+        all_columns_displayed=False,
+        row_positions=[0, 23, 46, 69],
+        col_positions=[0, 120, 240, 360],
+    )
+    before = deepcopy(vars(MT))
+    for call in (
+        lambda: MainTable.add_rows(MT, {1: [0] * 4}, {}, {1: 23}, {}, tree=False),
+        lambda: MainTable.add_columns(MT, {1: [0] * 20}, {}, {1: 120}, {}),
+        lambda: MainTable.delete_rows(MT, rows=[1]),
+        lambda: MainTable.delete_columns(MT, columns=[1]),
+        lambda: MainTable.delete_rows_data(MT, [1]),
+        lambda: MainTable.delete_columns_data(MT, [1]),
+    ):
+        with pytest.raises(TypeError):
+            call()
+        assert [list(row) for row in MT.data] == ListSource().data
+        assert {k: v for k, v in vars(MT).items() if k != "data"} == {k: v for k, v in before.items() if k != "data"}
+    assert not MainTable.resize_data_enabled(MT)
+    assert MainTable.resize_data_enabled(SimpleNamespace(data=[]))
+
+
+def test_edits_go_to_the_source():
+    source = ListSource()
+    data = VirtualData(source)
+    data.prefetch(range(5))
+    data[1][2] = "a"
+    assert source.data[1][2] == "a"
+    assert data[1][2] == "a"
+    data[3] = ["b", "c"]
+    assert source.data[3][:3] == ["b", "c", 14]
+    assert list(data[3]) == source.data[3]
+    read_only = VirtualData(ReadOnlySource())
+    with pytest.raises(TypeError):
+        read_only[0][0] = 1
+
+
+def test_prefetch_batches_consecutive_rows():
+    source = ListSource()
+    data = VirtualData(source, max_rows=4)
+    data.prefetch([0, 1, 2, 5, 6, 30])
+    assert source.calls == [(0, 3), (5, 7)]
+    assert list(data.rows) == [0, 1, 2, 5, 6]
+    data.prefetch([1, 2, 3])
+    assert source.calls[2:] == [(3, 4)]
+    # the visible rows are kept and then the most recently used
+    assert list(data.rows) == [6, 1, 2, 3]
+    data.prefetch([6, 7, 8, 9, 10])
+    assert list(data.rows) == [6, 7, 8, 9, 10]
+    source.data[0][0] = "changed"
+    data.invalidate()
+    assert data[0][0] == "changed"
+    assert data.row(0)[0] == "changed"
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_moves_against_list_model(seed):
+    rng = random.Random(seed)
+    source = ListSource(rows=rng.randint(1, 30), columns=rng.randint(1, 6))
+    model = [row[:] for row in source.data]
+    data = VirtualData(source, max_rows=rng.choice([1, 5, 100]))
+    for _ in range(10):
+        if rng.random() < 0.5:
+            to_move = rng.sample(range(len(model)), rng.randint(1, len(model)))
+            new_idxs, old_idxs = get_new_indexes(rng.randint(0, len(model)), to_move, get_inverse=True)
+            data.move_rows(new_idxs, old_idxs)
+            model = move_elements_by_mapping(model, new_idxs, old_idxs)
+        else:
+            to_move = rng.sample(range(source.columns), rng.randint(1, source.columns))
+            new_idxs, old_idxs = get_new_indexes(rng.randint(0, source.columns), to_move, get_inverse=True)
+            data.move_columns(new_idxs, old_idxs)
+            model = [move_elements_by_mapping(row, new_idxs, old_idxs) for row in model]
+        data.prefetch(rng.sample(range(len(model)), rng.randint(0, len(model))))
+        assert [list(row) for row in data] == model
+        r, c = rng.randrange(len(model)), rng.randrange(source.columns)
+        assert data[r][c] == data.cell(r, c) == model[r][c]
+        # edits of moved cells go to the source cell they came from
+        data[r][c] = model[r][c] = "edited"
+        assert [list(row) for row in data] == model
+    # the source itself is never reordered, the data maps onto it
+    assert [
+        [source.data[data.source_row(r)][data.source_col(c)] for c in range(source.columns)] for r in range(len(model))
+    ] == model
+
+
+def test_sorting_moves_rows_and_columns():
+    source = ListSource(rows=5, columns=3)
+    source.data = [[3, "c", 1], [1, "a", 2], [2, "b", 0], [5, "e", 4], [4, "d", 3]]
+    data = VirtualData(source)
+    sorted_rows, new_idxs = sort_rows_by_column(data, column=0)
+    assert [list(row) for _, row in sorted_rows] == sorted(source.data)
+    assert new_idxs == {1: 0, 2: 1, 0: 2, 4: 3, 3: 4}
+    # the same as sorting a list of lists
+    assert sort_columns_by_row(data, row=0)[1] == sort_columns_by_row(source.data, row=0)[1]
+
+
+def test_column_buffers():
+    assert column_buffer([1, 2, 3]) == (array("q", [1, 2, 3]), None)
+    assert column_buffer([1.5, None]) == (array("d", [1.5, 0]), bytearray([0, 1]))
+    assert column_buffer([1, 2.5]) == ([1, 2.5], None)
+    assert column_buffer(["a", None]) == (["a", None], None)
+    # too big for an array, kept as Python ints
+    assert column_buffer([2**70]) == ([2**70], None)
+    buffer = array("i", [4, 5])
+    assert column_buffer(buffer)[0] is buffer
+    assert column_buffer(memoryview(array("h", [6, 7]))) == (array("h", [6, 7]), None)
+
+
+def test_columnar_reads_and_edits():
+    rows = [[1, 1.5, "a"], [2, None], [None, 3.5, "c"]]
+    source = ColumnarData.from_rows(rows)
+    assert (source.row_count(), source.column_count()) == (3, 3)
+    assert [isinstance(column, array) for column in source.columns] == [True, True, False]
+    model = [[1, 1.5, "a"], [2, None, None], [None, 3.5, "c"]]
+    assert source.get_rows(0, 10) == model
+    assert source.get_rows(1, 2) == model[1:2]
+    assert [[source.get_cell(r, c) for c in range(3)] for r in range(3)] == model
+    source.set_cell(0, 0, None)
+    source.set_cell(2, 0, 5)
+    source.set_cell(1, 1, 2.5)
+    assert source.column(0) == [None, 2, 5]
+    assert source.column(1) == [1.5, 2.5, 3.5]
+    # a value that doesn't fit the column's array turns it into a list
+    source.set_cell(1, 0, "b")
+    assert source.columns[0] == [None, "b", 5]
+    assert source.numeric_column(0) is None
+    assert source.numeric_column(1) == (array("d", [1.5, 2.5, 3.5]), bytearray(3))
+    with pytest.raises(ValueError):
+        ColumnarData([[1, 2], [1]])
+    assert ColumnarData().row_count() == 0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_numeric_sort_matches_list_sort(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 40)
+    rows = [
+        [rng.choice([None, rng.randint(-5, 5)]), rng.choice([None, rng.uniform(-5, 5)]), rng.randint(0, 3)]
+        for _ in range(n)
+    ]
+    data = VirtualData(ColumnarData.from_rows(rows))
+    assert all(data.source.numeric_column(c) for c in range(3))
+    if seed % 2:
+        to_move = rng.sample(range(n), rng.randint(1, n))
+        new_idxs, old_idxs = get_new_indexes(rng.randint(0, n), to_move, get_inverse=True)
+        data.move_rows(new_idxs, old_idxs)
+        rows = move_elements_by_mapping(rows, new_idxs, old_idxs)
+    for column in range(3):
+        for reverse in (False, True):
+            assert sort_rows_by_column(data, column, reverse)[1] == sort_rows_by_column(rows, column, reverse)[1]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from tksheet.main_table import MainTable
+from tksheet.other_classes import DirtyCells
+from tksheet.sheet import Sheet
+
+N = 20
+
+
+def test_starts_all_dirty_and_resets():
+    dirty = DirtyCells()
+    assert dirty.all and dirty and (5, 5) in dirty
+    dirty.reset()
+    assert not dirty.all and not dirty and (5, 5) not in dirty
+    dirty.add_cell(1, 2)
+    assert dirty and (1, 2) in dirty and (2, 1) not in dirty
+    dirty.reset()
+    assert not dirty and (1, 2) not in dirty
+    dirty.reset(all_=True)
+    assert dirty.all and not dirty.cells
+
+
+def test_rows_columns_and_boxes():
+    dirty = DirtyCells()
+    dirty.reset()
+    dirty.add_rows(range(3, 5))
+    dirty.add_columns([7])
+    dirty.add_span("cell", range(10, 12), range(10, 12))
+    dirty.add_span("row", range(15, 16), range(0))
+    dirty.add_span("column", range(0), range(18, 19))
+    expected = {
+        (r, c)
+        for r in range(N + 5)
+        for c in range(N + 5)
+        if r in (3, 4) or c == 7 or (10 <= r < 12 and 10 <= c < 12) or r == 15 or c == 18
+    }
+    assert {(r, c) for r in range(N + 5) for c in range(N + 5) if (r, c) in dirty} == expected
+
+
+def test_too_many_changes_become_all():
+    dirty = DirtyCells(max_cells=3, max_boxes=2)
+    dirty.reset()
+    for i in range(3):
+        dirty.add_cell(i, i)
+    assert not dirty.all
+    dirty.add_cell(3, 3)
+    assert dirty.all and not dirty.cells
+    # once everything is dirty nothing more is stored
+    dirty.add_cell(4, 4)
+    dirty.add_rows([1])
+    assert not dirty.cells and not dirty.rows
+    dirty.reset()
+    dirty.add_rows(range(4))
+    assert dirty.all
+    dirty.reset()
+    dirty.add_columns(range(4))
+    assert dirty.all
+    dirty.reset()
+    for i in range(3):
+        dirty.add_box(i, i, None, None)
+    assert dirty.all and not dirty.boxes
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_against_brute_force(seed):
+    rng = random.Random(seed)
+    dirty = DirtyCells(max_cells=30, max_boxes=5)
+    dirty.reset()
+    model, all_ = set(), False
+    for _ in range(rng.randint(1, 12)):
+        op = rng.randrange(4)
+        if op == 0:
+            r, c = rng.randrange(N), rng.randrange(N)
+            dirty.add_cell(r, c)
+            model.add((r, c))
+        elif op == 1:
+            rows = rng.sample(range(N), rng.randint(1, 5))
+            dirty.add_rows(rows)
+            model.update((r, c) for r in rows for c in range(N))
+        elif op == 2:
+            columns = rng.sample(range(N), rng.randint(1, 5))
+            dirty.add_columns(columns)
+            model.update((r, c) for r in range(N) for c in columns)
+        else:
+            r, c = rng.randrange(N), rng.randrange(N)
+            r2, c2 = r + rng.randint(1, 5), c + rng.randint(1, 5)
+            dirty.add_box(r, c, r2, c2)
+            model.update((r_, c_) for r_ in range(r, r2) for c_ in range(c, c2))
+        all_ = all_ or dirty.all
+    for r in range(N):
+        for c in range(N):
+            assert ((r, c) in dirty) is (all_ or (r, c) in model)
+
+
+def sheet() -> SimpleNamespace:
+    redraws = []
+    MT = SimpleNamespace(
+        dirty=DirtyCells(),
+        main_table_redraw_grid_and_text=lambda **kwargs: redraws.append(kwargs["dirty_only"]),
+    )
+    return SimpleNamespace(
+        MT=MT,
+        after_redraw_time_ms=0,
+        after_redraw_id=None,
+        pending_redraw={"table": True, "index": True, "header": True, "scrolled": False},
+        schedule_redraw=lambda **kwargs: None,
+        redraws=redraws,
+    )
+
+
+def test_refresh_timer_keeps_dirty_cells_only_if_asked():
+    ns = sheet()
+    ns.MT.dirty.reset()
+    ns.MT.dirty.add_cell(1, 1)
+    Sheet.set_refresh_timer(ns, dirty=True)
+    Sheet.after_redraw(ns)
+    assert not ns.MT.dirty.all
+    ns.MT.dirty.add_cell(2, 2)
+    Sheet.set_refresh_timer(ns)
+    Sheet.after_redraw(ns)
+    assert ns.MT.dirty.all
+    # a dirty change without a redraw is redrawn in full with the next one
+    ns.MT.dirty.reset()
+    Sheet.set_refresh_timer(ns, redraw=False, dirty=True)
+    Sheet.set_refresh_timer(ns, dirty=True)
+    Sheet.after_redraw(ns)
+    assert ns.redraws == [True, False, False]
+
+
+def test_dirty_cells_redrawn_only_in_the_same_viewport():
+    viewport = ((0, 0, 800, 600), (0, [0, 20, 40], None, 0), (0, [0, 100], None, 0, 800))
+    MT = SimpleNamespace(dirty=DirtyCells(), drawn_viewport=viewport)
+    MT.dirty.reset()
+    MT.dirty.add_cell(0, 0)
+    assert MainTable.dirty_cells_redrawable(MT, True, viewport)
+    assert not MainTable.dirty_cells_redrawable(MT, True, (viewport[0], (1, [20, 40, 60], None, 20), viewport[2]))
+    assert not MainTable.dirty_cells_redrawable(MT, True, ((0, 0, 800, 620), *viewport[1:]))
+    assert not MainTable.dirty_cells_redrawable(MT, True, (viewport[0], viewport[1], (0, [0, 100], [1], 0, 800)))
+    assert not MainTable.dirty_cells_redrawable(MT, False, viewport)
+    MT.dirty.all = True
+    assert not MainTable.dirty_cells_redrawable(MT, True, viewport)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from tksheet.main_table import MainTable
+from tksheet.other_classes import DirtyCells, DisplayStringCache
+
+
+def test_entries_are_only_used_for_the_same_objects():
+    cache = DisplayStringCache()
+    value, kwargs = [1.5], {"decimals": 1}
+    cache.add((0, 0), value, kwargs, "1.5")
+    assert cache.get((0, 0), value, kwargs) == "1.5"
+    # equal but not the same objects
+    assert cache.get((0, 0), [1.5], kwargs) is None
+    assert cache.get((0, 0), value, {"decimals": 1}) is None
+    assert cache.get((0, 1), value, kwargs) is None
+    assert cache.info() == {"hits": 1, "misses": 3, "size": 1, "maxsize": 10000}
+
+
+def test_least_recently_used_are_discarded_first():
+    cache = DisplayStringCache(maxsize=3)
+    kwargs = {}
+    values = {key: object() for key in range(5)}
+    for key in range(3):
+        cache.add(key, values[key], kwargs, f"{key}")
+    assert cache.get(0, values[0], kwargs) == "0"
+    cache.add(3, values[3], kwargs, "3")
+    assert list(cache.strings) == [2, 0, 3]
+    # a miss doesn't count as a use
+    assert cache.get(2, object(), kwargs) is None
+    cache.add(4, values[4], kwargs, "4")
+    assert list(cache.strings) == [0, 3, 4]
+
+
+def test_maxsize_and_resize():
+    cache = DisplayStringCache(maxsize=0)
+    cache.add((0, 0), 1, {}, "1")
+    assert len(cache) == 0
+    cache.resize(4)
+    for i in range(4):
+        cache.add((i, 0), i, {}, f"{i}")
+    assert len(cache) == 4
+    cache.resize(2)
+    assert list(cache.strings) == [(2, 0), (3, 0)]
+    assert cache.info()["maxsize"] == 2
+    cache.resize(0)
+    assert len(cache) == 0
+    cache.add((0, 0), 1, {}, "1")
+    assert len(cache) == 0
+    cache.resize(1)
+    cache.add((0, 0), 1, {}, "1")
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_setting_cell_data_discards_the_entry():
+    MT = SimpleNamespace(
+        data=[[1, 2], [3, 4]],
+        cell_options={},
+        get_cell_kwargs=lambda datarn, datacn, key: {},
+        dirty=DirtyCells(),
+        display_strings=DisplayStringCache(),
+    )
+    kwargs = {}
+    MT.display_strings.add((0, 1), 2, kwargs, "2")
+    MT.display_strings.add((1, 1), 4, kwargs, "4")
+    MainTable.set_cell_data(MT, 0, 1, 5)
+    assert MT.data[0][1] == 5
+    assert list(MT.display_strings.strings) == [(1, 1)]
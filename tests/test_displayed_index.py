@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import random
+from array import array
+from types import SimpleNamespace
+
+import pytest
+
+from tksheet.functions import b_index, displayed_index
+from tksheet.main_table import MainTable
+
+
+class Table:
+    """
+    The parts of MainTable that map data indexes to displayed indexes
+    """
+
+    displayed_rows = MainTable.displayed_rows
+    displayed_columns = MainTable.displayed_columns
+    displayed_rows_index = MainTable.displayed_rows_index
+    displayed_columns_index = MainTable.displayed_columns_index
+    displayed_storage = MainTable.displayed_storage
+    disprn = MainTable.disprn
+    dispcn = MainTable.dispcn
+    try_disprn = MainTable.try_disprn
+    try_dispcn = MainTable.try_dispcn
+
+    def __init__(self, rows: list[int], columns: list[int], compact: bool = False) -> None:
+        self.PAR = SimpleNamespace(ops=SimpleNamespace(compact_storage=compact))
+        self.all_rows_displayed = False
+        self.all_columns_displayed = False
+        self.displayed_rows = rows
+        self.displayed_columns = columns
+
+
+def expected(displayed: list[int], i: int) -> int | None:
+    try:
+        return b_index(displayed, i)
+    except ValueError:
+        return None
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_displayed_index_against_brute_force(seed):
+    rng = random.Random(seed)
+    displayed = sorted(rng.sample(range(50), rng.randint(0, 50)))
+    total = rng.randint(0, 60)
+    idxs = displayed_index(displayed, total)
+    assert len(idxs) >= total
+    assert len(idxs) >= (displayed[-1] + 1 if displayed else 0)
+    assert list(idxs) == [displayed.index(i) if i in displayed else -1 for i in range(len(idxs))]
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_disprn_and_dispcn_match_b_index(seed):
+    rng = random.Random(seed)
+    rows = sorted(rng.sample(range(40), rng.randint(0, 40)))
+    columns = sorted(rng.sample(range(40), rng.randint(0, 40)))
+    table = Table(rows, columns, compact=seed % 2 == 0)
+    # without an index b_index is used, then with one
+    for build in (False, True):
+        if build:
+            table.displayed_rows_index()
+            table.displayed_columns_index()
+        assert (table.displayed_rows_index(build=False) is None) is not build
+        for i in range(-2, 45):
+            for disp, try_disp, displayed in (
+                (table.disprn, table.try_disprn, rows),
+                (table.dispcn, table.try_dispcn, columns),
+            ):
+                assert try_disp(i) == expected(displayed, i)
+                if expected(displayed, i) is None:
+                    with pytest.raises(ValueError):
+                        disp(i)
+                else:
+                    assert disp(i) == expected(displayed, i)
+
+
+def test_index_cache():
+    table = Table([1, 3, 5], [0, 2])
+    idxs = table.displayed_rows_index(total=10)
+    assert list(idxs) == [-1, 0, -1, 1, -1, 2, -1, -1, -1, -1]
+    assert table.displayed_rows_index() is idxs
+    # a larger total than the index covers rebuilds it
+    assert len(table.displayed_rows_index(total=20)) == 20
+    assert table.displayed_rows_index(build=False, total=30) is None
+    # the key is the displayed list's id and length, in place insertions change the length
+    table.displayed_rows.insert(1, 2)
+    assert table.displayed_rows_index(build=False) is None
+    assert table.disprn(3) == 2
+    assert list(table.displayed_rows_index()[:6]) == [-1, 0, 1, 2, -1, 3]
+    # setting the displayed rows forgets the index
+    table.displayed_rows_index()
+    table.displayed_rows = array("q", [4])
+    assert table.displayed_rows_index(build=False) is None
+    assert table.disprn(4) == 0
+    table.all_rows_displayed = True
+    assert table.displayed_rows_index() is None
+    assert table.disprn(7) == 7
+    assert list(table.displayed_columns_index()) == [0, -1, 1]
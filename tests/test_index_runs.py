@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import random
+from bisect import bisect_left
+
+import pytest
+
+from tksheet.functions import push_n
+from tksheet.option_store import CellRuns, IndexRuns, moved_runs, moved_stretches
+
+
+def check(runs: IndexRuns | CellRuns, model: set) -> None:
+    assert set(runs) == model
+    assert len(runs) == len(model)
+    assert runs == model
+    # a frozen set kept from before a change would be stale
+    assert runs.frozen() == model
+    if isinstance(runs, IndexRuns):
+        # runs are not empty, sorted and neither overlap nor touch
+        assert all(start < stop for start, stop in runs.runs())
+        assert all(runs.stops[i] < runs.starts[i + 1] for i in range(len(runs.starts) - 1))
+
+
+def shifted(x: int, to_bis: list[int]) -> int:
+    return x - bisect_left(to_bis, x)
+
+
+def shuffled(rng: random.Random, total: int) -> dict[int, int]:
+    new = list(range(total))
+    rng.shuffle(new)
+    return dict(zip(range(total), new))
+
+
+def moved_block(rng: random.Random, total: int) -> dict[int, int]:
+    """
+    {old index: new index} for every index, as the sheet makes for
+    moving some rows or columns to one place
+    """
+    to_move = sorted(rng.sample(range(total), rng.randint(1, 8)))
+    others = [i for i in range(total) if i not in to_move]
+    at = rng.randint(0, len(others))
+    order = others[:at] + to_move + others[at:]
+    return {old: new for new, old in enumerate(order)}
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_moved_runs_against_brute_force(seed):
+    rng = random.Random(seed)
+    total = 80
+    full_new_idxs = moved_block(rng, total) if seed % 2 else shuffled(rng, total)
+    stretches = moved_stretches(full_new_idxs)
+    assert [i for a, b in zip(*stretches[:2]) for i in range(a, b)] == [
+        k for k in range(total) if full_new_idxs[k] != k
+    ]
+    for _ in range(10):
+        start = rng.randrange(total)
+        stop = rng.randint(start, total)
+        runs = moved_runs(start, stop, stretches)
+        assert [i for a, b in runs for i in range(a, b)] == sorted(full_new_idxs[i] for i in range(start, stop))
+        # sorted and joined where they touch
+        assert all(a < b for a, b in runs)
+        assert all(runs[i][1] < runs[i + 1][0] for i in range(len(runs) - 1))
+
+
+def test_moved_runs_only_split_at_moved_indexes():
+    # the indexes of the run which aren't moved are never gone through
+    assert moved_stretches({0: 0, 5: 6, 6: 5, 7: 7}) == ([5, 6], [6, 7], [1, -1])
+    assert moved_runs(0, 10**12, moved_stretches({5: 6, 6: 5})) == [(0, 10**12)]
+    assert moved_runs(0, 10**12, moved_stretches({5: 10**12, 6: 5, 10**12: 6})) == [(0, 6), (7, 10**12 + 1)]
+    # moving two rows to the end shifts the rows after them as one stretch
+    full_new_idxs = {0: 0, 1: 8, 2: 9, **{i: i - 2 for i in range(3, 10)}}
+    assert moved_stretches(full_new_idxs) == ([1, 3], [3, 10], [7, -2])
+    assert moved_runs(2, 5, moved_stretches(full_new_idxs)) == [(1, 3), (9, 10)]
+    runs = IndexRuns()
+    runs.add_run(0, 10**12)
+    runs.move_keys({0: 1, 1: 0, 10**12: 10**12})
+    assert list(runs.runs()) == [(0, 10**12)]
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_against_set_model(seed):
+    rng = random.Random(seed)
+    n = 40
+    idxs = IndexRuns(rng.sample(range(n), rng.randint(0, 20)))
+    model = set(idxs)
+    cells = CellRuns({(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 60))})
+    cells_model = set(cells)
+    for _ in range(60):
+        op = rng.randrange(9)
+        axis = rng.randint(0, 1)
+        if op == 0:
+            x, cell = rng.randrange(n), (rng.randrange(n), rng.randrange(n))
+            idxs.add(x)
+            model.add(x)
+            cells.add(cell)
+            cells_model.add(cell)
+        elif op == 1:
+            x, cell = rng.randrange(n), (rng.randrange(n), rng.randrange(n))
+            idxs.discard(x)
+            model.discard(x)
+            cells.discard(cell)
+            cells_model.discard(cell)
+        elif op == 2:
+            start = rng.randrange(n)
+            rows, cols = range(start, start + rng.randint(0, 10)), rng.sample(range(n), 5)
+            idxs.update(rows)
+            model.update(rows)
+            cells.add_area(rows, cols)
+            cells_model.update((r, c) for r in rows for c in cols)
+        elif op == 3:
+            start = rng.randrange(n)
+            stop = start + rng.randint(0, 10)
+            idxs.remove_run(start, stop)
+            model.difference_update(range(start, stop))
+        elif op == 4:
+            to_insert = sorted(rng.sample(range(n + 10), rng.randint(1, 5)))
+            idxs.insert_keys(to_insert)
+            model = {push_n(x, to_insert) for x in model}
+            cells.insert_keys(to_insert, axis)
+            cells_model = {(r, push_n(c, to_insert)) if axis else (push_n(r, to_insert), c) for r, c in cells_model}
+        elif op == 5:
+            to_bis = sorted(rng.sample(range(n + 10), rng.randint(1, 8)))
+            to_del = set(to_bis)
+            idxs.delete_keys(to_bis)
+            model = {shifted(x, to_bis) for x in model if x not in to_del}
+            cells.delete_keys(to_del, to_bis, axis)
+            cells_model = {
+                (r, shifted(c, to_bis)) if axis else (shifted(r, to_bis), c)
+                for r, c in cells_model
+                if (c if axis else r) not in to_del
+            }
+        elif op == 6:
+            total = n + 60
+            full_new_idxs = moved_block(rng, total) if rng.random() < 0.5 else shuffled(rng, total)
+            full_new_idxs.update((x, x) for x in range(total, 1000))
+            idxs.move_keys(full_new_idxs)
+            model = {full_new_idxs[x] for x in model}
+            cells.move_keys(full_new_idxs, axis)
+            cells_model = {(r, full_new_idxs[c]) if axis else (full_new_idxs[r], c) for r, c in cells_model}
+        elif op == 7:
+            xs = rng.sample(range(n), 6)
+            idxs.update(set(xs))
+            model.update(xs)
+            more = [(rng.randrange(n), rng.randrange(n)) for _ in range(6)]
+            cells.update(more)
+            cells_model.update(more)
+        else:
+            # copies share nothing with the original
+            idxs_copy, cells_copy = idxs.copy(), cells.copy()
+            idxs_copy.add(1000)
+            cells_copy.add((1000, 1))
+            assert 1000 not in idxs
+            assert (1000, 1) not in cells
+        check(idxs, model)
+        check(cells, cells_model)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_queries(seed):
+    rng = random.Random(seed)
+    n = 40
+    a, b = IndexRuns(rng.sample(range(n), 20)), IndexRuns(rng.sample(range(n), 10))
+    a_set, b_set = set(a), set(b)
+    assert set(a | b) == a_set | b_set
+    assert set(a & b) == a_set & b_set
+    assert set(a.union(b, range(3, 7))) == a_set | b_set | set(range(3, 7))
+    assert set(a.intersection(b, range(30))) == a_set & b_set & set(range(30))
+    check(a.intersection(b), a_set & b_set)
+    check(a.union(b), a_set | b_set)
+    assert a.last(-1) == max(a_set)
+    assert all((x in a) == (x in a_set) for x in range(-2, n + 2))
+    assert "a" not in a
+    c = CellRuns({(rng.randrange(n), rng.randrange(n)) for _ in range(60)})
+    d = CellRuns({(rng.randrange(n), rng.randrange(n)) for _ in range(80)})
+    c_set, d_set = set(c), set(d)
+    assert set(c | d) == c_set | d_set
+    assert set(c & d) == c_set & d_set
+    assert set(c.intersection(d, c)) == c_set & d_set
+    assert all(((r, 3) in c) == ((r, 3) in c_set) for r in range(-2, n + 2))
+    assert 5 not in c
+    assert c.max_row(-1) == max(r for r, _ in c_set)
+    assert c.max_column(-1) == max(col for _, col in c_set)
+
+
+def test_frozen_is_kept_until_changed():
+    idxs = IndexRuns(range(10))
+    frozen = idxs.frozen()
+    assert idxs.frozen() is frozen
+    assert idxs.copy().frozen() is frozen
+    idxs.add(20)
+    assert 20 in idxs.frozen()
+    cells = CellRuns([(0, 0), (1, 1)])
+    frozen = cells.frozen()
+    assert cells.frozen() is frozen
+    cells.insert_keys([0], axis=1)
+    assert cells.frozen() == {(0, 1), (1, 2)}
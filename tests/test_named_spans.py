@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import random
+from bisect import bisect_left
+
+import pytest
+
+from tksheet.option_store import NamedSpans
+from tksheet.other_classes import Span
+
+N = 40
+
+
+def random_span(rng: random.Random, name: str) -> Span:
+    def axis() -> tuple[int | None, int | None]:
+        k = rng.random()
+        if k < 0.25:
+            return None, None
+        start = rng.randrange(N)
+        return (start, None) if k < 0.4 else (start, start + rng.randint(1, 8))
+
+    from_r, upto_r = axis()
+    from_c, upto_c = axis()
+    return Span(from_r=from_r, upto_r=upto_r, from_c=from_c, upto_c=upto_c, name=name)
+
+
+def covers(span: Span, r: int, c: int) -> bool:
+    def within(start: int | None, stop: int | None, i: int) -> bool:
+        return start is None or (start <= i and (stop is None or i < stop))
+
+    return within(span["from_r"], span["upto_r"], r) and within(span["from_c"], span["upto_c"], c)
+
+
+def coords(spans: NamedSpans) -> dict[str, tuple]:
+    return {name: (s["from_r"], s["from_c"], s["upto_r"], s["upto_c"]) for name, s in spans.items()}
+
+
+def inserted(start: int | None, stop: int | None, idxs: list[int], total: int) -> tuple[int | None, int | None]:
+    """
+    Where a span's bounds end up after inserting at idxs, spans grow by
+    the indexes inserted within them or at their start
+    """
+    if start is None:
+        return start, stop
+    idx_set = set(idxs)
+    new_position = [i for i in range(total + len(idxs)) if i not in idx_set]
+    start = new_position[start - 1] + 1 if start else 0
+    if stop is not None:
+        stop = new_position[stop - 1] + 1
+    return start, stop
+
+
+def deleted(start: int | None, stop: int | None, to_bis: list[int]) -> tuple[int | None, int | None]:
+    if start is None:
+        return start, stop
+    return start - bisect_left(to_bis, start), None if stop is None else stop - bisect_left(to_bis, stop)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_against_brute_force(seed):
+    rng = random.Random(seed)
+    spans = NamedSpans({f"s{i}": random_span(rng, f"s{i}") for i in range(rng.randint(0, 25))})
+    objects = dict(spans)
+    total = N + 10
+    for _ in range(10):
+        op = rng.randrange(5)
+        axis = rng.choice("rc")
+        before = coords(spans)
+        if op == 0:
+            idxs = sorted(rng.sample(range(total), rng.randint(1, 6)))
+            grown = spans.insert_keys(idxs, axis)
+            total += len(idxs)
+            expected = {}
+            for name, (from_r, from_c, upto_r, upto_c) in before.items():
+                if axis == "r":
+                    from_r, upto_r = inserted(from_r, upto_r, idxs, total - len(idxs))
+                else:
+                    from_c, upto_c = inserted(from_c, upto_c, idxs, total - len(idxs))
+                expected[name] = (from_r, from_c, upto_r, upto_c)
+            assert coords(spans) == expected
+            # the indexes inserted within each span are returned with it
+            for span, within in grown:
+                stop = total if span[f"upto_{axis}"] is None else span[f"upto_{axis}"]
+                assert list(within) == [i for i in idxs if span[f"from_{axis}"] <= i < stop]
+        elif op == 1:
+            to_bis = sorted(rng.sample(range(total), rng.randint(1, 6)))
+            gone = spans.within(to_bis, total, axis)
+            assert gone == {
+                name
+                for name, s in spans.items()
+                if isinstance(s[f"from_{axis}"], int)
+                and set(range(s[f"from_{axis}"], s[f"upto_{axis}"] or total)) <= set(to_bis)
+            }
+            for name in gone:
+                del spans[name]
+            spans.delete_keys(to_bis, axis)
+            total -= len(to_bis)
+            expected = {}
+            for name, (from_r, from_c, upto_r, upto_c) in before.items():
+                if name in gone:
+                    continue
+                if axis == "r":
+                    from_r, upto_r = deleted(from_r, upto_r, to_bis)
+                else:
+                    from_c, upto_c = deleted(from_c, upto_c, to_bis)
+                expected[name] = (from_r, from_c, upto_r, upto_c)
+            assert coords(spans) == expected
+        elif op == 2:
+            name = f"x{rng.randrange(100)}"
+            spans[name] = objects[name] = random_span(rng, name)
+        elif op == 3 and spans:
+            del spans[rng.choice(list(spans))]
+        # the sheet keeps using the same span objects
+        assert all(spans[name] is objects[name] for name in spans)
+        for _ in range(10):
+            r, c = rng.randrange(total + 10), rng.randrange(total + 10)
+            assert sorted(spans.covering(r, c)) == sorted(name for name, s in spans.items() if covers(s, r, c))
+        start = rng.randrange(total)
+        stop = start + rng.randint(1, 10)
+        assert sorted(spans.overlapping(start, stop, axis)) == sorted(
+            name
+            for name, s in spans.items()
+            if isinstance(s[f"from_{axis}"], int)
+            and s[f"from_{axis}"] < stop
+            and (s[f"upto_{axis}"] is None or s[f"upto_{axis}"] > start)
+        )
+
+
+def test_changed_after_editing_a_span():
+    spans = NamedSpans({"a": Span(from_r=0, upto_r=2, from_c=None, upto_c=None, name="a")})
+    assert spans.covering(5, 0) == []
+    spans["a"]["upto_r"] = 10
+    spans.changed("r")
+    assert spans.covering(5, 0) == ["a"]
+    assert NamedSpans.from_dict(spans) is spans
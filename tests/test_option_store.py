@@ -0,0 +1,118 @@
+import random
+from bisect import bisect_left
+from types import SimpleNamespace
+
+import pytest
+
+from tksheet.functions import push_n
+from tksheet.main_table import MainTable
+from tksheet.option_store import OptionStore, RangeOptions
+
+
+def check(store: OptionStore, model: dict) -> None:
+    assert len(store) == len(model)
+    assert dict(store.items()) == model
+    assert store == model
+    assert all(store[k] == v for k, v in model.items())
+    # blocks are sorted, not empty and hold only the keys from their start to the next
+    assert store.starts == sorted(set(store.starts))
+    assert all(store.blocks)
+    for b, (block, delta) in enumerate(zip(store.blocks, store.deltas)):
+        stop = store.starts[b + 1] if b + 1 < len(store.starts) else float("inf")
+        assert all(store.starts[b] <= k + delta < stop for k in block)
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_against_dict_model(seed):
+    rng = random.Random(seed)
+    cells = seed % 2 == 0
+    n = rng.choice([10, 50, 300])
+
+    def key():
+        return (rng.randrange(n), rng.randrange(n)) if cells else rng.randrange(n)
+
+    model = {key(): rng.random() for _ in range(rng.randint(0, 100))}
+    store = OptionStore(model, cells=cells, load=rng.choice([2, 3, 8, 64]))
+    for _ in range(150):
+        op = rng.random()
+        axis = rng.randint(0, 1) if cells else 0
+        if op < 0.4:
+            k = key()
+            model[k] = store[k] = rng.random()
+        elif op < 0.55 and model:
+            k = rng.choice(list(model))
+            del model[k], store[k]
+        elif op < 0.7:
+            idxs = sorted(rng.sample(range(n + 10), rng.randint(1, 5)))
+            store.insert_keys(idxs, axis)
+            if not cells:
+                model = {push_n(r, idxs): v for r, v in model.items()}
+            elif axis:
+                model = {(r, push_n(c, idxs)): v for (r, c), v in model.items()}
+            else:
+                model = {(push_n(r, idxs), c): v for (r, c), v in model.items()}
+        elif op < 0.85:
+            to_bis = sorted(rng.sample(range(n + 10), rng.randint(1, 8)))
+            to_del = set(to_bis)
+            store.delete_keys(to_del, to_bis, axis)
+
+            def shift(i, to_bis=to_bis):
+                return i - bisect_left(to_bis, i)
+
+            if not cells:
+                model = {shift(r): v for r, v in model.items() if r not in to_del}
+            elif axis:
+                model = {(r, shift(c)): v for (r, c), v in model.items() if c not in to_del}
+            else:
+                model = {(shift(r), c): v for (r, c), v in model.items() if r not in to_del}
+        else:
+            for _ in range(5):
+                k = (rng.randrange(-3, n + 20), rng.randrange(n)) if cells else rng.randrange(-3, n + 20)
+                assert (k in store) == (k in model)
+                assert store.get(k) == model.get(k)
+        check(store, model)
+
+
+def test_dict_behaviour():
+    store = OptionStore({3: {"a": 1}, 1: {"b": 2}})
+    assert list(store) == [1, 3]
+    assert store.get(2, "default") == "default"
+    assert "x" not in store
+    with pytest.raises(KeyError):
+        store[2]
+    with pytest.raises(KeyError):
+        del store[2]
+    store.clear()
+    assert not store and store == {}
+    assert OptionStore.from_dict(store) is store
+
+
+def test_cell_rows():
+    store = OptionStore({(2, 1): "a", (2, 5): "b", (7, 0): "c"}, cells=True, load=1)
+    assert store.row(2) == {1: "a", 5: "b"}
+    assert store.row(3) is None
+    assert store.row(-1) is None
+    store.insert_keys([0])
+    assert store.row(3) == {1: "a", 5: "b"}
+    assert store.rows_between(3, 8) == [(3, {1: "a", 5: "b"})]
+    assert store.rows_between(0, 100) == [(3, {1: "a", 5: "b"}), (8, {0: "c"})]
+
+
+def test_resolved_options_area_matches_cells():
+    rng = random.Random(0)
+    mt = SimpleNamespace(
+        cell_options=OptionStore(
+            {(r, c): {"a": "cell", "b": r} for r in range(30) for c in range(10) if rng.random() < 0.3}, cells=True
+        ),
+        row_options=OptionStore({r: {"a": "row", "c": r} for r in range(0, 30, 3)}),
+        col_options=OptionStore({c: {"a": "col", "d": c} for c in range(0, 10, 2)}),
+        range_options=RangeOptions([(5, 2, 12, 6, "a", "range"), (0, 0, 30, 1, "e", "range")]),
+    )
+    rows, cols = [0, 3, 4, 7, 11, 12, 29, 40], range(-1, 11)
+    area = MainTable.resolved_options_area(mt, rows, cols)
+    assert area == {(r, c): MainTable.resolved_options(mt, r, c) for r in rows for c in cols}
+    assert area[(3, 0)] == {"a": "row", "c": 3, "d": 0, "e": "range", **mt.cell_options.get((3, 0), {})}
+    # cell options over ranges, ranges over rows and rows over columns
+    mt.cell_options[(6, 3)] = {"a": "cell"}
+    assert MainTable.resolved_options_area(mt, [6, 7], [3])[(6, 3)]["a"] == "cell"
+    assert MainTable.resolved_options_area(mt, [6], [2, 3])[(6, 2)]["a"] == "range"
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import random
+from itertools import accumulate
+from types import SimpleNamespace
+
+import pytest
+
+from tksheet.main_table import MainTable
+
+DATARN = 3
+
+
+def old_overflow(mt: SimpleNamespace, cells: dict, rnge: range, datarn: int):
+    """
+    The neighbour scan which overflow_width() replaced
+    """
+    for c_ in rnge:
+        if (
+            cells[(datarn, cells["datacn"][c_])]
+            or (datarn, cells["datacn"][c_]) in cells["dropdown"]
+            or (datarn, cells["datacn"][c_]) in cells["checkbox"]
+        ):
+            return
+        else:
+            yield mt.col_positions[c_ + 1] - mt.col_positions[c_]
+
+
+def old_overflow_width(mt: SimpleNamespace, cells: dict, c: int, align: str, start: int, end: int) -> int:
+    if align[-1] == "w":
+        return sum(old_overflow(mt, cells, range(c + 1, end), DATARN))
+    elif align[-1] == "e":
+        return sum(old_overflow(mt, cells, reversed(range(start, c)), DATARN))
+    return 0
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_against_neighbour_scan(seed):
+    rng = random.Random(seed)
+    columns = rng.randint(1, 30)
+    mt = SimpleNamespace(col_positions=list(accumulate((rng.randint(0, 120) for _ in range(columns)), initial=0)))
+    # a row of the frame, hidden columns give displayed and data indexes which differ
+    datacns = sorted(rng.sample(range(columns * 2), columns))
+    cells = {"datacn": dict(enumerate(datacns)), "dropdown": {}, "checkbox": {}}
+    stops = []
+    for c, datacn in enumerate(datacns):
+        t = (DATARN, datacn)
+        kind = rng.random()
+        cells[t] = "text" if kind < 0.3 else ""
+        if 0.3 <= kind < 0.4:
+            cells["dropdown"][t] = {}
+        elif 0.4 <= kind < 0.5:
+            cells["checkbox"][t] = {}
+        if kind < 0.5:
+            stops.append(c)
+    # the frame's columns, the stops are collected from them
+    start = rng.randint(0, columns - 1)
+    end = rng.randint(start + 1, columns)
+    stops = [c for c in stops if start <= c < end]
+    for c in range(start, end):
+        for align in ("w", "e", "center", "nw", "ne", "n"):
+            assert MainTable.overflow_width(mt, stops, c, align, start, end) == old_overflow_width(
+                mt, cells, c, align, start, end
+            )
+
+
+def test_edges_of_the_frame():
+    mt = SimpleNamespace(col_positions=[0, 10, 30, 60, 100, 150])
+    # nothing to stop the text, it overflows up to the frame's edges
+    assert MainTable.overflow_width(mt, [], 1, "w", 0, 5) == 120
+    assert MainTable.overflow_width(mt, [], 1, "w", 0, 3) == 30
+    assert MainTable.overflow_width(mt, [], 3, "e", 1, 5) == 50
+    # a neighbour with content stops it
+    assert MainTable.overflow_width(mt, [1, 3], 1, "w", 0, 5) == 30
+    assert MainTable.overflow_width(mt, [1, 3], 3, "e", 0, 5) == 30
+    assert MainTable.overflow_width(mt, [1, 2, 3], 2, "w", 0, 5) == 0
+    assert MainTable.overflow_width(mt, [1, 2, 3], 2, "e", 0, 5) == 0
+    assert MainTable.overflow_width(mt, [1, 3], 1, "center", 0, 5) == 0
@@ -0,0 +1,169 @@
+from threading import Event
+
+import pytest
+
+from tksheet.data_sources import PagedData
+from tksheet.sorting import sort_rows_by_column
+
+
+class ListSource:
+    def __init__(self, rows: int = 1000, columns: int = 3) -> None:
+        self.data = [[r * columns + c for c in range(columns)] for r in range(rows)]
+        self.columns = columns
+        self.calls = []
+        # cleared to hold the worker thread inside get_rows()
+        self.go = Event()
+        self.go.set()
+        self.fail = set()
+
+    def row_count(self) -> int:
+        return len(self.data)
+
+    def column_count(self) -> int:
+        return self.columns
+
+    def get_cell(self, r: int, c: int):
+        return self.data[r][c]
+
+    def get_rows(self, start: int, stop: int):
+        self.go.wait(5)
+        self.calls.append((start, stop))
+        if start in self.fail:
+            raise ValueError(f"can't load {start}")
+        return [row[:] for row in self.data[start:stop]]
+
+    def set_cell(self, r: int, c: int, value) -> None:
+        self.data[r][c] = value
+
+
+@pytest.fixture
+def source():
+    return ListSource()
+
+
+@pytest.fixture
+def paged(source):
+    data = PagedData(source, page_size=10, max_pages=5, read_ahead=0)
+    yield data
+    source.go.set()
+    data.close()
+
+
+def test_reads_match_source(paged, source):
+    assert len(paged) == 1000
+    assert paged[5][1] == source.data[5][1]
+    assert list(paged[999]) == source.data[999]
+    assert paged.stats()["misses"] == 2
+
+
+def test_loading_page_shows_placeholder_only_to_redraw(paged, source):
+    source.go.clear()
+    paged.prefetch(range(5))
+    assert paged.loading(0)
+    source.go.set()
+    # reading data waits for the page instead of returning the placeholder
+    assert list(paged[0]) == [0, 1, 2]
+    assert not paged.loading(0)
+    assert paged.poll() == list(range(10))
+    assert paged.poll() == []
+
+
+def test_sort_waits_for_pending_pages(source):
+    paged = PagedData(ListSource(rows=20), page_size=10, read_ahead=0)
+    paged.source.go.clear()
+    paged.prefetch(range(20))
+    paged.source.go.set()
+    rows, _ = sort_rows_by_column(paged, 0, reverse=True)
+    assert [row[0] for _, row in rows] == [r * 3 for r in range(19, -1, -1)]
+    paged.close()
+
+
+def test_set_cell_updates_loaded_page(paged, source):
+    assert paged[5][1] == 16
+    paged[5][1] = "edited"
+    assert source.get_cell(5, 1) == "edited"
+    assert paged[5][1] == "edited"
+    assert paged.row(5) == [15, "edited", 17]
+
+
+def test_set_cell_waits_for_pending_page(paged, source):
+    source.go.clear()
+    paged.prefetch((5,))
+    source.go.set()
+    paged[5][1] = "edited"
+    assert paged.poll() == list(range(10))
+    assert paged[5][1] == "edited"
+
+
+def test_set_cell_of_tuple_rows_drops_page(paged, source):
+    source.get_rows = lambda start, stop: [tuple(row) for row in source.data[start:stop]]
+    assert paged[5][1] == 16
+    paged[5][1] = "edited"
+    assert 0 not in paged.pages
+    assert paged[5][1] == "edited"
+
+
+def test_set_cell_after_moving(paged, source):
+    paged.move_rows({0: 20}, {20: 0})
+    paged[20][0] = "edited"
+    assert source.data[0][0] == "edited"
+    assert paged[20][0] == "edited"
+
+
+def test_poll_raises_source_errors(paged, source):
+    source.fail.add(10)
+    paged.prefetch((5, 15))
+    paged.wait(1)
+    with pytest.raises(ValueError):
+        paged.poll()
+    # the rows of the page which did load are still returned
+    assert paged.poll() == list(range(10))
+    with pytest.raises(ValueError):
+        paged[15][0]
+    # not requested again until invalidated
+    paged.prefetch((15,))
+    assert not paged.pending
+    source.fail.clear()
+    paged.invalidate()
+    assert paged[15][0] == 45
+
+
+def test_eviction(source):
+    for eviction, kept in (("lru", {0, 3, 4}), ("fifo", {2, 3, 4})):
+        paged = PagedData(source, page_size=10, max_pages=3, eviction=eviction)
+        for r in (0, 10, 20, 0, 30, 40):
+            paged[r][0]
+        assert set(paged.pages) == kept
+        assert paged.stats()["evictions"] == 2
+
+
+def test_read_ahead_follows_scrolling(source):
+    paged = PagedData(source, page_size=10, read_ahead=2)
+    paged.prefetch(range(50, 60))
+    paged.wait(7)
+    assert paged.pages.keys() | paged.pending == {5, 6, 7}
+    paged.prefetch(range(30, 40))
+    paged.wait(1)
+    assert {1, 2, 3} <= paged.pages.keys()
+    paged.close()
+
+
+def test_invalidate_ignores_stale_pages(paged, source):
+    source.go.clear()
+    paged.prefetch((0,))
+    paged.invalidate()
+    source.data[0][0] = "new"
+    source.go.set()
+    assert paged[0][0] == "new"
+
+
+def test_close_stops_worker(paged, source):
+    paged.prefetch((0,))
+    thread = paged.thread
+    paged.close()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert paged.thread is None
+    paged.prefetch((50,))
+    assert paged.thread is not None
+    assert paged[50][0] == 150
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from types import SimpleNamespace
+
+import pytest
+
+from tksheet.functions import add_to_displayed, push_displayed
+from tksheet.main_table import MainTable
+from tksheet.positions import Positions
+from tksheet.sheet import Sheet
+
+SIZES = (0, 1, 3, 5, 20, 7.5)
+
+
+def positions(sizes: list[float]) -> list[float]:
+    return list(accumulate(sizes, initial=0))
+
+
+def check(pos: Positions, sizes: list[float], rng: random.Random) -> None:
+    model = positions(sizes)
+    assert len(pos) == len(model)
+    assert list(pos) == model
+    assert pos == model
+    assert list(pos.sizes()) == sizes
+    assert all(pos[i] == model[i] for i in range(-len(model), len(model)))
+    a, b = rng.randint(-2, len(model) + 2), rng.randint(-2, len(model) + 2)
+    assert pos[a:b] == model[a:b]
+    for px in [-1, 0, 0.5, 3, 5, 7.5, 20, model[-1], model[-1] + 1] + [
+        rng.uniform(-1, model[-1] + 2) for _ in range(5)
+    ]:
+        assert pos.bisect_left(px) == bisect_left(model, px)
+        assert pos.bisect_right(px) == bisect_right(model, px)
+        lo = rng.randint(0, len(model))
+        hi = rng.randint(lo, len(model))
+        assert pos.bisect_left(px, lo, hi) == bisect_left(model, px, lo, hi)
+        assert pos.bisect_right(px, lo, hi) == bisect_right(model, px, lo, hi)
+
+
+def edit(pos: Positions, sizes: list[float], rng: random.Random) -> None:
+    op = rng.randrange(4)
+    if op == 0 and sizes:
+        i, size = rng.randrange(len(sizes)), rng.choice(SIZES)
+        sizes[i] = size
+        pos.set_size(i, size)
+    elif op == 1:
+        i, new = rng.randint(0, len(sizes)), [rng.choice(SIZES) for _ in range(rng.randint(0, 6))]
+        sizes[i:i] = new
+        pos.insert_sizes(i, new)
+    elif op == 2 and sizes:
+        i, count = rng.randrange(len(sizes)), rng.randint(1, 8)
+        del sizes[i : i + count]
+        pos.delete_sizes(i, count)
+    elif op == 3 and sizes:
+        idx1, idx2 = rng.randrange(len(sizes)), rng.randrange(len(sizes))
+        sizes.insert(idx2, sizes.pop(idx1))
+        pos.move_size(idx1, idx2)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_blocks_against_list_model(seed):
+    rng = random.Random(seed)
+    sizes = [rng.choice(SIZES) for _ in range(rng.randint(0, 30))]
+    typecode = "d" if seed % 2 else None
+    pos = Positions(sizes, load=rng.choice([2, 3, 4, 8]), typecode=typecode)
+    sizes = sizes[:]
+    for _ in range(40):
+        edit(pos, sizes, rng)
+        check(pos, sizes, rng)
+        # blocks are split once they grow past twice the load
+        assert all(0 < len(block) <= pos.load * 2 for block in pos.blocks)
+        assert all(isinstance(block, array if typecode else list) for block in pos.blocks)
+    copied = pos.copy()
+    pos.insert_sizes(0, [100])
+    check(copied, sizes, rng)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_list_compatible_writes(seed):
+    rng = random.Random(seed)
+    # whole numbers so that sums of sizes are exact, the first position is always 0
+    model = positions([rng.randint(0, 20) for _ in range(rng.randint(1, 20))])
+    pos = Positions.from_positions(model)
+    pos.load = 3
+    for _ in range(20):
+        op = rng.randrange(6)
+        if op == 0 and len(model) > 1:
+            i, value = rng.randrange(1, len(model)), rng.randint(0, 100)
+            model[i] = value
+            pos[i] = value
+        elif op == 1 and len(model) > 1:
+            del model[-1]
+            del pos[-1]
+        elif op == 2:
+            value = model[-1] + rng.randint(0, 20)
+            model.append(value)
+            pos.append(value)
+        elif op == 3:
+            values = positions([rng.randint(0, 20) for _ in range(3)])[1:]
+            values = [model[-1] + v for v in values]
+            model.extend(values)
+            pos.extend(values)
+        elif op == 4:
+            i, value = rng.randint(1, len(model)), rng.randint(0, 100)
+            model.insert(i, value)
+            pos.insert(i, value)
+        elif len(model) > 1:
+            i = rng.randrange(1, len(model))
+            assert pos.pop(i) == model.pop(i)
+        assert list(pos) == model
+
+
+def test_from_positions():
+    pos = Positions.from_positions([0, 5, 5, 12])
+    assert list(pos.sizes()) == [5, 0, 7]
+    assert Positions.from_positions(pos) is pos
+    assert list(Positions.from_positions([])) == [0]
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_uniform_against_list_model(seed):
+    rng = random.Random(seed)
+    default = rng.choice([0, 1, 5, 20, 7.5])
+    max_overrides = rng.choice([2, 5, 100])
+    pos = Positions.uniform(default, rng.randint(0, 30), load=rng.choice([2, 3, 8]), max_overrides=max_overrides)
+    sizes = [default] * pos.n
+    for _ in range(40):
+        was_uniform = pos.is_uniform
+        edit(pos, sizes, rng)
+        check(pos, sizes, rng)
+        if pos.is_uniform:
+            assert pos.overrides == {i: size for i, size in enumerate(sizes) if size != default}
+        else:
+            # uniform positions only turn into blocks once too many sizes differ
+            assert not was_uniform or sum(size != default for size in sizes) > max_overrides
+    copied = pos.copy()
+    pos.insert_sizes(0, [100])
+    check(copied, sizes, rng)
+
+
+def test_uniform_upgrade():
+    pos = Positions.uniform(10, 5, max_overrides=1)
+    pos.set_size(1, 3)
+    assert pos.is_uniform
+    assert list(pos.iter_sizes(1, 4)) == [3, 10, 10]
+    pos.set_size(3, 4)
+    assert not pos.is_uniform
+    assert list(pos.sizes()) == [10, 3, 10, 4, 10]
+    pos = Positions.uniform(10, 3)
+    pos.upgrade()
+    assert not pos.is_uniform
+    assert list(pos) == [0, 10, 20, 30]
+
+
+class Table:
+    """
+    The parts of MainTable that hiding and showing rows use, the tests
+    have no display to create a Sheet on
+    """
+
+    row_positions = MainTable.row_positions
+    displayed_rows = MainTable.displayed_rows
+    displayed_rows_index = MainTable.displayed_rows_index
+    disprn = MainTable.disprn
+    set_row_positions = MainTable.set_row_positions
+    get_row_heights = MainTable.get_row_heights
+    gen_row_heights = MainTable.gen_row_heights
+    displayed_storage = MainTable.displayed_storage
+    positions_typecode = MainTable.positions_typecode
+
+    def __init__(self, rows: int, uniform: bool, compact: bool = False) -> None:
+        self.PAR = SimpleNamespace(ops=SimpleNamespace(compact_storage=compact))
+        self.rows = rows
+        self.all_rows_displayed = True
+        self.displayed_rows = []
+        self.saved_row_heights = {}
+        if uniform:
+            self._row_positions = Positions.uniform(7, rows, max_overrides=3, typecode=self.positions_typecode)
+        else:
+            self.set_row_positions([7] * rows)
+
+    def total_data_rows(self) -> int:
+        return self.rows
+
+    def get_default_row_height(self) -> int:
+        return 7
+
+    def deselect(self, **kwargs) -> None:
+        pass
+
+
+def sheet(table: Table) -> SimpleNamespace:
+    return SimpleNamespace(MT=table, set_refresh_timer=lambda redraw=True: None)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_hide_and_show_rows_uniform(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 30)
+    # compact storage on one of the two sheets only changes how they are stored
+    compact = seed % 2 == 0
+    uniform, blocks = sheet(Table(n, uniform=True, compact=compact)), sheet(Table(n, uniform=False))
+    for i, size in [(rng.randrange(n), rng.choice([3, 7, 9])) for _ in range(rng.randint(0, 5))]:
+        uniform.MT.row_positions.set_size(i, size)
+        blocks.MT.row_positions.set_size(i, size)
+    for _ in range(6):
+        if rng.random() < 0.5:
+            rows = set(rng.sample(range(n), rng.randint(1, n)))
+            Sheet.hide_rows(uniform, rows, data_indexes=True)
+            Sheet.hide_rows(blocks, rows, data_indexes=True)
+        else:
+            rows = rng.sample(range(n), rng.randint(1, n))
+            Sheet.show_rows(uniform, rows)
+            Sheet.show_rows(blocks, rows)
+        assert list(uniform.MT.displayed_rows) == blocks.MT.displayed_rows
+        assert isinstance(uniform.MT.displayed_rows, array if compact else list)
+        assert list(uniform.MT.row_positions) == list(blocks.MT.row_positions)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_displayed_index_after_hide_and_show_rows(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 30)
+    table = Table(n, uniform=seed % 2 == 0, compact=seed % 3 == 0)
+    for _ in range(8):
+        # the index is built before each change so that a stale one would be used
+        if not table.all_rows_displayed:
+            table.displayed_rows_index()
+        if rng.random() < 0.5:
+            Sheet.hide_rows(sheet(table), set(rng.sample(range(n), rng.randint(1, n))), data_indexes=True)
+        else:
+            Sheet.show_rows(sheet(table), rng.sample(range(n), rng.randint(1, n)))
+        displayed = list(range(n)) if table.all_rows_displayed else list(table.displayed_rows)
+        for r in range(n):
+            if r in displayed:
+                assert table.disprn(r) == displayed.index(r)
+            else:
+                with pytest.raises(ValueError):
+                    table.disprn(r)
+
+
+def test_hide_rows_uniform_saves_only_overrides():
+    table = Table(10, uniform=True)
+    table.row_positions.set_size(2, 20)
+    Sheet.hide_rows(sheet(table), {1, 2, 3}, data_indexes=True)
+    assert table.row_positions.is_uniform
+    # sizes equal to the default are not saved, showing a row falls back to it
+    assert table.saved_row_heights == {2: 20}
+    Sheet.show_rows(sheet(table), [2])
+    assert list(table.row_positions.sizes()) == [7, 20] + [7] * 6
+
+
+def test_set_typecode():
+    pos = Positions([5, 6, 7], load=2)
+    pos.set_typecode("d")
+    assert all(isinstance(block, array) for block in pos.blocks)
+    assert list(pos) == [0, 5, 11, 18]
+    pos.set_typecode(None)
+    assert all(isinstance(block, list) for block in pos.blocks)
+    uniform = Positions.uniform(5, 3)
+    uniform.set_typecode("d")
+    assert uniform.is_uniform
+    uniform.upgrade()
+    assert isinstance(uniform.blocks[0], array)
+
+
+def test_compact_displayed_rows():
+    table = Table(5, uniform=True, compact=True)
+    table.displayed_rows = [0, 2, 4]
+    assert table.displayed_rows == array("q", [0, 2, 4])
+    # the displayed rows are moved along by inserted rows in place with the same type
+    assert add_to_displayed(table.displayed_rows, [1]) == array("q", [0, 1, 3, 5])
+    assert push_displayed(array("q", [0, 2, 4]), [1]) == array("q", [0, 3, 5])
+    assert add_to_displayed([0, 2, 4], [1]) == [0, 1, 3, 5]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from tksheet.main_table import MainTable
+from tksheet.sheet import Sheet
+
+CHECKBOX = {"checkbox": {"text": ""}}
+
+
+class Table:
+    """
+    The parts of MainTable that reading rows of uneven lengths use,
+    column 3 has checkboxes so its empty cells are False
+    """
+
+    total_data_rows = MainTable.total_data_rows
+    total_data_cols = MainTable.total_data_cols
+    logical_data_cols = MainTable.logical_data_cols
+    fix_data_len = MainTable.fix_data_len
+    get_cell_data = MainTable.get_cell_data
+    get_value_for_empty_cell = MainTable.get_value_for_empty_cell
+    get_empty_row_seq = MainTable.get_empty_row_seq
+    format_value = MainTable.format_value
+
+    def __init__(self, data: list[list], headers: list | int = 0, columns: int = 0) -> None:
+        self.data = data
+        self._headers = headers
+        self._row_index = []
+        self.col_positions = list(range(0, 100 * columns + 1, 100))
+        self.cell_options = {}
+        self.CH = SimpleNamespace(fix_header=self.fix_header, get_cell_data=self.header_cell)
+
+    def fix_header(self, datacn: int) -> None:
+        self._headers.extend(f"h{c}" for c in range(len(self._headers), datacn + 1))
+
+    def header_cell(self, datacn: int, get_displayed: bool = True) -> str:
+        return self._headers[datacn] if datacn < len(self._headers) else ""
+
+    def get_cell_kwargs(self, datarn: int, datacn: int, key: str = "format", **kwargs) -> dict:
+        return CHECKBOX.get(key, {}) if datacn == 3 else {}
+
+
+def sheet(table: Table) -> SimpleNamespace:
+    ns = SimpleNamespace(MT=table, CH=table.CH, RI=None)
+    ns.get_row_data = lambda *args, **kwargs: Sheet.get_row_data(ns, *args, **kwargs)
+    return ns
+
+
+def test_logical_data_cols():
+    table = Table([[1, 2], [3], [4, 5, 6]], headers=["a"])
+    assert table.logical_data_cols() == 3
+    # the header is made long enough, rows are left as they are
+    assert table._headers == ["a", "h1", "h2"]
+    assert table.data == [[1, 2], [3], [4, 5, 6]]
+    assert table.logical_data_cols(at_least_cols=5) == 5
+    assert table.logical_data_cols(total_data_cols=1) == 1
+    table.col_positions = list(range(0, 701, 100))
+    assert table.logical_data_cols() == 7
+    assert Table([[1]], headers=["a", "b", "c", "d"]).logical_data_cols() == 4
+    assert Table([[1]], headers=["a", "b", "c", "d"]).logical_data_cols(include_header=False) == 1
+
+
+def test_fix_data_len():
+    table = Table([[1, 2]])
+    assert table.fix_data_len(0) == 1
+    assert table.data == [[1, 2]]
+    assert table.fix_data_len(2) == 3
+    assert table.data == [[1, 2], [], []]
+    # only the last row is given cells, up to the column asked for
+    assert table.fix_data_len(4, 3) == 5
+    assert table.data == [[1, 2], [], [], [], ["", "", "", False]]
+
+
+def test_rows_are_padded_to_the_widest_row():
+    table = Table([[1, 2], [3], [4, 5, 6, 7, 8], []], headers=["a", "b"])
+    ns = sheet(table)
+    assert Sheet.get_row_data(ns, 1) == [3, "", "", False, ""]
+    assert Sheet.get_row_data(ns, 3) == ["", "", "", False, ""]
+    assert Sheet.get_row_data(ns, 1, only_columns=[0, 3]) == [3, False]
+    expected = [[1, 2, "", False, ""], [3, "", "", False, ""], [4, 5, 6, 7, 8], ["", "", "", False, ""]]
+    assert Sheet.get_sheet_data(ns) == expected
+    assert Sheet.get_sheet_data(ns, get_header=True) == [["a", "b", "", "", ""], *expected]
+    # with the header the rows are padded to the header's length
+    table._headers = list("abcdefg")
+    assert Sheet.get_row_data(ns, 1) == [3, "", "", False, "", "", ""]
+    assert {len(row) for row in Sheet.get_sheet_data(ns, get_header=True)} == {7}
+    assert Sheet.get_sheet_data(ns) == expected
+    # the data isn't changed by reading it
+    assert table.data == [[1, 2], [3], [4, 5, 6, 7, 8], []]
@@ -0,0 +1,136 @@
+import random
+from bisect import bisect_left
+from types import SimpleNamespace
+
+import pytest
+
+from tksheet.functions import push_n
+from tksheet.main_table import MainTable
+from tksheet.option_store import OptionStore, RangeOptions
+from tksheet.sheet import Sheet
+
+N = 20
+
+
+def check(ranged: RangeOptions, model: dict) -> None:
+    for r in range(-1, N + 12):
+        for c in range(-1, N + 12):
+            assert (ranged.get(r, c) or {}) == model.get((r, c), {})
+            for k in "ab":
+                assert ranged.value(r, c, k) == model.get((r, c), {}).get(k)
+    for k in "ab":
+        assert dict(ranged.cells(k)) == {cell: d[k] for cell, d in model.items() if k in d}
+    assert ranged.by_cell() == model
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_against_dict_model(seed):
+    rng = random.Random(seed)
+    ranged, model = RangeOptions(), {}
+    values = [object() for _ in range(3)]
+    for _ in range(25):
+        op = rng.random()
+        fr, ur = sorted(rng.sample(range(N), 2))
+        fc, uc = sorted(rng.sample(range(N), 2))
+        axis = rng.randint(0, 1)
+        if op < 0.35:
+            k, v = rng.choice("ab"), rng.choice(values)
+            ranged.add(fr, fc, ur, uc, k, v)
+            for r in range(fr, ur):
+                for c in range(fc, uc):
+                    model.setdefault((r, c), {})[k] = v
+        elif op < 0.5:
+            k = rng.choice(["a", "b", None])
+            ranged.delete(k, fr, fc, ur, uc)
+            for r in range(fr, ur):
+                for c in range(fc, uc):
+                    if (r, c) in model:
+                        if k is None:
+                            model[(r, c)] = {}
+                        else:
+                            model[(r, c)].pop(k, None)
+        elif op < 0.65:
+            idxs = sorted(rng.sample(range(N + 5), rng.randint(1, 4)))
+            ranged.insert_keys(idxs, axis)
+            model = {((push_n(r, idxs), c) if axis == 0 else (r, push_n(c, idxs))): d for (r, c), d in model.items()}
+        elif op < 0.8:
+            to_bis = sorted(rng.sample(range(N + 5), rng.randint(1, 4)))
+            ranged.delete_keys(to_bis, axis)
+            model = {
+                ((r - bisect_left(to_bis, r), c) if axis == 0 else (r, c - bisect_left(to_bis, c))): d
+                for (r, c), d in model.items()
+                if (c if axis else r) not in to_bis
+            }
+        elif op < 0.9:
+            perm = list(range(N + 5))
+            rng.shuffle(perm)
+            full = dict(enumerate(perm))
+            ranged.move_keys(full, axis)
+            model = {((full.get(r, r), c) if axis == 0 else (r, full.get(c, c))): d for (r, c), d in model.items()}
+        else:
+            ranged = ranged.copy()
+        model = {cell: d for cell, d in model.items() if d}
+        check(ranged, model)
+
+
+def test_later_ranges_take_priority_and_neighbours_join():
+    ranged = RangeOptions()
+    ranged.add(0, 0, 5, 5, "a", 1)
+    ranged.add(2, 2, 3, 3, "a", 2)
+    assert ranged.value(2, 2, "a") == 2
+    assert ranged.value(1, 1, "a") == 1
+    value = object()
+    ranged = RangeOptions()
+    ranged.add(0, 0, 5, 2, "a", value)
+    ranged.add(5, 0, 9, 2, "a", value)
+    assert list(ranged) == [(0, 0, 9, 2, "a", value)]
+
+
+def test_moves_split_ranges_only_where_indexes_move():
+    ranged = RangeOptions()
+    ranged.add(0, 0, 5, 10**9, "a", 1)
+    ranged.add(10, 0, 11, 10**9, "b", 2)
+    # columns 3 and 4 moved to 0, the columns before them move along
+    ranged.move_keys({0: 2, 1: 3, 2: 4, 3: 0, 4: 1}, axis=1)
+    assert list(ranged) == [(0, 0, 5, 10**9, "a", 1), (10, 0, 11, 10**9, "b", 2)]
+    # moving its first row below row 9 splits the first range
+    ranged.move_keys({i: i - 1 for i in range(1, 10)} | {0: 9}, axis=0)
+    assert sorted(ranged) == [(0, 0, 4, 10**9, "a", 1), (9, 0, 10, 10**9, "a", 1), (10, 0, 11, 10**9, "b", 2)]
+
+
+def test_clear_and_overlaps():
+    ranged = RangeOptions([(0, 0, 2, 2, "a", 1), (4, 4, 6, 6, "b", 2)])
+    assert ranged.overlaps("a", 1, 1, 3, 3)
+    assert not ranged.overlaps("b", 1, 1, 3, 3)
+    assert ranged.clear("a") == [(0, 0, 2, 2, "a", 1)]
+    assert list(ranged) == [(4, 4, 6, 6, "b", 2)]
+
+
+def test_get_cell_options_merges_ranges():
+    mt = SimpleNamespace(
+        cell_options=OptionStore({(0, 0): {"a": "cell"}, (9, 9): {"b": 1}}, cells=True),
+        range_options=RangeOptions([(0, 0, 1, 2, "a", "range"), (0, 0, 1, 2, "c", 2)]),
+    )
+    sheet = SimpleNamespace(MT=mt)
+    options = Sheet.get_cell_options(sheet)
+    assert options == {(0, 0): {"a": "cell", "c": 2}, (0, 1): {"a": "range", "c": 2}, (9, 9): {"b": 1}}
+    assert Sheet.get_cell_options(sheet, "a") == {(0, 0): "cell", (0, 1): "range"}
+    # a new dict, changing it doesn't change the ranges
+    options[(0, 1)]["a"] = "changed"
+    assert mt.range_options.value(0, 1, "a") == "range"
+    mt.range_options.clear()
+    assert Sheet.get_cell_options(sheet) is mt.cell_options
+
+
+def test_area_options_leave_no_empty_cell_options():
+    mt = SimpleNamespace(
+        cell_options=OptionStore({(0, 0): {"align": "w"}, (1, 1): {"align": "e", "readonly": True}}, cells=True),
+        range_options=RangeOptions(),
+    )
+    mt.cells_with_options = lambda rows, cols: MainTable.cells_with_options(mt, rows, cols)
+    mt.del_area_option = lambda rows, cols, key: MainTable.del_area_option(mt, rows, cols, key)
+    MainTable.set_area_option(mt, range(5), range(5), "align", "center")
+    assert dict(mt.cell_options.items()) == {(1, 1): {"readonly": True}}
+    assert list(mt.range_options) == [(0, 0, 5, 5, "align", "center")]
+    MainTable.del_area_option(mt, range(2), range(2), "readonly")
+    assert not mt.cell_options
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import random
+from itertools import accumulate
+from types import SimpleNamespace
+
+import pytest
+
+from tksheet.functions import scroll_overlap
+from tksheet.main_table import MainTable
+from tksheet.positions import Positions
+
+
+def window(positions: list[int], displayed: list[int] | None, start: int, stop: int) -> tuple:
+    """
+    The visible rows or columns start to stop as stored in a drawn viewport
+    """
+    return start, positions[start : stop + 1], None if displayed is None else displayed[start:stop]
+
+
+def test_no_overlap():
+    positions = list(range(0, 400, 20))
+    assert scroll_overlap(window(positions, None, 0, 5), window(positions, None, 5, 10)) == range(0)
+    assert scroll_overlap(window(positions, None, 10, 15), window(positions, None, 0, 3)) == range(0)
+
+
+def test_partial_overlap():
+    positions = list(range(0, 400, 20))
+    assert scroll_overlap(window(positions, None, 0, 6), window(positions, None, 2, 9)) == range(2, 6)
+    assert scroll_overlap(window(positions, None, 2, 9), window(positions, None, 0, 6)) == range(2, 6)
+    assert scroll_overlap(window(positions, None, 0, 6), window(positions, None, 0, 6)) == range(6)
+    assert scroll_overlap(window(positions, None, 0, 6), window(positions, None, 2, 4)) == range(2, 4)
+
+
+def test_positions_differ():
+    positions = list(range(0, 400, 20))
+    resized = positions[:4] + [p + 5 for p in positions[4:]]
+    assert scroll_overlap(window(positions, None, 0, 6), window(resized, None, 2, 9)) == range(0)
+    # the change is outside of the overlap
+    assert scroll_overlap(window(positions, None, 0, 3), window(resized, None, 1, 5)) == range(1, 3)
+
+
+def test_displayed_indexes_differ():
+    positions = list(range(0, 400, 20))
+    displayed = [0, 1, 2, 5, 6, 7, 8, 9, 10]
+    moved = [0, 1, 2, 6, 5, 7, 8, 9, 10]
+    assert scroll_overlap(window(positions, displayed, 0, 6), window(positions, displayed, 2, 8)) == range(2, 6)
+    assert scroll_overlap(window(positions, displayed, 0, 6), window(positions, moved, 2, 8)) == range(0)
+    assert scroll_overlap(window(positions, displayed, 0, 3), window(positions, moved, 1, 8)) == range(1, 3)
+
+
+def test_all_displayed_and_displayed_list_differ():
+    positions = list(range(0, 400, 20))
+    displayed = list(range(20))
+    assert scroll_overlap(window(positions, None, 0, 6), window(positions, displayed, 2, 8)) == range(0)
+    assert scroll_overlap(window(positions, displayed, 0, 6), window(positions, None, 2, 8)) == range(0)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_against_brute_force(seed):
+    rng = random.Random(seed)
+    total = 30
+    positions = list(accumulate((rng.randint(0, 3) * 10 for _ in range(total)), initial=0))
+    displayed = None if rng.random() < 0.3 else sorted(rng.sample(range(100), total))
+    a, b = rng.randrange(total), rng.randrange(total)
+    a_stop, b_stop = min(total, a + rng.randint(1, 10)), min(total, b + rng.randint(1, 10))
+    prev, now = window(positions, displayed, a, a_stop), window(positions, displayed, b, b_stop)
+    start, stop = max(a, b), min(a_stop, b_stop)
+    assert scroll_overlap(prev, now) == (range(start, stop) if start < stop else range(0))
+    # any difference within the overlap means nothing is kept
+    if start < stop:
+        changed = positions[:]
+        i = rng.randint(start, stop)
+        changed[i] += 1
+        assert scroll_overlap(prev, window(changed, displayed, b, b_stop)) == range(0)
+
+
+def test_rows_cut_off_at_the_top_are_redrawn():
+    MT = SimpleNamespace(row_positions=Positions.from_positions(list(range(0, 400, 20))))
+    positions = list(range(0, 400, 20))
+    prev = (*window(positions, None, 0, 8), 0)
+    now = (*window(positions, None, 1, 9), 30)
+    # row 1 starts above the new top of the view
+    assert MainTable.scroll_keep_rows(MT, prev, now) == range(2, 8)
+    now = (*window(positions, None, 1, 9), 20)
+    assert MainTable.scroll_keep_rows(MT, prev, now) == range(1, 8)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import random
+from collections import defaultdict
+
+import pytest
+
+from tksheet.other_classes import SelectionIntervals
+
+N = 30
+# the lookups are checked beyond the largest box
+END = N + 12
+
+
+def old_sets(boxes: list[tuple[int, int, int, int, str]]) -> tuple[dict, dict, dict]:
+    """
+    The sets the table, index and header built for each redraw before
+    SelectionIntervals
+    """
+    table, index, header = defaultdict(set), defaultdict(set), defaultdict(set)
+    for r1, c1, r2, c2, type_ in boxes:
+        for r in range(END):
+            if r1 <= r < r2:
+                index[type_ if type_ != "columns" else "cells"].add(r)
+                if type_ == "rows":
+                    table["rows"].add(r)
+        for c in range(END):
+            if c1 <= c < c2:
+                header[type_ if type_ != "rows" else "cells"].add(c)
+                if type_ == "columns":
+                    table["columns"].add(c)
+        if type_ == "cells":
+            table["cells"].update((r, c) for r in range(r1, r2) for c in range(c1, c2))
+    return table, index, header
+
+
+def random_box(rng: random.Random) -> tuple[int, int, int, int, str]:
+    type_ = rng.choice(("cells", "rows", "columns"))
+    r1, c1 = rng.randrange(N), rng.randrange(N)
+    r2, c2 = r1 + rng.randint(1, 10), c1 + rng.randint(1, 10)
+    if type_ == "rows":
+        c1, c2 = 0, N
+    elif type_ == "columns":
+        r1, r2 = 0, N
+    return r1, c1, r2, c2, type_
+
+
+def check(boxes: list[tuple[int, int, int, int, str]]) -> None:
+    selections = SelectionIntervals(boxes)
+    table, index, header = old_sets(boxes)
+    for r in range(END):
+        assert selections.row(r) is (r in table["rows"])
+        assert selections.cells_row(r) is (r in index["cells"])
+        for c in range(END):
+            assert selections.cell(r, c) is ((r, c) in table["cells"])
+    for c in range(END):
+        assert selections.column(c) is (c in table["columns"])
+        assert selections.cells_column(c) is (c in header["cells"])
+    assert index["rows"] == table["rows"]
+    assert header["columns"] == table["columns"]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_against_old_sets(seed):
+    rng = random.Random(seed)
+    check([random_box(rng) for _ in range(rng.randint(0, 8))])
+
+
+def test_overlapping_and_touching_boxes_merge():
+    boxes = [
+        (2, 2, 5, 5, "cells"),
+        (4, 3, 8, 9, "cells"),
+        (8, 0, 9, 1, "cells"),
+        (10, 0, 12, N, "rows"),
+        (12, 0, 13, N, "rows"),
+        (0, 20, N, 22, "columns"),
+        (0, 21, N, 25, "columns"),
+    ]
+    selections = SelectionIntervals(boxes)
+    assert selections.rows == ([10], [13])
+    assert selections.columns == ([20], [25])
+    assert selections.bands == [2, 4, 5, 8, 9]
+    assert selections.band_columns == [([2], [5]), ([2], [9]), ([3], [9]), ([0], [1])]
+    check(boxes)
+
+
+def test_band_edges():
+    selections = SelectionIntervals([(3, 4, 6, 7, "cells"), (6, 5, 8, 6, "cells")])
+    # stops are exclusive on both axes
+    assert [selections.cell(r, 4) for r in (2, 3, 5, 6)] == [False, True, True, False]
+    assert [selections.cell(r, 5) for r in (5, 6, 7, 8)] == [True, True, True, False]
+    assert [selections.cell(3, c) for c in (3, 4, 6, 7)] == [False, True, True, False]
+    assert not selections.cell(100, 5)
+    assert not SelectionIntervals().cell(0, 0)
+    check([(3, 4, 6, 7, "cells"), (6, 5, 8, 6, "cells")])
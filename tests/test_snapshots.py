@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import random
+from bisect import bisect_left
+
+import pytest
+
+from tksheet.functions import push_n
+from tksheet.option_store import NamedSpans, OptionStore, RangeOptions
+from tksheet.other_classes import Span
+
+N = 60
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_option_store_copies_are_independent(seed):
+    rng = random.Random(seed)
+    cells = seed % 2 == 0
+
+    def key():
+        return (rng.randrange(N), rng.randrange(N)) if cells else rng.randrange(N)
+
+    model = {key(): rng.random() for _ in range(rng.randint(0, 150))}
+    # every copy of the store is checked against its own dict after every change
+    pairs = [(OptionStore(model, cells=cells, load=4), dict(model))]
+    for _ in range(40):
+        store, model = rng.choice(pairs)
+        op = rng.randrange(5)
+        axis = rng.randint(0, 1) if cells else 0
+        if op == 0:
+            for _ in range(5):
+                k, v = key(), rng.random()
+                store[k] = model[k] = v
+        elif op == 1:
+            for k in [key() for _ in range(5)]:
+                if k in model:
+                    del store[k], model[k]
+        elif op == 2:
+            idxs = sorted(rng.sample(range(N + 5), rng.randint(1, 4)))
+            store.insert_keys(idxs, axis=axis)
+            moved = {
+                (
+                    push_n(k, idxs) if not cells else (k[0], push_n(k[1], idxs)) if axis else (push_n(k[0], idxs), k[1])
+                ): v
+                for k, v in model.items()
+            }
+            model.clear()
+            model.update(moved)
+        elif op == 3:
+            to_bis = sorted(rng.sample(range(N + 5), rng.randint(1, 6)))
+            to_del = set(to_bis)
+            store.delete_keys(to_del, to_bis, axis=axis)
+
+            def shift(x: int, to_bis: list[int] = to_bis) -> int:
+                return x - bisect_left(to_bis, x)
+
+            kept = {}
+            for k, v in model.items():
+                i = k if not cells else k[axis]
+                if i not in to_del:
+                    kept[shift(k) if not cells else (k[0], shift(k[1])) if axis else (shift(k[0]), k[1])] = v
+            model.clear()
+            model.update(kept)
+        else:
+            pairs.append((store.copy(), dict(model)))
+        for other, other_model in pairs:
+            assert dict(other.items()) == other_model
+            assert len(other) == len(other_model)
+            assert len(other.owned) == len(other.blocks) == len(other.starts)
+
+
+def test_option_store_copy_shares_unchanged_blocks():
+    store = OptionStore({i: i for i in range(20)}, load=4)
+    snapshot = store.copy()
+    assert all(a is b for a, b in zip(store.blocks, snapshot.blocks))
+    store[0] = "changed"
+    assert snapshot[0] == 0
+    assert store.blocks[0] is not snapshot.blocks[0]
+    assert all(a is b for a, b in zip(store.blocks[1:], snapshot.blocks[1:]))
+    cells = OptionStore({(0, 0): {"a": 1}}, cells=True)
+    snapshot = cells.copy()
+    cells[(0, 1)] = {"b": 2}
+    assert dict(snapshot.items()) == {(0, 0): {"a": 1}}
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_range_options_copies_are_independent(seed):
+    rng = random.Random(seed)
+    # every copy is checked against the ranges from replaying its own changes on a new RangeOptions
+    copies = [(RangeOptions(), [])]
+    for _ in range(30):
+        ranges, log = rng.choice(copies)
+        op = rng.choice(["add", "delete", "insert_keys", "delete_keys", "clear", "copy"])
+        if op == "copy":
+            copies.append((ranges.copy(), log[:]))
+            continue
+        from_r, from_c = rng.randrange(N), rng.randrange(N)
+        if op == "add":
+            args = (from_r, from_c, from_r + rng.randint(1, 9), from_c + rng.randint(1, 9), rng.choice("ab"), 1)
+        elif op == "delete":
+            args = (rng.choice(["a", None]), from_r, from_c, from_r + 5, from_c + 5)
+        elif op in ("insert_keys", "delete_keys"):
+            args = (sorted(rng.sample(range(N), 3)), rng.randint(0, 1))
+        else:
+            args = ("b",)
+        getattr(ranges, op)(*args)
+        log.append((op, args))
+        for other, other_log in copies:
+            replayed = RangeOptions()
+            for logged_op, logged_args in other_log:
+                getattr(replayed, logged_op)(*logged_args)
+            assert other.ranges == replayed.ranges
+            r, c = rng.randrange(N), rng.randrange(N)
+            assert other.get(r, c) == replayed.get(r, c)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_named_span_snapshots(seed):
+    rng = random.Random(seed)
+
+    def span(name: str) -> Span:
+        start = rng.randrange(N)
+        return Span(
+            from_r=start,
+            upto_r=start + rng.randint(1, 5),
+            from_c=None,
+            upto_c=None,
+            type_="highlight",
+            kwargs={"bg": "red"},
+            name=name,
+            widget=None,
+        )
+
+    def coords(spans: NamedSpans) -> dict[str, tuple[int, int]]:
+        return {name: (s["from_r"], s["upto_r"]) for name, s in spans.items()}
+
+    live = NamedSpans({f"s{i}": span(f"s{i}") for i in range(8)})
+    objects = dict(live)
+    snapshots = []
+    for _ in range(20):
+        op = rng.randrange(4)
+        if op == 0:
+            snapshots.append((live.copy(), coords(live)))
+        elif op == 1:
+            live.insert_keys(sorted(rng.sample(range(N), 3)))
+        elif op == 2:
+            live.delete_keys(sorted(rng.sample(range(N), 3)))
+        elif snapshots:
+            # undo, the snapshot becomes the live spans
+            live, expected = snapshots.pop(rng.randrange(len(snapshots)))
+            assert coords(live) == expected
+            objects = dict(live)
+        # structural changes never replace the span objects in use
+        assert all(live[name] is objects[name] for name in live)
+        for snapshot, expected in snapshots:
+            assert coords(snapshot) == expected
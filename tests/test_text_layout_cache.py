@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from tksheet.other_classes import TextLayoutCache
+
+
+def test_least_recently_used_are_discarded_first():
+    cache = TextLayoutCache(maxsize=3)
+    for key in "abc":
+        cache.add(key, (key,))
+    assert cache.get("a") == ("a",)
+    cache.add("d", ("d",))
+    assert list(cache.layouts) == ["c", "a", "d"]
+    assert cache.get("b") is None
+    cache.add("b", ("b",))
+    assert list(cache.layouts) == ["a", "d", "b"]
+    assert cache.get("c") is None
+
+
+def test_resize_and_info():
+    cache = TextLayoutCache(maxsize=5)
+    for i in range(5):
+        cache.add(i, (f"{i}",))
+    cache.get(0)
+    cache.get(9)
+    assert cache.info() == {"hits": 1, "misses": 1, "size": 5, "maxsize": 5}
+    cache.resize(2)
+    assert list(cache.layouts) == [4, 0]
+    assert cache.info() == {"hits": 1, "misses": 1, "size": 2, "maxsize": 2}
+    cache.resize(0)
+    cache.add(1, ("1",))
+    assert len(cache) == 0
+    cache.resize(-1)
+    assert len(cache) == 0
+    cache.resize(3)
+    cache.add(1, ("1",))
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info()["hits"] == 1
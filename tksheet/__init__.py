@@ -31,6 +31,7 @@ from .constants import (
     symbols_set,
     truthy,
 )
+from .data_sources import ColumnarData, CSVFileData, DataSource, PagedData, VirtualData, VirtualRow
 from .formatters import (
     Formatter,
     alt_percentage_to_str,
@@ -90,6 +91,7 @@ from .functions import (
     tksheet_type_error,
 )
 from .main_table import MainTable
+from .option_store import OptionStore
 from .other_classes import (
     DotDict,
     DraggedRowColumn,
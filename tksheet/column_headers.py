@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 import tkinter as tk
-from collections import defaultdict
-from collections.abc import Callable, Hashable, Iterator, Sequence
+from collections.abc import Callable, Hashable, Iterator, Mapping, Sequence
 from functools import partial
-from itertools import islice, repeat
 from math import ceil
 from operator import itemgetter
 from typing import Any, Literal
 
-from .colors import color_map
 from .constants import (
     USER_OS,
     _test_str,
@@ -32,16 +29,17 @@ from .functions import (
     mod_event_val,
     new_tk_event,
     recursive_bind,
+    release_drawn_items,
     rounded_box_coords,
     safe_copy,
     stored_event_dict,
     try_b_index,
     try_binding,
     widget_descendants,
-    wrap_text,
 )
 from .menus import build_empty_rc_menu, build_header_rc_menu
-from .other_classes import DraggedRowColumn, DropdownStorage, EventDataDict, TextEditorStorage
+from .option_store import OptionStore
+from .other_classes import DraggedRowColumn, DropdownStorage, EventDataDict, SelectionIntervals, TextEditorStorage
 from .row_index import RowIndex
 from .sorting import sort_column, sort_rows_by_column, sort_tree_rows_by_column
 from .text_editor import TextEditor
@@ -135,6 +133,9 @@ class ColumnHeaders(tk.Canvas):
         self.hidd_dropdown = {}
         self.hidd_checkbox = {}
         self.hidd_corners = set()
+        # displayed column: [(item type, canvas item id), ...]
+        self.drawn_cols = {}
+        self.drawn_viewport = None
 
         self.align = kwargs["header_align"]
         self.basic_bindings()
@@ -187,6 +188,14 @@ class ColumnHeaders(tk.Canvas):
         self.current_height = new_height
         return expanded
 
+    @property
+    def cell_options(self) -> OptionStore:
+        return self._cell_options
+
+    @cell_options.setter
+    def cell_options(self, options: Mapping) -> None:
+        self._cell_options = OptionStore.from_dict(options)
+
     def is_readonly(self, datacn: int) -> bool:
         return datacn in self.cell_options and "readonly" in self.cell_options[datacn]
 
@@ -584,12 +593,12 @@ class ColumnHeaders(tk.Canvas):
                 if self.scroll_if_event_offscreen(event):
                     need_redraw = True
             if need_redraw:
-                self.MT.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=False)
+                self.MT.redraw_after_input(redraw_header=True, redraw_row_index=False)
         try_binding(self.extra_b1_motion_func, event)
 
     def drag_height_resize(self, height: int) -> None:
         if self.set_height(height, set_TL=True):
-            self.MT.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=False, redraw_table=False)
+            self.MT.redraw_after_input(redraw_header=True, redraw_row_index=False, redraw_table=False)
 
     def get_b1_motion_box(self, start_col: int, end_col: int) -> tuple[int, int, int, int, Literal["columns"]]:
         if end_col >= start_col:
@@ -772,12 +781,8 @@ class ColumnHeaders(tk.Canvas):
             new_col_pos = ceil(self.MT.col_positions[self.rsz_w - 1] + self.ops.min_column_width)
         elif size > self.ops.max_column_width:
             new_col_pos = int(self.MT.col_positions[self.rsz_w - 1] + self.ops.max_column_width)
-        increment = new_col_pos - self.MT.col_positions[self.rsz_w]
-        self.MT.col_positions[self.rsz_w + 1 :] = [
-            e + increment for e in islice(self.MT.col_positions, self.rsz_w + 1, None)
-        ]
-        self.MT.col_positions[self.rsz_w] = new_col_pos
-        new_width = self.MT.col_positions[self.rsz_w] - self.MT.col_positions[self.rsz_w - 1]
+        new_width = new_col_pos - self.MT.col_positions[self.rsz_w - 1]
+        self.MT.col_positions.set_size(self.rsz_w - 1, new_width)
         self.MT.allow_auto_resize_columns = False
         self.MT.recreate_all_selection_boxes()
         self.MT.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=True, set_scrollregion=False)
@@ -1230,12 +1235,7 @@ class ColumnHeaders(tk.Canvas):
             width = int(self.ops.max_column_width)
         if only_if_too_small and width <= self.MT.col_positions[col + 1] - self.MT.col_positions[col]:
             return self.MT.col_positions[col + 1] - self.MT.col_positions[col]
-        new_col_pos = self.MT.col_positions[col] + width
-        increment = new_col_pos - self.MT.col_positions[col + 1]
-        self.MT.col_positions[col + 2 :] = [
-            e + increment for e in islice(self.MT.col_positions, col + 2, len(self.MT.col_positions))
-        ]
-        self.MT.col_positions[col + 1] = new_col_pos
+        self.MT.col_positions.set_size(col, width)
         if recreate:
             self.MT.recreate_all_selection_boxes()
         return width
@@ -1256,9 +1256,9 @@ class ColumnHeaders(tk.Canvas):
             )
         elif width is not None:
             if self.MT.all_columns_displayed:
-                self.MT.set_col_positions(itr=repeat(width, self.MT.total_data_cols()))
+                self.MT.reset_col_positions(ncols=self.MT.total_data_cols(), width=width)
             else:
-                self.MT.set_col_positions(itr=repeat(width, len(self.MT.displayed_columns)))
+                self.MT.reset_col_positions(ncols=len(self.MT.displayed_columns), width=width)
         if recreate:
             self.MT.recreate_all_selection_boxes()
 
@@ -1269,63 +1269,55 @@ class ColumnHeaders(tk.Canvas):
         c: int,
         sel_cells_bg: str,
         sel_cols_bg: str,
-        selections: dict,
+        selections: SelectionIntervals,
         datacn: int,
         has_dd: bool,
         tags: str | tuple[str],
-    ) -> tuple[str, bool]:
-        redrawn = False
+    ) -> tuple[str, int | None]:
+        iid = None
         kwargs = self.get_cell_kwargs(datacn, key="highlight")
         if kwargs:
             high_bg = kwargs[0]
-            if high_bg and not high_bg.startswith("#"):
-                high_bg = color_map[high_bg]
-            if "columns" in selections and c in selections["columns"]:
+            if high_bg:
+                high_bg = self.MT.color_cache.hex(high_bg)
+            if selections.column(c):
                 txtfg = (
                     self.ops.header_selected_columns_fg
                     if kwargs[1] is None or self.ops.display_selected_fg_over_highlights
                     else kwargs[1]
                 )
-                redrawn = self.redraw_highlight(
+                iid = self.redraw_highlight(
                     fc + 1,
                     0,
                     sc,
                     self.current_height - 1,
                     fill=self.ops.header_selected_columns_bg
                     if high_bg is None
-                    else (
-                        f"#{int((int(high_bg[1:3], 16) + int(sel_cols_bg[1:3], 16)) / 2):02X}"
-                        + f"{int((int(high_bg[3:5], 16) + int(sel_cols_bg[3:5], 16)) / 2):02X}"
-                        + f"{int((int(high_bg[5:], 16) + int(sel_cols_bg[5:], 16)) / 2):02X}"
-                    ),
+                    else self.MT.color_cache.blend(high_bg, sel_cols_bg),
                     outline=self.ops.header_fg if has_dd and self.ops.show_dropdown_borders else "",
                     tags=tags,
                 )
-            elif "cells" in selections and c in selections["cells"]:
+            elif selections.cells_column(c):
                 txtfg = (
                     self.ops.header_selected_cells_fg
                     if kwargs[1] is None or self.ops.display_selected_fg_over_highlights
                     else kwargs[1]
                 )
-                redrawn = self.redraw_highlight(
+                iid = self.redraw_highlight(
                     fc + 1,
                     0,
                     sc,
                     self.current_height - 1,
                     fill=self.ops.header_selected_cells_bg
                     if high_bg is None
-                    else (
-                        f"#{int((int(high_bg[1:3], 16) + int(sel_cells_bg[1:3], 16)) / 2):02X}"
-                        + f"{int((int(high_bg[3:5], 16) + int(sel_cells_bg[3:5], 16)) / 2):02X}"
-                        + f"{int((int(high_bg[5:], 16) + int(sel_cells_bg[5:], 16)) / 2):02X}"
-                    ),
+                    else self.MT.color_cache.blend(high_bg, sel_cells_bg),
                     outline=self.ops.header_fg if has_dd and self.ops.show_dropdown_borders else "",
                     tags=tags,
                 )
             else:
                 txtfg = self.ops.header_fg if kwargs[1] is None else kwargs[1]
                 if high_bg:
-                    redrawn = self.redraw_highlight(
+                    iid = self.redraw_highlight(
                         fc + 1,
                         0,
                         sc,
@@ -1335,9 +1327,9 @@ class ColumnHeaders(tk.Canvas):
                         tags=tags,
                     )
         elif not kwargs:
-            if "columns" in selections and c in selections["columns"]:
+            if selections.column(c):
                 txtfg = self.ops.header_selected_columns_fg
-                redrawn = self.redraw_highlight(
+                iid = self.redraw_highlight(
                     fc + 1,
                     0,
                     sc,
@@ -1346,9 +1338,9 @@ class ColumnHeaders(tk.Canvas):
                     outline=self.ops.header_fg if has_dd and self.ops.show_dropdown_borders else "",
                     tags=tags,
                 )
-            elif "cells" in selections and c in selections["cells"]:
+            elif selections.cells_column(c):
                 txtfg = self.ops.header_selected_cells_fg
-                redrawn = self.redraw_highlight(
+                iid = self.redraw_highlight(
                     fc + 1,
                     0,
                     sc,
@@ -1359,7 +1351,7 @@ class ColumnHeaders(tk.Canvas):
                 )
             else:
                 txtfg = self.ops.header_fg
-                redrawn = self.redraw_highlight(
+                iid = self.redraw_highlight(
                     fc + 1,
                     0,
                     sc,
@@ -1368,7 +1360,7 @@ class ColumnHeaders(tk.Canvas):
                     outline=self.ops.header_fg if has_dd and self.ops.show_dropdown_borders else "",
                     tags=tags,
                 )
-        return txtfg, redrawn
+        return txtfg, iid
 
     def redraw_highlight(
         self,
@@ -1379,7 +1371,7 @@ class ColumnHeaders(tk.Canvas):
         fill: str,
         outline: str,
         tags: str | tuple[str],
-    ) -> bool:
+    ) -> int:
         if not self.ops.show_vertical_grid:
             x2 += 1
         if self.hidd_high:
@@ -1392,7 +1384,7 @@ class ColumnHeaders(tk.Canvas):
         else:
             iid = self.create_rectangle(x1, y1, x2, y2, fill=fill, outline=outline, tags=tags)
         self.disp_high[iid] = True
-        return True
+        return iid
 
     def redraw_gridline(
         self,
@@ -1422,7 +1414,7 @@ class ColumnHeaders(tk.Canvas):
         draw_outline: bool = True,
         draw_arrow: bool = True,
         open_: bool = False,
-    ) -> None:
+    ) -> int | None:
         # if draw_outline and self.ops.show_dropdown_borders:
         #     self.redraw_highlight(x1 + 1, y1 + 1, x2, y2, fill="", outline=self.ops.header_fg)
         if draw_arrow:
@@ -1459,6 +1451,8 @@ class ColumnHeaders(tk.Canvas):
             else:
                 t = self.create_line(points, fill=fill, width=2, capstyle=tk.ROUND, joinstyle=tk.BEVEL, tag="lift")
             self.disp_dropdown[t] = True
+            return t
+        return None
 
     def redraw_checkbox(
         self,
@@ -1469,7 +1463,7 @@ class ColumnHeaders(tk.Canvas):
         fill: str,
         outline: str,
         draw_check: bool = False,
-    ) -> None:
+    ) -> tuple[int, ...]:
         points = rounded_box_coords(x1, y1, x2, y2)
         if self.hidd_checkbox:
             t, sh = self.hidd_checkbox.popitem()
@@ -1481,6 +1475,7 @@ class ColumnHeaders(tk.Canvas):
         else:
             t = self.create_polygon(points, fill=outline, outline=fill, smooth=True, tag="lift")
         self.disp_checkbox[t] = True
+        iids = (t,)
         if draw_check:
             # draw filled box
             x1 = x1 + 4
@@ -1498,6 +1493,8 @@ class ColumnHeaders(tk.Canvas):
             else:
                 t = self.create_polygon(points, fill=fill, outline=outline, smooth=True, tag="lift")
             self.disp_checkbox[t] = True
+            iids += (t,)
+        return iids
 
     def configure_scrollregion(self, last_col_line_pos: float) -> bool:
         try:
@@ -1527,16 +1524,15 @@ class ColumnHeaders(tk.Canvas):
             self.MT.char_widths[self.header_font][c] = wd
             return wd
 
-    def redraw_corner(self, x: float, y: float, tags: str | tuple[str]) -> None:
+    def redraw_corner(self, x: float, y: float, tags: str | tuple[str]) -> int:
         if self.hidd_corners:
             iid = self.hidd_corners.pop()
             self.coords(iid, x - 10, y, x, y, x, y + 10)
             self.itemconfig(iid, fill=self.ops.header_grid_fg, state="normal", tags=tags)
-            self.disp_corners.add(iid)
         else:
-            self.disp_corners.add(
-                self.create_polygon(x - 10, y, x, y, x, y + 10, fill=self.ops.header_grid_fg, tags=tags)
-            )
+            iid = self.create_polygon(x - 10, y, x, y, x, y + 10, fill=self.ops.header_grid_fg, tags=tags)
+        self.disp_corners.add(iid)
+        return iid
 
     def redraw_grid_and_text(
         self,
@@ -1550,21 +1546,36 @@ class ColumnHeaders(tk.Canvas):
         scrollpos_right: float,
         col_pos_exists: bool,
         set_scrollregion: bool,
+        keep_cols: range = range(0),
     ) -> bool:
+        """
+        keep_cols: displayed columns which are already drawn correctly
+                   e.g. after scrolling and are left as they are
+        """
         if set_scrollregion and not self.configure_scrollregion(last_col_line_pos=last_col_line_pos):
             return False
-        self.hidd_text.update(self.disp_text)
-        self.disp_text = {}
-        self.hidd_high.update(self.disp_high)
-        self.disp_high = {}
+        if keep_cols:
+            drawn_cols = {}
+            for c, items in self.drawn_cols.items():
+                if c in keep_cols:
+                    drawn_cols[c] = items
+                else:
+                    release_drawn_items(self, items)
+            self.drawn_cols = drawn_cols
+        else:
+            self.hidd_text.update(self.disp_text)
+            self.disp_text = {}
+            self.hidd_high.update(self.disp_high)
+            self.disp_high = {}
+            self.hidd_dropdown.update(self.disp_dropdown)
+            self.disp_dropdown = {}
+            self.hidd_checkbox.update(self.disp_checkbox)
+            self.disp_checkbox = {}
+            self.hidd_corners.update(self.disp_corners)
+            self.disp_corners = set()
+            self.drawn_cols = {}
         self.hidd_grid.update(self.disp_grid)
         self.disp_grid = {}
-        self.hidd_dropdown.update(self.disp_dropdown)
-        self.disp_dropdown = {}
-        self.hidd_checkbox.update(self.disp_checkbox)
-        self.disp_checkbox = {}
-        self.hidd_corners.update(self.disp_corners)
-        self.disp_corners = set()
         self.visible_col_dividers = {}
         self.col_height_resize_bbox = (
             scrollpos_left,
@@ -1600,30 +1611,25 @@ class ColumnHeaders(tk.Canvas):
                     )
                 )
             self.redraw_gridline(points=points, fill=self.ops.header_grid_fg, width=1)
-        sel_cells_bg = (
-            self.ops.header_selected_cells_bg
-            if self.ops.header_selected_cells_bg.startswith("#")
-            else color_map[self.ops.header_selected_cells_bg]
-        )
-        sel_cols_bg = (
-            self.ops.header_selected_columns_bg
-            if self.ops.header_selected_columns_bg.startswith("#")
-            else color_map[self.ops.header_selected_columns_bg]
-        )
+        sel_cells_bg = self.MT.color_cache.hex(self.ops.header_selected_cells_bg)
+        sel_cols_bg = self.MT.color_cache.hex(self.ops.header_selected_columns_bg)
         font = self.ops.header_font
-        selections = self.get_redraw_selections(text_start_col, grid_end_col)
+        selections = self.MT.get_redraw_selections()
         dd_coords = self.dropdown.get_coords()
         wrap = self.ops.header_wrap
         txt_h = self.MT.header_txt_height
         note_corners = self.ops.note_corners
         for c in range(text_start_col, text_end_col):
+            if c in keep_cols:
+                continue
+            self.drawn_cols[c] = items = []
             draw_y = 3
             cleftgridln = self.MT.col_positions[c]
             crightgridln = self.MT.col_positions[c + 1]
             datacn = c if self.MT.all_columns_displayed else self.MT.displayed_columns[c]
             kwargs = self.get_cell_kwargs(datacn, key="dropdown")
             tag = f"{c}"
-            fill, dd_drawn = self.redraw_highlight_get_text_fg(
+            fill, high_iid = self.redraw_highlight_get_text_fg(
                 fc=cleftgridln,
                 sc=crightgridln,
                 c=c,
@@ -1634,6 +1640,8 @@ class ColumnHeaders(tk.Canvas):
                 has_dd=bool(kwargs),
                 tags=("h", "c", tag),
             )
+            if high_iid is not None:
+                items.append(("high", high_iid))
             if datacn in self.cell_options and "align" in self.cell_options[datacn]:
                 align = self.cell_options[datacn]["align"]
             else:
@@ -1646,17 +1654,19 @@ class ColumnHeaders(tk.Canvas):
                     draw_x = crightgridln - 5 - txt_h
                 elif align[-1] == "n":
                     draw_x = cleftgridln + (crightgridln - cleftgridln - txt_h) / 2
-                self.redraw_dropdown(
+                dd_iid = self.redraw_dropdown(
                     cleftgridln,
                     0,
                     crightgridln,
                     self.current_height - 1,
                     fill=fill if kwargs["state"] != "disabled" else self.ops.header_grid_fg,
                     outline=fill,
-                    draw_outline=not dd_drawn,
+                    draw_outline=high_iid is None,
                     draw_arrow=max_width >= 5,
                     open_=dd_coords == c,
                 )
+                if dd_iid is not None:
+                    items.append(("dropdown", dd_iid))
             else:
                 max_width = crightgridln - cleftgridln - 2
                 if align[-1] == "w":
@@ -1680,14 +1690,17 @@ class ColumnHeaders(tk.Canvas):
                         )
                     except Exception:
                         draw_check = False
-                    self.redraw_checkbox(
-                        cleftgridln + 2,
-                        2,
-                        cleftgridln + txt_h + 3,
-                        txt_h + 3,
-                        fill=fill if kwargs["state"] == "normal" else self.ops.header_grid_fg,
-                        outline="",
-                        draw_check=draw_check,
+                    items.extend(
+                        ("checkbox", iid)
+                        for iid in self.redraw_checkbox(
+                            cleftgridln + 2,
+                            2,
+                            cleftgridln + txt_h + 3,
+                            txt_h + 3,
+                            fill=fill if kwargs["state"] == "normal" else self.ops.header_grid_fg,
+                            outline="",
+                            draw_check=draw_check,
+                        )
                     )
             if (
                 max_width < self.MT.header_txt_width
@@ -1698,16 +1711,16 @@ class ColumnHeaders(tk.Canvas):
                 continue
             tags = ("lift", "c", tag)
             if note_corners and max_width > 5 and datacn in self.cell_options and "note" in self.cell_options[datacn]:
-                self.redraw_corner(crightgridln, 0, tags)
+                items.append(("corners", self.redraw_corner(crightgridln, 0, tags)))
             text = self.cell_str(datacn, fix=False)
             if not text:
                 continue
-            gen_lines = wrap_text(
+            gen_lines = self.MT.wrap_lines(
                 text=text,
                 max_width=max_width,
                 max_lines=int((self.current_height - top - 2) / txt_h),
                 char_width_fn=self.char_width_fn,
-                widths=self.MT.char_widths[font],
+                font=font,
                 wrap=wrap,
             )
             if align[-1] == "w" or align[-1] == "e":
@@ -1744,6 +1757,7 @@ class ColumnHeaders(tk.Canvas):
                         tags=tags,
                     )
                 self.disp_text[iid] = True
+                items.append(("text", iid))
             else:
                 for line in gen_lines:
                     if self.hidd_text:
@@ -1779,6 +1793,7 @@ class ColumnHeaders(tk.Canvas):
                             tags=tags,
                         )
                     self.disp_text[iid] = True
+                    items.append(("text", iid))
                     draw_y += self.MT.header_txt_height
 
         for dct in (self.hidd_text, self.hidd_high, self.hidd_grid, self.hidd_dropdown, self.hidd_checkbox):
@@ -1896,15 +1911,6 @@ class ColumnHeaders(tk.Canvas):
         self.hide_tooltip()
         self.focus_set()
 
-    def get_redraw_selections(self, startc: int, endc: int) -> dict[str, set[int]]:
-        d = defaultdict(set)
-        for _, box in self.MT.get_selection_items():
-            _, c1, _, c2 = box.coords
-            for c in range(startc, endc):
-                if c1 <= c and c2 > c:
-                    d[box.type_ if box.type_ != "rows" else "cells"].add(c)
-        return d
-
     def open_cell(self, event: Any = None, ignore_existing_editor: bool = False) -> None:
         if not self.MT.anything_selected() or (not ignore_existing_editor and self.text_editor.open):
             return
@@ -11,6 +11,22 @@ nonelike: set[Hashable] = {None, "none", ""}
 truthy: set[Hashable] = {True, "true", "t", "yes", "y", "on", "1"}
 falsy: set[Hashable] = {False, "false", "f", "no", "n", "off", "0"}
 _test_str: str = "0"
+# printable ASCII and Latin-1 characters, their widths are measured when a font is first used
+_preload_chars: str = "".join(map(chr, (*range(32, 127), *range(160, 256))))
+# Tcl lambda which measures the widths of many characters in one evaluation
+# in the same way as char_width_fn(), the width of prefix + char minus the width of prefix
+_measure_chars_tcl: str = """{canvas item font prefix chars} {
+    $canvas itemconfigure $item -text $prefix -font $font
+    set b [$canvas bbox $item]
+    set base [expr {[lindex $b 2] - [lindex $b 0]}]
+    set res {}
+    foreach ch $chars {
+        $canvas itemconfigure $item -text $prefix$ch
+        set b [$canvas bbox $item]
+        lappend res [expr {[lindex $b 2] - [lindex $b 0] - $base}]
+    }
+    return $res
+}"""
 
 val_modifying_options: set[str] = {"checkbox", "format", "dropdown"}
 
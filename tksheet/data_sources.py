@@ -0,0 +1,794 @@
+from __future__ import annotations
+
+import csv
+import os
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import suppress
+from io import StringIO
+from itertools import islice, zip_longest
+from mmap import ACCESS_READ, mmap
+from queue import Queue
+from threading import Condition, Lock, Thread
+from typing import Any, Literal, Protocol, runtime_checkable
+
+from .functions import move_fast
+
+
+@runtime_checkable
+class DataSource(Protocol):
+    """
+    Provides the table data without it having to be a list of lists
+    Optionally also has a set_cell(r, c, value) method, without one
+    the data can't be edited
+    """
+
+    def row_count(self) -> int: ...
+
+    def column_count(self) -> int: ...
+
+    def get_cell(self, r: int, c: int) -> Any: ...
+
+    def get_rows(self, start: int, stop: int) -> Sequence[Sequence[Any]]: ...
+
+
+class VirtualRow:
+    """
+    A row of a VirtualData, cells are fetched when they are used
+    """
+
+    __slots__ = ("data", "r")
+
+    def __init__(self, data: VirtualData, r: int) -> None:
+        self.data = data
+        self.r = r
+
+    def __len__(self) -> int:
+        return self.data.column_count()
+
+    def __getitem__(self, c: int | slice) -> Any:
+        if isinstance(c, slice):
+            return self.data.row(self.r)[c]
+        if c < 0:
+            c += self.data.column_count()
+        if not 0 <= c < self.data.column_count():
+            raise IndexError("column index out of range")
+        return self.data.cell(self.r, c)
+
+    def __setitem__(self, c: int, value: Any) -> None:
+        if c < 0:
+            c += self.data.column_count()
+        if not 0 <= c < self.data.column_count():
+            raise IndexError("column index out of range")
+        self.data.set_cell(self.r, c, value)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.data.row(self.r))
+
+    def __repr__(self) -> str:
+        return repr(self.data.row(self.r))
+
+    def extend(self, values: Iterable[Any]) -> None:
+        for _ in values:
+            raise TypeError("Columns can't be added to a data source.")
+
+    def append(self, value: Any) -> None:
+        raise TypeError("Columns can't be added to a data source.")
+
+    def insert(self, c: int, value: Any) -> None:
+        raise TypeError("Columns can't be added to a data source.")
+
+    def pop(self, c: int = -1) -> Any:
+        raise TypeError("Columns can't be deleted from a data source.")
+
+
+class VirtualData:
+    """
+    Wraps a DataSource so that it can be used as the sheet data, which is otherwise a list
+    of lists, rows are only fetched from the source when they are used
+    Rows and columns can be moved, e.g. by sorting, but not added or deleted
+    """
+
+    __slots__ = ("col_order", "max_rows", "order", "rows", "source")
+
+    def __init__(self, source: DataSource, max_rows: int = 1000) -> None:
+        self.source = source
+        # data index -> source index, None while nothing has been moved
+        self.order = None
+        self.col_order = None
+        # source rows fetched by row() and prefetch(), oldest first
+        self.rows = {}
+        self.max_rows = max_rows
+
+    def __len__(self) -> int:
+        return self.row_count()
+
+    def __getitem__(self, r: int | slice) -> VirtualRow | list[VirtualRow]:
+        if isinstance(r, slice):
+            return [VirtualRow(self, i) for i in range(*r.indices(len(self)))]
+        if r < 0:
+            r += self.row_count()
+        if not 0 <= r < self.row_count():
+            raise IndexError("row index out of range")
+        return VirtualRow(self, r)
+
+    def __setitem__(self, r: int, row: Iterable[Any]) -> None:
+        if not isinstance(r, int):
+            raise TypeError("Rows can't be added to or deleted from a data source.")
+        for c, value in enumerate(row):
+            self.set_cell(r, c, value)
+
+    def __iter__(self) -> Iterator[VirtualRow]:
+        return (VirtualRow(self, r) for r in range(len(self)))
+
+    def extend(self, rows: Iterable[Any]) -> None:
+        for _ in rows:
+            raise TypeError("Rows can't be added to a data source.")
+
+    def append(self, row: Any) -> None:
+        raise TypeError("Rows can't be added to a data source.")
+
+    def insert(self, r: int, row: Any) -> None:
+        raise TypeError("Rows can't be added to a data source.")
+
+    def pop(self, r: int = -1) -> Any:
+        raise TypeError("Rows can't be deleted from a data source.")
+
+    def row_count(self) -> int:
+        return self.source.row_count()
+
+    def column_count(self) -> int:
+        return self.source.column_count()
+
+    def source_row(self, r: int) -> int:
+        return r if self.order is None else self.order[r]
+
+    def source_col(self, c: int) -> int:
+        return c if self.col_order is None else self.col_order[c]
+
+    def cell(self, r: int, c: int) -> Any:
+        if r in self.rows:
+            return self.rows[r][self.source_col(c)]
+        return self.source.get_cell(self.source_row(r), self.source_col(c))
+
+    def set_cell(self, r: int, c: int, value: Any) -> None:
+        if not hasattr(self.source, "set_cell"):
+            raise TypeError("The data source is read only.")
+        self.source.set_cell(self.source_row(r), self.source_col(c), value)
+        self.rows.pop(r, None)
+
+    def row(self, r: int) -> list[Any]:
+        if r not in self.rows:
+            self.prefetch((r,))
+        row = self.rows[r]
+        return list(row) if self.col_order is None else [row[c] for c in self.col_order]
+
+    def prefetch(self, rows: Iterable[int]) -> None:
+        """
+        Fetches the data rows which aren't already stored,
+        consecutive source rows are fetched with a single get_rows() call
+        The rows become the most recently used so they aren't evicted
+        """
+        total = len(self)
+        visible = {r for r in rows if 0 <= r < total}
+        need = []
+        for r in visible:
+            if r in self.rows:
+                self.rows[r] = self.rows.pop(r)
+            else:
+                need.append((self.source_row(r), r))
+        need.sort()
+        i = 0
+        while i < len(need):
+            j = i + 1
+            while j < len(need) and need[j][0] == need[j - 1][0] + 1:
+                j += 1
+            for (_, r), row in zip(need[i:j], self.source.get_rows(need[i][0], need[j - 1][0] + 1)):
+                self.rows[r] = row
+            i = j
+        if (excess := len(self.rows) - max(self.max_rows, len(visible))) > 0:
+            for r in list(islice(self.rows, excess)):
+                del self.rows[r]
+
+    def invalidate(self) -> None:
+        """
+        Forgets fetched rows, use after the source's data has changed
+        """
+        self.rows = {}
+
+    def move_rows(self, new_idxs: dict[int, int], old_idxs: dict[int, int]) -> None:
+        self.order = move_fast(list(range(len(self))) if self.order is None else self.order, new_idxs, old_idxs)
+        self.rows = {}
+
+    def move_columns(self, new_idxs: dict[int, int], old_idxs: dict[int, int]) -> None:
+        self.col_order = move_fast(
+            list(range(self.column_count())) if self.col_order is None else self.col_order,
+            new_idxs,
+            old_idxs,
+        )
+
+
+class PagedData(VirtualData):
+    """
+    A VirtualData which loads its source's rows in pages using a worker thread so that
+    a slow source doesn't block the sheet, while a page is loading the sheet's redraw
+    shows a placeholder for its rows, see loading()
+    Pages are requested by prefetch(), loaded pages are collected on the main thread
+    by poll() which returns the data rows which can now be redrawn
+    Reading a cell in any other way waits for its page, or loads it if it hasn't been
+    requested, so data is never read as the placeholder
+    The source's row and column counts are read once and again by invalidate(), its
+    other methods are only used by one thread at a time
+    """
+
+    __slots__ = (
+        "counts",
+        "errors",
+        "eviction",
+        "failed",
+        "generation",
+        "inverse",
+        "loaded",
+        "lock",
+        "max_pages",
+        "page_size",
+        "pages",
+        "pending",
+        "placeholder",
+        "poll_interval",
+        "queue",
+        "read_ahead",
+        "ready",
+        "thread",
+        "total_columns",
+        "total_rows",
+        "updated",
+        "viewport_page",
+    )
+
+    def __init__(
+        self,
+        source: DataSource,
+        page_size: int = 100,
+        max_pages: int = 50,
+        read_ahead: int = 2,
+        eviction: Literal["lru", "fifo"] = "lru",
+        placeholder: Any = "…",
+        poll_interval: int = 20,
+    ) -> None:
+        super().__init__(source)
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.read_ahead = read_ahead
+        self.eviction = eviction
+        self.placeholder = placeholder
+        self.poll_interval = poll_interval
+        self.total_rows = source.row_count()
+        self.total_columns = source.column_count()
+        # source page -> rows, least recently used or oldest first
+        self.pages = {}
+        # pages requested from the worker thread and not yet collected
+        self.pending = set()
+        # (generation, page, rows or the exception raised) appended by the worker thread
+        self.loaded = deque()
+        # collected pages whose rows haven't been returned by poll() yet
+        self.updated = []
+        # source page -> the exception raised loading it, until invalidate()
+        self.failed = {}
+        # exceptions not yet raised by poll()
+        self.errors = []
+        self.generation = 0
+        # source index -> data index, None while nothing has been moved
+        self.inverse = None
+        self.viewport_page = 0
+        self.counts = {"hits": 0, "misses": 0, "loads": 0, "evictions": 0}
+        # held while using the source
+        self.lock = Lock()
+        # notified when the worker thread appends to loaded
+        self.ready = Condition()
+        self.queue = None
+        self.thread = None
+
+    def row_count(self) -> int:
+        return self.total_rows
+
+    def column_count(self) -> int:
+        return self.total_columns
+
+    def start(self) -> None:
+        self.queue = Queue()
+        self.thread = Thread(target=self.worker, args=(self.queue,), daemon=True)
+        self.thread.start()
+
+    def worker(self, queue: Queue) -> None:
+        while (request := queue.get()) is not None:
+            generation, page = request
+            start = page * self.page_size
+            try:
+                with self.lock:
+                    rows = self.source.get_rows(start, min(start + self.page_size, self.total_rows))
+            except Exception as error:
+                rows = error
+            with self.ready:
+                self.loaded.append((generation, page, rows))
+                self.ready.notify_all()
+
+    def close(self) -> None:
+        """
+        Stops the worker thread once it has loaded the pages already
+        requested, it's started again if more pages are requested
+        """
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread = None
+
+    def wait(self, page: int) -> None:
+        """
+        Waits for the worker thread to load a pending page and collects it
+        """
+        with self.ready:
+            self.ready.wait_for(lambda: any(loaded[:2] == (self.generation, page) for loaded in tuple(self.loaded)))
+        self.collect()
+
+    def collect(self) -> None:
+        """
+        Stores the pages loaded by the worker thread
+        """
+        while self.loaded:
+            generation, page, rows = self.loaded.popleft()
+            if generation != self.generation:
+                continue
+            self.pending.discard(page)
+            if isinstance(rows, Exception):
+                self.failed[page] = rows
+                self.errors.append(rows)
+            else:
+                self.store(page, rows)
+                self.updated.append(page)
+
+    def loading(self, r: int) -> bool:
+        """
+        Whether data row r's page has been requested and is still loading
+        """
+        return self.source_row(r) // self.page_size in self.pending
+
+    def page(self, r: int) -> Sequence[Sequence[Any]]:
+        """
+        Returns the page of source row r, waiting for it if it's
+        loading and loading it now if it hasn't been requested
+        """
+        page = r // self.page_size
+        if page in self.pending:
+            self.wait(page)
+        if page in self.pages:
+            self.counts["hits"] += 1
+            if self.eviction == "lru":
+                self.pages[page] = self.pages.pop(page)
+            return self.pages[page]
+        if page in self.failed:
+            raise self.failed[page]
+        self.counts["misses"] += 1
+        start = page * self.page_size
+        with self.lock:
+            rows = self.source.get_rows(start, min(start + self.page_size, self.total_rows))
+        self.store(page, rows)
+        return rows
+
+    def store(self, page: int, rows: Sequence[Sequence[Any]]) -> None:
+        self.pages[page] = rows
+        self.counts["loads"] += 1
+        while len(self.pages) > self.max_pages:
+            del self.pages[next(iter(self.pages))]
+            self.counts["evictions"] += 1
+
+    def cell(self, r: int, c: int) -> Any:
+        r = self.source_row(r)
+        return self.page(r)[r % self.page_size][self.source_col(c)]
+
+    def set_cell(self, r: int, c: int, value: Any) -> None:
+        if not hasattr(self.source, "set_cell"):
+            raise TypeError("The data source is read only.")
+        r, c = self.source_row(r), self.source_col(c)
+        page = r // self.page_size
+        if page in self.pending:
+            # the page may be read from the source before the edit
+            self.wait(page)
+        with self.lock:
+            self.source.set_cell(r, c, value)
+        if (rows := self.pages.get(page)) is not None:
+            try:
+                rows[r % self.page_size][c] = value
+            except TypeError:
+                # the source's rows can't be changed, e.g. tuples
+                del self.pages[page]
+
+    def row(self, r: int) -> list[Any]:
+        r = self.source_row(r)
+        row = self.page(r)[r % self.page_size]
+        return list(row) if self.col_order is None else [row[c] for c in self.col_order]
+
+    def prefetch(self, rows: Iterable[int]) -> None:
+        """
+        Requests the pages of the data rows which aren't loaded and some
+        further pages in the direction the rows have moved in
+        """
+        self.collect()
+        pages = sorted({self.source_row(r) // self.page_size for r in rows if 0 <= r < len(self)})
+        if not pages:
+            return
+        last_page = (len(self) - 1) // self.page_size
+        if self.order is None and self.read_ahead:
+            if pages[0] >= self.viewport_page:
+                pages.extend(range(pages[-1] + 1, min(pages[-1] + self.read_ahead, last_page) + 1))
+            else:
+                pages.extend(range(pages[0] - 1, max(pages[0] - self.read_ahead, 0) - 1, -1))
+        self.viewport_page = pages[0]
+        for page in pages[: self.max_pages]:
+            if page in self.pages:
+                if self.eviction == "lru":
+                    self.pages[page] = self.pages.pop(page)
+            elif page not in self.pending and page not in self.failed:
+                if self.thread is None:
+                    self.start()
+                self.pending.add(page)
+                self.queue.put((self.generation, page))
+
+    def poll(self) -> list[int]:
+        """
+        Stores the pages loaded by the worker thread, returns the data rows
+        of the pages collected since the last poll()
+        If the source raised an exception loading a page it's raised here,
+        the page's cells can't be read until invalidate() is used
+        """
+        self.collect()
+        if self.errors:
+            error = self.errors[0]
+            self.errors = []
+            raise error
+        rows = []
+        for page in self.updated:
+            start = page * self.page_size
+            stop = min(start + self.page_size, self.total_rows)
+            if self.inverse is None:
+                rows.extend(range(start, stop))
+            else:
+                rows.extend(self.inverse[r] for r in range(start, stop))
+        self.updated = []
+        return rows
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self.total_rows = self.source.row_count()
+            self.total_columns = self.source.column_count()
+        self.pages = {}
+        self.pending = set()
+        self.updated = []
+        self.failed = {}
+        self.errors = []
+        self.generation += 1
+
+    def move_rows(self, new_idxs: dict[int, int], old_idxs: dict[int, int]) -> None:
+        super().move_rows(new_idxs, old_idxs)
+        self.inverse = [0] * len(self.order)
+        for data_r, source_r in enumerate(self.order):
+            self.inverse[source_r] = data_r
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "page_size": self.page_size,
+            "max_pages": self.max_pages,
+            "eviction": self.eviction,
+            "pages": len(self.pages),
+            "pending": len(self.pending),
+            **self.counts,
+        }
+
+
+def column_buffer(values: Iterable[Any]) -> tuple[array | list[Any], bytearray | None]:
+    """
+    Returns a column's values and its null mask, the values are stored in an
+    array.array if they are all ints or all floats, Nones are stored as 0 and
+    are marked in the null mask which is None if there are no Nones
+    NumPy arrays and other 1d buffers with an array typecode are copied without
+    converting each value
+    """
+    if isinstance(values, array):
+        return values, None
+    with suppress(TypeError, ValueError):
+        view = memoryview(values)
+        if view.ndim == 1 and len(view.format) == 1 and view.format in "bBhHiIlLqQfd":
+            buffer = array(view.format)
+            buffer.frombytes(view.tobytes())
+            return buffer, None
+    values = list(values)
+    nulls = bytearray(v is None for v in values) if None in values else None
+    types = {type(v) for v in values}
+    types.discard(type(None))
+    if types == {int} or types == {float}:
+        with suppress(OverflowError):
+            return array("q" if types == {int} else "d", (0 if v is None else v for v in values)), nulls
+    return values, None
+
+
+class ColumnarData:
+    """
+    A DataSource which stores the table by column, columns of ints or floats
+    are stored in array.arrays with a null mask instead of as Python objects
+    """
+
+    __slots__ = ("columns", "nulls", "rows")
+
+    def __init__(self, columns: Iterable[Iterable[Any]] = ()) -> None:
+        self.columns = []
+        self.nulls = []
+        self.rows = None
+        for values in columns:
+            buffer, nulls = column_buffer(values)
+            if self.rows is None:
+                self.rows = len(buffer)
+            elif len(buffer) != self.rows:
+                raise ValueError("All columns must have the same number of rows.")
+            self.columns.append(buffer)
+            self.nulls.append(nulls)
+        if self.rows is None:
+            self.rows = 0
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Iterable[Any]]) -> ColumnarData:
+        """
+        Creates a ColumnarData from a list of lists, short rows are padded with None
+        """
+        return cls(zip_longest(*rows))
+
+    def row_count(self) -> int:
+        return self.rows
+
+    def column_count(self) -> int:
+        return len(self.columns)
+
+    def get_cell(self, r: int, c: int) -> Any:
+        if (nulls := self.nulls[c]) is not None and nulls[r]:
+            return None
+        return self.columns[c][r]
+
+    def get_rows(self, start: int, stop: int) -> list[list[Any]]:
+        stop = min(stop, self.rows)
+        columns = []
+        for buffer, nulls in zip(self.columns, self.nulls):
+            values = buffer[start:stop]
+            if isinstance(values, array):
+                values = values.tolist()
+            if nulls is not None:
+                i = nulls.find(1, start, stop)
+                while i != -1:
+                    values[i - start] = None
+                    i = nulls.find(1, i + 1, stop)
+            columns.append(values)
+        return list(map(list, zip(*columns)))
+
+    def set_cell(self, r: int, c: int, value: Any) -> None:
+        buffer, nulls = self.columns[c], self.nulls[c]
+        if isinstance(buffer, array):
+            if value is None:
+                if nulls is None:
+                    nulls = self.nulls[c] = bytearray(self.rows)
+                nulls[r] = 1
+                buffer[r] = 0
+                return
+            if type(value) is (float if buffer.typecode in "fd" else int):
+                with suppress(OverflowError):
+                    buffer[r] = value
+                    if nulls is not None:
+                        nulls[r] = 0
+                    return
+            # the value doesn't fit the column's type
+            buffer = self.columns[c] = self.column(c)
+            self.nulls[c] = None
+        buffer[r] = value
+
+    def column(self, c: int) -> list[Any]:
+        """
+        Returns a column's values as a list
+        """
+        if (nulls := self.nulls[c]) is None:
+            return list(self.columns[c])
+        return [None if null else value for value, null in zip(self.columns[c], nulls)]
+
+    def numeric_column(self, c: int) -> tuple[array, bytearray | None] | None:
+        """
+        Returns a column's array.array and null mask if the column is stored as one
+        """
+        if isinstance(self.columns[c], array):
+            return self.columns[c], self.nulls[c]
+        return None
+
+
+class CSVFileData:
+    """
+    A read-mostly DataSource for a csv file, the file is memory mapped and the
+    byte offset of every row is stored, rows are only parsed when they are used
+    Edits are kept separately and are only written to a file by save()
+    """
+
+    def __init__(
+        self,
+        path: str,
+        delimiter: str = ",",
+        quotechar: str = '"',
+        encoding: str = "utf-8",
+        header: bool = False,
+        columns: int | None = None,
+        background: bool = False,
+        cache_size: int = 1000,
+    ) -> None:
+        self.path = path
+        self.delimiter = delimiter
+        self.quotechar = quotechar
+        self.encoding = encoding
+        self.cache_size = cache_size
+        self.header = []
+        self.columns = columns
+        # the number of rows the number of columns was guessed from, None if it was given
+        self.sampled = None if columns else 0
+        # row -> parsed row, most recently used last
+        self.cache = {}
+        # row -> {column: value}
+        self.edits = {}
+        self.thread = None
+        self.open()
+        if header and self.offsets[-1] < self.size:
+            self.index_rows(rows=1)
+            self.header = self.parse(self.offsets[0], self.offsets[1])[0]
+            self.offsets = array("Q", (self.offsets[1],))
+        if background:
+            # the rows at the start of the file to guess the number of columns from,
+            # a value with a lot of quoted newlines can't hold up the constructor
+            self.index_rows(rows=1000, until=self.indexed + 1_048_576)
+        else:
+            self.index_rows()
+        self.guess_columns()
+        if background and not self.done:
+            self.thread = Thread(target=self.index_rows, daemon=True)
+            self.thread.start()
+
+    def open(self) -> None:
+        with open(self.path, "rb") as file:
+            self.size = os.fstat(file.fileno()).st_size
+            # mmap can't map an empty file, the map stays open after the file is closed
+            self.mm = mmap(file.fileno(), 0, access=ACCESS_READ) if self.size else b""
+        start = 3 if self.mm[:3] == b"\xef\xbb\xbf" else 0
+        # offsets[r] is the start of row r, the last offset is the end of the last indexed row
+        self.offsets = array("Q", (start,))
+        self.indexed = start
+        # whether indexing stopped inside a quoted value
+        self.quoted = False
+        self.cache = {}
+        self.stop = False
+
+    def close(self) -> None:
+        """
+        Stops indexing and closes the memory map of the file
+        """
+        self.stop = True
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if isinstance(self.mm, mmap):
+            self.mm.close()
+
+    def index_rows(self, rows: int | None = None, until: int | None = None) -> None:
+        """
+        Finds the offsets of the file's rows in a single pass, newlines inside
+        quoted values don't end a row
+        rows: stop once there are this many rows
+        until: stop at the first line which ends after this byte offset
+        """
+        mm, offsets = self.mm, self.offsets
+        size = self.size if until is None else min(until, self.size)
+        quote = self.quotechar.encode(self.encoding)
+        pos = self.indexed
+        quoted = self.quoted
+        while pos < size and not self.stop:
+            end = self.size if (nl := mm.find(b"\n", pos)) == -1 else nl + 1
+            if quote and mm.find(quote, pos, end) != -1 and mm[pos:end].count(quote) % 2:
+                quoted = not quoted
+            pos = self.indexed = end
+            if not quoted:
+                offsets.append(pos)
+                if rows is not None and len(offsets) > rows:
+                    break
+        self.quoted = quoted
+
+    def guess_columns(self) -> bool:
+        """
+        If the number of columns wasn't given, sets it to the length of the
+        longest of the first 1000 rows which have been indexed so far
+        Returns True if the number of columns has changed
+        """
+        if self.sampled is None or (self.sampled >= 1000 and self.columns is not None):
+            return False
+        rows = min(1000, self.row_count())
+        columns = max(map(len, self.parse(self.offsets[self.sampled], self.offsets[rows])), default=0)
+        self.sampled = rows
+        if self.columns is None:
+            self.columns = max(columns, len(self.header)) if rows else len(self.header)
+            return True
+        if columns > self.columns:
+            self.columns = columns
+            return True
+        return False
+
+    @property
+    def done(self) -> bool:
+        return self.indexed >= self.size
+
+    def progress(self) -> int:
+        """
+        Returns how much of the file has been indexed as a percentage
+        """
+        return 100 if self.done else int(self.indexed / self.size * 100)
+
+    def parse(self, start: int, stop: int) -> list[list[str]]:
+        return list(
+            csv.reader(
+                StringIO(self.mm[start:stop].decode(self.encoding, errors="replace"), newline=""),
+                delimiter=self.delimiter,
+                quotechar=self.quotechar,
+            )
+        )
+
+    def row_count(self) -> int:
+        return len(self.offsets) - 1
+
+    def column_count(self) -> int:
+        return self.columns
+
+    def get_cell(self, r: int, c: int) -> Any:
+        if (edits := self.edits.get(r)) and c in edits:
+            return edits[c]
+        if r in self.cache:
+            row = self.cache[r] = self.cache.pop(r)
+        else:
+            row = self.cache[r] = self.parse(self.offsets[r], self.offsets[r + 1])[0]
+            if len(self.cache) > self.cache_size:
+                del self.cache[next(iter(self.cache))]
+        return row[c] if c < len(row) else ""
+
+    def get_rows(self, start: int, stop: int) -> list[list[Any]]:
+        rows = []
+        for r, row in enumerate(self.parse(self.offsets[start], self.offsets[stop]), start=start):
+            row = row[: self.columns] if len(row) >= self.columns else row + [""] * (self.columns - len(row))
+            if edits := self.edits.get(r):
+                for c, value in edits.items():
+                    row[c] = value
+            rows.append(row)
+        return rows
+
+    def set_cell(self, r: int, c: int, value: Any) -> None:
+        self.edits.setdefault(r, {})[c] = value
+
+    def save(self, path: str | None = None) -> None:
+        """
+        Writes the rows with any edits to path, if path is None or the same file
+        the original file is replaced and the edits are cleared
+        """
+        if self.thread is not None:
+            self.thread.join()
+        replace = path is None or os.path.abspath(path) == os.path.abspath(self.path)
+        target = f"{self.path}.tmp" if replace else path
+        with open(target, "w", newline="", encoding=self.encoding) as f:
+            writer = csv.writer(f, delimiter=self.delimiter, quotechar=self.quotechar)
+            if self.header:
+                writer.writerow(self.header)
+            for start in range(0, self.row_count(), 10_000):
+                writer.writerows(self.get_rows(start, min(start + 10_000, self.row_count())))
+        if replace:
+            self.close()
+            os.replace(target, self.path)
+            self.open()
+            self.edits = {}
+            if self.header:
+                self.index_rows(rows=1)
+                self.offsets = array("Q", (self.offsets[1],))
+            self.index_rows()
@@ -5,10 +5,12 @@ import csv
 import io
 import re
 import tkinter as tk
+from array import array
 from bisect import bisect_left
 from collections import deque
 from collections.abc import Callable, Generator, Hashable, Iterable, Iterator, Sequence
 from difflib import SequenceMatcher
+from functools import partial
 from itertools import chain, islice, repeat
 from types import ModuleType
 from typing import Any, Literal
@@ -17,6 +19,7 @@ from .colors import color_map
 from .constants import align_value_error, symbols_set
 from .formatters import to_bool
 from .other_classes import DotDict, EventDataDict, Highlight, Loc, Span
+from .positions import Positions
 
 ORD_A = ord("A")
 
@@ -483,6 +486,17 @@ def bisect_in(sorted_seq: Sequence[int], num: int) -> bool:
         return False
 
 
+def displayed_index(displayed: Sequence[int], total: int) -> array:
+    """
+    The inverse of a sorted list of displayed indexes, the displayed
+    index of each data index or -1 if it isn't displayed
+    """
+    idxs = array("q", (-1,)) * max(total, displayed[-1] + 1 if displayed else 0)
+    for i, e in enumerate(displayed):
+        idxs[e] = i
+    return idxs
+
+
 def push_n(num: int, sorted_seq: Sequence[int]) -> int:
     if num < sorted_seq[0]:
         return num
@@ -830,19 +844,21 @@ def index_exists(seq: Sequence[Any], index: int) -> bool:
         return False
 
 
-def add_to_displayed(displayed: list[int], to_add: Iterable[int]) -> list[int]:
+def add_to_displayed(displayed: list[int] | array, to_add: Iterable[int]) -> list[int] | array:
     # assumes to_add is sorted
+    seq = partial(array, displayed.typecode) if isinstance(displayed, array) else list
     for i in to_add:
         ins = bisect_left(displayed, i)
-        displayed[ins:] = [i] + [e + 1 for e in islice(displayed, ins, None)]
+        displayed[ins:] = seq(chain((i,), map((1).__add__, islice(displayed, ins, None))))
     return displayed
 
 
-def push_displayed(displayed: list[int], to_add: Iterable[int]) -> list[int]:
+def push_displayed(displayed: list[int] | array, to_add: Iterable[int]) -> list[int] | array:
     # assumes to_add is sorted
+    seq = partial(array, displayed.typecode) if isinstance(displayed, array) else list
     for i in to_add:
         ins = bisect_left(displayed, i)
-        displayed[ins:] = [e + 1 for e in islice(displayed, ins, None)]
+        displayed[ins:] = seq(map((1).__add__, islice(displayed, ins, None)))
     return displayed
 
 
@@ -913,6 +929,41 @@ def any_editor_or_dropdown_open(MT) -> bool:
     )
 
 
+def release_drawn_items(canvas: tk.Canvas, items: Iterable[tuple[str, int]]) -> None:
+    """
+    Moves drawn canvas items back into the canvas' hidden item storage
+    items are (item type, canvas item id) e.g. ("text", 5)
+    the items stay showing until they are reused or hidden
+    """
+    for kind, iid in items:
+        if kind == "corners":
+            canvas.disp_corners.discard(iid)
+            canvas.hidd_corners.add(iid)
+        elif (showing := getattr(canvas, f"disp_{kind}").pop(iid, None)) is not None:
+            getattr(canvas, f"hidd_{kind}")[iid] = showing
+
+
+def scroll_overlap(
+    prev: tuple[int, list[float], list[int] | None],
+    now: tuple[int, list[float], list[int] | None],
+) -> range:
+    """
+    prev and now are (first visible index, visible positions, visible displayed indexes or None)
+    for either rows or columns, before and after scrolling
+    Returns the visible indexes of both views which have unchanged positions and data indexes
+    """
+    start = max(prev[0], now[0])
+    stop = min(prev[0] + len(prev[1]), now[0] + len(now[1])) - 1
+    if (
+        start >= stop
+        or prev[1][start - prev[0] : stop - prev[0] + 1] != now[1][start - now[0] : stop - now[0] + 1]
+        or (prev[2] is None) is not (now[2] is None)
+        or (prev[2] is not None and prev[2][start - prev[0] : stop - prev[0]] != now[2][start - now[0] : stop - now[0]])
+    ):
+        return range(0)
+    return range(start, stop)
+
+
 def get_new_indexes(
     move_to: int,
     to_move: Iterable[int],
@@ -957,14 +1008,14 @@ def insert_items(
 
 def data_to_displayed_idxs(
     to_convert: list[int],
-    displayed: list[int],
+    displayed: list[int] | array,
 ) -> list[int]:
     return [i for i, e in enumerate(displayed) if bisect_in(to_convert, e)]
 
 
 def displayed_to_data_idxs(
     to_convert: list[int],
-    displayed: list[int],
+    displayed: list[int] | array,
 ) -> list[int]:
     return [displayed[e] for e in to_convert]
 
@@ -1171,6 +1222,20 @@ def options_with_key(
     return (k for k, dct in options.items() if key in dct)
 
 
+def merged_options(cell: dict | None, row: dict | None, col: dict | None, ranged: dict | None) -> dict:
+    """
+    A cell's options for every key, cell options take priority over range options,
+    range options over row options and row options over column options
+    the returned dict may be one of the given dicts and must not be modified
+    """
+    options = {**col, **row} if row and col else row or col or {}
+    if ranged:
+        options = {**options, **ranged}
+    if cell:
+        return {**options, **cell} if options else cell
+    return options
+
+
 def try_binding(
     binding: None | Callable,
     event: dict,
@@ -1817,6 +1882,19 @@ def pop_positions(
             yield pos
 
 
+def pop_uniform_positions(
+    positions: Positions,
+    to_pop: dict[int, int],  # displayed index: data index
+    save_to: dict[int, int],
+    default: float,
+) -> None:
+    for i in sorted(to_pop, reverse=True):
+        if i < positions.n:
+            if (size := positions.size(i)) != default:
+                save_to[to_pop[i]] = size
+            positions.delete_sizes(i)
+
+
 def get_horizontal_gridline_points(
     left: float,
     stop: float,
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import csv as csv
 import io
+import json
 import tkinter as tk
+from array import array
 from bisect import bisect_left, bisect_right
 from collections import defaultdict, deque
-from collections.abc import Callable, Generator, Hashable, Iterator, Sequence
+from collections.abc import Callable, Generator, Hashable, Iterable, Iterator, Mapping, Sequence
+from contextlib import suppress
 from functools import partial
 from itertools import accumulate, chain, filterfalse, islice, repeat
 from operator import itemgetter
@@ -13,10 +16,11 @@ from re import IGNORECASE, escape, sub
 from tkinter import TclError
 from typing import Any, Literal
 
-from .colors import color_map
 from .column_headers import ColumnHeaders
 from .constants import (
     USER_OS,
+    _measure_chars_tcl,
+    _preload_chars,
     _test_str,
     bind_add_columns,
     bind_add_rows,
@@ -29,6 +33,7 @@ from .constants import (
     text_editor_to_unbind,
     val_modifying_options,
 )
+from .data_sources import CSVFileData, DataSource, PagedData, VirtualData
 from .find_window import FindWindow, replacer
 from .formatters import (
     data_to_str,
@@ -42,15 +47,14 @@ from .functions import (
     add_to_displayed,
     any_editor_or_dropdown_open,
     b_index,
-    bisect_in,
     box_gen_coords,
     box_is_single_cell,
     cell_down_within_box,
     cell_right_within_box,
-    color_tup,
     consecutive_ranges,
     data_to_displayed_idxs,
     diff_gen,
+    displayed_index,
     estimate_max_visible_cells,
     event_dict,
     event_has_char_key,
@@ -72,6 +76,7 @@ from .functions import (
     is_last_cell,
     is_type_int,
     len_to_idx,
+    merged_options,
     mod_event_val,
     mod_span,
     move_elements_by_mapping_gen,
@@ -80,8 +85,10 @@ from .functions import (
     next_cell,
     push_n,
     recursive_bind,
+    release_drawn_items,
     rounded_box_coords,
     safe_copy,
+    scroll_overlap,
     span_idxs_post_move,
     stored_event_dict,
     try_binding,
@@ -89,10 +96,14 @@ from .functions import (
     wrap_text,
 )
 from .menus import build_empty_rc_menu, build_header_rc_menu, build_index_rc_menu, build_table_rc_menu
+from .option_store import NamedSpans, OptionStore, RangeOptions
 from .other_classes import (
     Box_nt,
     Box_st,
     Box_t,
+    ColorCache,
+    DirtyCells,
+    DisplayStringCache,
     DropdownStorage,
     EditorStorageBase,
     EventDataDict,
@@ -102,8 +113,11 @@ from .other_classes import (
     ProgressBar,
     Selected,
     SelectionBox,
+    SelectionIntervals,
     TextEditorStorage,
+    TextLayoutCache,
 )
+from .positions import Positions
 from .row_index import RowIndex
 from .sorting import sort_selection
 from .text_editor import TextEditor
@@ -189,12 +203,23 @@ class MainTable(tk.Canvas):
         self.hidd_dropdown = {}
         self.hidd_checkbox = {}
         self.hidd_corners = set()
+        # (displayed row, displayed column): [(item type, canvas item id), ...]
+        self.drawn_cells = {}
+        self.drawn_viewport = None
+        self.redraw_frame = {}
+        self.dirty = DirtyCells()
+        self.color_cache = ColorCache()
+        # canvas commands collected during a redraw when using the batched_redraw option
+        self.tcl_batch = None
 
         self.selection_boxes: dict[int, SelectionBox] = {}
+        # all_states: (selection box tuples, SelectionIntervals) reused while boxes are unchanged
+        self.redraw_selections = {}
         self.selected = ()
         self.named_spans = {}
         self.reset_tags()
         self.cell_options = {}
+        self.range_options = RangeOptions()
         self.col_options = {}
         self.row_options = {}
         self.purge_undo_and_redo_stack()
@@ -331,14 +356,20 @@ class MainTable(tk.Canvas):
         self.RI.set_width(self.PAR.ops.default_row_index_width)
 
         self.char_widths = {}
+        # the contents of the char_widths_file option's file, loaded when first needed
+        self.char_widths_file_data = None
+        self.paged_data_poll_id = None
+        # shared by the table, index and header
+        self.text_layouts = TextLayoutCache(self.PAR.ops.text_layout_cache_size)
+        self.display_strings = DisplayStringCache(self.PAR.ops.display_string_cache_size)
         self.set_table_font_help()
         self.set_header_font_help()
         self.set_index_font_help()
 
         self.data = kwargs["data_reference"]
-        if isinstance(self.data, (list, tuple)):
-            self.data = kwargs["data_reference"]
-        else:
+        if isinstance(self.data, DataSource):
+            self.data = VirtualData(self.data)
+        elif not isinstance(self.data, (list, tuple, VirtualData)):
             self.data = []
         if not self.data and (
             isinstance(kwargs["total_rows"], int)
@@ -705,21 +736,27 @@ class MainTable(tk.Canvas):
                     for box in self.selection_boxes.values()
                 )
             )
+            rows_idx = None if tree else self.displayed_rows_index()
+            cols_idx = self.displayed_columns_index()
         else:
+            totalrows = self.total_data_rows(include_index=False)
+            totalcols = self.total_data_cols(include_header=False)
             iterable = box_gen_coords(
                 from_r=0,
                 from_c=0,
-                upto_r=self.total_data_rows(include_index=False),
-                upto_c=self.total_data_cols(include_header=False),
+                upto_r=totalrows,
+                upto_c=totalcols,
                 start_r=0,
                 start_c=0,
                 reverse=False,
             )
+            rows_idx = None if tree else self.displayed_rows_index(total=totalrows)
+            cols_idx = self.displayed_columns_index(total=totalcols)
         for r, c in iterable:
-            m = self.find_match(find, r, c)
-            if m and (
-                (tree or self.all_rows_displayed or bisect_in(self.displayed_rows, r))
-                and (self.all_columns_displayed or bisect_in(self.displayed_columns, c))
+            if (
+                (rows_idx is None or rows_idx[r] != -1)
+                and (cols_idx is None or cols_idx[c] != -1)
+                and self.find_match(find, r, c)
             ):
                 current = f"{self.get_cell_data(r, c, True)}"
                 new = sub(escape(find), replacer(find, replace, current), current, flags=IGNORECASE)
@@ -802,14 +839,15 @@ class MainTable(tk.Canvas):
             displayed_cols=self.displayed_columns,
             no_wrap=True,
         )
+        rows_idx, cols_idx = self.displayed_rows_index(), self.displayed_columns_index()
         if stop:
             for r, c in iterable:
                 if (r, c) == stop:
                     return None
                 elif (
-                    self.find_match(find, r, c)  # will not show hidden rows
-                    and (self.all_rows_displayed or bisect_in(self.displayed_rows, r))
-                    and (self.all_columns_displayed or bisect_in(self.displayed_columns, c))
+                    (rows_idx is None or rows_idx[r] != -1)  # will not show hidden rows
+                    and (cols_idx is None or cols_idx[c] != -1)
+                    and self.find_match(find, r, c)
                 ):
                     return (r, c, current_box.fill_iid)
         else:
@@ -818,9 +856,9 @@ class MainTable(tk.Canvas):
                     (r, c, current_box.fill_iid)
                     for r, c in iterable
                     if (
-                        self.find_match(find, r, c)  # will not show hidden rows
-                        and (self.all_rows_displayed or bisect_in(self.displayed_rows, r))
-                        and (self.all_columns_displayed or bisect_in(self.displayed_columns, c))
+                        (rows_idx is None or rows_idx[r] != -1)  # will not show hidden rows
+                        and (cols_idx is None or cols_idx[c] != -1)
+                        and self.find_match(find, r, c)
                     )
                 ),
                 None,
@@ -835,6 +873,7 @@ class MainTable(tk.Canvas):
             displayed_rows=self.displayed_rows,
             displayed_cols=self.displayed_columns,
         )
+        rows_idx, cols_idx = self.displayed_rows_index(), self.displayed_columns_index()
         if reverse:
             # iterate backwards through selection boxes from the box before current
             idx = next(i for i, k in enumerate(reversed(self.selection_boxes)) if k == current_id)
@@ -847,9 +886,9 @@ class MainTable(tk.Canvas):
                     )
                     for r, c in fn(*box.coords, box.coords.upto_r - 1, box.coords.upto_c - 1)
                     if (
-                        self.find_match(find, r, c)  # will not show hidden rows
-                        and (self.all_rows_displayed or bisect_in(self.displayed_rows, r))
-                        and (self.all_columns_displayed or bisect_in(self.displayed_columns, c))
+                        (rows_idx is None or rows_idx[r] != -1)  # will not show hidden rows
+                        and (cols_idx is None or cols_idx[c] != -1)
+                        and self.find_match(find, r, c)
                     )
                 ),
                 None,
@@ -866,9 +905,9 @@ class MainTable(tk.Canvas):
                     )
                     for r, c in fn(*box.coords, box.coords.from_r, box.coords.from_c)
                     if (
-                        self.find_match(find, r, c)
-                        and (self.all_rows_displayed or bisect_in(self.displayed_rows, r))
-                        and (self.all_columns_displayed or bisect_in(self.displayed_columns, c))
+                        (rows_idx is None or rows_idx[r] != -1)
+                        and (cols_idx is None or cols_idx[c] != -1)
+                        and self.find_match(find, r, c)
                     )
                 ),
                 None,
@@ -912,6 +951,8 @@ class MainTable(tk.Canvas):
             )
         else:
             start_r, start_c = 0, 0
+        rows_idx = None if tree else self.displayed_rows_index(total=totalrows)
+        cols_idx = self.displayed_columns_index(total=totalcols)
         return next(
             (
                 (r, c, None)
@@ -925,9 +966,9 @@ class MainTable(tk.Canvas):
                     reverse=reverse,
                 )
                 if (
-                    self.find_match(find, r, c)
-                    and (tree or self.all_rows_displayed or bisect_in(self.displayed_rows, r))
-                    and (self.all_columns_displayed or bisect_in(self.displayed_columns, c))
+                    (rows_idx is None or rows_idx[r] != -1)
+                    and (cols_idx is None or cols_idx[c] != -1)
+                    and self.find_match(find, r, c)
                 )
             ),
             None,
@@ -1251,16 +1292,18 @@ class MainTable(tk.Canvas):
         return event_data
 
     def ctrl_v(self, event: Any = None, validation: bool = True) -> None | EventDataDict:
-        if not self.PAR.ops.paste_can_expand_x and len(self.col_positions) == 1:
+        expand_x = self.PAR.ops.paste_can_expand_x and self.resize_data_enabled()
+        expand_y = self.PAR.ops.paste_can_expand_y and self.resize_data_enabled()
+        if not expand_x and len(self.col_positions) == 1:
             return
-        if not self.PAR.ops.paste_can_expand_y and len(self.row_positions) == 1:
+        if not expand_y and len(self.row_positions) == 1:
             return
         event_data = self.new_event_dict("edit_table", state=True)
         if self.selected:
             selected_r = self.selected.box.from_r
             selected_c = self.selected.box.from_c
             curr_coords = (self.selected.row, self.selected.column)
-        elif not self.selected and not self.PAR.ops.paste_can_expand_x and not self.PAR.ops.paste_can_expand_y:
+        elif not self.selected and not expand_x and not expand_y:
             return
         else:
             if not self.data:
@@ -1309,15 +1352,15 @@ class MainTable(tk.Canvas):
         added_rows = 0
         added_cols = 0
         total_data_cols = None
-        if self.PAR.ops.paste_can_expand_x and selected_c + new_data_numcols > len(self.col_positions) - 1:
-            total_data_cols = self.equalize_data_row_lengths()
+        if expand_x and selected_c + new_data_numcols > len(self.col_positions) - 1:
+            total_data_cols = self.logical_data_cols()
             added_cols = selected_c + new_data_numcols - len(self.col_positions) + 1
             if (
                 isinstance(self.PAR.ops.paste_insert_column_limit, int)
                 and self.PAR.ops.paste_insert_column_limit < len(self.col_positions) - 1 + added_cols
             ):
                 added_cols = self.PAR.ops.paste_insert_column_limit - len(self.col_positions) - 1
-        if self.PAR.ops.paste_can_expand_y and selected_r + new_data_numrows > len(self.row_positions) - 1:
+        if expand_y and selected_r + new_data_numrows > len(self.row_positions) - 1:
             added_rows = selected_r + new_data_numrows - len(self.row_positions) + 1
             if (
                 isinstance(self.PAR.ops.paste_insert_row_limit, int)
@@ -1433,10 +1476,7 @@ class MainTable(tk.Canvas):
                 columns=added_cols,
             )
             # only add the extra rows if expand_y is allowed
-            if self.PAR.ops.paste_can_expand_x and self.PAR.ops.paste_can_expand_y:
-                endrow = selected_r + new_data_numrows
-            else:
-                endrow = selected_r + adjusted_new_data_numrows
+            endrow = selected_r + (new_data_numrows if expand_x and expand_y else adjusted_new_data_numrows)
             for ndr, r in enumerate(
                 range(
                     selected_r,
@@ -1579,7 +1619,7 @@ class MainTable(tk.Canvas):
         fix_len = (move_to - 1) if move_to else move_to
         if not self.all_columns_displayed and not data_indexes:
             fix_len = self.datacn(fix_len)
-        totalcols = self.equalize_data_row_lengths(at_least_cols=fix_len)
+        totalcols = self.logical_data_cols(at_least_cols=fix_len)
         if not self.all_columns_displayed and not data_indexes:
             keep = set(map(self.datacn, to_move))
             data_new_idxs = {
@@ -1616,7 +1656,7 @@ class MainTable(tk.Canvas):
                 "displayed": {} if disp_new_idxs is None else disp_new_idxs,
             }
         event_data["options"] = self.copy_options()
-        event_data["named_spans"] = {k: span.copy_self() for k, span in self.named_spans.items()}
+        event_data["named_spans"] = self.named_spans.copy()
 
         if move_widths and disp_new_idxs:
             self.set_col_positions(
@@ -1650,9 +1690,25 @@ class MainTable(tk.Canvas):
                 totalcols = max(data_new_idxs.values(), default=0)
                 if totalcols:
                     totalcols += 1
-                totalcols = self.equalize_data_row_lengths(at_least_cols=totalcols)
+                totalcols = self.logical_data_cols(at_least_cols=totalcols)
 
-            self.data = [move_fast(k, data_new_idxs, data_old_idxs) for k in self.data]
+            if isinstance(self.data, VirtualData):
+                self.data.move_columns(data_new_idxs, data_old_idxs)
+            else:
+                # rows which end before the first moved column are unchanged
+                # other rows are only given cells up to the last moved column
+                idxs = tuple(chain(data_new_idxs, data_new_idxs.values()))
+                start, end = min(idxs, default=0), max(idxs, default=-1) + 1
+                self.data = [
+                    move_fast(
+                        row if len(row) >= end else [*row, *self.gen_empty_row_seq(rn, end=end, start=len(row))],
+                        data_new_idxs,
+                        data_old_idxs,
+                    )
+                    if len(row) > start
+                    else row
+                    for rn, row in enumerate(self.data)
+                ]
             maxidx = len_to_idx(totalcols)
             self.CH.fix_header(maxidx)
             if isinstance(self._headers, list) and self._headers:
@@ -1664,25 +1720,24 @@ class MainTable(tk.Canvas):
                 old_idxs=data_old_idxs,
                 get_inverse=True,
             )
-            self.tagged_cells = {
-                tags: {(k[0], full_new_idxs[k[1]]) for k in tagged} for tags, tagged in self.tagged_cells.items()
-            }
+            for tagged in self.tagged_cells.values():
+                tagged.move_keys(full_new_idxs, axis=1)
             self.cell_options = {(k[0], full_new_idxs[k[1]]): v for k, v in self.cell_options.items()}
+            self.range_options.move_keys(full_new_idxs, axis=1)
             self.progress_bars = {(k[0], full_new_idxs[k[1]]): v for k, v in self.progress_bars.items()}
             self.col_options = {full_new_idxs[k]: v for k, v in self.col_options.items()}
-            self.tagged_columns = {
-                tags: {full_new_idxs[k] for k in tagged} for tags, tagged in self.tagged_columns.items()
-            }
+            for tagged in self.tagged_columns.values():
+                tagged.move_keys(full_new_idxs)
             self.CH.cell_options = {full_new_idxs[k]: v for k, v in self.CH.cell_options.items()}
             self.displayed_columns = sorted(full_new_idxs[k] for k in self.displayed_columns)
             if self.named_spans:
                 totalrows = self.total_data_rows()
                 new_ops = self.PAR.create_options_from_span
                 qkspan = self.span()
-                for span in self.named_spans.values():
-                    # span is neither a cell options nor col options span, continue
-                    if not isinstance(span["from_c"], int):
-                        continue
+                # only spans overlapping the moved columns can change
+                moved = tuple(chain(data_new_idxs, data_new_idxs.values()))
+                for name in self.named_spans.overlapping(min(moved, default=0), max(moved, default=-1) + 1, axis="c"):
+                    span = self.named_spans[name]
                     oldupto_colrange, newupto_colrange, newfrom, newupto = span_idxs_post_move(
                         data_new_idxs,
                         full_new_idxs,
@@ -1766,25 +1821,30 @@ class MainTable(tk.Canvas):
                             # span is for cell options
                             else:
                                 rng_upto_r = totalrows if span["upto_r"] is None else span["upto_r"]
+                                self.range_options.delete(
+                                    span["type_"], span["from_r"], full_new_idxs[k], rng_upto_r, full_new_idxs[k] + 1
+                                )
                                 for r in range(span["from_r"], rng_upto_r):
                                     if (r, full_new_idxs[k]) in self.cell_options and span[
                                         "type_"
                                     ] in self.cell_options[(r, full_new_idxs[k])]:
                                         del self.cell_options[(r, full_new_idxs[k])][span["type_"]]
                     # finally, change the span coords
+                    self.named_spans.unshare(name)
                     span["from_c"], span["upto_c"] = newfrom, newupto
+                self.named_spans.changed("c")
         return data_new_idxs, disp_new_idxs, event_data
 
     def get_max_column_idx(self, maxidx: int | None = None) -> int:
         if maxidx is None:
             maxidx = len_to_idx(self.total_data_cols())
-        maxiget = partial(max, key=itemgetter(1))
         return max(
             max(self.cell_options, key=itemgetter(1), default=(0, maxidx))[1],
+            self.range_options.max_column(maxidx),
             max(self.col_options, default=maxidx),
             max(self.CH.cell_options, default=maxidx),
-            maxiget(map(maxiget, self.tagged_cells.values()), default=(0, maxidx))[1],
-            max(map(max, self.tagged_columns.values()), default=maxidx),
+            max((tagged.max_column(maxidx) for tagged in self.tagged_cells.values()), default=maxidx),
+            max((tagged.last(maxidx) for tagged in self.tagged_columns.values()), default=maxidx),
             max((d.from_c for d in self.named_spans.values() if isinstance(d.from_c, int)), default=maxidx),
             max((d.upto_c for d in self.named_spans.values() if isinstance(d.upto_c, int)), default=maxidx),
             self.displayed_columns[-1] if self.displayed_columns else maxidx,
@@ -1836,11 +1896,14 @@ class MainTable(tk.Canvas):
         data_old_idxs: dict[int, int],
         maxidx: int,
     ) -> None:
-        self.data = move_fast(
-            self.data,
-            data_new_idxs,
-            data_old_idxs,
-        )
+        if isinstance(self.data, VirtualData):
+            self.data.move_rows(data_new_idxs, data_old_idxs)
+        else:
+            self.data = move_fast(
+                self.data,
+                data_new_idxs,
+                data_old_idxs,
+            )
         self.RI.fix_index(maxidx)
         if isinstance(self._row_index, list) and self._row_index:
             self._row_index = move_fast(self._row_index, data_new_idxs, data_old_idxs)
@@ -1875,7 +1938,7 @@ class MainTable(tk.Canvas):
                 "displayed": {} if disp_new_idxs is None else disp_new_idxs,
             }
         event_data["options"] = self.copy_options()
-        event_data["named_spans"] = {k: span.copy_self() for k, span in self.named_spans.items()}
+        event_data["named_spans"] = self.named_spans.copy()
 
         if move_data:
             maxidx = len_to_idx(totalrows)
@@ -1904,12 +1967,13 @@ class MainTable(tk.Canvas):
                 old_idxs=data_old_idxs,
                 get_inverse=True,
             )
-            self.tagged_cells = {
-                tags: {(full_new_idxs[k[0]], k[1]) for k in tagged} for tags, tagged in self.tagged_cells.items()
-            }
+            for tagged in self.tagged_cells.values():
+                tagged.move_keys(full_new_idxs)
             self.cell_options = {(full_new_idxs[k[0]], k[1]): v for k, v in self.cell_options.items()}
+            self.range_options.move_keys(full_new_idxs)
             self.progress_bars = {(full_new_idxs[k[0]], k[1]): v for k, v in self.progress_bars.items()}
-            self.tagged_rows = {tags: {full_new_idxs[k] for k in tagged} for tags, tagged in self.tagged_rows.items()}
+            for tagged in self.tagged_rows.values():
+                tagged.move_keys(full_new_idxs)
             self.row_options = {full_new_idxs[k]: v for k, v in self.row_options.items()}
             self.RI.cell_options = {full_new_idxs[k]: v for k, v in self.RI.cell_options.items()}
             self.RI.rns = {v: full_new_idxs[k] for v, k in self.RI.rns.items()}
@@ -1921,10 +1985,10 @@ class MainTable(tk.Canvas):
                 totalcols = self.total_data_cols()
                 new_ops = self.PAR.create_options_from_span
                 qkspan = self.span()
-                for span in self.named_spans.values():
-                    # span is neither a cell options nor row options span, continue
-                    if not isinstance(span["from_r"], int):
-                        continue
+                # only spans overlapping the moved rows can change
+                moved = tuple(chain(data_new_idxs, data_new_idxs.values()))
+                for name in self.named_spans.overlapping(min(moved, default=0), max(moved, default=-1) + 1):
+                    span = self.named_spans[name]
                     oldupto_rowrange, newupto_rowrange, newfrom, newupto = span_idxs_post_move(
                         data_new_idxs,
                         full_new_idxs,
@@ -2008,13 +2072,18 @@ class MainTable(tk.Canvas):
                             # span is for cell options
                             else:
                                 rng_upto_c = totalcols if span["upto_c"] is None else span["upto_c"]
+                                self.range_options.delete(
+                                    span["type_"], full_new_idxs[k], span["from_c"], full_new_idxs[k] + 1, rng_upto_c
+                                )
                                 for c in range(span["from_c"], rng_upto_c):
                                     if (full_new_idxs[k], c) in self.cell_options and span[
                                         "type_"
                                     ] in self.cell_options[(full_new_idxs[k], c)]:
                                         del self.cell_options[(full_new_idxs[k], c)][span["type_"]]
                     # finally, change the span coords
+                    self.named_spans.unshare(name)
                     span["from_r"], span["upto_r"] = newfrom, newupto
+                self.named_spans.changed("r")
 
         if not undo_modification and create_selections and self.PAR.ops.treeview:
             self.PAR.selection_set(*[self._row_index[k].iid for k in data_new_idxs.values()])
@@ -2051,13 +2120,13 @@ class MainTable(tk.Canvas):
     def get_max_row_idx(self, maxidx: int | None = None) -> int:
         if maxidx is None:
             maxidx = len_to_idx(self.total_data_rows())
-        maxiget = partial(max, key=itemgetter(0))
         return max(
             max(self.cell_options, key=itemgetter(0), default=(maxidx, 0))[0],
+            self.range_options.max_row(maxidx),
             max(self.row_options, default=maxidx),
             max(self.RI.cell_options, default=maxidx),
-            maxiget(map(maxiget, self.tagged_cells.values()), default=(maxidx, 0))[0],
-            max(map(max, self.tagged_rows.values()), default=maxidx),
+            max((tagged.max_row(maxidx) for tagged in self.tagged_cells.values()), default=maxidx),
+            max((tagged.last(maxidx) for tagged in self.tagged_rows.values()), default=maxidx),
             max((d.from_r for d in self.named_spans.values() if isinstance(d.from_r, int)), default=maxidx),
             max((d.upto_r for d in self.named_spans.values() if isinstance(d.upto_r, int)), default=maxidx),
             self.displayed_rows[-1] if self.displayed_rows else maxidx,
@@ -2162,6 +2231,8 @@ class MainTable(tk.Canvas):
     def restore_sheet_state(self, modification: EventDataDict) -> None:
         if "cell_options" in modification["options"]:
             self.cell_options = modification["options"]["cell_options"]
+        if "range_options" in modification["options"]:
+            self.range_options = modification["options"]["range_options"]
         if "column_options" in modification["options"]:
             self.col_options = modification["options"]["column_options"]
         if "row_options" in modification["options"]:
@@ -2206,7 +2277,7 @@ class MainTable(tk.Canvas):
                 event_data = self.RI.rename_iid(new, old, event_data=event_data)
 
         if modification["moved"]["columns"]:
-            totalcols = max(self.equalize_data_row_lengths(), max(modification["moved"]["columns"]["data"].values()))
+            totalcols = max(self.logical_data_cols(), max(modification["moved"]["columns"]["data"].values()))
             data_new_idxs, disp_new_idxs, event_data = self.move_columns_adjust_options_dict(
                 data_new_idxs=dict(
                     zip(
@@ -3012,6 +3083,10 @@ class MainTable(tk.Canvas):
             and any(x in self.enabled_bindings_menu_entries for x in ("all", "edit_cell", "edit_bindings", "edit"))
         )
 
+    def resize_data_enabled(self) -> bool:
+        # a data source has a fixed number of rows and columns
+        return not isinstance(self.data, VirtualData)
+
     def index_edit_cell_enabled(self) -> bool:
         return (
             self.rc_popup_menus_enabled
@@ -3368,6 +3443,7 @@ class MainTable(tk.Canvas):
     def is_readonly(self, datarn: int, datacn: int) -> bool:
         return (
             ((datarn, datacn) in self.cell_options and "readonly" in self.cell_options[(datarn, datacn)])
+            or (self.range_options and self.range_options.value(datarn, datacn, "readonly"))
             or (datarn in self.row_options and "readonly" in self.row_options[datarn])
             or (datacn in self.col_options and "readonly" in self.col_options[datacn])
         )
@@ -3387,12 +3463,7 @@ class MainTable(tk.Canvas):
             r1, c1, r2, c2 = box.coords
             for r in range(r1, r2):
                 for c in range(c1, c2):
-                    datarn, datacn = self.datarn(r), self.datacn(c)
-                    if not (
-                        ((datarn, datacn) in self.cell_options and "readonly" in self.cell_options[(datarn, datacn)])
-                        or (datarn in self.row_options and "readonly" in self.row_options[datarn])
-                        or (datacn in self.col_options and "readonly" in self.col_options[datacn])
-                    ):
+                    if not self.is_readonly(self.datarn(r), self.datacn(c)):
                         return False
         return True
 
@@ -3625,7 +3696,7 @@ class MainTable(tk.Canvas):
             if self.scroll_if_event_offscreen(event):
                 need_redraw = True
             if need_redraw:
-                self.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=True, redraw_table=True)
+                self.redraw_after_input(redraw_header=True, redraw_row_index=True)
         try_binding(self.extra_b1_motion_func, event)
 
     def ctrl_b1_motion(self, event: Any) -> None:
@@ -3750,7 +3821,7 @@ class MainTable(tk.Canvas):
             y2 = self.canvasy(y)
         elif y is None:
             y2 = self.canvasy(event.y)
-        r = bisect_left(self.row_positions, y2)
+        r = self.row_positions.bisect_left(y2)
         if r != 0:
             r -= 1
         if not allow_end and r >= len(self.row_positions) - 1:
@@ -3762,7 +3833,7 @@ class MainTable(tk.Canvas):
             x2 = self.canvasx(x)
         elif x is None:
             x2 = self.canvasx(event.x)
-        c = bisect_left(self.col_positions, x2)
+        c = self.col_positions.bisect_left(x2)
         if c != 0:
             c -= 1
         if not allow_end and c >= len(self.col_positions) - 1:
@@ -3858,7 +3929,7 @@ class MainTable(tk.Canvas):
         self.xview(*args)
         if self.show_header:
             self.CH.xview(*args)
-        self.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=False)
+        self.redraw_after_input(redraw_header=True, redraw_row_index=False, scrolled=True)
         if move_synced:
             self.x_move_synced_scrolls(*args, use_scrollbar=True)
 
@@ -3866,10 +3937,39 @@ class MainTable(tk.Canvas):
         self.yview(*args)
         if self.show_index:
             self.RI.yview(*args)
-        self.main_table_redraw_grid_and_text(redraw_header=False, redraw_row_index=True)
+        self.redraw_after_input(redraw_header=False, redraw_row_index=True, scrolled=True)
         if move_synced:
             self.y_move_synced_scrolls(*args, use_scrollbar=True)
 
+    def redraw_after_input(
+        self,
+        redraw_header: bool,
+        redraw_row_index: bool,
+        redraw_table: bool = True,
+        scrolled: bool = False,
+    ) -> None:
+        """
+        Redraws after mouse and scroll bar events, when the max_redraw_fps
+        option is set the redraw is scheduled instead so that bursts of
+        events only cause one redraw per frame, using the latest view
+        """
+        if self.PAR.ops.max_redraw_fps > 0:
+            if not scrolled:
+                self.dirty.all = True
+            self.PAR.schedule_redraw(
+                table=redraw_table,
+                index=redraw_row_index,
+                header=redraw_header,
+                scrolled=scrolled,
+            )
+        else:
+            self.main_table_redraw_grid_and_text(
+                redraw_header=redraw_header,
+                redraw_row_index=redraw_row_index,
+                redraw_table=redraw_table,
+                scrolled=scrolled,
+            )
+
     def set_xviews(
         self,
         *args: Any,
@@ -3925,7 +4025,7 @@ class MainTable(tk.Canvas):
             self.yview_scroll(-1, "units")
             self.RI.yview_scroll(-1, "units")
             self.y_move_synced_scrolls("moveto", self.yview()[0])
-        self.main_table_redraw_grid_and_text(redraw_header=False, redraw_row_index=True)
+        self.redraw_after_input(redraw_header=False, redraw_row_index=True, scrolled=True)
 
     def shift_mousewheel(self, event: Any) -> None:
         if event.delta < 0 or event.num == 5:
@@ -3938,7 +4038,7 @@ class MainTable(tk.Canvas):
             self.xview_scroll(-1, "units")
             self.CH.xview_scroll(-1, "units")
             self.x_move_synced_scrolls("moveto", self.xview()[0])
-        self.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=False)
+        self.redraw_after_input(redraw_header=True, redraw_row_index=False, scrolled=True)
 
     def ctrl_mousewheel(self, event: Any) -> None:
         if event.delta < 0 or event.num == 5:
@@ -4009,6 +4109,7 @@ class MainTable(tk.Canvas):
             self.recreate_all_selection_boxes()
         self.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=True)
         self.refresh_open_window_positions(zoom=zoom)
+        self.preload_zoom_char_widths()
         self.RI.refresh_open_window_positions(zoom=zoom)
         self.CH.refresh_open_window_positions(zoom=zoom)
         self.see(
@@ -4116,8 +4217,8 @@ class MainTable(tk.Canvas):
 
     def set_table_font_help(self):
         self.table_font = self.PAR.ops.table_font
-        if self.PAR.ops.table_font not in self.char_widths:
-            self.char_widths[self.PAR.ops.table_font] = {}
+        self.preload_char_widths(self.PAR.ops.table_font, self.visible_chars())
+        self.text_layouts.clear()
         self.table_test_str_w = self.get_txt_w(_test_str)
         self.table_txt_width, self.table_txt_height = self.get_txt_dimensions("|", self.PAR.ops.table_font)
         self.min_row_height = max(6, self.table_txt_height, self.index_txt_height) + 6
@@ -4157,8 +4258,8 @@ class MainTable(tk.Canvas):
 
     def set_index_font_help(self) -> None:
         self.RI.index_font = self.PAR.ops.index_font
-        if self.PAR.ops.index_font not in self.char_widths:
-            self.char_widths[self.PAR.ops.index_font] = {}
+        self.preload_char_widths(self.PAR.ops.index_font)
+        self.text_layouts.clear()
         self.RI.index_test_str_w = self.get_txt_w(_test_str, self.PAR.ops.index_font)
         self.index_txt_width, self.index_txt_height = self.get_txt_dimensions("|", self.PAR.ops.index_font)
         self.min_row_height = max(6, self.table_txt_height, self.index_txt_height) + 6
@@ -4197,8 +4298,8 @@ class MainTable(tk.Canvas):
 
     def set_header_font_help(self) -> None:
         self.CH.header_font = self.PAR.ops.header_font
-        if self.PAR.ops.header_font not in self.char_widths:
-            self.char_widths[self.PAR.ops.header_font] = {}
+        self.preload_char_widths(self.PAR.ops.header_font)
+        self.text_layouts.clear()
         self.CH.header_test_str_w = self.get_txt_w(_test_str, self.PAR.ops.header_font)
         self.header_txt_width, self.header_txt_height = self.get_txt_dimensions("|", self.PAR.ops.header_font)
         self.min_header_height = self.header_txt_height + 6
@@ -4218,16 +4319,20 @@ class MainTable(tk.Canvas):
 
     def data_reference(
         self,
-        newdataref: list | tuple | None = None,
+        newdataref: list | tuple | DataSource | None = None,
         reset_col_positions: bool = True,
         reset_row_positions: bool = True,
         redraw: bool = False,
         return_id: bool = True,
         keep_formatting: bool = True,
     ) -> Any:
-        if isinstance(newdataref, (list, tuple)):
+        if isinstance(newdataref, DataSource):
+            newdataref = VirtualData(newdataref)
+        if isinstance(newdataref, (list, tuple, VirtualData)):
             self.hide_dropdown_editor_all_canvases()
+            self.close_data(newdataref)
             self.data = newdataref
+            self.display_strings.clear()
             if keep_formatting:
                 self.reapply_formatting()
             else:
@@ -4291,14 +4396,9 @@ class MainTable(tk.Canvas):
             if h != self.row_positions[r + 1] - self.row_positions[r]:
                 cell_needs_resize_h = True
         if cell_needs_resize_w:
-            old_width = self.col_positions[c + 1] - self.col_positions[c]
-            new_col_pos = self.col_positions[c] + w
-            increment = new_col_pos - self.col_positions[c + 1]
-            self.col_positions[c + 2 :] = [
-                e + increment for e in islice(self.col_positions, c + 2, len(self.col_positions))
-            ]
-            self.col_positions[c + 1] = new_col_pos
-            new_width = self.col_positions[c + 1] - self.col_positions[c]
+            old_width = self.col_positions.size(c)
+            self.col_positions.set_size(c, w)
+            new_width = w
             if run_binding and self.CH.column_width_resize_func and old_width != new_width:
                 self.CH.column_width_resize_func(
                     event_dict(
@@ -4308,14 +4408,9 @@ class MainTable(tk.Canvas):
                     )
                 )
         if cell_needs_resize_h:
-            old_height = self.row_positions[r + 1] - self.row_positions[r]
-            new_row_pos = self.row_positions[r] + h
-            increment = new_row_pos - self.row_positions[r + 1]
-            self.row_positions[r + 2 :] = [
-                e + increment for e in islice(self.row_positions, r + 2, len(self.row_positions))
-            ]
-            self.row_positions[r + 1] = new_row_pos
-            new_height = self.row_positions[r + 1] - self.row_positions[r]
+            old_height = self.row_positions.size(r)
+            self.row_positions.set_size(r, h)
+            new_height = h
             if run_binding and self.RI.row_height_resize_func and old_height != new_height:
                 self.RI.row_height_resize_func(
                     event_dict(
@@ -4344,27 +4439,14 @@ class MainTable(tk.Canvas):
                 box_w = self.table_txt_height + 1
                 max_width -= box_w + 4
         if self.PAR.ops.allow_cell_overflow and not kwargs:
+            disprn = self.disprn(datarn)
             if self.cells_cache is None:
-                disprn = self.disprn(datarn)
                 self.cells_cache = self._redraw_precache_cells(disprn, disprn + 1, 0, len(self.col_positions) - 1)
             if not (align := self.get_cell_kwargs(datarn, datacn, key="align")):
                 align = self.align
-            if align[-1] == "w":
-                max_width += sum(
-                    self._overflow(
-                        self.cells_cache,
-                        range(dispcn + 1, len(self.col_positions) - 1),
-                        datarn,
-                    )
-                )
-            elif align[-1] == "e":
-                max_width += sum(
-                    self._overflow(
-                        self.cells_cache,
-                        reversed(range(0, dispcn)),
-                        datarn,
-                    )
-                )
+            max_width += self.overflow_width(
+                self.cells_cache["overflow_stops"][disprn], dispcn, align, 0, len(self.col_positions) - 1
+            )
         return max_width
 
     def get_wrapped_cell_height(self, datarn: int, datacn: int) -> int:
@@ -4373,12 +4455,12 @@ class MainTable(tk.Canvas):
             1,
             sum(
                 1
-                for _ in wrap_text(
+                for _ in self.wrap_lines(
                     text=self.cell_str(datarn, datacn, get_displayed=True),
                     max_width=self.get_cell_max_width(datarn, dispcn),
                     max_lines=float("inf"),
                     char_width_fn=self.char_width_fn,
-                    widths=self.char_widths[self.table_font],
+                    font=self.table_font,
                     wrap=self.PAR.ops.table_wrap,
                 )
             ),
@@ -4434,6 +4516,8 @@ class MainTable(tk.Canvas):
                 if (
                     (datarn, datacn) in self.cell_options
                     and "dropdown" in self.cell_options[(datarn, datacn)]
+                    or self.range_options
+                    and self.range_options.value(datarn, datacn, "dropdown")
                     or datarn in self.row_options
                     and "dropdown" in self.row_options[datarn]
                     or datacn in self.col_options
@@ -4465,31 +4549,148 @@ class MainTable(tk.Canvas):
         self.recreate_all_selection_boxes()
         return self.row_positions, self.col_positions
 
+    @property
+    def displayed_columns(self) -> list[int] | array:
+        return self._displayed_columns
+
+    @displayed_columns.setter
+    def displayed_columns(self, columns: Iterable[int]) -> None:
+        self._displayed_columns = self.displayed_storage(columns)
+        self._displayed_columns_index = (None, None)
+
+    @property
+    def displayed_rows(self) -> list[int] | array:
+        return self._displayed_rows
+
+    @displayed_rows.setter
+    def displayed_rows(self, rows: Iterable[int]) -> None:
+        self._displayed_rows = self.displayed_storage(rows)
+        self._displayed_rows_index = (None, None)
+
+    def displayed_columns_index(self, build: bool = True, total: int = 0) -> array | None:
+        """
+        Maps data column indexes to displayed column indexes, -1 for
+        hidden columns, None if all columns are displayed or if it isn't
+        up to date and build is False, covers at least total columns
+        """
+        if self.all_columns_displayed:
+            return None
+        key = (id(self._displayed_columns), len(self._displayed_columns))
+        if self._displayed_columns_index[0] == key and len(self._displayed_columns_index[1]) >= total:
+            return self._displayed_columns_index[1]
+        if not build:
+            return None
+        self._displayed_columns_index = (key, displayed_index(self._displayed_columns, total))
+        return self._displayed_columns_index[1]
+
+    def displayed_rows_index(self, build: bool = True, total: int = 0) -> array | None:
+        """
+        Maps data row indexes to displayed row indexes, -1 for hidden
+        rows, None if all rows are displayed or if it isn't up to date
+        and build is False, covers at least total rows
+        """
+        if self.all_rows_displayed:
+            return None
+        key = (id(self._displayed_rows), len(self._displayed_rows))
+        if self._displayed_rows_index[0] == key and len(self._displayed_rows_index[1]) >= total:
+            return self._displayed_rows_index[1]
+        if not build:
+            return None
+        self._displayed_rows_index = (key, displayed_index(self._displayed_rows, total))
+        return self._displayed_rows_index[1]
+
+    def displayed_storage(self, idxs: Iterable[int]) -> list[int] | array:
+        if self.PAR.ops.compact_storage:
+            return idxs if isinstance(idxs, array) else array("q", idxs)
+        return idxs if isinstance(idxs, list) else list(idxs)
+
+    @property
+    def cell_options(self) -> OptionStore:
+        return self._cell_options
+
+    @cell_options.setter
+    def cell_options(self, options: Mapping) -> None:
+        self._cell_options = OptionStore.from_dict(options, cells=True)
+
+    @property
+    def row_options(self) -> OptionStore:
+        return self._row_options
+
+    @row_options.setter
+    def row_options(self, options: Mapping) -> None:
+        self._row_options = OptionStore.from_dict(options)
+
+    @property
+    def col_options(self) -> OptionStore:
+        return self._col_options
+
+    @col_options.setter
+    def col_options(self, options: Mapping) -> None:
+        self._col_options = OptionStore.from_dict(options)
+
+    @property
+    def progress_bars(self) -> OptionStore:
+        return self._progress_bars
+
+    @progress_bars.setter
+    def progress_bars(self, bars: Mapping) -> None:
+        self._progress_bars = OptionStore.from_dict(bars, cells=True)
+
+    @property
+    def named_spans(self) -> NamedSpans:
+        return self._named_spans
+
+    @named_spans.setter
+    def named_spans(self, spans: Mapping) -> None:
+        self._named_spans = NamedSpans.from_dict(spans)
+
+    @property
+    def positions_typecode(self) -> str | None:
+        return "d" if self.PAR.ops.compact_storage else None
+
+    @property
+    def col_positions(self) -> Positions:
+        return self._col_positions
+
+    @col_positions.setter
+    def col_positions(self, positions: Iterable[float]) -> None:
+        self._col_positions = Positions.from_positions(positions, typecode=self.positions_typecode)
+
+    @property
+    def row_positions(self) -> Positions:
+        return self._row_positions
+
+    @row_positions.setter
+    def row_positions(self, positions: Iterable[float]) -> None:
+        self._row_positions = Positions.from_positions(positions, typecode=self.positions_typecode)
+
     def set_col_positions(self, itr: Iterator[float]) -> None:
-        self.col_positions = list(accumulate(chain([0], itr)))
+        self._col_positions = Positions(itr, typecode=self.positions_typecode)
 
     def reset_col_positions(self, ncols: int | None = None, width: int | None = None) -> None:
         if width is None:
             width = self.PAR.ops.default_column_width
         if isinstance(ncols, int):
-            self.set_col_positions(itr=repeat(width, ncols))
+            self._col_positions = Positions.uniform(width, ncols, typecode=self.positions_typecode)
         elif self.all_columns_displayed:
-            self.set_col_positions(itr=repeat(width, self.total_data_cols()))
+            self._col_positions = Positions.uniform(width, self.total_data_cols(), typecode=self.positions_typecode)
         else:
-            self.set_col_positions(itr=repeat(width, len(self.displayed_columns)))
+            self._col_positions = Positions.uniform(
+                width, len(self.displayed_columns), typecode=self.positions_typecode
+            )
 
     def set_row_positions(self, itr: Iterator[float]) -> None:
-        self.row_positions = list(accumulate(chain([0], itr)))
+        self._row_positions = Positions(itr, typecode=self.positions_typecode)
 
     def reset_row_positions(self, nrows: int | None = None, height: int | None = None) -> None:
         if height is None:
             height = self.get_default_row_height()
         if isinstance(nrows, int):
-            self.set_row_positions(itr=repeat(height, nrows))
+            self._row_positions = Positions.uniform(height, nrows, typecode=self.positions_typecode)
         elif self.all_rows_displayed:
-            self.set_row_positions(itr=repeat(height, self.total_data_rows()))
+            self._row_positions = Positions.uniform(height, self.total_data_rows(), typecode=self.positions_typecode)
         else:
-            self.set_row_positions(itr=repeat(height, len(self.displayed_rows)))
+            self._row_positions = Positions.uniform(height, len(self.displayed_rows), typecode=self.positions_typecode)
 
     def del_col_position(self, idx: int, deselect_all: bool = False) -> None:
         if deselect_all:
@@ -4497,10 +4698,7 @@ class MainTable(tk.Canvas):
         if idx == "end" or len(self.col_positions) <= idx + 1:
             del self.col_positions[-1]
         else:
-            w = self.col_positions[idx + 1] - self.col_positions[idx]
-            idx += 1
-            del self.col_positions[idx]
-            self.col_positions[idx:] = [e - w for e in islice(self.col_positions, idx, len(self.col_positions))]
+            self.col_positions.delete_sizes(idx)
 
     def del_row_position(self, idx: int, deselect_all: bool = False) -> None:
         if deselect_all:
@@ -4508,10 +4706,7 @@ class MainTable(tk.Canvas):
         if idx == "end" or len(self.row_positions) <= idx + 1:
             del self.row_positions[-1]
         else:
-            w = self.row_positions[idx + 1] - self.row_positions[idx]
-            idx += 1
-            del self.row_positions[idx]
-            self.row_positions[idx:] = [e - w for e in islice(self.row_positions, idx, len(self.row_positions))]
+            self.row_positions.delete_sizes(idx)
 
     def del_col_positions(self, idxs: Iterator[int] | None = None) -> None:
         if idxs is None:
@@ -4556,25 +4751,9 @@ class MainTable(tk.Canvas):
         else:
             w = widths
         if idx == "end" or len(self.col_positions) == idx + 1:
-            if len(w) > 1:
-                self.col_positions += list(accumulate(chain([self.col_positions[-1] + w[0]], islice(w, 1, None))))
-            else:
-                self.col_positions.append(self.col_positions[-1] + w[0])
+            self.col_positions.insert_sizes(len(self.col_positions) - 1, w)
         else:
-            if len(w) > 1:
-                idx += 1
-                self.col_positions[idx:idx] = list(
-                    accumulate(chain([self.col_positions[idx - 1] + w[0]], islice(w, 1, None)))
-                )
-                idx += len(w)
-                sumw = sum(w)
-                self.col_positions[idx:] = [e + sumw for e in islice(self.col_positions, idx, len(self.col_positions))]
-            else:
-                w = w[0]
-                idx += 1
-                self.col_positions.insert(idx, self.col_positions[idx - 1] + w)
-                idx += 1
-                self.col_positions[idx:] = [e + w for e in islice(self.col_positions, idx, len(self.col_positions))]
+            self.col_positions.insert_sizes(idx, w)
 
     def insert_row_positions(
         self,
@@ -4592,25 +4771,9 @@ class MainTable(tk.Canvas):
         else:
             h = heights
         if idx == "end" or len(self.row_positions) == idx + 1:
-            if len(h) > 1:
-                self.row_positions += list(accumulate(chain([self.row_positions[-1] + h[0]], islice(h, 1, None))))
-            else:
-                self.row_positions.append(self.row_positions[-1] + h[0])
+            self.row_positions.insert_sizes(len(self.row_positions) - 1, h)
         else:
-            if len(h) > 1:
-                idx += 1
-                self.row_positions[idx:idx] = list(
-                    accumulate(chain([self.row_positions[idx - 1] + h[0]], islice(h, 1, None)))
-                )
-                idx += len(h)
-                sumh = sum(h)
-                self.row_positions[idx:] = [e + sumh for e in islice(self.row_positions, idx, len(self.row_positions))]
-            else:
-                h = h[0]
-                idx += 1
-                self.row_positions.insert(idx, self.row_positions[idx - 1] + h)
-                idx += 1
-                self.row_positions[idx:] = [e + h for e in islice(self.row_positions, idx, len(self.row_positions))]
+            self.row_positions.insert_sizes(idx, h)
 
     def named_span_coords(self, name: str | dict) -> tuple[int, int, int | None, int | None]:
         dct = self.named_spans[name] if isinstance(name, str) else name
@@ -4626,60 +4789,52 @@ class MainTable(tk.Canvas):
         cols: list | tuple,
         create_ops: bool = True,
     ) -> None:
-        self.tagged_cells = {
-            tags: {(r, push_n(c, cols)) for (r, c) in tagged} for tags, tagged in self.tagged_cells.items()
-        }
-        self.cell_options = {(r, push_n(c, cols)): v for (r, c), v in self.cell_options.items()}
-        self.progress_bars = {(r, push_n(c, cols)): v for (r, c), v in self.progress_bars.items()}
-        self.tagged_columns = {tags: {push_n(c, cols) for c in tagged} for tags, tagged in self.tagged_columns.items()}
-        self.col_options = {push_n(c, cols): v for c, v in self.col_options.items()}
-        self.CH.cell_options = {push_n(c, cols): v for c, v in self.CH.cell_options.items()}
+        for tagged in self.tagged_cells.values():
+            tagged.insert_keys(cols, axis=1)
+        self.cell_options.insert_keys(cols, axis=1)
+        self.range_options.insert_keys(cols, axis=1)
+        self.progress_bars.insert_keys(cols, axis=1)
+        for tagged in self.tagged_columns.values():
+            tagged.insert_keys(cols)
+        self.col_options.insert_keys(cols)
+        self.CH.cell_options.insert_keys(cols)
         # if there are named spans where columns were added
         # add options to gap which was created by adding columns
         totalrows = None
         new_ops = partial(self.PAR.create_options_from_span, set_data=False)
         qkspan = self.span()
-        for span in self.named_spans.values():
-            if isinstance(span["from_c"], int):
-                for datacn in cols:
-                    if span["from_c"] > datacn:
-                        span["from_c"] += 1
-                        if isinstance(span["upto_c"], int):
-                            span["upto_c"] += 1
-                    elif span["from_c"] <= datacn and (
-                        (isinstance(span["upto_c"], int) and span["upto_c"] > datacn) or span["upto_c"] is None
-                    ):
-                        if isinstance(span["upto_c"], int):
-                            span["upto_c"] += 1
-                        # if to_add then it's an undo/redo and don't
-                        # need to create fresh options
-                        if create_ops:
-                            # if rows are none it's a column options span
-                            if span["from_r"] is None:
-                                new_ops(
-                                    mod_span(
-                                        qkspan,
-                                        span,
-                                        from_c=datacn,
-                                        upto_c=datacn + 1,
-                                    )
-                                )
-                            # cells
-                            else:
-                                if totalrows is None:
-                                    totalrows = self.total_data_rows()
-                                rng_upto_r = totalrows if span["upto_r"] is None else span["upto_r"]
-                                for rn in range(span["from_r"], rng_upto_r):
-                                    new_ops(
-                                        mod_span(
-                                            qkspan,
-                                            span,
-                                            from_r=rn,
-                                            from_c=datacn,
-                                            upto_r=rn + 1,
-                                            upto_c=datacn + 1,
-                                        )
-                                    )
+        for span, datacns in self.named_spans.insert_keys(cols, axis="c"):
+            # if to_add then it's an undo/redo and don't
+            # need to create fresh options
+            if not create_ops:
+                continue
+            for datacn in datacns:
+                # if rows are none it's a column options span
+                if span["from_r"] is None:
+                    new_ops(
+                        mod_span(
+                            qkspan,
+                            span,
+                            from_c=datacn,
+                            upto_c=datacn + 1,
+                        )
+                    )
+                # cells
+                else:
+                    if totalrows is None:
+                        totalrows = self.total_data_rows()
+                    rng_upto_r = totalrows if span["upto_r"] is None else span["upto_r"]
+                    for rn in range(span["from_r"], rng_upto_r):
+                        new_ops(
+                            mod_span(
+                                qkspan,
+                                span,
+                                from_r=rn,
+                                from_c=datacn,
+                                upto_r=rn + 1,
+                                upto_c=datacn + 1,
+                            )
+                        )
 
     def adjust_options_post_add_rows(
         self,
@@ -4687,14 +4842,15 @@ class MainTable(tk.Canvas):
         create_ops: bool = True,
         tree: bool = True,
     ) -> None:
-        self.tagged_cells = {
-            tags: {(push_n(r, rows), c) for (r, c) in tagged} for tags, tagged in self.tagged_cells.items()
-        }
-        self.cell_options = {(push_n(r, rows), c): v for (r, c), v in self.cell_options.items()}
-        self.progress_bars = {(push_n(r, rows), c): v for (r, c), v in self.progress_bars.items()}
-        self.tagged_rows = {tags: {push_n(r, rows) for r in tagged} for tags, tagged in self.tagged_rows.items()}
-        self.row_options = {push_n(r, rows): v for r, v in self.row_options.items()}
-        self.RI.cell_options = {push_n(r, rows): v for r, v in self.RI.cell_options.items()}
+        for tagged in self.tagged_cells.values():
+            tagged.insert_keys(rows)
+        self.cell_options.insert_keys(rows)
+        self.range_options.insert_keys(rows)
+        self.progress_bars.insert_keys(rows)
+        for tagged in self.tagged_rows.values():
+            tagged.insert_keys(rows)
+        self.row_options.insert_keys(rows)
+        self.RI.cell_options.insert_keys(rows)
         if tree:
             self.RI.rns = {k: push_n(r, rows) for k, r in self.RI.rns.items()}
         # if there are named spans where rows were added
@@ -4702,47 +4858,38 @@ class MainTable(tk.Canvas):
         totalcols = None
         new_ops = partial(self.PAR.create_options_from_span, set_data=False)
         qkspan = self.span()
-        for span in self.named_spans.values():
-            if isinstance(span["from_r"], int):
-                for datarn in rows:
-                    if span["from_r"] > datarn:
-                        span["from_r"] += 1
-                        if isinstance(span["upto_r"], int):
-                            span["upto_r"] += 1
-                    elif span["from_r"] <= datarn and (
-                        (isinstance(span["upto_r"], int) and span["upto_r"] > datarn) or span["upto_r"] is None
-                    ):
-                        if isinstance(span["upto_r"], int):
-                            span["upto_r"] += 1
-                        # if to_add then it's an undo/redo and don't
-                        # need to create fresh options
-                        if create_ops:
-                            # if cols are none it's a row options span
-                            if span["from_c"] is None:
-                                new_ops(
-                                    mod_span(
-                                        qkspan,
-                                        span,
-                                        from_r=datarn,
-                                        upto_r=datarn + 1,
-                                    )
-                                )
-                            # cells
-                            else:
-                                if totalcols is None:
-                                    totalcols = self.total_data_cols()
-                                rng_upto_c = totalcols if span["upto_c"] is None else span["upto_c"]
-                                for cn in range(span["from_c"], rng_upto_c):
-                                    new_ops(
-                                        mod_span(
-                                            qkspan,
-                                            span,
-                                            from_r=datarn,
-                                            from_c=cn,
-                                            upto_r=datarn + 1,
-                                            upto_c=cn + 1,
-                                        )
-                                    )
+        for span, datarns in self.named_spans.insert_keys(rows):
+            # if to_add then it's an undo/redo and don't
+            # need to create fresh options
+            if not create_ops:
+                continue
+            for datarn in datarns:
+                # if cols are none it's a row options span
+                if span["from_c"] is None:
+                    new_ops(
+                        mod_span(
+                            qkspan,
+                            span,
+                            from_r=datarn,
+                            upto_r=datarn + 1,
+                        )
+                    )
+                # cells
+                else:
+                    if totalcols is None:
+                        totalcols = self.total_data_cols()
+                    rng_upto_c = totalcols if span["upto_c"] is None else span["upto_c"]
+                    for cn in range(span["from_c"], rng_upto_c):
+                        new_ops(
+                            mod_span(
+                                qkspan,
+                                span,
+                                from_r=datarn,
+                                from_c=cn,
+                                upto_r=datarn + 1,
+                                upto_c=cn + 1,
+                            )
+                        )
 
     def adjust_options_post_delete_columns(
         self,
@@ -4754,47 +4901,15 @@ class MainTable(tk.Canvas):
             to_del = set()
         if not to_bis:
             to_bis = sorted(to_del)
-        self.tagged_cells = {
-            tags: {
-                (
-                    r,
-                    c if not (num := bisect_left(to_bis, c)) else c - num,
-                )
-                for (r, c) in tagged
-                if c not in to_del
-            }
-            for tags, tagged in self.tagged_cells.items()
-        }
-        self.cell_options = {
-            (
-                r,
-                c if not (num := bisect_left(to_bis, c)) else c - num,
-            ): v
-            for (r, c), v in self.cell_options.items()
-            if c not in to_del
-        }
-        self.progress_bars = {
-            (
-                r,
-                c if not (num := bisect_left(to_bis, c)) else c - num,
-            ): v
-            for (r, c), v in self.progress_bars.items()
-            if c not in to_del
-        }
-        self.tagged_columns = {
-            tags: {c if not (num := bisect_left(to_bis, c)) else c - num for c in tagged if c not in to_del}
-            for tags, tagged in self.tagged_columns.items()
-        }
-        self.col_options = {
-            c if not (num := bisect_left(to_bis, c)) else c - num: v
-            for c, v in self.col_options.items()
-            if c not in to_del
-        }
-        self.CH.cell_options = {
-            c if not (num := bisect_left(to_bis, c)) else c - num: v
-            for c, v in self.CH.cell_options.items()
-            if c not in to_del
-        }
+        for tagged in self.tagged_cells.values():
+            tagged.delete_keys(to_del, to_bis, axis=1)
+        self.cell_options.delete_keys(to_del, to_bis, axis=1)
+        self.range_options.delete_keys(to_bis, axis=1)
+        self.progress_bars.delete_keys(to_del, to_bis, axis=1)
+        for tagged in self.tagged_columns.values():
+            tagged.delete_keys(to_bis)
+        self.col_options.delete_keys(to_del, to_bis)
+        self.CH.cell_options.delete_keys(to_del, to_bis)
         self.del_columns_from_named_spans(
             to_del=to_del,
             to_bis=to_bis,
@@ -4812,22 +4927,10 @@ class MainTable(tk.Canvas):
             named_spans = self.get_spans_to_del_from_cols(cols=to_del)
         for name in named_spans:
             del self.named_spans[name]
-        for span in self.named_spans.values():
-            if isinstance(span["from_c"], int):
-                for c in to_bis:
-                    if span["from_c"] > c:
-                        span["from_c"] -= 1
-                    if isinstance(span["upto_c"], int) and span["upto_c"] > c:
-                        span["upto_c"] -= 1
+        self.named_spans.delete_keys(to_bis, axis="c")
 
     def get_spans_to_del_from_cols(self, cols: set[int]) -> set[str]:
-        total = self.total_data_cols()
-        return {
-            nm
-            for nm, sp in self.named_spans.items()
-            if isinstance(sp["from_c"], int)
-            and all(c in cols for c in range(sp["from_c"], total if sp["upto_c"] is None else sp["upto_c"]))
-        }
+        return self.named_spans.within(sorted(cols), self.total_data_cols(), axis="c")
 
     def adjust_options_post_delete_rows(
         self,
@@ -4839,47 +4942,15 @@ class MainTable(tk.Canvas):
             to_del = set()
         if not to_bis:
             to_bis = sorted(to_del)
-        self.tagged_cells = {
-            tags: {
-                (
-                    r if not (num := bisect_left(to_bis, r)) else r - num,
-                    c,
-                )
-                for (r, c) in tagged
-                if r not in to_del
-            }
-            for tags, tagged in self.tagged_cells.items()
-        }
-        self.cell_options = {
-            (
-                r if not (num := bisect_left(to_bis, r)) else r - num,
-                c,
-            ): v
-            for (r, c), v in self.cell_options.items()
-            if r not in to_del
-        }
-        self.progress_bars = {
-            (
-                r if not (num := bisect_left(to_bis, r)) else r - num,
-                c,
-            ): v
-            for (r, c), v in self.progress_bars.items()
-            if r not in to_del
-        }
-        self.tagged_rows = {
-            tags: {r if not (num := bisect_left(to_bis, r)) else r - num for r in tagged if r not in to_del}
-            for tags, tagged in self.tagged_rows.items()
-        }
-        self.row_options = {
-            r if not (num := bisect_left(to_bis, r)) else r - num: v
-            for r, v in self.row_options.items()
-            if r not in to_del
-        }
-        self.RI.cell_options = {
-            r if not (num := bisect_left(to_bis, r)) else r - num: v
-            for r, v in self.RI.cell_options.items()
-            if r not in to_del
-        }
+        for tagged in self.tagged_cells.values():
+            tagged.delete_keys(to_del, to_bis)
+        self.cell_options.delete_keys(to_del, to_bis)
+        self.range_options.delete_keys(to_bis)
+        self.progress_bars.delete_keys(to_del, to_bis)
+        for tagged in self.tagged_rows.values():
+            tagged.delete_keys(to_bis)
+        self.row_options.delete_keys(to_del, to_bis)
+        self.RI.cell_options.delete_keys(to_del, to_bis)
         self.RI.rns = {
             v: r if not (num := bisect_left(to_bis, r)) else r - num for v, r in self.RI.rns.items() if r not in to_del
         }
@@ -4900,22 +4971,10 @@ class MainTable(tk.Canvas):
             named_spans = self.get_spans_to_del_from_rows(rows=to_del)
         for name in named_spans:
             del self.named_spans[name]
-        for span in self.named_spans.values():
-            if isinstance(span["from_r"], int):
-                for r in to_bis:
-                    if span["from_r"] > r:
-                        span["from_r"] -= 1
-                    if isinstance(span["upto_r"], int) and span["upto_r"] > r:
-                        span["upto_r"] -= 1
+        self.named_spans.delete_keys(to_bis)
 
     def get_spans_to_del_from_rows(self, rows: set[int]) -> set[str]:
-        total = self.total_data_rows()
-        return {
-            nm
-            for nm, sp in self.named_spans.items()
-            if isinstance(sp["from_r"], int)
-            and all(r in rows for r in range(sp["from_r"], total if sp["upto_r"] is None else sp["upto_r"]))
-        }
+        return self.named_spans.within(sorted(rows), self.total_data_rows())
 
     def add_columns(
         self,
@@ -4930,6 +4989,8 @@ class MainTable(tk.Canvas):
         mod_event_boxes: bool = True,
         from_undo: bool = False,
     ) -> EventDataDict | None:
+        if isinstance(self.data, VirtualData):
+            raise TypeError("Columns can't be added to a data source.")
         if not from_undo and not try_binding(self.extra_begin_insert_cols_rc_func, event_data, "begin_add_columns"):
             return
         self.saved_column_widths = {}
@@ -4947,12 +5008,15 @@ class MainTable(tk.Canvas):
         maxrn = 0
         for cn, rowdict in columns.items():
             for rn, v in rowdict.items():
-                if rn < len(self.data) and cn > len(self.data[rn]):
-                    self.fix_row_len(rn, cn - 1)
-                elif rn >= len(self.data):
-                    self.fix_data_len(rn, cn - 1)
+                if rn >= len(self.data):
+                    self.fix_data_len(rn)
                 if rn > maxrn:
                     maxrn = rn
+                if cn >= len(self.data[rn]):
+                    # empty cells after the end of a row don't need adding
+                    if v is None or (isinstance(v, str) and not v):
+                        continue
+                    self.fix_row_len(rn, cn - 1)
                 self.data[rn].insert(cn, v)
         # if not hiding rows then we can extend row positions if necessary
         if add_row_positions and self.all_rows_displayed and maxrn >= len(self.row_positions) - 1:
@@ -4997,7 +5061,7 @@ class MainTable(tk.Canvas):
         return event_data
 
     def rc_add_columns(self, event: Any = None) -> None:
-        rowlen = self.equalize_data_row_lengths()
+        rowlen = self.logical_data_cols()
         selcols = sorted(self.get_selected_cols())
         if (
             selcols
@@ -5061,6 +5125,8 @@ class MainTable(tk.Canvas):
         mod_event_boxes: bool = True,
         from_undo: bool = False,
     ) -> EventDataDict | None:
+        if isinstance(self.data, VirtualData):
+            raise TypeError("Rows can't be added to a data source.")
         if not from_undo and not try_binding(self.extra_begin_insert_rows_rc_func, event_data, "begin_add_rows"):
             return
         self.saved_row_heights = {}
@@ -5073,7 +5139,7 @@ class MainTable(tk.Canvas):
         for rn, row in rows.items():
             cn = len(row) - 1
             if rn > len(self.data):
-                self.fix_data_len(rn - 1, cn)
+                self.fix_data_len(rn - 1)
             self.data.insert(rn, row)
             if cn > maxcn:
                 maxcn = cn
@@ -5293,22 +5359,23 @@ class MainTable(tk.Canvas):
 
     def copy_options(self) -> dict:
         return {
-            "cell_options": dict(self.cell_options),
-            "column_options": dict(self.col_options),
-            "row_options": dict(self.row_options),
-            "CH_cell_options": dict(self.CH.cell_options),
-            "RI_cell_options": dict(self.RI.cell_options),
-            "tagged_cells": {f"{tag}": set(s) for tag, s in self.tagged_cells.items()},
-            "tagged_rows": {f"{tag}": set(s) for tag, s in self.tagged_rows.items()},
-            "tagged_columns": {f"{tag}": set(s) for tag, s in self.tagged_columns.items()},
+            "cell_options": self.cell_options.copy(),
+            "range_options": self.range_options.copy(),
+            "column_options": self.col_options.copy(),
+            "row_options": self.row_options.copy(),
+            "CH_cell_options": self.CH.cell_options.copy(),
+            "RI_cell_options": self.RI.cell_options.copy(),
+            "tagged_cells": {f"{tag}": s.copy() for tag, s in self.tagged_cells.items()},
+            "tagged_rows": {f"{tag}": s.copy() for tag, s in self.tagged_rows.items()},
+            "tagged_columns": {f"{tag}": s.copy() for tag, s in self.tagged_columns.items()},
         }
 
     def copy_sheet_state(self) -> dict:
         return {
-            "row_positions": list(self.row_positions),
-            "col_positions": list(self.col_positions),
-            "displayed_rows": list(self.displayed_rows),
-            "displayed_columns": list(self.displayed_columns),
+            "row_positions": self.row_positions.copy(),
+            "col_positions": self.col_positions.copy(),
+            "displayed_rows": self.displayed_rows[:],
+            "displayed_columns": self.displayed_columns[:],
             "all_rows_displayed": bool(self.all_rows_displayed),
             "saved_row_heights": dict(self.saved_row_heights),
             "saved_column_widths": dict(self.saved_column_widths),
@@ -5317,11 +5384,13 @@ class MainTable(tk.Canvas):
         }
 
     def delete_columns_data(self, cols: list[int], event_data: EventDataDict | None = None) -> EventDataDict:
+        if isinstance(self.data, VirtualData):
+            raise TypeError("Columns can't be deleted from a data source.")
         self.mouseclick_outside_editor_or_dropdown_all_canvases()
         if not event_data:
             event_data = self.new_event_dict("delete_columns", state=True)
         event_data["options"] = self.copy_options()
-        event_data["named_spans"] = {k: span.copy_self() for k, span in self.named_spans.items()}
+        event_data["named_spans"] = self.named_spans.copy()
         for i, datacn in enumerate(cols):
             for rn in range(len(self.data)):
                 if datacn not in event_data["deleted"]["columns"]:
@@ -5375,6 +5444,8 @@ class MainTable(tk.Canvas):
         undo: bool = True,
         emit_event: bool = True,
     ) -> EventDataDict:
+        if isinstance(self.data, VirtualData):
+            raise TypeError("Columns can't be deleted from a data source.")
         event_data = self.new_event_dict("delete_columns", state=True)
         if not columns and not (columns := sorted(self.get_selected_cols())):
             return event_data
@@ -5407,11 +5478,13 @@ class MainTable(tk.Canvas):
         return event_data
 
     def delete_rows_data(self, rows: list[int], event_data: EventDataDict | None = None) -> EventDataDict:
+        if isinstance(self.data, VirtualData):
+            raise TypeError("Rows can't be deleted from a data source.")
         self.mouseclick_outside_editor_or_dropdown_all_canvases()
         if not event_data:
             event_data = self.new_event_dict("delete_rows", state=True)
         event_data["options"] = self.copy_options()
-        event_data["named_spans"] = {k: span.copy_self() for k, span in self.named_spans.items()}
+        event_data["named_spans"] = self.named_spans.copy()
 
         for i, datarn in enumerate(rows):
             event_data["deleted"]["rows"][datarn] = self.data.pop(datarn - i)
@@ -5466,6 +5539,8 @@ class MainTable(tk.Canvas):
         undo: bool = True,
         emit_event: bool = True,
     ) -> None | EventDataDict:
+        if isinstance(self.data, VirtualData):
+            raise TypeError("Rows can't be deleted from a data source.")
         event_data = self.new_event_dict("delete_rows", state=True)
         if not rows and not (rows := sorted(self.get_selected_rows())):
             return
@@ -5512,33 +5587,11 @@ class MainTable(tk.Canvas):
 
     def move_row_position(self, idx1: int, idx2: int):
         if not len(self.row_positions) <= 2:
-            if idx1 < idx2:
-                height = self.row_positions[idx1 + 1] - self.row_positions[idx1]
-                self.row_positions.insert(idx2 + 1, self.row_positions.pop(idx1 + 1))
-                for i in range(idx1 + 1, idx2 + 1):
-                    self.row_positions[i] -= height
-                self.row_positions[idx2 + 1] = self.row_positions[idx2] + height
-            else:
-                height = self.row_positions[idx1 + 1] - self.row_positions[idx1]
-                self.row_positions.insert(idx2 + 1, self.row_positions.pop(idx1 + 1))
-                for i in range(idx2 + 2, idx1 + 2):
-                    self.row_positions[i] += height
-                self.row_positions[idx2 + 1] = self.row_positions[idx2] + height
+            self.row_positions.move_size(idx1, idx2)
 
     def move_col_position(self, idx1: int, idx2: int):
         if not len(self.col_positions) <= 2:
-            if idx1 < idx2:
-                width = self.col_positions[idx1 + 1] - self.col_positions[idx1]
-                self.col_positions.insert(idx2 + 1, self.col_positions.pop(idx1 + 1))
-                for i in range(idx1 + 1, idx2 + 1):
-                    self.col_positions[i] -= width
-                self.col_positions[idx2 + 1] = self.col_positions[idx2] + width
-            else:
-                width = self.col_positions[idx1 + 1] - self.col_positions[idx1]
-                self.col_positions.insert(idx2 + 1, self.col_positions.pop(idx1 + 1))
-                for i in range(idx2 + 2, idx1 + 2):
-                    self.col_positions[i] += width
-                self.col_positions[idx2 + 1] = self.col_positions[idx2] + width
+            self.col_positions.move_size(idx1, idx2)
 
     def display_rows(
         self,
@@ -5562,7 +5615,7 @@ class MainTable(tk.Canvas):
             elif not all_rows_displayed and self.all_rows_displayed:
                 # if rows is None then displayed_rows needs to be reset
                 if rows is None:
-                    self.displayed_rows = list(range(self.total_data_rows()))
+                    self.displayed_rows = range(self.total_data_rows())
                 self.all_rows_displayed = False
         if reset_row_positions:
             self.reset_row_positions()
@@ -5591,7 +5644,7 @@ class MainTable(tk.Canvas):
             elif not all_columns_displayed and self.all_columns_displayed:
                 # if columns is None then displayed_columns needs to be reset
                 if columns is None:
-                    self.displayed_columns = list(range(self.total_data_cols()))
+                    self.displayed_columns = range(self.total_data_cols())
                 self.all_columns_displayed = False
         if reset_col_positions:
             self.reset_col_positions()
@@ -5696,7 +5749,10 @@ class MainTable(tk.Canvas):
 
     def total_data_cols(self, include_header: bool = True) -> int:
         h_total = len(self._headers) if include_header and isinstance(self._headers, (list, tuple)) else 0
-        d_total = max(map(len, self.data), default=0)  # max(map(len, )) is faster
+        if isinstance(self.data, VirtualData):
+            d_total = self.data.column_count()
+        else:
+            d_total = max(map(len, self.data), default=0)  # max(map(len, )) is faster
         return max(h_total, d_total)
 
     def total_data_rows(self, include_index: bool = True) -> int:
@@ -5720,12 +5776,17 @@ class MainTable(tk.Canvas):
                 elif lnr < total_columns:
                     r.extend(self.gen_empty_row_seq(rn, end=total_columns, start=lnr))
 
-    def equalize_data_row_lengths(
+    def logical_data_cols(
         self,
         include_header: bool = True,
         total_data_cols: int | None = None,
         at_least_cols: int | None = None,
     ) -> int:
+        """
+        Returns the number of data columns, at least as many as there are column
+        positions, and makes the header long enough
+        Shorter rows are left as they are, their missing cells are treated as empty
+        """
         if not isinstance(total_data_cols, int):
             total_data_cols = self.total_data_cols(include_header=include_header)
         if isinstance(at_least_cols, int) and at_least_cols > total_data_cols:
@@ -5733,6 +5794,18 @@ class MainTable(tk.Canvas):
         total_data_cols = max(total_data_cols, len(self.col_positions) - 1)
         if not isinstance(self._headers, int) and include_header and total_data_cols > len(self._headers):
             self.CH.fix_header(total_data_cols - 1)
+        return total_data_cols
+
+    def equalize_data_row_lengths(
+        self,
+        include_header: bool = True,
+        total_data_cols: int | None = None,
+        at_least_cols: int | None = None,
+    ) -> int:
+        total_data_cols = self.logical_data_cols(include_header, total_data_cols, at_least_cols)
+        if isinstance(self.data, VirtualData):
+            # every row of a data source has the same length
+            return total_data_cols
         empty_v = self.get_value_for_empty_cell
         for rn, r in enumerate(self.data):
             if total_data_cols > (lnr := len(r)):
@@ -5749,16 +5822,16 @@ class MainTable(tk.Canvas):
 
     @property
     def visible_text_rows(self) -> tuple[int, int]:
-        start = bisect_left(self.row_positions, self.canvasy(0))
-        end = bisect_right(self.row_positions, self.canvasy(self.winfo_height()))
+        start = self.row_positions.bisect_left(self.canvasy(0))
+        end = self.row_positions.bisect_right(self.canvasy(self.winfo_height()))
         start = start - 1 if start else start
         end = end - 1 if end == len(self.row_positions) else end
         return start, end
 
     @property
     def visible_text_columns(self) -> tuple[int, int]:
-        start = bisect_left(self.col_positions, self.canvasx(0))
-        end = bisect_right(self.col_positions, self.canvasx(self.winfo_width()))
+        start = self.col_positions.bisect_left(self.canvasx(0))
+        end = self.col_positions.bisect_right(self.canvasx(self.winfo_width()))
         start = start - 1 if start else start
         end = end - 1 if end == len(self.col_positions) else end
         return start, end
@@ -5771,10 +5844,10 @@ class MainTable(tk.Canvas):
         fr: int | float,
         sc: int | float,
         sr: int | float,
-        sel_cells_bg: tuple[int, int, int],
-        sel_cols_bg: tuple[int, int, int],
-        sel_rows_bg: tuple[int, int, int],
-        selections: dict,
+        sel_cells_bg: str,
+        sel_cols_bg: str,
+        sel_rows_bg: str,
+        selections: SelectionIntervals,
         datarn: int,
         datacn: int,
         can_width: int | None,
@@ -5782,25 +5855,25 @@ class MainTable(tk.Canvas):
         alternate_color: Highlight | None,
         has_dd: bool,
         tags: str | tuple[str],
-    ) -> tuple[str, bool]:
+        options: dict | None = None,
+    ) -> tuple[str, int | None]:
+        """
+        options: the cell's resolved_options() if already known
+        """
+        iid = None
         if (datarn, datacn) in self.progress_bars:
             kwargs = self.progress_bars[(datarn, datacn)]
         else:
-            if (datarn, datacn) in self.cell_options and "highlight" in self.cell_options[(datarn, datacn)]:
-                kwargs = self.cell_options[(datarn, datacn)]["highlight"]
-            elif datarn in self.row_options and "highlight" in self.row_options[datarn]:
-                kwargs = self.row_options[datarn]["highlight"]
-            elif datacn in self.col_options and "highlight" in self.col_options[datacn]:
-                kwargs = self.col_options[datacn]["highlight"]
-            else:
-                kwargs = {}
+            if options is None:
+                options = self.resolved_options(datarn, datacn)
+            kwargs = options["highlight"] if "highlight" in options else {}
         if alt := bool(not kwargs and alternate_color and r % 2):
             kwargs = alternate_color
 
         if kwargs:
             high_bg = kwargs[0]
-            if high_bg and not high_bg.startswith("#"):
-                high_bg = color_map[high_bg]
+            if high_bg:
+                high_bg = self.color_cache.hex(high_bg)
 
             # cell is a single currently selected cell box
             #         not highlighted
@@ -5809,13 +5882,13 @@ class MainTable(tk.Canvas):
                 txtfg = self.PAR.ops.table_fg
 
             # cell is highlighted and cell selected
-            elif "cells" in selections and (r, c) in selections["cells"]:
+            elif selections.cell(r, c):
                 txtfg = (
                     self.PAR.ops.table_selected_cells_fg
                     if kwargs[1] is None or self.PAR.ops.display_selected_fg_over_highlights
                     else kwargs[1]
                 )
-                self.redraw_highlight(
+                iid = self.redraw_highlight(
                     x1=fc + 1,
                     y1=fr + 1,
                     x2=sc,
@@ -5823,11 +5896,7 @@ class MainTable(tk.Canvas):
                     fill=(
                         self.PAR.ops.table_selected_cells_bg
                         if high_bg is None
-                        else (
-                            f"#{int((int(high_bg[1:3], 16) + sel_cells_bg[0]) / 2):02X}"
-                            + f"{int((int(high_bg[3:5], 16) + sel_cells_bg[1]) / 2):02X}"
-                            + f"{int((int(high_bg[5:], 16) + sel_cells_bg[2]) / 2):02X}"
-                        )
+                        else self.color_cache.blend(high_bg, sel_cells_bg)
                     ),
                     outline=self.PAR.ops.table_fg if has_dd and self.PAR.ops.show_dropdown_borders else "",
                     tags=tags,
@@ -5836,13 +5905,13 @@ class MainTable(tk.Canvas):
                 )
 
             # cell is highlighted and row selected
-            elif "rows" in selections and r in selections["rows"]:
+            elif selections.row(r):
                 txtfg = (
                     self.PAR.ops.table_selected_rows_fg
                     if kwargs[1] is None or self.PAR.ops.display_selected_fg_over_highlights
                     else kwargs[1]
                 )
-                self.redraw_highlight(
+                iid = self.redraw_highlight(
                     x1=fc + 1,
                     y1=fr + 1,
                     x2=sc,
@@ -5850,11 +5919,7 @@ class MainTable(tk.Canvas):
                     fill=(
                         self.PAR.ops.table_selected_rows_bg
                         if high_bg is None
-                        else (
-                            f"#{int((int(high_bg[1:3], 16) + sel_rows_bg[0]) / 2):02X}"
-                            + f"{int((int(high_bg[3:5], 16) + sel_rows_bg[1]) / 2):02X}"
-                            + f"{int((int(high_bg[5:], 16) + sel_rows_bg[2]) / 2):02X}"
-                        )
+                        else self.color_cache.blend(high_bg, sel_rows_bg)
                     ),
                     outline=self.PAR.ops.table_fg if has_dd and self.PAR.ops.show_dropdown_borders else "",
                     tags=tags,
@@ -5863,13 +5928,13 @@ class MainTable(tk.Canvas):
                 )
 
             # cell is highlighted and column selected
-            elif "columns" in selections and c in selections["columns"]:
+            elif selections.column(c):
                 txtfg = (
                     self.PAR.ops.table_selected_columns_fg
                     if kwargs[1] is None or self.PAR.ops.display_selected_fg_over_highlights
                     else kwargs[1]
                 )
-                self.redraw_highlight(
+                iid = self.redraw_highlight(
                     x1=fc + 1,
                     y1=fr + 1,
                     x2=sc,
@@ -5877,11 +5942,7 @@ class MainTable(tk.Canvas):
                     fill=(
                         self.PAR.ops.table_selected_columns_bg
                         if high_bg is None
-                        else (
-                            f"#{int((int(high_bg[1:3], 16) + sel_cols_bg[0]) / 2):02X}"
-                            + f"{int((int(high_bg[3:5], 16) + sel_cols_bg[1]) / 2):02X}"
-                            + f"{int((int(high_bg[5:], 16) + sel_cols_bg[2]) / 2):02X}"
-                        )
+                        else self.color_cache.blend(high_bg, sel_cols_bg)
                     ),
                     outline=self.PAR.ops.table_fg if has_dd and self.PAR.ops.show_dropdown_borders else "",
                     tags=tags,
@@ -5894,7 +5955,7 @@ class MainTable(tk.Canvas):
                 txtfg = self.PAR.ops.table_fg if kwargs[1] is None else kwargs[1]
                 if high_bg:  # Only draw if fill exists
                     if not isinstance(kwargs, ProgressBar):
-                        self.redraw_highlight(
+                        iid = self.redraw_highlight(
                             x1=fc + 1,
                             y1=fr + 1,
                             x2=sc,
@@ -5909,7 +5970,7 @@ class MainTable(tk.Canvas):
                         if kwargs.del_when_done and kwargs.percent >= 100:
                             del self.progress_bars[(datarn, datacn)]
                         else:
-                            self.redraw_highlight(
+                            iid = self.redraw_highlight(
                                 x1=fc + 1,
                                 y1=fr + 1,
                                 x2=sc,
@@ -5922,9 +5983,9 @@ class MainTable(tk.Canvas):
                             )
 
         elif not kwargs:
-            if "cells" in selections and (r, c) in selections["cells"]:
+            if selections.cell(r, c):
                 txtfg = self.PAR.ops.table_selected_cells_fg
-                self.redraw_highlight(
+                iid = self.redraw_highlight(
                     x1=fc + 1,
                     y1=fr + 1,
                     x2=sc,
@@ -5935,9 +5996,9 @@ class MainTable(tk.Canvas):
                     can_width=None,
                     pc=None,
                 )
-            elif "rows" in selections and r in selections["rows"]:
+            elif selections.row(r):
                 txtfg = self.PAR.ops.table_selected_rows_fg
-                self.redraw_highlight(
+                iid = self.redraw_highlight(
                     x1=fc + 1,
                     y1=fr + 1,
                     x2=sc,
@@ -5948,9 +6009,9 @@ class MainTable(tk.Canvas):
                     can_width=None,
                     pc=None,
                 )
-            elif "columns" in selections and c in selections["columns"]:
+            elif selections.column(c):
                 txtfg = self.PAR.ops.table_selected_columns_fg
-                self.redraw_highlight(
+                iid = self.redraw_highlight(
                     x1=fc + 1,
                     y1=fr + 1,
                     x2=sc,
@@ -5963,7 +6024,7 @@ class MainTable(tk.Canvas):
                 )
             else:
                 txtfg = self.PAR.ops.table_fg
-                self.redraw_highlight(
+                iid = self.redraw_highlight(
                     x1=fc + 1,
                     y1=fr + 1,
                     x2=sc,
@@ -5974,7 +6035,7 @@ class MainTable(tk.Canvas):
                     can_width=None,
                     pc=None,
                 )
-        return txtfg
+        return txtfg, iid
 
     def redraw_highlight(
         self,
@@ -5987,7 +6048,7 @@ class MainTable(tk.Canvas):
         tags: str | tuple[str],
         can_width: None | float = None,
         pc: None | float = None,
-    ) -> bool:
+    ) -> int:
         if not self.PAR.ops.show_horizontal_grid:
             y2 += 1
         if not self.PAR.ops.show_vertical_grid:
@@ -6005,25 +6066,27 @@ class MainTable(tk.Canvas):
             coords = (x1, y1, (x2 - x1) * (pc / 100), y2)
         if self.hidd_high:
             iid, showing = self.hidd_high.popitem()
-            self.coords(iid, coords)
+            self.canvas_coords(iid, coords)
             if showing:
-                self.itemconfig(iid, fill=fill, outline=outline, tags=tags)
+                self.canvas_itemconfig(iid, fill=fill, outline=outline, tags=tags)
             else:
-                self.itemconfig(iid, fill=fill, outline=outline, state="normal", tags=tags)
+                self.canvas_itemconfig(iid, fill=fill, outline=outline, state="normal", tags=tags)
         else:
             iid = self.create_rectangle(coords, fill=fill, outline=outline, tags=tags)
         self.disp_high[iid] = True
-        return True
+        return iid
 
     def redraw_gridline(self, points: list[float]) -> None:
         if points:
             if self.hidd_grid:
                 iid, sh = self.hidd_grid.popitem()
-                self.coords(iid, points)
+                self.canvas_coords(iid, points)
                 if sh:
-                    self.itemconfig(iid, fill=self.PAR.ops.table_grid_fg, width=1, capstyle="butt", joinstyle="round")
+                    self.canvas_itemconfig(
+                        iid, fill=self.PAR.ops.table_grid_fg, width=1, capstyle="butt", joinstyle="round"
+                    )
                 else:
-                    self.itemconfig(
+                    self.canvas_itemconfig(
                         iid,
                         fill=self.PAR.ops.table_grid_fg,
                         width=1,
@@ -6119,21 +6182,40 @@ class MainTable(tk.Canvas):
             self.PAR.yscroll.grid()
             self.PAR.yscroll_showing = True
 
-    def _overflow(
-        self,
-        cells: dict,
-        rnge: Generator[int],
-        datarn: int,
-    ) -> Generator[float]:
-        for c_ in rnge:
-            if (
-                cells[(datarn, cells["datacn"][c_])]
-                or (datarn, cells["datacn"][c_]) in cells["dropdown"]
-                or (datarn, cells["datacn"][c_]) in cells["checkbox"]
-            ):
-                return
-            else:
-                yield self.col_positions[c_ + 1] - self.col_positions[c_]
+    def poll_paged_data(self) -> None:
+        """
+        Redraws the rows of pages which have finished loading
+        """
+        self.paged_data_poll_id = None
+        if not isinstance(self.data, PagedData):
+            return
+        try:
+            rows = self.data.poll()
+        finally:
+            # poll() raises the source's errors, the pages loaded with them are redrawn next time
+            if self.data.pending or self.data.updated:
+                self.paged_data_poll_id = self.after(self.data.poll_interval, self.poll_paged_data)
+        if rows:
+            self.dirty.add_rows(rows)
+            self.PAR.set_refresh_timer(dirty=True)
+
+    def close_data(self, new_data: Any = None) -> None:
+        """
+        Stops the worker thread of the table's PagedData and closes its
+        CSVFileData, used when the table data is replaced by new_data or
+        the sheet is destroyed
+        """
+        if self.paged_data_poll_id is not None:
+            self.after_cancel(self.paged_data_poll_id)
+            self.paged_data_poll_id = None
+        if not isinstance(self.data, VirtualData) or self.data is new_data:
+            return
+        if isinstance(self.data, PagedData):
+            self.data.close()
+        if isinstance(self.data.source, CSVFileData) and not (
+            isinstance(new_data, VirtualData) and new_data.source is self.data.source
+        ):
+            self.data.source.close()
 
     def _redraw_precache_cells(
         self,
@@ -6141,42 +6223,193 @@ class MainTable(tk.Canvas):
         text_end_row: int,
         text_start_col: int,
         text_end_col: int,
+        keep_rows: range = range(0),
+        keep_cols: range = range(0),
     ) -> dict:
-        cells = {"datarn": {}, "datacn": {}, "dropdown": {}, "checkbox": {}}
-        for r in range(text_start_row, text_end_row):
-            datarn = r if self.all_rows_displayed else self.displayed_rows[r]
-            cells["datarn"][r] = datarn
-            for c in range(text_start_col, text_end_col):
-                if c in cells["datacn"]:
-                    datacn = cells["datacn"][c]
-                else:
-                    datacn = c if self.all_columns_displayed else self.displayed_columns[c]
-                    cells["datacn"][c] = datacn
+        # display strings of cells which are kept are taken from the previous frame
+        prev_cells = self.redraw_frame["cells"] if keep_rows and keep_cols else {}
+        cells = {"datarn": {}, "datacn": {}, "options": {}, "dropdown": {}, "checkbox": {}}
+        if isinstance(self.data, VirtualData):
+            # fetch all of the visible rows at once rather than one cell at a time
+            self.data.prefetch(
+                range(text_start_row, text_end_row)
+                if self.all_rows_displayed
+                else self.displayed_rows[text_start_row:text_end_row]
+            )
+            if isinstance(self.data, PagedData) and self.data.pending and self.paged_data_poll_id is None:
+                self.paged_data_poll_id = self.after(self.data.poll_interval, self.poll_paged_data)
+        if overflow := self.PAR.ops.allow_cell_overflow:
+            # per row, the sorted displayed columns which text can't overflow into
+            cells["overflow_stops"] = {}
+        if text_start_row < text_end_row:
+            cells["datarn"] = dict(
+                zip(
+                    range(text_start_row, text_end_row),
+                    range(text_start_row, text_end_row)
+                    if self.all_rows_displayed
+                    else self.displayed_rows[text_start_row:text_end_row],
+                )
+            )
+            cells["datacn"] = dict(
+                zip(
+                    range(text_start_col, text_end_col),
+                    range(text_start_col, text_end_col)
+                    if self.all_columns_displayed
+                    else self.displayed_columns[text_start_col:text_end_col],
+                )
+            )
+        # every option of each cell is resolved once and used for the whole redraw
+        cells["options"] = self.resolved_options_area(cells["datarn"].values(), cells["datacn"].values())
+        for r, datarn in cells["datarn"].items():
+            if overflow:
+                cells["overflow_stops"][r] = stops = []
+            for c, datacn in cells["datacn"].items():
                 t = (datarn, datacn)
+                opts = cells["options"][t]
+                if "dropdown" in opts:
+                    cells["dropdown"][t] = opts["dropdown"]
+                elif "checkbox" in opts:
+                    cells["checkbox"][t] = opts["checkbox"]
+
+                if r in keep_rows and c in keep_cols and t in prev_cells:
+                    cells[t] = prev_cells[t]
+                else:
+                    cells[t] = self.redraw_cell_str(datarn, datacn, opts)
+                if overflow and (cells[t] or t in cells["dropdown"] or t in cells["checkbox"]):
+                    stops.append(c)
 
-                # self.get_cell_kwargs not used here to boost performance
-                if t in self.cell_options and "dropdown" in self.cell_options[t]:
-                    cells["dropdown"][t] = self.cell_options[t]["dropdown"]
-
-                elif datarn in self.row_options and "dropdown" in self.row_options[datarn]:
-                    cells["dropdown"][t] = self.row_options[datarn]["dropdown"]
+        return cells
 
-                elif datacn in self.col_options and "dropdown" in self.col_options[datacn]:
-                    cells["dropdown"][t] = self.col_options[datacn]["dropdown"]
+    def redraw_loading(self, datarn: int) -> bool:
+        return isinstance(self.data, PagedData) and self.data.loading(datarn)
 
-                else:
-                    if t in self.cell_options and "checkbox" in self.cell_options[t]:
-                        cells["checkbox"][t] = self.cell_options[t]["checkbox"]
+    def redraw_cell_str(self, datarn: int, datacn: int, options: dict) -> str:
+        """
+        The text a redraw shows for a cell, the placeholder
+        while the cell is in a PagedData page which is loading
+        """
+        if self.redraw_loading(datarn):
+            return f"{self.data.placeholder}"
+        return self.cell_str(datarn, datacn, get_displayed=True, options=options)
 
-                    elif datarn in self.row_options and "checkbox" in self.row_options[datarn]:
-                        cells["checkbox"][t] = self.row_options[datarn]["checkbox"]
+    def overflow_width(self, stops: list[int], c: int, align: str, start: int, end: int) -> int:
+        """
+        The width of the empty cells next to column c that its text can overflow into
+        stops: the sorted columns with content in the row, see _redraw_precache_cells()
+        start, end: the range of columns the stops were collected from
+        """
+        if align[-1] == "w":
+            idx = bisect_right(stops, c)
+            return self.col_positions[stops[idx] if idx < len(stops) else end] - self.col_positions[c + 1]
+        elif align[-1] == "e":
+            idx = bisect_left(stops, c)
+            return self.col_positions[c] - self.col_positions[stops[idx - 1] + 1 if idx else start]
+        return 0
+
+    def wrap_lines(
+        self,
+        text: str,
+        max_width: int,
+        max_lines: int | float,
+        char_width_fn: Callable,
+        font: FontTuple,
+        wrap: Literal["", "c", "w"] = "",
+        start_line: int = 0,
+    ) -> tuple[str, ...]:
+        """
+        wrap_text() with the resulting lines stored in self.text_layouts
+        """
+        key = (text, max_width, max_lines, font, wrap, start_line)
+        if (lines := self.text_layouts.get(key)) is None:
+            lines = tuple(
+                wrap_text(
+                    text=text,
+                    max_width=max_width,
+                    max_lines=max_lines,
+                    char_width_fn=char_width_fn,
+                    widths=self.char_widths[font],
+                    wrap=wrap,
+                    start_line=start_line,
+                )
+            )
+            self.text_layouts.add(key, lines)
+        return lines
 
-                    elif datacn in self.col_options and "checkbox" in self.col_options[datacn]:
-                        cells["checkbox"][t] = self.col_options[datacn]["checkbox"]
+    def visible_chars(self) -> set[str]:
+        """
+        The characters in the table cells drawn by the last redraw
+        """
+        cells = self.redraw_frame["cells"] if self.redraw_frame else {}
+        return {ch for k, v in cells.items() if isinstance(k, tuple) for ch in v}
 
-                cells[t] = self.cell_str(datarn, datacn, get_displayed=True)
+    def preload_char_widths(self, font: FontTuple, chars: Iterable[str] = ()) -> None:
+        """
+        Measures the widths of the ASCII and Latin-1 characters plus any in chars
+        which aren't already known for font, in a single Tcl evaluation
+        Widths stored in the char_widths_file option's file are used if available
+        """
+        widths = self.char_widths.setdefault(font, {})
+        if not widths and self.PAR.ops.char_widths_file:
+            widths.update(self.load_char_widths_file().get(self.char_widths_key(font), {}))
+        to_measure = tuple(dict.fromkeys(c for c in chain(_preload_chars, chars) if c not in widths and c != "\t"))
+        if not to_measure:
+            return
+        try:
+            measured = self.tk.splitlist(
+                self.tk.call(
+                    "apply",
+                    _measure_chars_tcl,
+                    str(self.txt_measure_canvas),
+                    self.txt_measure_canvas_text,
+                    font,
+                    _test_str,
+                    to_measure,
+                )
+            )
+        except TclError:
+            return
+        widths.update(zip(to_measure, map(int, measured)))
+        if self.PAR.ops.char_widths_file:
+            self.save_char_widths_file()
 
-        return cells
+    def preload_zoom_char_widths(self) -> None:
+        """
+        Measures the fonts one zoom step either side of the current table, index and header
+        fonts, one font per idle callback so that the interface stays responsive
+        """
+        fonts = [
+            FontTuple(font[0], font[1] + step, font[2])
+            for font in (self.PAR.ops.table_font, self.PAR.ops.index_font, self.PAR.ops.header_font)
+            for step in (1, -1)
+            if font[1] + step > 0
+        ]
+        pending = list(dict.fromkeys(font for font in fonts if font not in self.char_widths))
+
+        def measure_next() -> None:
+            if pending:
+                self.preload_char_widths(pending.pop(0))
+                if pending:
+                    self.after_idle(measure_next)
+
+        if pending:
+            self.after_idle(measure_next)
+
+    def char_widths_key(self, font: FontTuple) -> str:
+        return f"{font[0]}|{font[1]}|{font[2]}|{self.tk.call('tk', 'scaling')}"
+
+    def load_char_widths_file(self) -> dict[str, dict[str, int]]:
+        if self.char_widths_file_data is None:
+            self.char_widths_file_data = {}
+            with suppress(OSError, ValueError), open(self.PAR.ops.char_widths_file, encoding="utf-8") as f:
+                if isinstance(data := json.load(f), dict):
+                    self.char_widths_file_data = data
+        return self.char_widths_file_data
+
+    def save_char_widths_file(self) -> None:
+        data = self.load_char_widths_file()
+        data.update((self.char_widths_key(font), widths) for font, widths in self.char_widths.items() if widths)
+        with suppress(OSError), open(self.PAR.ops.char_widths_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
 
     def char_width_fn(self, c: str) -> int:
         if c in self.char_widths[self.table_font]:
@@ -6201,16 +6434,15 @@ class MainTable(tk.Canvas):
             self.char_widths[self.table_font][c] = wd
             return wd
 
-    def redraw_corner(self, x: float, y: float, tags: str | tuple[str]) -> None:
+    def redraw_corner(self, x: float, y: float, tags: str | tuple[str]) -> int:
         if self.hidd_corners:
             iid = self.hidd_corners.pop()
-            self.coords(iid, x - 10, y, x, y, x, y + 10)
-            self.itemconfig(iid, fill=self.PAR.ops.table_grid_fg, state="normal", tags=tags)
-            self.disp_corners.add(iid)
+            self.canvas_coords(iid, x - 10, y, x, y, x, y + 10)
+            self.canvas_itemconfig(iid, fill=self.PAR.ops.table_grid_fg, state="normal", tags=tags)
         else:
-            self.disp_corners.add(
-                self.create_polygon(x - 10, y, x, y, x, y + 10, fill=self.PAR.ops.table_grid_fg, tags=tags)
-            )
+            iid = self.create_polygon(x - 10, y, x, y, x, y + 10, fill=self.PAR.ops.table_grid_fg, tags=tags)
+        self.disp_corners.add(iid)
+        return iid
 
     def redraw_grid_and_text(
         self,
@@ -6234,20 +6466,37 @@ class MainTable(tk.Canvas):
         text_end_row: int,
         text_start_col: int,
         text_end_col: int,
+        keep_rows: range = range(0),
+        keep_cols: range = range(0),
     ) -> None:
+        """
+        keep_rows, keep_cols: displayed cells in both are already drawn
+                              correctly e.g. after scrolling and are left as they are
+        """
+        self.start_tcl_batch()
         # reset canvas item storage
-        self.hidd_text.update(self.disp_text)
-        self.disp_text = {}
-        self.hidd_high.update(self.disp_high)
-        self.disp_high = {}
+        if keep_rows and keep_cols:
+            drawn_cells = {}
+            for loc, items in self.drawn_cells.items():
+                if loc[0] in keep_rows and loc[1] in keep_cols:
+                    drawn_cells[loc] = items
+                else:
+                    release_drawn_items(self, items)
+            self.drawn_cells = drawn_cells
+        else:
+            self.hidd_text.update(self.disp_text)
+            self.disp_text = {}
+            self.hidd_high.update(self.disp_high)
+            self.disp_high = {}
+            self.hidd_dropdown.update(self.disp_dropdown)
+            self.disp_dropdown = {}
+            self.hidd_checkbox.update(self.disp_checkbox)
+            self.disp_checkbox = {}
+            self.hidd_corners.update(self.disp_corners)
+            self.disp_corners = set()
+            self.drawn_cells = {}
         self.hidd_grid.update(self.disp_grid)
         self.disp_grid = {}
-        self.hidd_dropdown.update(self.disp_dropdown)
-        self.disp_dropdown = {}
-        self.hidd_checkbox.update(self.disp_checkbox)
-        self.disp_checkbox = {}
-        self.hidd_corners.update(self.disp_corners)
-        self.disp_corners = set()
         points = []
         # manage horizontal grid lines
         if self.PAR.ops.show_horizontal_grid and row_pos_exists:
@@ -6284,12 +6533,6 @@ class MainTable(tk.Canvas):
         if points:
             self.redraw_gridline(points)
 
-        font = self.PAR.ops.table_font
-        dd_coords = self.dropdown.get_coords()
-        selections = self.get_redraw_selections(text_start_row, grid_end_row, text_start_col, grid_end_col)
-        sel_cells_bg = color_tup(self.PAR.ops.table_selected_cells_bg)
-        sel_cols_bg = color_tup(self.PAR.ops.table_selected_columns_bg)
-        sel_rows_bg = color_tup(self.PAR.ops.table_selected_rows_bg)
         current_loc = (self.selected.row, self.selected.column) if self.selected else ()
         if self.PAR.ops.alternate_color:
             alternate_color = Highlight(
@@ -6308,233 +6551,329 @@ class MainTable(tk.Canvas):
             override = ()
         else:
             override = (
-                color_tup(self.PAR.ops.table_selected_cells_fg),
-                color_tup(self.PAR.ops.table_selected_columns_fg),
-                color_tup(self.PAR.ops.table_selected_rows_fg),
+                self.PAR.ops.table_selected_cells_fg,
+                self.PAR.ops.table_selected_columns_fg,
+                self.PAR.ops.table_selected_rows_fg,
             )
-        allow_overflow = self.PAR.ops.allow_cell_overflow
-        wrap = self.PAR.ops.table_wrap
-        cells = self._redraw_precache_cells(
-            text_start_row=text_start_row,
-            text_end_row=text_end_row,
-            text_start_col=text_start_col,
-            text_end_col=text_end_col,
+        # everything needed to draw any visible cell, kept so that
+        # individual cells can be redrawn without redrawing the whole table
+        self.redraw_frame = {
+            "font": self.PAR.ops.table_font,
+            "dd_coords": self.dropdown.get_coords(),
+            "selections": self.get_redraw_selections(all_states=not self.PAR.ops.show_selected_cells_border),
+            "sel_cells_bg": self.PAR.ops.table_selected_cells_bg,
+            "sel_cols_bg": self.PAR.ops.table_selected_columns_bg,
+            "sel_rows_bg": self.PAR.ops.table_selected_rows_bg,
+            "current_loc": current_loc,
+            "alternate_color": alternate_color,
+            "dont_blend": dont_blend,
+            "override": override,
+            "allow_overflow": self.PAR.ops.allow_cell_overflow,
+            "wrap": self.PAR.ops.table_wrap,
+            "note_corners": self.PAR.ops.note_corners,
+            "scrollpos_top": scrollpos_top,
+            "scrollpos_right": scrollpos_right,
+            "can_width": can_width,
+            "text_start_col": text_start_col,
+            "text_end_col": text_end_col,
+            "cells": self._redraw_precache_cells(
+                text_start_row=text_start_row,
+                text_end_row=text_end_row,
+                text_start_col=text_start_col,
+                text_end_col=text_end_col,
+                keep_rows=keep_rows,
+                keep_cols=keep_cols,
+            ),
+        }
+        self.redraw_cells(
+            to_draw=(
+                (r, c)
+                for r in range(text_start_row, text_end_row)
+                for c in range(text_start_col, text_end_col)
+                if r not in keep_rows or c not in keep_cols
+            ),
+            frame=self.redraw_frame,
         )
-        note_corners = self.PAR.ops.note_corners
+        for dct in (
+            self.hidd_text,
+            self.hidd_high,
+            self.hidd_grid,
+            self.hidd_dropdown,
+            self.hidd_checkbox,
+        ):
+            for iid, showing in dct.items():
+                if showing:
+                    self.canvas_itemconfig(iid, state="hidden")
+                    dct[iid] = False
+        for iid in self.hidd_corners:
+            self.canvas_itemconfig(iid, state="hidden")
+        self.run_tcl_batch()
+        self.lift_table_items()
+        self.tag_bind("c", "<Enter>", self.enter_cell)
+        self.tag_bind("c", "<Leave>", self.leave_cell)
+
+    def redraw_cells(self, to_draw: Iterator[tuple[int, int]], frame: dict) -> None:
+        """
+        to_draw is an iterable of displayed (row, column) tuples
+        canvas items are taken from the hidden item storage
+        and the items used for each cell are stored in self.drawn_cells
+        """
+        font = frame["font"]
+        dd_coords = frame["dd_coords"]
+        selections = frame["selections"]
+        sel_cells_bg = frame["sel_cells_bg"]
+        sel_cols_bg = frame["sel_cols_bg"]
+        sel_rows_bg = frame["sel_rows_bg"]
+        current_loc = frame["current_loc"]
+        alternate_color = frame["alternate_color"]
+        dont_blend = frame["dont_blend"]
+        override = frame["override"]
+        allow_overflow = frame["allow_overflow"]
+        wrap = frame["wrap"]
+        note_corners = frame["note_corners"]
+        scrollpos_top = frame["scrollpos_top"]
+        scrollpos_right = frame["scrollpos_right"]
+        can_width = frame["can_width"]
+        text_start_col = frame["text_start_col"]
+        text_end_col = frame["text_end_col"]
+        cells = frame["cells"]
+        drawn_cells = self.drawn_cells
 
         # This is a little messy but
         # we try to avoid any function use to maximise performance
-        for r in range(text_start_row, text_end_row):
+        for r, c in to_draw:
             rtopgridln = self.row_positions[r]
             rbotgridln = self.row_positions[r + 1]
             datarn = cells["datarn"][r]
-            for c in range(text_start_col, text_end_col):
-                cleftgridln = self.col_positions[c]
-                crightgridln = self.col_positions[c + 1]
-                datacn = cells["datacn"][c]
-                disp_loc = (r, c)
-                loc = (datarn, datacn)
-                tag = f"{r}_{c}"
-                fill = self.redraw_highlight_get_text_fg(
-                    r=r,
-                    c=c,
-                    fc=cleftgridln,
-                    fr=rtopgridln,
-                    sc=crightgridln,
-                    sr=rbotgridln,
-                    sel_cells_bg=override[0] if override and disp_loc == current_loc else sel_cells_bg,
-                    sel_cols_bg=override[1] if override and disp_loc == current_loc else sel_cols_bg,
-                    sel_rows_bg=override[2] if override and disp_loc == current_loc else sel_rows_bg,
-                    selections=selections,
-                    datarn=datarn,
-                    datacn=datacn,
-                    can_width=can_width,
-                    dont_blend=disp_loc == dont_blend,
-                    alternate_color=alternate_color,
-                    has_dd=loc in cells["dropdown"],
-                    tags=("h", "c", tag),
-                )
-                if loc in self.cell_options and "align" in self.cell_options[(datarn, datacn)]:
-                    align = self.cell_options[(datarn, datacn)]["align"]
-                elif datarn in self.row_options and "align" in self.row_options[datarn]:
-                    align = self.row_options[datarn]["align"]
-                elif datacn in self.col_options and "align" in self.col_options[datacn]:
-                    align = self.col_options[datacn]["align"]
-                else:
-                    align = self.align
+            cleftgridln = self.col_positions[c]
+            crightgridln = self.col_positions[c + 1]
+            datacn = cells["datacn"][c]
+            disp_loc = (r, c)
+            loc = (datarn, datacn)
+            tag = f"{r}_{c}"
+            opts = cells["options"][loc]
+            drawn_cells[disp_loc] = items = []
+            fill, iid = self.redraw_highlight_get_text_fg(
+                r=r,
+                c=c,
+                fc=cleftgridln,
+                fr=rtopgridln,
+                sc=crightgridln,
+                sr=rbotgridln,
+                sel_cells_bg=override[0] if override and disp_loc == current_loc else sel_cells_bg,
+                sel_cols_bg=override[1] if override and disp_loc == current_loc else sel_cols_bg,
+                sel_rows_bg=override[2] if override and disp_loc == current_loc else sel_rows_bg,
+                selections=selections,
+                datarn=datarn,
+                datacn=datacn,
+                can_width=can_width,
+                dont_blend=disp_loc == dont_blend,
+                alternate_color=alternate_color,
+                has_dd=loc in cells["dropdown"],
+                tags=("h", "c", tag),
+                options=opts,
+            )
+            if iid is not None:
+                items.append(("high", iid))
+            align = opts["align"] if "align" in opts else self.align
 
-                kws = cells["dropdown"][loc] if loc in cells["dropdown"] else None
-                if kws:
-                    max_width = crightgridln - cleftgridln - self.table_txt_height - 5
-                    if align[-1] == "w":
-                        draw_x = cleftgridln + 2
-                    elif align[-1] == "e":
-                        draw_x = crightgridln - 5 - self.table_txt_height
-                    elif align[-1] == "n":
-                        draw_x = cleftgridln + (crightgridln - cleftgridln - self.table_txt_height) / 2
-
-                    # redraw dropdown
-
-                    x1 = cleftgridln
-                    y1 = rtopgridln
-                    x2 = crightgridln
-                    y2 = self.row_positions[r + 1]
-                    # if not dd_drawn and self.PAR.ops.show_dropdown_borders:
-                    #     self.redraw_highlight(x1 + 1, y1 + 1, x2, y2, fill="", outline=self.PAR.ops.table_fg)
-                    if max_width >= 5:
-                        if dd_coords == disp_loc:
-                            # up arrow
-                            points = (
-                                x2 - self.dd_up_arrow[0],
-                                y1 + self.dd_up_arrow[1],
-                                x2 - self.dd_up_arrow[2],
-                                y1 + self.dd_up_arrow[3],
-                                x2 - self.dd_up_arrow[4],
-                                y1 + self.dd_up_arrow[5],
-                            )
-                        else:
-                            # down arrow
-                            points = (
-                                x2 - self.dd_down_arrow[0],
-                                y1 + self.dd_down_arrow[1],
-                                x2 - self.dd_down_arrow[2],
-                                y1 + self.dd_down_arrow[3],
-                                x2 - self.dd_down_arrow[4],
-                                y1 + self.dd_down_arrow[5],
-                            )
-                        _fill = fill if kws["state"] != "disabled" else self.PAR.ops.table_grid_fg
-                        if self.hidd_dropdown:
-                            cid, sh = self.hidd_dropdown.popitem()
-                            self.coords(cid, points)
-                            if sh:
-                                self.itemconfig(cid, fill=_fill)
-                            else:
-                                self.itemconfig(cid, fill=_fill, state="normal")
+            kws = cells["dropdown"][loc] if loc in cells["dropdown"] else None
+            if kws:
+                max_width = crightgridln - cleftgridln - self.table_txt_height - 5
+                if align[-1] == "w":
+                    draw_x = cleftgridln + 2
+                elif align[-1] == "e":
+                    draw_x = crightgridln - 5 - self.table_txt_height
+                elif align[-1] == "n":
+                    draw_x = cleftgridln + (crightgridln - cleftgridln - self.table_txt_height) / 2
+
+                # redraw dropdown
+
+                x1 = cleftgridln
+                y1 = rtopgridln
+                x2 = crightgridln
+                y2 = self.row_positions[r + 1]
+                # if not dd_drawn and self.PAR.ops.show_dropdown_borders:
+                #     self.redraw_highlight(x1 + 1, y1 + 1, x2, y2, fill="", outline=self.PAR.ops.table_fg)
+                if max_width >= 5:
+                    if dd_coords == disp_loc:
+                        # up arrow
+                        points = (
+                            x2 - self.dd_up_arrow[0],
+                            y1 + self.dd_up_arrow[1],
+                            x2 - self.dd_up_arrow[2],
+                            y1 + self.dd_up_arrow[3],
+                            x2 - self.dd_up_arrow[4],
+                            y1 + self.dd_up_arrow[5],
+                        )
+                    else:
+                        # down arrow
+                        points = (
+                            x2 - self.dd_down_arrow[0],
+                            y1 + self.dd_down_arrow[1],
+                            x2 - self.dd_down_arrow[2],
+                            y1 + self.dd_down_arrow[3],
+                            x2 - self.dd_down_arrow[4],
+                            y1 + self.dd_down_arrow[5],
+                        )
+                    _fill = fill if kws["state"] != "disabled" else self.PAR.ops.table_grid_fg
+                    if self.hidd_dropdown:
+                        cid, sh = self.hidd_dropdown.popitem()
+                        self.canvas_coords(cid, points)
+                        if sh:
+                            self.canvas_itemconfig(cid, fill=_fill)
                         else:
-                            cid = self.create_line(
-                                points, fill=_fill, width=2, capstyle="round", joinstyle="bevel", tag="lift"
-                            )
-                        self.disp_dropdown[cid] = True
+                            self.canvas_itemconfig(cid, fill=_fill, state="normal")
+                    else:
+                        cid = self.create_line(
+                            points, fill=_fill, width=2, capstyle="round", joinstyle="bevel", tag="lift"
+                        )
+                    self.disp_dropdown[cid] = True
+                    items.append(("dropdown", cid))
 
-                elif loc in cells["checkbox"]:
-                    kws = cells["checkbox"][loc]
+            elif loc in cells["checkbox"]:
+                kws = cells["checkbox"][loc]
 
+                if align[-1] == "w":
+                    draw_x = cleftgridln + 2
+                elif align[-1] == "e":
+                    draw_x = crightgridln - 2
+                elif align[-1] == "n":
+                    draw_x = cleftgridln + (crightgridln - cleftgridln) / 2
+
+                max_width = crightgridln - cleftgridln - 2
+
+                if max_width > self.table_txt_height + 1:
+                    box_w = self.table_txt_height + 1
                     if align[-1] == "w":
-                        draw_x = cleftgridln + 2
-                    elif align[-1] == "e":
-                        draw_x = crightgridln - 2
+                        draw_x += box_w + 3
                     elif align[-1] == "n":
-                        draw_x = cleftgridln + (crightgridln - cleftgridln) / 2
-
-                    max_width = crightgridln - cleftgridln - 2
-
-                    if max_width > self.table_txt_height + 1:
-                        box_w = self.table_txt_height + 1
-                        if align[-1] == "w":
-                            draw_x += box_w + 3
-                        elif align[-1] == "n":
-                            draw_x += box_w / 2 + 1
-                        max_width -= box_w + 4
-                        try:
-                            draw_check = bool(self.data[datarn][datacn])
-                        except Exception:
-                            draw_check = False
-
-                        # redraw checkbox
-
-                        x1 = cleftgridln + 2
-                        y1 = rtopgridln + 2
-                        x2 = cleftgridln + self.table_txt_height + 3
-                        y2 = rtopgridln + self.table_txt_height + 3
-                        points = rounded_box_coords(x1, y1, x2, y2)
-                        _fill = fill if kws["state"] == "normal" else self.PAR.ops.table_grid_fg
+                        draw_x += box_w / 2 + 1
+                    max_width -= box_w + 4
+                    try:
+                        draw_check = not self.redraw_loading(datarn) and bool(self.data[datarn][datacn])
+                    except Exception:
+                        draw_check = False
+
+                    # redraw checkbox
+
+                    x1 = cleftgridln + 2
+                    y1 = rtopgridln + 2
+                    x2 = cleftgridln + self.table_txt_height + 3
+                    y2 = rtopgridln + self.table_txt_height + 3
+                    points = rounded_box_coords(x1, y1, x2, y2)
+                    _fill = fill if kws["state"] == "normal" else self.PAR.ops.table_grid_fg
+                    if self.hidd_checkbox:
+                        cid, sh = self.hidd_checkbox.popitem()
+                        self.canvas_coords(cid, points)
+                        if sh:
+                            self.canvas_itemconfig(cid, fill="", outline=_fill)
+                        else:
+                            self.canvas_itemconfig(cid, fill="", outline=_fill, state="normal")
+                    else:
+                        cid = self.create_polygon(points, fill="", outline=_fill, smooth=True, tag="lift")
+                    self.disp_checkbox[cid] = True
+                    items.append(("checkbox", cid))
+                    if draw_check:
+                        points = rounded_box_coords(x1 + 4, y1 + 4, x2 - 3, y2 - 3, radius=4)
                         if self.hidd_checkbox:
                             cid, sh = self.hidd_checkbox.popitem()
-                            self.coords(cid, points)
+                            self.canvas_coords(cid, points)
                             if sh:
-                                self.itemconfig(cid, fill="", outline=_fill)
+                                self.canvas_itemconfig(cid, fill=_fill, outline="")
                             else:
-                                self.itemconfig(cid, fill="", outline=_fill, state="normal")
+                                self.canvas_itemconfig(cid, fill=_fill, outline="", state="normal")
                         else:
-                            cid = self.create_polygon(points, fill="", outline=_fill, smooth=True, tag="lift")
+                            cid = self.create_polygon(points, fill=_fill, outline="", smooth=True, tag="lift")
                         self.disp_checkbox[cid] = True
-                        if draw_check:
-                            points = rounded_box_coords(x1 + 4, y1 + 4, x2 - 3, y2 - 3, radius=4)
-                            if self.hidd_checkbox:
-                                cid, sh = self.hidd_checkbox.popitem()
-                                self.coords(cid, points)
-                                if sh:
-                                    self.itemconfig(cid, fill=_fill, outline="")
-                                else:
-                                    self.itemconfig(cid, fill=_fill, outline="", state="normal")
-                            else:
-                                cid = self.create_polygon(points, fill=_fill, outline="", smooth=True, tag="lift")
-                            self.disp_checkbox[cid] = True
+                        items.append(("checkbox", cid))
 
-                else:
-                    max_width = crightgridln - cleftgridln - 2
-                    if align[-1] == "w":
-                        draw_x = cleftgridln + 2
-                    elif align[-1] == "e":
-                        draw_x = crightgridln - 2
-                    elif align[-1] == "n":
-                        draw_x = cleftgridln + (crightgridln - cleftgridln) / 2
+            else:
+                max_width = crightgridln - cleftgridln - 2
+                if align[-1] == "w":
+                    draw_x = cleftgridln + 2
+                elif align[-1] == "e":
+                    draw_x = crightgridln - 2
+                elif align[-1] == "n":
+                    draw_x = cleftgridln + (crightgridln - cleftgridln) / 2
 
-                tags = ("lift", "c", tag)
+            tags = ("lift", "c", tag)
 
-                if (
-                    note_corners
-                    and max_width > 5
-                    and (
-                        (loc in self.cell_options and "note" in self.cell_options[(datarn, datacn)])
-                        or (datarn in self.row_options and "note" in self.row_options[datarn])
-                        or (datacn in self.col_options and "note" in self.col_options[datacn])
+            if note_corners and max_width > 5 and "note" in opts:
+                items.append(("corners", self.redraw_corner(crightgridln, rtopgridln, tags)))
+
+            # redraw text
+            if not cells[loc] or (align[-1] == "w" and draw_x > scrollpos_right) or cleftgridln + 5 > scrollpos_right:
+                continue
+            if allow_overflow and not kws:
+                max_width += self.overflow_width(cells["overflow_stops"][r], c, align, text_start_col, text_end_col)
+            if max_width <= 1:
+                continue
+            start_line = max(0, int((scrollpos_top - rtopgridln) / self.table_txt_height))
+            draw_y = rtopgridln + 3 + (start_line * self.table_txt_height)
+            gen_lines = self.wrap_lines(
+                text=cells[loc],
+                max_width=max_width,
+                max_lines=int((rbotgridln - rtopgridln - 2) / self.table_txt_height),
+                char_width_fn=self.char_width_fn,
+                font=font,
+                wrap=wrap,
+                start_line=start_line,
+            )
+            if align[-1] == "w" or align[-1] == "e":
+                if self.hidd_text:
+                    iid, showing = self.hidd_text.popitem()
+                    self.canvas_coords(iid, draw_x, draw_y)
+                    if showing:
+                        self.canvas_itemconfig(
+                            iid,
+                            text="\n".join(gen_lines),
+                            fill=fill,
+                            font=font,
+                            anchor=align,
+                            tags=tags,
+                        )
+                    else:
+                        self.canvas_itemconfig(
+                            iid,
+                            text="\n".join(gen_lines),
+                            fill=fill,
+                            font=font,
+                            anchor=align,
+                            state="normal",
+                            tags=tags,
+                        )
+                else:
+                    iid = self.create_text(
+                        draw_x,
+                        draw_y,
+                        text="\n".join(gen_lines),
+                        fill=fill,
+                        font=font,
+                        anchor=align,
+                        tags=tags,
                     )
-                ):
-                    self.redraw_corner(crightgridln, rtopgridln, tags)
+                self.disp_text[iid] = True
+                items.append(("text", iid))
 
-                # redraw text
-                if (
-                    not cells[loc]
-                    or (align[-1] == "w" and draw_x > scrollpos_right)
-                    or cleftgridln + 5 > scrollpos_right
-                ):
-                    continue
-                if allow_overflow and not kws:
-                    if align[-1] == "w":
-                        max_width += sum(self._overflow(cells, range(c + 1, text_end_col), datarn))
-                    elif align[-1] == "e":
-                        max_width += sum(self._overflow(cells, reversed(range(text_start_col, c)), datarn))
-                if max_width <= 1:
-                    continue
-                start_line = max(0, int((scrollpos_top - rtopgridln) / self.table_txt_height))
-                draw_y = rtopgridln + 3 + (start_line * self.table_txt_height)
-                gen_lines = wrap_text(
-                    text=cells[loc],
-                    max_width=max_width,
-                    max_lines=int((rbotgridln - rtopgridln - 2) / self.table_txt_height),
-                    char_width_fn=self.char_width_fn,
-                    widths=self.char_widths[font],
-                    wrap=wrap,
-                    start_line=start_line,
-                )
-                if align[-1] == "w" or align[-1] == "e":
+            elif align[-1] == "n":
+                for t in gen_lines:
                     if self.hidd_text:
                         iid, showing = self.hidd_text.popitem()
-                        self.coords(iid, draw_x, draw_y)
+                        self.canvas_coords(iid, draw_x, draw_y)
                         if showing:
-                            self.itemconfig(
+                            self.canvas_itemconfig(
                                 iid,
-                                text="\n".join(gen_lines),
+                                text=t,
                                 fill=fill,
                                 font=font,
                                 anchor=align,
                                 tags=tags,
                             )
                         else:
-                            self.itemconfig(
+                            self.canvas_itemconfig(
                                 iid,
-                                text="\n".join(gen_lines),
+                                text=t,
                                 fill=fill,
                                 font=font,
                                 anchor=align,
@@ -6545,63 +6884,116 @@ class MainTable(tk.Canvas):
                         iid = self.create_text(
                             draw_x,
                             draw_y,
-                            text="\n".join(gen_lines),
+                            text=t,
                             fill=fill,
                             font=font,
                             anchor=align,
                             tags=tags,
                         )
                     self.disp_text[iid] = True
+                    items.append(("text", iid))
+                    draw_y += self.table_txt_height
 
-                elif align[-1] == "n":
-                    for t in gen_lines:
-                        if self.hidd_text:
-                            iid, showing = self.hidd_text.popitem()
-                            self.coords(iid, draw_x, draw_y)
-                            if showing:
-                                self.itemconfig(
-                                    iid,
-                                    text=t,
-                                    fill=fill,
-                                    font=font,
-                                    anchor=align,
-                                    tags=tags,
-                                )
-                            else:
-                                self.itemconfig(
-                                    iid,
-                                    text=t,
-                                    fill=fill,
-                                    font=font,
-                                    anchor=align,
-                                    state="normal",
-                                    tags=tags,
-                                )
-                        else:
-                            iid = self.create_text(
-                                draw_x,
-                                draw_y,
-                                text=t,
-                                fill=fill,
-                                font=font,
-                                anchor=align,
-                                tags=tags,
-                            )
-                        self.disp_text[iid] = True
-                        draw_y += self.table_txt_height
-        for dct in (
-            self.hidd_text,
-            self.hidd_high,
-            self.hidd_grid,
-            self.hidd_dropdown,
-            self.hidd_checkbox,
-        ):
-            for iid, showing in dct.items():
-                if showing:
-                    self.itemconfig(iid, state="hidden")
-                    dct[iid] = False
-        for iid in self.hidd_corners:
-            self.itemconfig(iid, state="hidden")
+    def dirty_cells_redrawable(self, dirty_only: bool, viewport: tuple | None) -> bool:
+        """
+        Whether redrawing only the dirty cells is enough, the
+        viewport must be the same as the one last drawn
+        """
+        return dirty_only and not self.dirty.all and viewport == self.drawn_viewport
+
+    def redraw_dirty_cells(
+        self,
+        text_start_row: int,
+        text_end_row: int,
+        text_start_col: int,
+        text_end_col: int,
+    ) -> None:
+        """
+        Redraws only the visible cells in self.dirty, reusing the
+        frame information stored by the last full redraw_grid_and_text()
+        Only valid if the viewport has not changed since the last full redraw
+        """
+        frame = self.redraw_frame
+        cells = frame["cells"]
+        datarns, datacns = cells["datarn"], cells["datacn"]
+        rows = range(text_start_row, text_end_row)
+        cols = range(text_start_col, text_end_col)
+        if frame["allow_overflow"]:
+            # cell text can overflow into neighbouring cells so whole rows are redrawn
+            to_draw = [
+                (r, c) for r in rows if any((datarns[r], datacns[c_]) in self.dirty for c_ in cols) for c in cols
+            ]
+        elif self.dirty.rows or self.dirty.columns or self.dirty.boxes or len(self.dirty.cells) > len(rows) * len(cols):
+            to_draw = [(r, c) for r in rows for c in cols if (datarns[r], datacns[c]) in self.dirty]
+        else:
+            to_draw = []
+            for datarn, datacn in self.dirty.cells:
+                r = datarn if self.all_rows_displayed else self.try_disprn(datarn)
+                c = datacn if self.all_columns_displayed else self.try_dispcn(datacn)
+                if r is not None and c is not None and r in rows and c in cols:
+                    to_draw.append((r, c))
+        if not to_draw:
+            return
+        self.start_tcl_batch()
+        released = []
+        for r, c in to_draw:
+            t = (datarns[r], datacns[c])
+            cells["dropdown"].pop(t, None)
+            cells["checkbox"].pop(t, None)
+            cells["options"][t] = opts = self.resolved_options(*t)
+            if "dropdown" in opts:
+                cells["dropdown"][t] = opts["dropdown"]
+            elif "checkbox" in opts:
+                cells["checkbox"][t] = opts["checkbox"]
+            cells[t] = self.redraw_cell_str(*t, opts)
+            # give the cell's canvas items back to storage, they are likely to be reused
+            items = self.drawn_cells.pop((r, c), ())
+            release_drawn_items(self, items)
+            released.extend(items)
+        if frame["allow_overflow"]:
+            for r in {r for r, _ in to_draw}:
+                cells["overflow_stops"][r] = [
+                    c
+                    for c in cols
+                    if cells[(t := (datarns[r], datacns[c]))] or t in cells["dropdown"] or t in cells["checkbox"]
+                ]
+        self.redraw_cells(to_draw=to_draw, frame=frame)
+        for kind, iid in released:
+            if kind == "corners":
+                if iid in self.hidd_corners:
+                    self.canvas_itemconfig(iid, state="hidden")
+            elif (hidd := getattr(self, f"hidd_{kind}")).get(iid):
+                self.canvas_itemconfig(iid, state="hidden")
+                hidd[iid] = False
+        self.run_tcl_batch()
+        self.lift_table_items()
+
+    def start_tcl_batch(self) -> None:
+        self.tcl_batch = [] if self.PAR.ops.batched_redraw else None
+
+    def run_tcl_batch(self) -> None:
+        """
+        Evaluates all the collected canvas commands in a single call to Tcl
+        """
+        if self.tcl_batch:
+            self.tk.call("foreach", "tksheet_cmd", tuple(self.tcl_batch), "{*}$tksheet_cmd")
+        self.tcl_batch = None
+
+    def canvas_coords(self, iid: int, *args) -> None:
+        if self.tcl_batch is None:
+            self.coords(iid, *args)
+        else:
+            self.tcl_batch.append((self._w, "coords", iid, *args))
+
+    def canvas_itemconfig(self, iid: int, **kwargs) -> None:
+        if self.tcl_batch is None:
+            self.itemconfig(iid, **kwargs)
+        else:
+            self.tcl_batch.append(
+                (self._w, "itemconfigure", iid, *chain.from_iterable((f"-{k}", v) for k, v in kwargs.items()))
+            )
+
+    def lift_table_items(self) -> None:
         if self.PAR.ops.show_selected_cells_border:
             for _, box in self.selection_boxes.items():
                 if box.bd_iid:
@@ -6609,8 +7001,6 @@ class MainTable(tk.Canvas):
             if self.selected:
                 self.tag_raise(self.selected.iid)
         self.lift("lift")
-        self.tag_bind("c", "<Enter>", self.enter_cell)
-        self.tag_bind("c", "<Leave>", self.leave_cell)
 
     def enter_cell(self, event: tk.Event | None = None) -> None:
         if any_editor_or_dropdown_open(self):
@@ -6724,7 +7114,17 @@ class MainTable(tk.Canvas):
         redraw_table: bool = True,
         setting_views: bool = False,
         set_scrollregion: bool = True,
+        dirty_only: bool = False,
+        scrolled: bool = False,
     ) -> bool:
+        """
+        dirty_only: only redraw table cells in self.dirty if the
+                    viewport hasn't changed since the last redraw,
+                    requires the incremental_redraw option
+        scrolled: the view has only been scrolled since the last redraw,
+                  cells which are still visible are not redrawn,
+                  requires the incremental_redraw option
+        """
         try:
             can_width = self.winfo_width()
             can_height = self.winfo_height()
@@ -6761,10 +7161,10 @@ class MainTable(tk.Canvas):
         scrollpos_bot = self.canvasy(can_height)
         scrollpos_left = self.canvasx(0)
         scrollpos_right = self.canvasx(can_width)
-        grid_start_row = bisect_left(self.row_positions, scrollpos_top)
-        grid_end_row = bisect_right(self.row_positions, scrollpos_bot)
-        grid_start_col = bisect_left(self.col_positions, scrollpos_left)
-        grid_end_col = bisect_right(self.col_positions, scrollpos_right)
+        grid_start_row = self.row_positions.bisect_left(scrollpos_top)
+        grid_end_row = self.row_positions.bisect_right(scrollpos_bot)
+        grid_start_col = self.col_positions.bisect_left(scrollpos_left)
+        grid_end_col = self.col_positions.bisect_right(scrollpos_right)
         text_start_row = grid_start_row - 1 if grid_start_row else grid_start_row
         text_end_row = grid_end_row - 1 if grid_end_row == len(self.row_positions) else grid_end_row
         text_start_col = grid_start_col - 1 if grid_start_col else grid_start_col
@@ -6783,6 +7183,45 @@ class MainTable(tk.Canvas):
             self.recreate_all_selection_boxes()
         x_stop = min(last_col_line_pos, scrollpos_right)
         y_stop = min(last_row_line_pos, scrollpos_bot)
+        keep_rows = keep_cols = keep_index = keep_header = range(0)
+        if self.PAR.ops.incremental_redraw:
+            viewport = (
+                (
+                    can_width,
+                    can_height,
+                    self.RI.current_width,
+                    self.CH.current_height,
+                    self.CH.canvasy(0),
+                    self.selected,
+                    tuple((iid, box.coords, box.type_) for iid, box in self.selection_boxes.items()),
+                    self.dropdown.get_coords(),
+                    self.RI.dropdown.get_coords(),
+                    self.CH.dropdown.get_coords(),
+                ),
+                (
+                    text_start_row,
+                    self.row_positions[text_start_row : text_end_row + 1],
+                    None if self.all_rows_displayed else self.displayed_rows[text_start_row:text_end_row],
+                    scrollpos_top,
+                ),
+                (
+                    text_start_col,
+                    self.col_positions[text_start_col : text_end_col + 1],
+                    None if self.all_columns_displayed else self.displayed_columns[text_start_col:text_end_col],
+                    scrollpos_left,
+                    scrollpos_right,
+                ),
+            )
+            if scrolled and not self.dirty:
+                if (prev := self.drawn_viewport) and prev[0] == viewport[0]:
+                    keep_rows = self.scroll_keep_rows(prev[1], viewport[1])
+                    keep_cols = self.scroll_keep_cols(prev[2], viewport[2], self.PAR.ops.allow_cell_overflow)
+                if (prev := self.RI.drawn_viewport) and prev[0] == viewport[0]:
+                    keep_index = self.scroll_keep_rows(prev[1], viewport[1])
+                if (prev := self.CH.drawn_viewport) and prev[0] == viewport[0]:
+                    keep_header = self.scroll_keep_cols(prev[2], viewport[2], False)
+        else:
+            viewport = None
         if redraw_header and self.show_header:
             self.CH.redraw_grid_and_text(
                 last_col_line_pos=last_col_line_pos,
@@ -6795,7 +7234,9 @@ class MainTable(tk.Canvas):
                 scrollpos_right=scrollpos_right,
                 col_pos_exists=col_pos_exists,
                 set_scrollregion=set_scrollregion,
+                keep_cols=keep_header,
             )
+            self.CH.drawn_viewport = viewport
         if redraw_row_index and self.show_index:
             self.RI.redraw_grid_and_text(
                 last_row_line_pos=last_row_line_pos,
@@ -6808,8 +7249,22 @@ class MainTable(tk.Canvas):
                 scrollpos_bot=scrollpos_bot,
                 row_pos_exists=row_pos_exists,
                 set_scrollregion=set_scrollregion,
+                keep_rows=keep_index,
             )
-        if redraw_table:
+            self.RI.drawn_viewport = viewport
+        redraw_all_cells = redraw_table
+        if redraw_table and self.PAR.ops.incremental_redraw:
+            if self.dirty_cells_redrawable(dirty_only, viewport):
+                self.redraw_dirty_cells(
+                    text_start_row=text_start_row,
+                    text_end_row=text_end_row,
+                    text_start_col=text_start_col,
+                    text_end_col=text_end_col,
+                )
+                redraw_all_cells = False
+            self.drawn_viewport = viewport
+            self.dirty.reset()
+        if redraw_all_cells:
             self.redraw_grid_and_text(
                 last_row_line_pos=last_row_line_pos,
                 last_col_line_pos=last_col_line_pos,
@@ -6831,11 +7286,46 @@ class MainTable(tk.Canvas):
                 text_end_row=text_end_row,
                 text_start_col=text_start_col,
                 text_end_col=text_end_col,
+                keep_rows=keep_rows,
+                keep_cols=keep_cols,
             )
-        event_data = {"sheetname": "", "header": redraw_header, "row_index": redraw_row_index, "table": redraw_table}
+        if not setting_views:
+            self.PAR.redrawn(table=redraw_table, index=redraw_row_index, header=redraw_header)
+        event_data = {
+            "sheetname": "",
+            "header": redraw_header,
+            "row_index": redraw_row_index,
+            "table": redraw_table,
+        }
         self.PAR.emit_event("<<SheetRedrawn>>", data=event_data)
         return True
 
+    def scroll_keep_rows(self, prev: tuple, now: tuple) -> range:
+        """
+        Rows visible before and after scrolling which don't need redrawing,
+        rows cut off at the top of either view have their text drawn from a different line
+        """
+        keep = scroll_overlap(prev[:3], now[:3])
+        if keep:
+            return range(self.row_positions.bisect_left(max(prev[3], now[3]), keep.start, keep.stop), keep.stop)
+        return keep
+
+    def scroll_keep_cols(self, prev: tuple, now: tuple, allow_overflow: bool) -> range:
+        """
+        Columns visible before and after scrolling which don't need redrawing,
+        columns cut off at the right of either view may not have had their text drawn
+        """
+        if allow_overflow and prev != now:
+            # overflowing text depends on which columns are visible
+            return range(0)
+        keep = scroll_overlap(prev[:3], now[:3])
+        if keep:
+            return range(
+                keep.start,
+                min(keep.stop, self.col_positions.bisect_right(min(prev[4], now[4]), keep.start, keep.stop + 1) - 1),
+            )
+        return keep
+
     def get_selection_items(
         self,
         cells: bool = True,
@@ -7211,26 +7701,18 @@ class MainTable(tk.Canvas):
                 data=self.get_select_event(self.being_drawn_item),
             )
 
-    def get_redraw_selections(self, startr: int, endr: int, startc: int, endc: int) -> dict:
-        d = defaultdict(set)
-        ignore_hidd_current = not self.PAR.ops.show_selected_cells_border
-        for _, box in self.get_selection_items():
-            r1, c1, r2, c2 = box.coords
-            if box.state == "normal" or ignore_hidd_current:
-                if box.type_ == "cells":
-                    for r in range(startr, endr):
-                        for c in range(startc, endc):
-                            if r1 <= r and c1 <= c and r2 > r and c2 > c:
-                                d["cells"].add((r, c))
-                elif box.type_ == "rows":
-                    for r in range(startr, endr):
-                        if r1 <= r and r2 > r:
-                            d["rows"].add(r)
-                elif box.type_ == "columns":
-                    for c in range(startc, endc):
-                        if c1 <= c and c2 > c:
-                            d["columns"].add(c)
-        return d
+    def get_redraw_selections(self, all_states: bool = True) -> SelectionIntervals:
+        """
+        all_states: False to leave out hidden selection boxes, e.g. the currently selected cell's box
+        the result is reused until the selection boxes change
+        """
+        boxes = tuple(
+            (*box.coords, box.type_) for box in self.selection_boxes.values() if all_states or box.state == "normal"
+        )
+        cached = self.redraw_selections.get(all_states)
+        if cached is None or cached[0] != boxes:
+            self.redraw_selections[all_states] = cached = (boxes, SelectionIntervals(boxes))
+        return cached[1]
 
     def get_selected_min_max(self) -> tuple[int, int, int, int] | tuple[None, None, None, None]:
         if not self.get_selection_items():
@@ -7977,7 +8459,7 @@ class MainTable(tk.Canvas):
         kwargs = self.get_cell_kwargs(datarn, datacn, key="checkbox")
         if kwargs["state"] == "normal":
             pre_edit_value = self.get_cell_data(datarn, datacn)
-            value = not self.data[datarn][datacn] if isinstance(self.data[datarn][datacn], bool) else False
+            value = not pre_edit_value if isinstance(pre_edit_value, bool) else False
             self.set_cell_data_undo(
                 r,
                 c,
@@ -8059,6 +8541,8 @@ class MainTable(tk.Canvas):
                         self.data[datarn][datacn] = kwargs["formatter"](value, **kwargs)
                 else:
                     self.data[datarn][datacn] = value
+            self.dirty.add_cell(datarn, datacn)
+            self.display_strings.discard((datarn, datacn))
 
     def format_value(self, datarn: int, datacn: int, value: Any) -> Any:
         if (datarn, datacn) in self.cell_options and "checkbox" in self.cell_options[(datarn, datacn)]:
@@ -8121,8 +8605,13 @@ class MainTable(tk.Canvas):
                     self.data[datarn][datacn] = self.get_value_for_empty_cell(datarn, datacn)
 
     def fix_data_len(self, datarn: int, datacn: int | None = None) -> int:
-        ncols = self.total_data_cols() if datacn is None else datacn + 1
-        self.data.extend(self.get_empty_row_seq(rn, end=ncols, start=0) for rn in range(len(self.data), datarn + 1))
+        """
+        Adds rows up to datarn, the added rows have no cells except
+        row datarn which is given cells up to datacn if it's not None
+        """
+        if datarn >= len(self.data):
+            self.data.extend([] for _ in range(len(self.data), datarn))
+            self.data.append([] if datacn is None else self.get_empty_row_seq(datarn, end=datacn + 1))
         return len(self.data)
 
     def reapply_formatting(self) -> None:
@@ -8131,14 +8620,25 @@ class MainTable(tk.Canvas):
                 if not (
                     (r, c) in self.cell_options
                     and "format" in self.cell_options[(r, c)]
+                    or self.range_options
+                    and self.range_options.value(r, c, "format")
                     or r in self.row_options
                     and "format" in self.row_options[r]
+                    or c >= len(self.data[r])
                 ):
                     self.set_cell_data(r, c, value=self.data[r][c])
         for r in gen_formatted(self.row_options):
             for c in range(len(self.data[r])):
-                if not ((r, c) in self.cell_options and "format" in self.cell_options[(r, c)]):
+                if not (
+                    (r, c) in self.cell_options
+                    and "format" in self.cell_options[(r, c)]
+                    or self.range_options
+                    and self.range_options.value(r, c, "format")
+                ):
                     self.set_cell_data(r, c, value=self.data[r][c])
+        for (r, c), _ in self.range_options.cells("format"):
+            if len(self.data) > r and len(self.data[r]) > c and "format" not in self.cell_options.get((r, c), ()):
+                self.set_cell_data(r, c, value=self.data[r][c])
         for r, c in gen_formatted(self.cell_options):
             if len(self.data) > r and len(self.data[r]) > c:
                 self.set_cell_data(r, c, value=self.data[r][c])
@@ -8156,9 +8656,16 @@ class MainTable(tk.Canvas):
     ) -> None:
         if isinstance(datarn, str) and datarn.lower() == "all":
             itr = gen_formatted(self.cell_options)
+            ranged = self.range_options.clear("format")
         else:
             itr = ((datarn, datacn),)
+            ranged = self.range_options.delete("format", datarn, datacn, datarn + 1, datacn + 1)
         get_val = self.get_value_for_empty_cell
+        if clear_values:
+            for from_r, from_c, upto_r, upto_c, _, _ in ranged:
+                for r in range(from_r, upto_r):
+                    for c in range(from_c, upto_c):
+                        self.set_cell_data(r, c, get_val(r, c), expand_sheet=False)
         for key in itr:
             try:
                 del self.cell_options[key]["format"]
@@ -8191,54 +8698,43 @@ class MainTable(tk.Canvas):
                 for datarn in range(len(self.data)):
                     self.set_cell_data(datarn, datacn, get_val(datarn, datacn), expand_sheet=False)
 
-    def cell_str(self, datarn: int, datacn: int, get_displayed: bool = False, **kwargs) -> str:
+    def cell_str(
+        self,
+        datarn: int,
+        datacn: int,
+        get_displayed: bool = False,
+        options: dict | None = None,
+        **kwargs,
+    ) -> str:
         """
         deals with possibility of formatter class being in self.data cell
         if cell is formatted - possibly returns invalid_value kwarg if
         cell value is not in datatypes kwarg
         if get displayed is true then Nones are replaced by
+        options: the cell's resolved_options() if already known
         """
+        if options is None:
+            options = self.resolved_options(datarn, datacn)
         if get_displayed:
             # check for dropdown
-            if (datarn, datacn) in self.cell_options and "dropdown" in self.cell_options[(datarn, datacn)]:
-                kws = self.cell_options[(datarn, datacn)]["dropdown"]
-            elif datarn in self.row_options and "dropdown" in self.row_options[datarn]:
-                kws = self.row_options[datarn]["dropdown"]
-            elif datacn in self.col_options and "dropdown" in self.col_options[datacn]:
-                kws = self.col_options[datacn]["dropdown"]
-            else:
-                kws = None
-            if kws and kws["text"] is not None:
+            if (kws := options.get("dropdown")) and kws["text"] is not None:
                 return f"{kws['text']}"
 
             # check for checkbox
-            if (datarn, datacn) in self.cell_options and "checkbox" in self.cell_options[(datarn, datacn)]:
-                kws = self.cell_options[(datarn, datacn)]["checkbox"]
-            elif datarn in self.row_options and "checkbox" in self.row_options[datarn]:
-                kws = self.row_options[datarn]["checkbox"]
-            elif datacn in self.col_options and "checkbox" in self.col_options[datacn]:
-                kws = self.col_options[datacn]["checkbox"]
-            else:
-                kws = None
-            if kws:
+            if kws := options.get("checkbox"):
                 return f"{kws['text']}"
         try:
             value = self.data[datarn][datacn]
         except Exception:
             value = ""
         # check for format
-        if (datarn, datacn) in self.cell_options and "format" in self.cell_options[(datarn, datacn)]:
-            kws = self.cell_options[(datarn, datacn)]["format"]
-        elif datarn in self.row_options and "format" in self.row_options[datarn]:
-            kws = self.row_options[datarn]["format"]
-        elif datacn in self.col_options and "format" in self.col_options[datacn]:
-            kws = self.col_options[datacn]["format"]
-        else:
-            kws = None
-        if kws:
+        if kws := options.get("format"):
             if kws["formatter"] is None:
                 if get_displayed:
-                    return data_to_str(value, **kws)
+                    if (string := self.display_strings.get((datarn, datacn), value, kws)) is None:
+                        string = data_to_str(value, **kws)
+                        self.display_strings.add((datarn, datacn), value, kws, string)
+                    return string
                 else:
                     return f"{get_data_with_valid_check(value, **kws)}"
             else:
@@ -8325,6 +8821,62 @@ class MainTable(tk.Canvas):
                 return value.get_clipboard_data()
         return f"{value}"
 
+    def cells_with_options(self, rows: range, cols: range) -> list[tuple[int, int]]:
+        """
+        The cells within rows and cols which have their own cell options
+        """
+        return [
+            (r, c)
+            for r, row in self.cell_options.rows_between(rows.start, rows.stop)
+            for c in row
+            if cols.start <= c < cols.stop
+        ]
+
+    def area_has_option(self, rows: range, cols: range, key: str) -> bool:
+        return self.range_options.overlaps(key, rows.start, cols.start, rows.stop, cols.stop) or any(
+            key in self.cell_options[t] for t in self.cells_with_options(rows, cols)
+        )
+
+    def set_area_option(
+        self,
+        rows: range,
+        cols: range,
+        key: str,
+        value: Any,
+        replaces: tuple[str, ...] = (),
+    ) -> None:
+        """
+        Sets key for every cell within rows and cols as one range option,
+        key and the keys in replaces are removed from the cells first
+        """
+        for k in replaces:
+            self.del_area_option(rows, cols, k)
+        self.del_area_option(rows, cols, key)
+        self.range_options.add(rows.start, cols.start, rows.stop, cols.stop, key, value)
+
+    def del_area_option(self, rows: range, cols: range, key: str) -> None:
+        for t in self.cells_with_options(rows, cols):
+            if key in (options := self.cell_options[t]):
+                del options[key]
+                if not options:
+                    del self.cell_options[t]
+        self.range_options.delete(key, rows.start, cols.start, rows.stop, cols.stop)
+
+    def unrange_options(self, rows: range, cols: range, key: str) -> None:
+        """
+        Moves the range options of key within rows and cols into the
+        cell options of each cell, for changes which depend on a cell's
+        existing value
+        """
+        for from_r, from_c, upto_r, upto_c, _, value in reversed(
+            self.range_options.delete(key, rows.start, cols.start, rows.stop, cols.stop)
+        ):
+            for r in range(from_r, upto_r):
+                for c in range(from_c, upto_c):
+                    if (r, c) not in self.cell_options:
+                        self.cell_options[(r, c)] = {}
+                    self.cell_options[(r, c)].setdefault(key, value)
+
     def get_cell_kwargs(
         self,
         datarn: int,
@@ -8335,7 +8887,12 @@ class MainTable(tk.Canvas):
         column: bool = True,
     ) -> dict:
         if key is None:
-            if cell and (datarn, datacn) in self.cell_options:
+            if cell and self.range_options and (ranged := self.range_options.get(datarn, datacn)):
+                if (datarn, datacn) in self.cell_options:
+                    return {**ranged, **self.cell_options[(datarn, datacn)]}
+                return ranged
+
+            elif cell and (datarn, datacn) in self.cell_options:
                 return self.cell_options[(datarn, datacn)]
 
             elif row and datarn in self.row_options:
@@ -8350,6 +8907,9 @@ class MainTable(tk.Canvas):
             if cell and (datarn, datacn) in self.cell_options and key in self.cell_options[(datarn, datacn)]:
                 return self.cell_options[(datarn, datacn)][key]
 
+            elif cell and self.range_options and (value := self.range_options.value(datarn, datacn, key)) is not None:
+                return value
+
             elif row and datarn in self.row_options and key in self.row_options[datarn]:
                 return self.row_options[datarn][key]
 
@@ -8359,6 +8919,42 @@ class MainTable(tk.Canvas):
             else:
                 return {}
 
+    def resolved_options(self, datarn: int, datacn: int) -> dict:
+        """
+        Returns the effective options of a cell for every key at once
+        cell options take priority over range options, range options over row options
+        and row options over column options
+        the returned dict must not be modified
+        """
+        return merged_options(
+            self.cell_options.get((datarn, datacn)),
+            self.row_options.get(datarn),
+            self.col_options.get(datacn),
+            self.range_options.get(datarn, datacn) if self.range_options else None,
+        )
+
+    def resolved_options_area(self, datarns: Iterable[int], datacns: Iterable[int]) -> dict[tuple[int, int], dict]:
+        """
+        Returns resolved_options() for every cell of the rows and columns
+        the option stores are searched once per row and column rather than per cell
+        """
+        datacns = tuple(datacns)
+        cols = [self.col_options.get(datacn) for datacn in datacns]
+        ranged = self.range_options
+        area = {}
+        for datarn in datarns:
+            cells = self.cell_options.row(datarn)
+            row = self.row_options.get(datarn)
+            ranges = ranged.row(datarn) if ranged else None
+            for datacn, col in zip(datacns, cols):
+                area[(datarn, datacn)] = merged_options(
+                    cells.get(datacn) if cells else None,
+                    row,
+                    col,
+                    ranged.get(datarn, datacn, ranges) if ranges else None,
+                )
+        return area
+
     def datacn(self, c: int) -> int:
         return c if self.all_columns_displayed else self.displayed_columns[c]
 
@@ -8366,7 +8962,13 @@ class MainTable(tk.Canvas):
         return r if self.all_rows_displayed else self.displayed_rows[r]
 
     def dispcn(self, datacn: int) -> int:
-        return datacn if self.all_columns_displayed else b_index(self.displayed_columns, datacn)
+        if self.all_columns_displayed:
+            return datacn
+        if (idxs := self.displayed_columns_index(build=False)) is None:
+            return b_index(self.displayed_columns, datacn)
+        if 0 <= datacn < len(idxs) and (dispcn := idxs[datacn]) != -1:
+            return dispcn
+        raise ValueError(f"{datacn} is not in Sequence")
 
     def try_dispcn(self, datacn: int) -> int | None:
         try:
@@ -8375,7 +8977,13 @@ class MainTable(tk.Canvas):
             return None
 
     def disprn(self, datarn: int) -> int:
-        return datarn if self.all_rows_displayed else b_index(self.displayed_rows, datarn)
+        if self.all_rows_displayed:
+            return datarn
+        if (idxs := self.displayed_rows_index(build=False)) is None:
+            return b_index(self.displayed_rows, datarn)
+        if 0 <= datarn < len(idxs) and (disprn := idxs[datarn]) != -1:
+            return disprn
+        raise ValueError(f"{datarn} is not in Sequence")
 
     def try_disprn(self, datarn: int) -> int | None:
         try:
@@ -252,7 +252,7 @@ def build_index_rc_menu(MT, popup_menu: tk.Menu, selected: Selected) -> None:
             compound=MT.PAR.ops.clear_contents_compound,
             **mnkwgs,
         )
-    if MT.rc_delete_row_enabled and selected:
+    if MT.rc_delete_row_enabled and selected and MT.resize_data_enabled():
         menu_add_command(
             popup_menu,
             label=MT.PAR.ops.delete_rows_label,
@@ -261,7 +261,7 @@ def build_index_rc_menu(MT, popup_menu: tk.Menu, selected: Selected) -> None:
             compound=MT.PAR.ops.delete_rows_compound,
             **mnkwgs,
         )
-    if MT.rc_insert_row_enabled:
+    if MT.rc_insert_row_enabled and MT.resize_data_enabled():
         menu_add_command(
             popup_menu,
             label=MT.PAR.ops.insert_rows_above_label,
@@ -429,7 +429,7 @@ def build_header_rc_menu(MT, popup_menu: tk.Menu, selected: Selected) -> None:
             compound=MT.PAR.ops.clear_contents_compound,
             **mnkwgs,
         )
-    if MT.rc_delete_column_enabled and selected:
+    if MT.rc_delete_column_enabled and selected and MT.resize_data_enabled():
         menu_add_command(
             popup_menu,
             label=MT.PAR.ops.delete_columns_label,
@@ -438,7 +438,7 @@ def build_header_rc_menu(MT, popup_menu: tk.Menu, selected: Selected) -> None:
             compound=MT.PAR.ops.delete_columns_compound,
             **mnkwgs,
         )
-    if MT.rc_insert_column_enabled:
+    if MT.rc_insert_column_enabled and MT.resize_data_enabled():
         menu_add_command(
             popup_menu,
             label=MT.PAR.ops.insert_columns_left_label,
@@ -527,6 +527,7 @@ def build_empty_rc_menu(MT, popup_menu: tk.Menu) -> None:
         MT.paste_enabled
         and any(x in MT.enabled_bindings_menu_entries for x in ("all", "paste", "edit_bindings", "edit"))
         and (MT.PAR.ops.paste_can_expand_x or MT.PAR.ops.paste_can_expand_y)
+        and MT.resize_data_enabled()
     ):
         menu_add_command(
             popup_menu,
@@ -537,7 +538,7 @@ def build_empty_rc_menu(MT, popup_menu: tk.Menu) -> None:
             compound=MT.PAR.ops.paste_compound,
             **mnkwgs,
         )
-    if MT.rc_insert_column_enabled:
+    if MT.rc_insert_column_enabled and MT.resize_data_enabled():
         menu_add_command(
             popup_menu,
             label=MT.PAR.ops.insert_column_label,
@@ -546,7 +547,7 @@ def build_empty_rc_menu(MT, popup_menu: tk.Menu) -> None:
             compound=MT.PAR.ops.insert_column_compound,
             **mnkwgs,
         )
-    if MT.rc_insert_row_enabled:
+    if MT.rc_insert_row_enabled and MT.resize_data_enabled():
         menu_add_command(
             popup_menu,
             label=MT.PAR.ops.insert_row_label,
@@ -0,0 +1,1289 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, MutableMapping, MutableSet, Sequence
+from heapq import merge
+from itertools import chain, repeat
+from operator import itemgetter
+from typing import Any
+from weakref import ref
+
+from .functions import consecutive_ranges, push_n
+
+
+def inserted_runs(start: int, stop: int, idxs: Sequence[int]) -> Iterator[tuple[int, int]]:
+    """
+    Where the indexes from start up to stop end up after inserting at
+    idxs, the same as push_n(), split around the inserted indexes
+    """
+    start, stop = push_n(start, idxs), push_n(stop - 1, idxs) + 1
+    for idx in idxs[bisect_left(idxs, start) : bisect_left(idxs, stop)]:
+        if idx > start:
+            yield start, idx
+        start = idx + 1
+    if stop > start:
+        yield start, stop
+
+
+def deleted_runs(start: int, stop: int, to_bis: Sequence[int]) -> Iterator[tuple[int, int]]:
+    start, stop = start - bisect_left(to_bis, start), stop - bisect_left(to_bis, stop)
+    if stop > start:
+        yield start, stop
+
+
+def moved_stretches(full_new_idxs: dict[int, int]) -> tuple[list[int], list[int], list[int]]:
+    """
+    The indexes which a move changes as sorted stretches of consecutive
+    indexes which move by the same amount, (starts, stops, offsets)
+    """
+    starts, stops, offsets = [], [], []
+    for k in sorted(k for k, v in full_new_idxs.items() if k != v):
+        offset = full_new_idxs[k] - k
+        if stops and k == stops[-1] and offset == offsets[-1]:
+            stops[-1] += 1
+        else:
+            starts.append(k)
+            stops.append(k + 1)
+            offsets.append(offset)
+    return starts, stops, offsets
+
+
+def moved_runs(
+    start: int,
+    stop: int,
+    stretches: tuple[list[int], list[int], list[int]],
+) -> list[tuple[int, int]]:
+    """
+    Where the indexes from start up to stop end up after a move, the run
+    is only split where the moved_stretches() within it begin and end
+    """
+    if start >= stop:
+        return []
+    starts, stops, offsets = stretches
+    pieces = []
+    for i in range(bisect_right(stops, start), bisect_left(starts, stop)):
+        moved_start, moved_stop = max(starts[i], start), min(stops[i], stop)
+        if moved_start > start:
+            pieces.append((start, moved_start))
+        pieces.append((moved_start + offsets[i], moved_stop + offsets[i]))
+        start = moved_stop
+    if stop > start:
+        pieces.append((start, stop))
+    runs = []
+    for piece in sorted(pieces):
+        if runs and piece[0] == runs[-1][1]:
+            runs[-1] = (runs[-1][0], piece[1])
+        else:
+            runs.append(piece)
+    return runs
+
+
+class OptionStore(MutableMapping):
+    """
+    The options of rows, columns or cells keyed by their data index
+
+    Reads and writes like the dict it replaces, {datarn: {...}} or
+    {(datarn, datacn): {...}}, but the keys are kept in blocks of sorted
+    ranges, each with its own offset, so that inserting or deleting rows
+    or columns only rewrites the keys of the blocks the change falls
+    within and shifts the offsets of the blocks after them
+
+    With cells=True the keys are (row, column) tuples, they are bucketed
+    by row and only shifting rows is lazy, inserting and deleting
+    columns rewrites the buckets holding columns at or after the change
+
+    copy() shares the blocks between both stores, a block is only copied
+    by whichever store first writes to it, owned is False for the blocks
+    which may still be shared
+    """
+
+    __slots__ = ("blocks", "cells", "deltas", "load", "n", "owned", "starts")
+
+    def __init__(
+        self,
+        items: Mapping | None = None,
+        cells: bool = False,
+        load: int = 512,
+    ) -> None:
+        self.cells = cells
+        self.load = load
+        self.load_items(items.items() if items else ())
+
+    @classmethod
+    def from_dict(cls, items: Mapping, cells: bool = False) -> OptionStore:
+        if isinstance(items, OptionStore):
+            return items
+        return cls(items, cells=cells)
+
+    def load_items(self, items: Iterator[tuple[Hashable, Any]]) -> None:
+        # starts are the lowest index each block can hold
+        # deltas are added to the keys stored in a block to get their index
+        if self.cells:
+            rows = {}
+            for (r, c), v in items:
+                if r in rows:
+                    rows[r][c] = v
+                else:
+                    rows[r] = {c: v}
+            self.n = sum(map(len, rows.values()))
+        else:
+            rows = dict(items)
+            self.n = len(rows)
+        keys = sorted(rows)
+        load = self.load
+        self.blocks = [{k: rows[k] for k in keys[i : i + load]} for i in range(0, len(keys), load)]
+        self.starts = keys[::load]
+        self.deltas = [0] * len(self.blocks)
+        self.owned = [True] * len(self.blocks)
+
+    def copy(self) -> OptionStore:
+        new = OptionStore.__new__(OptionStore)
+        new.cells = self.cells
+        new.load = self.load
+        new.n = self.n
+        new.blocks = self.blocks[:]
+        new.starts = self.starts[:]
+        new.deltas = self.deltas[:]
+        self.owned = [False] * len(self.blocks)
+        new.owned = self.owned[:]
+        return new
+
+    def writable(self, b: int) -> dict:
+        if not self.owned[b]:
+            if self.cells:
+                self.blocks[b] = {k: dict(row) for k, row in self.blocks[b].items()}
+            else:
+                self.blocks[b] = dict(self.blocks[b])
+            self.owned[b] = True
+        return self.blocks[b]
+
+    # dict compatible reading
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __bool__(self) -> bool:
+        return bool(self.n)
+
+    def __getitem__(self, key: int | tuple[int, int]) -> Any:
+        try:
+            if self.cells:
+                r, c = key
+                b = bisect_right(self.starts, r) - 1
+                if b >= 0:
+                    return self.blocks[b][r - self.deltas[b]][c]
+            else:
+                b = bisect_right(self.starts, key) - 1
+                if b >= 0:
+                    return self.blocks[b][key - self.deltas[b]]
+        except (KeyError, TypeError, ValueError):
+            pass
+        raise KeyError(key)
+
+    def get(self, key: int | tuple[int, int], default: Any = None) -> Any:
+        try:
+            if self.cells:
+                r, c = key
+                b = bisect_right(self.starts, r) - 1
+                if b >= 0 and (row := self.blocks[b].get(r - self.deltas[b])) is not None:
+                    return row.get(c, default)
+            else:
+                b = bisect_right(self.starts, key) - 1
+                if b >= 0:
+                    return self.blocks[b].get(key - self.deltas[b], default)
+        except (TypeError, ValueError):
+            pass
+        return default
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            if self.cells:
+                r, c = key
+                b = bisect_right(self.starts, r) - 1
+                return b >= 0 and (row := self.blocks[b].get(r - self.deltas[b])) is not None and c in row
+            b = bisect_right(self.starts, key) - 1
+            return b >= 0 and key - self.deltas[b] in self.blocks[b]
+        except (TypeError, ValueError):
+            return False
+
+    def __iter__(self) -> Iterator[int | tuple[int, int]]:
+        if self.cells:
+            for blk, d in zip(self.blocks, self.deltas):
+                for k, row in blk.items():
+                    r = k + d
+                    for c in row:
+                        yield r, c
+        else:
+            for blk, d in zip(self.blocks, self.deltas):
+                for k in blk:
+                    yield k + d
+
+    def items(self) -> Iterator[tuple[int | tuple[int, int], Any]]:
+        if self.cells:
+            for blk, d in zip(self.blocks, self.deltas):
+                for k, row in blk.items():
+                    r = k + d
+                    for c, v in row.items():
+                        yield (r, c), v
+        else:
+            for blk, d in zip(self.blocks, self.deltas):
+                for k, v in blk.items():
+                    yield k + d, v
+
+    def values(self) -> Iterator[Any]:
+        if self.cells:
+            for blk in self.blocks:
+                for row in blk.values():
+                    yield from row.values()
+        else:
+            for blk in self.blocks:
+                yield from blk.values()
+
+    def __repr__(self) -> str:
+        return f"OptionStore({dict(self.items())})"
+
+    def row(self, r: int) -> dict | None:
+        """
+        For cell keys, the {column: options} dict of row r, None if
+        the row has no cells, the dict must not be modified
+        """
+        b = bisect_right(self.starts, r) - 1
+        return self.blocks[b].get(r - self.deltas[b]) if b >= 0 else None
+
+    def rows_between(self, start: int, stop: int) -> list[tuple[int, Any]]:
+        """
+        The keys from start up to stop and their values, for cell keys
+        the values are the {column: options} dicts of each row
+        """
+        starts, deltas, blocks = self.starts, self.deltas, self.blocks
+        rows = []
+        for b in range(max(0, bisect_right(starts, start) - 1), bisect_left(starts, stop)):
+            d = deltas[b]
+            rows.extend((k + d, v) for k, v in blocks[b].items() if start <= k + d < stop)
+        return rows
+
+    # dict compatible writing
+
+    def __setitem__(self, key: int | tuple[int, int], value: Any) -> None:
+        if self.cells:
+            idx, c = key
+        else:
+            idx = key
+        starts = self.starts
+        if not starts:
+            starts.append(idx)
+            self.deltas.append(0)
+            self.blocks.append({})
+            self.owned.append(True)
+        b = bisect_right(starts, idx) - 1
+        if b < 0:
+            # the stored keys are relative to the delta, not the start
+            # so lowering the start of the first block costs nothing
+            b = 0
+            starts[0] = idx
+        blk = self.writable(b)
+        k = idx - self.deltas[b]
+        if self.cells:
+            if (row := blk.get(k)) is None:
+                blk[k] = {c: value}
+                self.n += 1
+            else:
+                if c not in row:
+                    self.n += 1
+                row[c] = value
+                return
+        else:
+            if k not in blk:
+                self.n += 1
+            blk[k] = value
+        if len(blk) > self.load:
+            self.split(b)
+
+    def __delitem__(self, key: int | tuple[int, int]) -> None:
+        if key not in self:
+            raise KeyError(key)
+        if self.cells:
+            idx, c = key
+            b = bisect_right(self.starts, idx) - 1
+            blk = self.writable(b)
+            k = idx - self.deltas[b]
+            row = blk[k]
+            del row[c]
+            if not row:
+                del blk[k]
+        else:
+            b = bisect_right(self.starts, key) - 1
+            blk = self.writable(b)
+            del blk[key - self.deltas[b]]
+        self.n -= 1
+        if not blk:
+            del self.blocks[b]
+            del self.starts[b]
+            del self.deltas[b]
+            del self.owned[b]
+
+    def clear(self) -> None:
+        self.load_items(())
+
+    def split(self, b: int) -> None:
+        blk = self.writable(b)
+        keys = sorted(blk)
+        keys = keys[len(keys) // 2 :]
+        self.blocks.insert(b + 1, {k: blk.pop(k) for k in keys})
+        self.starts.insert(b + 1, keys[0] + self.deltas[b])
+        self.deltas.insert(b + 1, self.deltas[b])
+        self.owned.insert(b + 1, True)
+
+    def drop_empty(self) -> None:
+        if not all(self.blocks):
+            keep = [i for i, blk in enumerate(self.blocks) if blk]
+            self.blocks = [self.blocks[i] for i in keep]
+            self.starts = [self.starts[i] for i in keep]
+            self.deltas = [self.deltas[i] for i in keep]
+            self.owned = [self.owned[i] for i in keep]
+
+    # structural changes
+
+    def insert_keys(self, idxs: Sequence[int], axis: int = 0) -> None:
+        """
+        Moves the keys along as if rows or columns were inserted at idxs
+
+        idxs are the sorted indexes of the inserted rows or columns after
+        insertion, the same as push_n(), axis=1 shifts the columns of cell
+        keys
+        """
+        if not idxs or not self.n:
+            return
+        if axis:
+            self.insert_columns(idxs)
+            return
+        starts, deltas, blocks = self.starts, self.deltas, self.blocks
+        total = len(idxs)
+        for b in range(max(0, bisect_right(starts, idxs[0]) - 1), len(starts)):
+            start = starts[b]
+            if (shift := push_n(start, idxs) - start) == total:
+                # every block from here on moves by the same amount
+                starts[b:] = [i + total for i in starts[b:]]
+                deltas[b:] = [i + total for i in deltas[b:]]
+                break
+            d = deltas[b]
+            if b + 1 < len(starts) and shift == push_n(starts[b + 1], idxs) - starts[b + 1]:
+                # nothing inserted within this block's range
+                deltas[b] = d + shift
+            else:
+                blocks[b] = {push_n(k + d, idxs) - d: v for k, v in blocks[b].items()}
+            starts[b] = start + shift
+
+    def delete_keys(self, to_del: set[int], to_bis: Sequence[int], axis: int = 0) -> None:
+        """
+        Removes the keys in to_del and moves the keys after them back
+
+        to_bis is to_del sorted, axis=1 deletes the columns of cell keys
+        """
+        if not to_bis or not self.n:
+            return
+        if axis:
+            self.delete_columns(to_del, to_bis)
+            return
+        starts, deltas, blocks = self.starts, self.deltas, self.blocks
+        total = len(to_bis)
+        cells = self.cells
+        for b in range(max(0, bisect_right(starts, to_bis[0]) - 1), len(starts)):
+            start = starts[b]
+            if (shift := bisect_left(to_bis, start)) == total:
+                starts[b:] = [i - total for i in starts[b:]]
+                deltas[b:] = [i - total for i in deltas[b:]]
+                break
+            d = deltas[b]
+            if b + 1 < len(starts) and shift == bisect_left(to_bis, starts[b + 1]):
+                deltas[b] = d - shift
+            else:
+                blk = blocks[b]
+                if cells:
+                    self.n -= sum(len(row) for k, row in blk.items() if k + d in to_del)
+                else:
+                    self.n -= sum(1 for k in blk if k + d in to_del)
+                blocks[b] = {k - bisect_left(to_bis, k + d): v for k, v in blk.items() if k + d not in to_del}
+            starts[b] = start - shift
+        self.drop_empty()
+
+    def insert_columns(self, idxs: Sequence[int]) -> None:
+        first = idxs[0]
+        for b, blk in enumerate(self.blocks):
+            for k, row in blk.items():
+                if any(c >= first for c in row):
+                    self.writable(b)[k] = {push_n(c, idxs): v for c, v in row.items()}
+
+    def delete_columns(self, to_del: set[int], to_bis: Sequence[int]) -> None:
+        first = to_bis[0]
+        for b in range(len(self.blocks)):
+            blk = self.blocks[b]
+            if any(c >= first for row in blk.values() for c in row):
+                blk = self.writable(b)
+            empty = []
+            for k, row in blk.items():
+                if any(c >= first for c in row):
+                    new = {c - bisect_left(to_bis, c): v for c, v in row.items() if c not in to_del}
+                    self.n -= len(row) - len(new)
+                    if new:
+                        blk[k] = new
+                    else:
+                        empty.append(k)
+            for k in empty:
+                del blk[k]
+        self.drop_empty()
+
+
+class RangeOptions:
+    """
+    Options set on rectangles of table cells
+
+    Each range is a tuple (from_r, from_c, upto_r, upto_c, key, value),
+    setting one option key for every cell within it, so that a span of
+    cells stores its highlight, format, readonly, align or dropdown once
+    instead of once per cell. Later ranges take priority over earlier
+    ones and cell options over ranges
+
+    Lookups go through an index of the row bounds of the ranges and the
+    ranges covering each slab of rows between them, it's rebuilt after
+    the ranges change
+
+    copy() shares the list of ranges and the index until either copy
+    changes them
+    """
+
+    __slots__ = ("bounds", "ranges", "shared", "slabs")
+
+    def __init__(self, ranges: Iterable[tuple[int, int, int, int, str, Any]] = ()) -> None:
+        self.ranges = list(ranges)
+        self.bounds = None
+        self.slabs = None
+        self.shared = False
+
+    def copy(self) -> RangeOptions:
+        new = RangeOptions.__new__(RangeOptions)
+        new.ranges = self.ranges
+        new.bounds = self.bounds
+        new.slabs = self.slabs
+        new.shared = self.shared = True
+        return new
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def __bool__(self) -> bool:
+        return bool(self.ranges)
+
+    def __iter__(self) -> Iterator[tuple[int, int, int, int, str, Any]]:
+        return iter(self.ranges)
+
+    def __repr__(self) -> str:
+        return f"RangeOptions({self.ranges})"
+
+    def index(self) -> tuple[list[int], list[list[tuple]]]:
+        if self.bounds is None:
+            bounds = sorted({i for rng in self.ranges for i in (rng[0], rng[2])})
+            slabs = [[] for _ in bounds]
+            for rng in self.ranges:
+                for i in range(bisect_left(bounds, rng[0]), bisect_left(bounds, rng[2])):
+                    slabs[i].append(rng)
+            self.bounds, self.slabs = bounds, slabs
+        return self.bounds, self.slabs
+
+    def changed(self) -> None:
+        # the ranges are a new list or were copied before being changed
+        self.bounds = None
+        self.slabs = None
+        self.shared = False
+
+    # lookups
+
+    def row(self, datarn: int) -> list[tuple[int, int, int, int, str, Any]]:
+        """
+        The ranges covering the row, in order
+        """
+        if not self.ranges:
+            return []
+        bounds, slabs = self.index()
+        return slabs[i] if (i := bisect_right(bounds, datarn) - 1) >= 0 else []
+
+    def get(self, datarn: int, datacn: int, ranges: list[tuple] | None = None) -> dict | None:
+        """
+        The options of every range covering the cell, None if there are none
+        ranges: the ranges covering the row if already known, see row()
+        """
+        options = None
+        for rng in self.row(datarn) if ranges is None else ranges:
+            if rng[1] <= datacn < rng[3]:
+                if options is None:
+                    options = {}
+                options[rng[4]] = rng[5]
+        return options
+
+    def value(self, datarn: int, datacn: int, key: str) -> Any:
+        """
+        The value of key for the cell, None if no range covering it has key
+        """
+        if not self.ranges:
+            return None
+        bounds, slabs = self.index()
+        if (i := bisect_right(bounds, datarn) - 1) < 0:
+            return None
+        value = None
+        for rng in slabs[i]:
+            if rng[4] == key and rng[1] <= datacn < rng[3]:
+                value = rng[5]
+        return value
+
+    def overlaps(self, key: str, from_r: int, from_c: int, upto_r: int, upto_c: int) -> bool:
+        return any(
+            rng[4] == key and rng[0] < upto_r and from_r < rng[2] and rng[1] < upto_c and from_c < rng[3]
+            for rng in self.ranges
+        )
+
+    def cells(self, key: str) -> Iterator[tuple[tuple[int, int], Any]]:
+        """
+        Every cell of the ranges with key and its value, dict() of it
+        gives each cell the value of the last range covering it
+        """
+        for from_r, from_c, upto_r, upto_c, k, v in self.ranges:
+            if k == key:
+                for r in range(from_r, upto_r):
+                    for c in range(from_c, upto_c):
+                        yield (r, c), v
+
+    def by_cell(self) -> dict[tuple[int, int], dict]:
+        """
+        Every cell of the ranges and its options, {(row, column): {key: value}},
+        each cell has the options get() returns for it
+        """
+        cells = {}
+        for from_r, from_c, upto_r, upto_c, k, v in self.ranges:
+            for r in range(from_r, upto_r):
+                for c in range(from_c, upto_c):
+                    if (r, c) in cells:
+                        cells[(r, c)][k] = v
+                    else:
+                        cells[(r, c)] = {k: v}
+        return cells
+
+    def max_row(self, default: int) -> int:
+        return max((rng[2] - 1 for rng in self.ranges), default=default)
+
+    def max_column(self, default: int) -> int:
+        return max((rng[3] - 1 for rng in self.ranges), default=default)
+
+    # changes
+
+    def add(self, from_r: int, from_c: int, upto_r: int, upto_c: int, key: str, value: Any) -> None:
+        if from_r >= upto_r or from_c >= upto_c:
+            return
+        self.delete(key, from_r, from_c, upto_r, upto_c)
+        if self.shared:
+            self.ranges = self.ranges[:]
+            self.shared = False
+        # extend a neighbouring range with the same value instead of adding one
+        for i, (fr, fc, ur, uc, k, v) in enumerate(self.ranges):
+            if k == key and v is value:
+                if fc == from_c and uc == upto_c and (ur == from_r or fr == upto_r):
+                    self.ranges[i] = (min(fr, from_r), fc, max(ur, upto_r), uc, k, v)
+                    break
+                if fr == from_r and ur == upto_r and (uc == from_c or fc == upto_c):
+                    self.ranges[i] = (fr, min(fc, from_c), ur, max(uc, upto_c), k, v)
+                    break
+        else:
+            self.ranges.append((from_r, from_c, upto_r, upto_c, key, value))
+        self.changed()
+
+    def delete(
+        self,
+        key: str | None,
+        from_r: int,
+        from_c: int,
+        upto_r: int,
+        upto_c: int,
+    ) -> list[tuple[int, int, int, int, str, Any]]:
+        """
+        Removes key, or every key if None, from the cells within the
+        rectangle, ranges partly within it are split into the pieces
+        outside of it
+
+        Returns the removed parts of the ranges
+        """
+        removed = []
+        ranges = []
+        for rng in self.ranges:
+            fr, fc, ur, uc, k, v = rng
+            if (key is None or k == key) and fr < upto_r and from_r < ur and fc < upto_c and from_c < uc:
+                mid_r, mid_ur = max(fr, from_r), min(ur, upto_r)
+                removed.append((mid_r, max(fc, from_c), mid_ur, min(uc, upto_c), k, v))
+                if fr < from_r:
+                    ranges.append((fr, fc, from_r, uc, k, v))
+                if upto_r < ur:
+                    ranges.append((upto_r, fc, ur, uc, k, v))
+                if fc < from_c:
+                    ranges.append((mid_r, fc, mid_ur, from_c, k, v))
+                if upto_c < uc:
+                    ranges.append((mid_r, upto_c, mid_ur, uc, k, v))
+            else:
+                ranges.append(rng)
+        if removed:
+            self.ranges = ranges
+            self.changed()
+        return removed
+
+    def clear(self, key: str | None = None) -> list[tuple[int, int, int, int, str, Any]]:
+        """
+        Removes every range with key, or every range if key is None
+
+        Returns the removed ranges
+        """
+        removed = [rng for rng in self.ranges if key is None or rng[4] == key]
+        if removed:
+            self.ranges = [] if key is None else [rng for rng in self.ranges if rng[4] != key]
+            self.changed()
+        return removed
+
+    def remap(self, axis: int, pieces: Callable[[int, int], Iterable[tuple[int, int]]]) -> None:
+        lo, hi = (1, 3) if axis else (0, 2)
+        ranges = []
+        for rng in self.ranges:
+            for start, stop in pieces(rng[lo], rng[hi]):
+                new = list(rng)
+                new[lo], new[hi] = start, stop
+                ranges.append(tuple(new))
+        self.ranges = ranges
+        self.changed()
+
+    def insert_keys(self, idxs: Sequence[int], axis: int = 0) -> None:
+        """
+        Moves the ranges along as if rows, or columns with axis=1, were
+        inserted at idxs, the same as push_n(), ranges which rows or
+        columns are inserted within are split around them
+        """
+
+        if idxs and self.ranges:
+            self.remap(axis, lambda start, stop: inserted_runs(start, stop, idxs))
+
+    def delete_keys(self, to_bis: Sequence[int], axis: int = 0) -> None:
+        if to_bis and self.ranges:
+            self.remap(axis, lambda start, stop: deleted_runs(start, stop, to_bis))
+
+    def move_keys(self, full_new_idxs: dict[int, int], axis: int = 0) -> None:
+        if self.ranges:
+            stretches = moved_stretches(full_new_idxs)
+            self.remap(axis, lambda start, stop: moved_runs(start, stop, stretches))
+
+
+class NamedSpans(dict):
+    """
+    The named spans of a sheet, {name: Span}
+
+    The spans with rows, and the spans with columns, are indexed by where
+    they end so that inserting or deleting rows or columns only goes
+    through the spans ending after the change, and by the slabs between
+    their bounds for finding the spans covering a cell. The indexes are
+    built when first used, insert_keys() and delete_keys() keep the end
+    indexes up to date, anything else which changes the coordinates of
+    named spans must call changed()
+
+    copy() shares the span objects with the copy, which is how undo
+    snapshots are taken, a span is only copied when its coordinates are
+    about to change, by unshare(), and the copy goes to every other
+    NamedSpans in the family still holding it so that the span objects
+    in use by the sheet stay the same
+    """
+
+    __slots__ = ("__weakref__", "ends", "family", "names", "slabs")
+
+    def __init__(self, spans: Mapping | None = None) -> None:
+        super().__init__(spans or ())
+        self.ends = {"r": None, "c": None}
+        self.names = {"r": None, "c": None}
+        self.slabs = {"r": None, "c": None}
+        self.family = [ref(self)]
+
+    @classmethod
+    def from_dict(cls, spans: Mapping) -> NamedSpans:
+        if isinstance(spans, NamedSpans):
+            return spans
+        return cls(spans)
+
+    def copy(self) -> NamedSpans:
+        new = NamedSpans(self)
+        self.family[:] = [r for r in self.family if r() is not None]
+        self.family.append(ref(new))
+        new.family = self.family
+        return new
+
+    def unshare(self, name: str) -> None:
+        span = self[name]
+        for r in self.family:
+            if (other := r()) is not None and other is not self and dict.get(other, name) is span:
+                # the coordinates are the same so other's indexes stay valid
+                dict.__setitem__(other, name, span.copy_self())
+
+    def changed(self, axis: str | None = None) -> None:
+        for ax in ("r", "c") if axis is None else (axis,):
+            self.ends[ax] = None
+            self.names[ax] = None
+            self.slabs[ax] = None
+
+    def __setitem__(self, name: str, span: dict) -> None:
+        super().__setitem__(name, span)
+        self.changed()
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(name)
+        for axis, names in self.names.items():
+            if names is not None and name in names:
+                i = names.index(name)
+                del names[i]
+                del self.ends[axis][i]
+            self.slabs[axis] = None
+
+    def pop(self, *args) -> Any:
+        value = super().pop(*args)
+        self.changed()
+        return value
+
+    def popitem(self) -> tuple[str, dict]:
+        item = super().popitem()
+        self.changed()
+        return item
+
+    def setdefault(self, name: str, span: dict | None = None) -> Any:
+        if name not in self:
+            self[name] = span
+        return self[name]
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self.changed()
+
+    # indexes
+
+    def index(self, axis: str) -> tuple[list[int | float], list[str]]:
+        if self.ends[axis] is None:
+            frm, upto = f"from_{axis}", f"upto_{axis}"
+            spans = sorted(
+                (
+                    (span[upto] if isinstance(span[upto], int) else float("inf"), name)
+                    for name, span in self.items()
+                    if isinstance(span[frm], int)
+                ),
+                key=itemgetter(0),
+            )
+            self.ends[axis] = [end for end, _ in spans]
+            self.names[axis] = [name for _, name in spans]
+        return self.ends[axis], self.names[axis]
+
+    def slab_index(self, axis: str) -> tuple[list[int], list[list[str]], list[str]]:
+        """
+        The sorted bounds of the spans with axis, the names of the spans
+        covering each slab from one bound up to the next, the last slab
+        has no end, and the names of the spans with neither rows nor columns
+        """
+        if self.slabs[axis] is None:
+            frm, upto = f"from_{axis}", f"upto_{axis}"
+            other = "from_c" if axis == "r" else "from_r"
+            spans = [
+                (span[frm], span[upto] if isinstance(span[upto], int) else None, name)
+                for name, span in self.items()
+                if isinstance(span[frm], int)
+            ]
+            bounds = sorted({i for start, stop, _ in spans for i in (start, stop) if i is not None})
+            slabs = [[] for _ in bounds]
+            for start, stop, name in spans:
+                for i in range(
+                    bisect_left(bounds, start),
+                    len(bounds) if stop is None else bisect_left(bounds, stop),
+                ):
+                    slabs[i].append(name)
+            whole = [name for name, span in self.items() if span[frm] is None and span[other] is None]
+            self.slabs[axis] = bounds, slabs, whole
+        return self.slabs[axis]
+
+    # lookups
+
+    def covering(self, datarn: int, datacn: int) -> list[str]:
+        """
+        The names of the spans covering the cell
+        """
+        if not self:
+            return []
+        names = []
+        bounds, slabs, whole = self.slab_index("r")
+        if (i := bisect_right(bounds, datarn) - 1) >= 0:
+            for name in slabs[i]:
+                span = self[name]
+                if span["from_c"] is None or (
+                    span["from_c"] <= datacn and (span["upto_c"] is None or datacn < span["upto_c"])
+                ):
+                    names.append(name)
+        bounds, slabs, _ = self.slab_index("c")
+        if (i := bisect_right(bounds, datacn) - 1) >= 0:
+            names.extend(name for name in slabs[i] if self[name]["from_r"] is None)
+        names.extend(whole)
+        return names
+
+    def overlapping(self, start: int, stop: int, axis: str = "r") -> list[str]:
+        """
+        The names of the spans with rows, or columns with axis="c", from
+        start up to stop
+        """
+        ends, names = self.index(axis)
+        frm = f"from_{axis}"
+        return [name for name in names[bisect_right(ends, start) :] if self[name][frm] < stop]
+
+    def within(self, to_bis: Sequence[int], total: int, axis: str = "r") -> set[str]:
+        """
+        The names of the spans all of whose rows, or columns with
+        axis="c", are in to_bis, total is the number of rows or columns
+        """
+        if not to_bis:
+            return set()
+        ends, names = self.index(axis)
+        frm, upto = f"from_{axis}", f"upto_{axis}"
+        within = set()
+        for name in names[bisect_right(ends, to_bis[0]) :]:
+            span = self[name]
+            start, stop = span[frm], total if span[upto] is None else span[upto]
+            if bisect_left(to_bis, stop) - bisect_left(to_bis, start) >= stop - start:
+                within.add(name)
+        return within
+
+    # structural changes
+
+    def insert_keys(self, idxs: Sequence[int], axis: str = "r") -> list[tuple[dict, Sequence[int]]]:
+        """
+        Moves the spans along as if rows, or columns with axis="c", were
+        inserted at idxs, the same as push_n(), spans grow by the indexes
+        inserted within them or at their start
+
+        Returns the spans which grew and the indexes inserted within each
+        """
+        grown = []
+        if not idxs:
+            return grown
+        ends, names = self.index(axis)
+        frm, upto = f"from_{axis}", f"upto_{axis}"
+        for i in range(bisect_right(ends, idxs[0]), len(ends)):
+            self.unshare(names[i])
+            span = self[names[i]]
+            start = push_n(span[frm] - 1, idxs) - span[frm] + 1
+            span[frm] += start
+            if isinstance(span[upto], int):
+                stop = push_n(span[upto] - 1, idxs) - span[upto] + 1
+                span[upto] += stop
+                ends[i] = span[upto]
+            else:
+                stop = len(idxs)
+            if stop > start:
+                grown.append((span, idxs[start:stop]))
+        self.slabs[axis] = None
+        return grown
+
+    def delete_keys(self, to_bis: Sequence[int], axis: str = "r") -> None:
+        if not to_bis:
+            return
+        ends, names = self.index(axis)
+        frm, upto = f"from_{axis}", f"upto_{axis}"
+        for i in range(bisect_right(ends, to_bis[0]), len(ends)):
+            self.unshare(names[i])
+            span = self[names[i]]
+            span[frm] -= bisect_left(to_bis, span[frm])
+            if isinstance(span[upto], int):
+                span[upto] -= bisect_left(to_bis, span[upto])
+                ends[i] = span[upto]
+        self.slabs[axis] = None
+
+
+class IndexRuns(MutableSet):
+    """
+    A set of row or column indexes kept as sorted runs of consecutive
+    indexes, the tags of rows and columns, tagging a span of rows stores
+    one run and inserting, deleting or moving rows rewrites runs rather
+    than every index
+
+    frozen() keeps a frozenset of the indexes beside the runs until the
+    next change so that repeated tag_has() calls don't rebuild it
+    """
+
+    __slots__ = ("frozen_set", "starts", "stops")
+
+    def __init__(self, idxs: Iterable[int] = ()) -> None:
+        self.starts = []
+        self.stops = []
+        self.frozen_set = None
+        if idxs:
+            self.update(idxs)
+
+    @classmethod
+    def _from_iterable(cls, idxs: Iterable[int]) -> IndexRuns:
+        return cls(idxs)
+
+    @classmethod
+    def from_runs(cls, runs: Iterable[tuple[int, int]]) -> IndexRuns:
+        """
+        runs are (start, stop) tuples sorted by start, overlapping or
+        touching runs are joined
+        """
+        new = cls()
+        new.load_runs(runs)
+        return new
+
+    def load_runs(self, runs: Iterable[tuple[int, int]]) -> None:
+        starts, stops = [], []
+        for start, stop in runs:
+            if stops and start <= stops[-1]:
+                if stop > stops[-1]:
+                    stops[-1] = stop
+            elif stop > start:
+                starts.append(start)
+                stops.append(stop)
+        self.starts, self.stops = starts, stops
+        self.frozen_set = None
+
+    def copy(self) -> IndexRuns:
+        new = IndexRuns()
+        new.starts = self.starts[:]
+        new.stops = self.stops[:]
+        new.frozen_set = self.frozen_set
+        return new
+
+    # reading
+
+    def __len__(self) -> int:
+        return sum(stop - start for start, stop in zip(self.starts, self.stops))
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def __contains__(self, idx: Any) -> bool:
+        try:
+            return (b := bisect_right(self.starts, idx) - 1) >= 0 and idx < self.stops[b]
+        except TypeError:
+            return False
+
+    def __iter__(self) -> Iterator[int]:
+        return chain.from_iterable(map(range, self.starts, self.stops))
+
+    def __repr__(self) -> str:
+        return f"IndexRuns({list(self.runs())})"
+
+    def runs(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts, self.stops)
+
+    def frozen(self) -> frozenset[int]:
+        if self.frozen_set is None:
+            self.frozen_set = frozenset(self)
+        return self.frozen_set
+
+    def last(self, default: int) -> int:
+        return self.stops[-1] - 1 if self.stops else default
+
+    def union(self, *others: Iterable[int]) -> IndexRuns:
+        return IndexRuns.from_runs(merge(self.runs(), *(as_index_runs(other).runs() for other in others)))
+
+    def intersection(self, *others: Iterable[int]) -> IndexRuns:
+        res = self
+        for other in map(as_index_runs, others):
+            a_starts, a_stops, b_starts, b_stops = res.starts, res.stops, other.starts, other.stops
+            starts, stops = [], []
+            i = j = 0
+            while i < len(a_starts) and j < len(b_starts):
+                if (start := max(a_starts[i], b_starts[j])) < (stop := min(a_stops[i], b_stops[j])):
+                    starts.append(start)
+                    stops.append(stop)
+                if a_stops[i] < b_stops[j]:
+                    i += 1
+                else:
+                    j += 1
+            res = IndexRuns()
+            res.starts, res.stops = starts, stops
+        return res.copy() if res is self else res
+
+    def __or__(self, other: Iterable[int]) -> IndexRuns:
+        return self.union(other) if isinstance(other, IndexRuns) else super().__or__(other)
+
+    def __and__(self, other: Iterable[int]) -> IndexRuns:
+        return self.intersection(other) if isinstance(other, IndexRuns) else super().__and__(other)
+
+    # writing
+
+    def add_run(self, start: int, stop: int) -> None:
+        if start >= stop:
+            return
+        # every run touching or overlapping start up to stop is joined
+        lo, hi = bisect_left(self.stops, start), bisect_right(self.starts, stop)
+        if lo < hi:
+            start, stop = min(start, self.starts[lo]), max(stop, self.stops[hi - 1])
+        self.starts[lo:hi] = (start,)
+        self.stops[lo:hi] = (stop,)
+        self.frozen_set = None
+
+    def remove_run(self, start: int, stop: int) -> None:
+        lo, hi = bisect_right(self.stops, start), bisect_left(self.starts, stop)
+        if start >= stop or lo >= hi:
+            return
+        starts, stops = [], []
+        if self.starts[lo] < start:
+            starts.append(self.starts[lo])
+            stops.append(start)
+        if self.stops[hi - 1] > stop:
+            starts.append(stop)
+            stops.append(self.stops[hi - 1])
+        self.starts[lo:hi] = starts
+        self.stops[lo:hi] = stops
+        self.frozen_set = None
+
+    def add(self, idx: int) -> None:
+        self.add_run(idx, idx + 1)
+
+    def discard(self, idx: int) -> None:
+        self.remove_run(idx, idx + 1)
+
+    def update(self, idxs: Iterable[int]) -> None:
+        if isinstance(idxs, range) and idxs.step == 1:
+            self.add_run(idxs.start, idxs.stop)
+        else:
+            self.load_runs(merge(self.runs(), as_index_runs(idxs).runs()))
+
+    def clear(self) -> None:
+        self.starts = []
+        self.stops = []
+        self.frozen_set = None
+
+    # structural changes
+
+    def insert_keys(self, idxs: Sequence[int]) -> None:
+        """
+        Moves the indexes along as if rows or columns were inserted at
+        idxs, the same as push_n()
+        """
+        if idxs and self.starts:
+            b = bisect_right(self.stops, idxs[0])
+            self.load_runs(
+                chain(
+                    zip(self.starts[:b], self.stops[:b]),
+                    chain.from_iterable(
+                        inserted_runs(start, stop, idxs) for start, stop in zip(self.starts[b:], self.stops[b:])
+                    ),
+                )
+            )
+
+    def delete_keys(self, to_bis: Sequence[int]) -> None:
+        if to_bis and self.starts:
+            b = bisect_right(self.stops, to_bis[0])
+            self.load_runs(
+                chain(
+                    zip(self.starts[:b], self.stops[:b]),
+                    chain.from_iterable(
+                        deleted_runs(start, stop, to_bis) for start, stop in zip(self.starts[b:], self.stops[b:])
+                    ),
+                )
+            )
+
+    def move_keys(
+        self,
+        full_new_idxs: dict[int, int],
+        stretches: tuple[list[int], list[int], list[int]] | None = None,
+    ) -> None:
+        """
+        stretches is moved_stretches(full_new_idxs), given when moving
+        many IndexRuns by the same move
+        """
+        if self.starts:
+            if stretches is None:
+                stretches = moved_stretches(full_new_idxs)
+            self.load_runs(
+                sorted(
+                    chain.from_iterable(
+                        moved_runs(start, stop, stretches) for start, stop in zip(self.starts, self.stops)
+                    )
+                )
+            )
+
+
+def as_index_runs(idxs: Iterable[int]) -> IndexRuns:
+    if isinstance(idxs, IndexRuns):
+        return idxs
+    if isinstance(idxs, range) and idxs.step == 1:
+        return IndexRuns.from_runs(((idxs.start, idxs.stop),))
+    new = IndexRuns()
+    new.load_runs(consecutive_ranges(sorted(set(idxs))))
+    return new
+
+
+class CellRuns(MutableSet):
+    """
+    A set of (row, column) cells, the tagged cells of one tag, kept as
+    the IndexRuns of columns of each row with the rows in an OptionStore
+    so that inserting and deleting rows shifts them lazily, like
+    IndexRuns frozen() is kept until the next change
+    """
+
+    __slots__ = ("frozen_set", "rows")
+
+    def __init__(self, cells: Iterable[tuple[int, int]] = ()) -> None:
+        self.rows = OptionStore()
+        self.frozen_set = None
+        if cells:
+            self.update(cells)
+
+    @classmethod
+    def _from_iterable(cls, cells: Iterable[tuple[int, int]]) -> CellRuns:
+        return cls(cells)
+
+    def copy(self) -> CellRuns:
+        new = CellRuns()
+        new.rows = OptionStore({r: runs.copy() for r, runs in self.rows.items()})
+        new.frozen_set = self.frozen_set
+        return new
+
+    # reading
+
+    def __len__(self) -> int:
+        return sum(map(len, self.rows.values()))
+
+    def __bool__(self) -> bool:
+        return bool(self.rows)
+
+    def __contains__(self, cell: Any) -> bool:
+        try:
+            r, c = cell
+        except (TypeError, ValueError):
+            return False
+        return (runs := self.rows.get(r)) is not None and c in runs
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return chain.from_iterable(zip(repeat(r), runs) for r, runs in self.rows.items())
+
+    def __repr__(self) -> str:
+        return f"CellRuns({ {r: list(runs.runs()) for r, runs in self.rows.items()} })"
+
+    def frozen(self) -> frozenset[tuple[int, int]]:
+        if self.frozen_set is None:
+            self.frozen_set = frozenset(self)
+        return self.frozen_set
+
+    def row(self, r: int) -> IndexRuns | None:
+        return self.rows.get(r)
+
+    def max_row(self, default: int) -> int:
+        return max(self.rows, default=default)
+
+    def max_column(self, default: int) -> int:
+        return max((runs.last(default) for runs in self.rows.values()), default=default)
+
+    def union(self, *others: Iterable[tuple[int, int]]) -> CellRuns:
+        new = self.copy()
+        for other in others:
+            new.update(other)
+        return new
+
+    def intersection(self, *others: Iterable[tuple[int, int]]) -> CellRuns:
+        res = self
+        for other in others:
+            if not isinstance(other, CellRuns):
+                other = CellRuns(other)
+            if len(other.rows) < len(res.rows):
+                res, other = other, res
+            new = CellRuns()
+            for r, runs in res.rows.items():
+                if (other_runs := other.rows.get(r)) is not None and (both := runs.intersection(other_runs)):
+                    new.rows[r] = both
+            res = new
+        return res.copy() if res is self else res
+
+    def __or__(self, other: Iterable[tuple[int, int]]) -> CellRuns:
+        return self.union(other) if isinstance(other, CellRuns) else super().__or__(other)
+
+    def __and__(self, other: Iterable[tuple[int, int]]) -> CellRuns:
+        return self.intersection(other) if isinstance(other, CellRuns) else super().__and__(other)
+
+    # writing
+
+    def add(self, cell: tuple[int, int]) -> None:
+        self.frozen_set = None
+        r, c = cell
+        if (runs := self.rows.get(r)) is None:
+            self.rows[r] = IndexRuns.from_runs(((c, c + 1),))
+        else:
+            runs.add(c)
+
+    def discard(self, cell: tuple[int, int]) -> None:
+        self.frozen_set = None
+        try:
+            r, c = cell
+        except (TypeError, ValueError):
+            return
+        if (runs := self.rows.get(r)) is not None:
+            runs.discard(c)
+            if not runs:
+                del self.rows[r]
+
+    def add_area(self, rows: Iterable[int], cols: Iterable[int]) -> None:
+        self.frozen_set = None
+        if not (cols := as_index_runs(cols)):
+            return
+        for r in rows:
+            if (runs := self.rows.get(r)) is None:
+                self.rows[r] = cols.copy()
+            else:
+                runs.update(cols)
+
+    def update(self, cells: Iterable[tuple[int, int]]) -> None:
+        if isinstance(cells, CellRuns):
+            for r, cols in cells.rows.items():
+                self.add_area((r,), cols)
+        else:
+            rows = {}
+            for r, c in cells:
+                if r in rows:
+                    rows[r].append(c)
+                else:
+                    rows[r] = [c]
+            for r, cols in rows.items():
+                self.add_area((r,), cols)
+
+    def clear(self) -> None:
+        self.frozen_set = None
+        self.rows = OptionStore()
+
+    # structural changes
+
+    def insert_keys(self, idxs: Sequence[int], axis: int = 0) -> None:
+        self.frozen_set = None
+        if axis:
+            for runs in self.rows.values():
+                runs.insert_keys(idxs)
+        else:
+            self.rows.insert_keys(idxs)
+
+    def delete_keys(self, to_del: set[int], to_bis: Sequence[int], axis: int = 0) -> None:
+        self.frozen_set = None
+        if axis:
+            empty = []
+            for r, runs in self.rows.items():
+                runs.delete_keys(to_bis)
+                if not runs:
+                    empty.append(r)
+            for r in empty:
+                del self.rows[r]
+        else:
+            self.rows.delete_keys(to_del, to_bis)
+
+    def move_keys(self, full_new_idxs: dict[int, int], axis: int = 0) -> None:
+        self.frozen_set = None
+        if axis:
+            stretches = moved_stretches(full_new_idxs)
+            for runs in self.rows.values():
+                runs.move_keys(full_new_idxs, stretches)
+        else:
+            self.rows = OptionStore({full_new_idxs.get(r, r): runs for r, runs in self.rows.items()})
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import copy
 import tkinter as tk
+from bisect import bisect_right
 from collections import namedtuple
 from collections.abc import Callable, Hashable, Iterator
 from typing import Any, Literal
 
+from .colors import color_map
+
 FontTuple = namedtuple("FontTuple", "family size style")
 Box_nt = namedtuple(
     "Box_nt",
@@ -559,6 +562,307 @@ class TextEditorStorage(EditorStorageBase):
         return self.window.c
 
 
+class DirtyCells:
+    """
+    Tracks which table cells (data indexes) have changed since the table was last drawn
+    When 'all' is True the next redraw must redraw the whole viewport
+    """
+
+    __slots__ = ("all", "boxes", "cells", "columns", "max_boxes", "max_cells", "rows")
+
+    def __init__(self, max_cells: int = 10000, max_boxes: int = 100) -> None:
+        self.max_cells = max_cells
+        self.max_boxes = max_boxes
+        self.reset(all_=True)
+
+    def __bool__(self) -> bool:
+        return self.all or bool(self.cells or self.rows or self.columns or self.boxes)
+
+    def __contains__(self, loc: tuple[int, int]) -> bool:
+        if self.all or loc in self.cells or loc[0] in self.rows or loc[1] in self.columns:
+            return True
+        r, c = loc
+        return any(
+            fr <= r and (ur is None or r < ur) and fc <= c and (uc is None or c < uc) for fr, fc, ur, uc in self.boxes
+        )
+
+    def reset(self, all_: bool = False) -> None:
+        self.all = all_
+        self.cells = set()
+        self.rows = set()
+        self.columns = set()
+        self.boxes = []
+
+    def add_cell(self, datarn: int, datacn: int) -> None:
+        if not self.all:
+            self.cells.add((datarn, datacn))
+            if len(self.cells) > self.max_cells:
+                self.reset(all_=True)
+
+    def add_rows(self, rows: Iterator[int]) -> None:
+        if not self.all:
+            self.rows.update(rows)
+            if len(self.rows) > self.max_cells:
+                self.reset(all_=True)
+
+    def add_columns(self, columns: Iterator[int]) -> None:
+        if not self.all:
+            self.columns.update(columns)
+            if len(self.columns) > self.max_cells:
+                self.reset(all_=True)
+
+    def add_box(self, from_r: int, from_c: int, upto_r: int | None, upto_c: int | None) -> None:
+        """
+        upto_r and upto_c can be None to represent an unbounded box
+        """
+        if not self.all:
+            self.boxes.append((from_r, from_c, upto_r, upto_c))
+            if len(self.boxes) > self.max_boxes:
+                self.reset(all_=True)
+
+    def add_span(self, kind: Literal["cell", "row", "column"], rows: range, cols: range) -> None:
+        if kind == "cell":
+            self.add_box(rows.start, cols.start, rows.stop, cols.stop)
+        elif kind == "row":
+            self.add_box(rows.start, 0, rows.stop, None)
+        elif kind == "column":
+            self.add_box(0, cols.start, None, cols.stop)
+
+
+class SelectionIntervals:
+    """
+    Displayed rows, columns and cells covered by selection boxes, stored as sorted
+    non-overlapping [start, stop) intervals so that lookups cost a bisect per axis
+    Cells boxes are split into bands of rows which have the same selected columns
+    """
+
+    __slots__ = ("bands", "band_columns", "cells_columns", "cells_rows", "columns", "rows")
+
+    def __init__(self, boxes: Iterator[tuple[int, int, int, int, Literal["cells", "rows", "columns"]]] = ()) -> None:
+        cells, rows, columns, cells_rows, cells_columns = [], [], [], [], []
+        for r1, c1, r2, c2, type_ in boxes:
+            if type_ == "cells":
+                cells.append((r1, c1, r2, c2))
+                cells_rows.append((r1, r2))
+                cells_columns.append((c1, c2))
+            elif type_ == "rows":
+                rows.append((r1, r2))
+                cells_columns.append((c1, c2))
+            elif type_ == "columns":
+                columns.append((c1, c2))
+                cells_rows.append((r1, r2))
+        self.rows = self.merge(rows)
+        self.columns = self.merge(columns)
+        self.cells_rows = self.merge(cells_rows)
+        self.cells_columns = self.merge(cells_columns)
+        self.bands = sorted({r for r1, _, r2, _ in cells for r in (r1, r2)})
+        self.band_columns = [
+            self.merge((c1, c2) for r1, c1, r2, c2 in cells if r1 <= start and r2 > start) for start in self.bands[:-1]
+        ]
+
+    @staticmethod
+    def merge(intervals: Iterator[tuple[int, int]]) -> tuple[list[int], list[int]]:
+        starts, stops = [], []
+        for start, stop in sorted(intervals):
+            if stops and start <= stops[-1]:
+                if stop > stops[-1]:
+                    stops[-1] = stop
+            elif start < stop:
+                starts.append(start)
+                stops.append(stop)
+        return starts, stops
+
+    @staticmethod
+    def covers(intervals: tuple[list[int], list[int]], i: int) -> bool:
+        idx = bisect_right(intervals[0], i) - 1
+        return idx >= 0 and i < intervals[1][idx]
+
+    def cell(self, r: int, c: int) -> bool:
+        """
+        Whether the cell is in a cells box
+        """
+        band = bisect_right(self.bands, r) - 1
+        if band < 0 or band >= len(self.band_columns):
+            return False
+        starts, stops = self.band_columns[band]
+        idx = bisect_right(starts, c) - 1
+        return idx >= 0 and c < stops[idx]
+
+    def row(self, r: int) -> bool:
+        """
+        Whether the row is in a rows box
+        """
+        return self.covers(self.rows, r)
+
+    def column(self, c: int) -> bool:
+        """
+        Whether the column is in a columns box
+        """
+        return self.covers(self.columns, c)
+
+    def cells_row(self, r: int) -> bool:
+        """
+        Whether the row has cells selected by a cells or columns box
+        """
+        return self.covers(self.cells_rows, r)
+
+    def cells_column(self, c: int) -> bool:
+        """
+        Whether the column has cells selected by a cells or rows box
+        """
+        return self.covers(self.cells_columns, c)
+
+
+class ColorCache:
+    """
+    Memoized color name to hex resolution, (r, g, b) tuples and
+    50/50 blends of highlight and selection colors used while redrawing
+    """
+
+    __slots__ = ("blends", "hexes", "maxsize", "tups")
+
+    def __init__(self, maxsize: int = 10000) -> None:
+        self.maxsize = maxsize
+        self.clear()
+
+    def clear(self) -> None:
+        self.hexes = {}
+        self.tups = {}
+        self.blends = {}
+
+    def hex(self, color: str) -> str:
+        if color in self.hexes:
+            return self.hexes[color]
+        if len(self.hexes) >= self.maxsize:
+            self.hexes = {}
+        res = self.hexes[color] = color if color.startswith("#") else color_map[color]
+        return res
+
+    def tup(self, color: str) -> tuple[int, int, int]:
+        if color in self.tups:
+            return self.tups[color]
+        if len(self.tups) >= self.maxsize:
+            self.tups = {}
+        res = self.hex(color)
+        res = self.tups[color] = int(res[1:3], 16), int(res[3:5], 16), int(res[5:], 16)
+        return res
+
+    def blend(self, color: str, selection_color: str) -> str:
+        key = (color, selection_color)
+        if key in self.blends:
+            return self.blends[key]
+        if len(self.blends) >= self.maxsize:
+            self.blends = {}
+        (r1, g1, b1), (r2, g2, b2) = self.tup(color), self.tup(selection_color)
+        res = self.blends[key] = f"#{int((r1 + r2) / 2):02X}{int((g1 + g2) / 2):02X}{int((b1 + b2) / 2):02X}"
+        return res
+
+
+class TextLayoutCache:
+    """
+    Least recently used cache of wrapped lines of text
+    a maxsize of 0 disables the cache
+    """
+
+    __slots__ = ("hits", "layouts", "maxsize", "misses")
+
+    def __init__(self, maxsize: int = 10000) -> None:
+        self.maxsize = maxsize
+        self.layouts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.layouts)
+
+    def get(self, key: Hashable) -> tuple[str, ...] | None:
+        try:
+            # moved to the end, the first key is the least recently used
+            self.layouts[key] = lines = self.layouts.pop(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return lines
+
+    def add(self, key: Hashable, lines: tuple[str, ...]) -> None:
+        if self.maxsize > 0:
+            self.layouts[key] = lines
+            if len(self.layouts) > self.maxsize:
+                del self.layouts[next(iter(self.layouts))]
+
+    def resize(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        while len(self.layouts) > max(0, maxsize):
+            del self.layouts[next(iter(self.layouts))]
+
+    def clear(self) -> None:
+        self.layouts = {}
+
+    def info(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.layouts),
+            "maxsize": self.maxsize,
+        }
+
+
+class DisplayStringCache:
+    """
+    Display strings of formatted table cells by (datarn, datacn)
+    an entry is only used while the cell's value and format options
+    are the same objects as when it was stored
+    the least recently used entries are discarded first,
+    a maxsize of 0 disables the cache
+    """
+
+    __slots__ = ("hits", "maxsize", "misses", "strings")
+
+    def __init__(self, maxsize: int = 10000) -> None:
+        self.maxsize = maxsize
+        self.strings = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def get(self, key: tuple[int, int], value: Any, kwargs: dict) -> str | None:
+        if (entry := self.strings.get(key)) is not None and entry[0] is value and entry[1] is kwargs:
+            # moved to the end, the first key is the least recently used
+            self.strings[key] = self.strings.pop(key)
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        return None
+
+    def add(self, key: tuple[int, int], value: Any, kwargs: dict, string: str) -> None:
+        if self.maxsize > 0:
+            self.strings[key] = (value, kwargs, string)
+            if len(self.strings) > self.maxsize:
+                del self.strings[next(iter(self.strings))]
+
+    def discard(self, key: tuple[int, int]) -> None:
+        self.strings.pop(key, None)
+
+    def resize(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        while len(self.strings) > max(0, maxsize):
+            del self.strings[next(iter(self.strings))]
+
+    def clear(self) -> None:
+        self.strings = {}
+
+    def info(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.strings),
+            "maxsize": self.maxsize,
+        }
+
+
 class ProgressBar:
     __slots__ = ("bg", "fg", "name", "percent", "del_when_done")
 
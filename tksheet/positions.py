@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import accumulate, chain, islice, repeat
+from math import ceil, floor
+from typing import Any
+
+
+class Positions:
+    """
+    The pixel positions of the row or column lines
+
+    Reads like the list [0, p1, p2, ... pn] that it replaces but is
+    stored as blocks of sizes, so that resizing, inserting and deleting
+    a row or column only rewrites one block instead of the whole tail.
+    The block offsets are rebuilt lazily, once per change, in a single
+    pass over the blocks
+
+    Positions made with Positions.uniform() store no sizes at all, the
+    positions are calculated from the default size and only the sizes
+    which differ from it are kept. They turn into blocks once more than
+    max_overrides sizes differ
+
+    With a typecode, e.g. "d", the blocks are stored as array.arrays
+    instead of lists of Python numbers
+    """
+
+    __slots__ = (
+        "blocks",
+        "cums",
+        "default",
+        "deltas",
+        "ends",
+        "keys",
+        "load",
+        "max_overrides",
+        "n",
+        "overrides",
+        "pxs",
+        "starts",
+        "sums",
+        "typecode",
+    )
+
+    def __init__(
+        self,
+        sizes: Iterable[float] = (),
+        load: int = 1024,
+        max_overrides: int = 1024,
+        typecode: str | None = None,
+    ) -> None:
+        self.load = load
+        self.max_overrides = max_overrides
+        self.typecode = typecode
+        self.load_sizes(sizes)
+
+    @classmethod
+    def uniform(
+        cls,
+        size: float,
+        n: int,
+        load: int = 1024,
+        max_overrides: int = 1024,
+        typecode: str | None = None,
+    ) -> Positions:
+        new = cls(load=load, max_overrides=max_overrides, typecode=typecode)
+        new.default = size
+        new.n = n
+        return new
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[float], typecode: str | None = None) -> Positions:
+        if isinstance(positions, Positions):
+            return positions
+        it = iter(positions)
+        prev = next(it, 0)
+        sizes = []
+        for e in it:
+            sizes.append(e - prev)
+            prev = e
+        return cls(sizes, typecode=typecode)
+
+    def load_sizes(self, sizes: Iterable[float]) -> None:
+        sizes = sizes if isinstance(sizes, list) else list(sizes)
+        load = self.load
+        if self.typecode:
+            self.blocks = [array(self.typecode, sizes[i : i + load]) for i in range(0, len(sizes), load)]
+        else:
+            self.blocks = [sizes[i : i + load] for i in range(0, len(sizes), load)]
+        self.sums = [sum(b) for b in self.blocks]
+        self.cums = [None] * len(self.blocks)
+        self.n = len(sizes)
+        self.starts = None
+        self.pxs = None
+        self.default = None
+        self.overrides = {}
+        self.keys = None
+
+    @property
+    def is_uniform(self) -> bool:
+        return self.default is not None
+
+    def upgrade(self) -> None:
+        """
+        Turns uniform positions into blocks of sizes
+        """
+        if self.default is not None:
+            self.load_sizes(self.sizes())
+
+    def set_typecode(self, typecode: str | None) -> None:
+        if typecode != self.typecode:
+            self.typecode = typecode
+            if self.default is None:
+                self.load_sizes(self.sizes())
+
+    def index(self) -> tuple[list[int], list[float]]:
+        if self.starts is None:
+            self.starts = list(accumulate(chain((0,), map(len, self.blocks))))
+        if self.pxs is None:
+            self.pxs = list(accumulate(chain((0,), self.sums)))
+        return self.starts, self.pxs
+
+    def uniform_index(self) -> tuple[list[int], list[float], list[float]]:
+        """
+        The sorted indexes of the overridden sizes, the total of the
+        overrides' differences from the default before each of them and
+        the positions of the lines at their ends
+        """
+        if self.keys is None:
+            d, overrides = self.default, self.overrides
+            self.keys = sorted(overrides)
+            self.deltas = list(accumulate(chain((0,), (overrides[k] - d for k in self.keys))))
+            self.ends = [k * d + delta for k, delta in zip(chain(self.keys, (self.n,)), self.deltas)]
+        return self.keys, self.deltas, self.ends
+
+    def cum(self, b: int) -> list[float]:
+        if (cum := self.cums[b]) is None:
+            if self.typecode:
+                cum = self.cums[b] = array(self.typecode, accumulate(self.blocks[b]))
+            else:
+                cum = self.cums[b] = list(accumulate(self.blocks[b]))
+        return cum
+
+    def locate(self, i: int) -> tuple[int, int]:
+        """
+        The block and the index within it of size i, for 0 <= i < n
+        """
+        starts = self.index()[0]
+        b = bisect_right(starts, i) - 1
+        return b, i - starts[b]
+
+    def changed(self, b: int) -> None:
+        self.sums[b] = sum(self.blocks[b])
+        self.cums[b] = None
+        self.pxs = None
+
+    # list compatible reading
+
+    def __len__(self) -> int:
+        return self.n + 1
+
+    def __bool__(self) -> bool:
+        return True
+
+    def position(self, i: int) -> float:
+        if self.default is not None:
+            keys, deltas, _ = self.uniform_index()
+            return i * self.default + deltas[bisect_left(keys, i)]
+        starts, pxs = self.index()
+        b = bisect_right(starts, i) - 1
+        if j := i - starts[b]:
+            return pxs[b] + self.cum(b)[j - 1]
+        return pxs[b]
+
+    def __getitem__(self, key: int | slice) -> float | list[float]:
+        if key.__class__ is int and 0 <= key <= self.n and self.pxs is not None and self.starts is not None:
+            # inlined position() for the common case
+            b = bisect_right(self.starts, key) - 1
+            if j := key - self.starts[b]:
+                if (cum := self.cums[b]) is None:
+                    cum = self.cum(b)
+                return self.pxs[b] + cum[j - 1]
+            return self.pxs[b]
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.n + 1)
+            if step != 1:
+                return [self.position(i) for i in range(start, stop, step)]
+            if stop <= start:
+                return []
+            return list(accumulate(chain((self.position(start),), self.iter_sizes(start, stop - 1))))
+        if key < 0:
+            key += self.n + 1
+        if key < 0 or key > self.n:
+            raise IndexError("positions index out of range")
+        return self.position(key)
+
+    def __iter__(self) -> Iterator[float]:
+        return accumulate(chain((0,), self.sizes()))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Positions):
+            return self.n == other.n and all(a == b for a, b in zip(self.sizes(), other.sizes()))
+        if isinstance(other, (list, tuple)):
+            return len(other) == self.n + 1 and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+    def copy(self) -> Positions:
+        if self.default is not None:
+            new = Positions.uniform(
+                self.default,
+                self.n,
+                load=self.load,
+                max_overrides=self.max_overrides,
+                typecode=self.typecode,
+            )
+            new.overrides = self.overrides.copy()
+            return new
+        new = Positions(load=self.load, max_overrides=self.max_overrides, typecode=self.typecode)
+        new.blocks = [b[:] for b in self.blocks]
+        new.sums = self.sums.copy()
+        new.cums = [None] * len(new.blocks)
+        new.n = self.n
+        return new
+
+    def uniform_bisect(self, px: float, right: bool) -> int:
+        keys, deltas, ends = self.uniform_index()
+        m = bisect_right(ends, px) if right else bisect_left(ends, px)
+        if m == len(ends):
+            return self.n + 1
+        # the lines keys[m - 1] + 1 ... keys[m] are default sizes apart
+        lo = keys[m - 1] + 1 if m else 0
+        d, delta = self.default, deltas[m]
+        if not d:
+            return lo
+        i = max(lo, floor((px - delta) / d) + 1 if right else ceil((px - delta) / d))
+        if right:
+            while i > lo and i - 1 < self.n and (i - 1) * d + delta > px:
+                i -= 1
+            while i * d + delta <= px:
+                i += 1
+        else:
+            while i > lo and (i - 1) * d + delta >= px:
+                i -= 1
+            while i * d + delta < px:
+                i += 1
+        return i
+
+    def bisect_left(self, px: float, lo: int = 0, hi: int | None = None) -> int:
+        """
+        Same as bisect.bisect_left(positions, px, lo, hi)
+        """
+        if self.default is not None:
+            i = self.uniform_bisect(px, right=False)
+        else:
+            starts, pxs = self.index()
+            b = bisect_left(pxs, px) - 1
+            if b < 0:
+                i = 0
+            elif b >= len(self.blocks):
+                i = self.n + 1
+            else:
+                i = starts[b] + 1 + bisect_left(self.cum(b), px - pxs[b])
+        return min(max(i, lo), self.n + 1 if hi is None else hi)
+
+    def bisect_right(self, px: float, lo: int = 0, hi: int | None = None) -> int:
+        """
+        Same as bisect.bisect_right(positions, px, lo, hi)
+        """
+        if self.default is not None:
+            i = self.uniform_bisect(px, right=True)
+        else:
+            starts, pxs = self.index()
+            b = bisect_right(pxs, px) - 1
+            if b < 0:
+                i = 0
+            elif b >= len(self.blocks):
+                i = self.n + 1
+            else:
+                i = starts[b] + 1 + bisect_right(self.cum(b), px - pxs[b])
+        return min(max(i, lo), self.n + 1 if hi is None else hi)
+
+    # sizes
+
+    def size(self, i: int) -> float:
+        if self.default is not None:
+            return self.overrides.get(i, self.default)
+        b, j = self.locate(i)
+        return self.blocks[b][j]
+
+    def sizes(self) -> Iterator[float]:
+        if self.default is not None:
+            return self.iter_sizes(0, self.n)
+        return chain.from_iterable(self.blocks)
+
+    def iter_sizes(self, start: int, stop: int) -> Iterator[float]:
+        if stop <= start:
+            return iter(())
+        if self.default is not None:
+            return chain.from_iterable(self.uniform_runs(start, stop))
+        b, j = self.locate(start)
+        return islice(chain.from_iterable(islice(self.blocks, b, None)), j, j + stop - start)
+
+    def uniform_runs(self, start: int, stop: int) -> Iterator[Iterable[float]]:
+        keys = self.uniform_index()[0]
+        i = start
+        for k in islice(keys, bisect_left(keys, start), None):
+            if k >= stop:
+                break
+            yield repeat(self.default, k - i)
+            yield (self.overrides[k],)
+            i = k + 1
+        yield repeat(self.default, stop - i)
+
+    def set_size(self, i: int, size: float) -> None:
+        if self.default is not None:
+            if size == self.default:
+                self.overrides.pop(i, None)
+            else:
+                self.overrides[i] = size
+            self.keys = None
+            if len(self.overrides) > self.max_overrides:
+                self.upgrade()
+            return
+        b, j = self.locate(i)
+        self.blocks[b][j] = size
+        self.changed(b)
+
+    def insert_sizes(self, i: int, sizes: Iterable[float]) -> None:
+        sizes = sizes if isinstance(sizes, list) else list(sizes)
+        if not sizes:
+            return
+        if self.default is not None:
+            i = min(i, self.n)
+            num = len(sizes)
+            self.overrides = {k + num if k >= i else k: v for k, v in self.overrides.items()}
+            if sizes.count(self.default) != num:
+                self.overrides.update((k, v) for k, v in enumerate(sizes, start=i) if v != self.default)
+            self.n += num
+            self.keys = None
+            if len(self.overrides) > self.max_overrides:
+                self.upgrade()
+            return
+        if not self.blocks:
+            self.load_sizes(sizes)
+            return
+        if i >= self.n:
+            b, j = len(self.blocks) - 1, len(self.blocks[-1])
+        else:
+            b, j = self.locate(i)
+        block = self.blocks[b]
+        block[j:j] = array(self.typecode, sizes) if self.typecode else sizes
+        self.n += len(sizes)
+        self.starts = None
+        if len(block) > self.load * 2:
+            load = self.load
+            new = [block[k : k + load] for k in range(0, len(block), load)]
+            self.blocks[b : b + 1] = new
+            self.sums[b : b + 1] = [sum(nb) for nb in new]
+            self.cums[b : b + 1] = [None] * len(new)
+            self.pxs = None
+        else:
+            self.changed(b)
+
+    def delete_sizes(self, i: int, count: int = 1) -> None:
+        count = min(count, self.n - i)
+        if count <= 0:
+            return
+        end = i + count
+        if self.default is not None:
+            self.overrides = {k - count if k >= end else k: v for k, v in self.overrides.items() if not i <= k < end}
+            self.n -= count
+            self.keys = None
+            return
+        starts = self.index()[0]
+        b1 = bisect_right(starts, i) - 1
+        b2 = bisect_left(starts, end) - 1
+        j1, j2 = i - starts[b1], end - starts[b2]
+        blocks = self.blocks
+        if b1 == b2:
+            del blocks[b1][j1:j2]
+        else:
+            del blocks[b1][j1:]
+            del blocks[b2][:j2]
+            del blocks[b1 + 1 : b2]
+            del self.sums[b1 + 1 : b2]
+            del self.cums[b1 + 1 : b2]
+            b2 = b1 + 1
+            self.changed(b2)
+        self.changed(b1)
+        self.n -= count
+        self.starts = None
+        # drop emptied blocks then merge what is left around the deletion
+        for b in range(b2, b1 - 1, -1):
+            if not blocks[b]:
+                del blocks[b], self.sums[b], self.cums[b]
+        if b1 + 1 < len(blocks) and len(blocks[b1]) + len(blocks[b1 + 1]) <= self.load:
+            blocks[b1].extend(blocks[b1 + 1])
+            del blocks[b1 + 1], self.sums[b1 + 1], self.cums[b1 + 1]
+            self.changed(b1)
+
+    def move_size(self, idx1: int, idx2: int) -> None:
+        size = self.size(idx1)
+        self.delete_sizes(idx1)
+        self.insert_sizes(idx2, [size])
+
+    # list compatible writing, these rebuild the blocks
+
+    def rebuild(self, positions: list[float]) -> None:
+        self.load_sizes(list(Positions.from_positions(positions).sizes()))
+
+    def __setitem__(self, key: int | slice, value: Any) -> None:
+        if isinstance(key, int):
+            if key < 0:
+                key += self.n + 1
+            if key < 0 or key > self.n:
+                raise IndexError("positions assignment index out of range")
+            if key < self.n:
+                self.set_size(key, self.position(key + 1) - value)
+            if key:
+                self.set_size(key - 1, value - self.position(key - 1))
+        else:
+            positions = list(self)
+            positions[key] = value
+            self.rebuild(positions)
+
+    def __delitem__(self, key: int | slice) -> None:
+        if self.n and (key == -1 or key == self.n):
+            self.delete_sizes(self.n - 1)
+        else:
+            positions = list(self)
+            del positions[key]
+            self.rebuild(positions)
+
+    def append(self, value: float) -> None:
+        self.insert_sizes(self.n, [value - self.position(self.n)])
+
+    def extend(self, values: Iterable[float]) -> None:
+        self.insert_sizes(self.n, Positions.from_positions(chain((self.position(self.n),), values)).sizes())
+
+    def __iadd__(self, values: Iterable[float]) -> Positions:
+        self.extend(values)
+        return self
+
+    def insert(self, idx: int, value: float) -> None:
+        positions = list(self)
+        positions.insert(idx, value)
+        self.rebuild(positions)
+
+    def pop(self, idx: int = -1) -> float:
+        positions = list(self)
+        value = positions.pop(idx)
+        self.rebuild(positions)
+        return value
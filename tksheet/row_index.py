@@ -2,14 +2,12 @@ from __future__ import annotations
 
 import tkinter as tk
 from collections import defaultdict
-from collections.abc import Callable, Generator, Hashable, Iterator, Sequence
+from collections.abc import Callable, Generator, Hashable, Iterator, Mapping, Sequence
 from functools import partial
-from itertools import islice, repeat
 from math import ceil
 from re import findall
 from typing import Any, Literal
 
-from .colors import color_map
 from .constants import (
     _test_str,
     text_editor_close_bindings,
@@ -35,6 +33,7 @@ from .functions import (
     num2alpha,
     push_displayed,
     recursive_bind,
+    release_drawn_items,
     remove_duplicates_outside_section,
     rounded_box_coords,
     safe_copy,
@@ -42,10 +41,17 @@ from .functions import (
     try_b_index,
     try_binding,
     widget_descendants,
-    wrap_text,
 )
 from .menus import build_empty_rc_menu, build_index_rc_menu
-from .other_classes import DraggedRowColumn, DropdownStorage, EventDataDict, Node, TextEditorStorage
+from .option_store import OptionStore
+from .other_classes import (
+    DraggedRowColumn,
+    DropdownStorage,
+    EventDataDict,
+    Node,
+    SelectionIntervals,
+    TextEditorStorage,
+)
 from .sorting import sort_columns_by_row, sort_row
 from .text_editor import TextEditor
 from .tooltip import Tooltip
@@ -141,6 +147,9 @@ class RowIndex(tk.Canvas):
         self.hidd_checkbox = {}
         self.hidd_tree_arrow = {}
         self.hidd_corners = set()
+        # displayed row: [(item type, canvas item id), ...]
+        self.drawn_rows = {}
+        self.drawn_viewport = None
 
         self.align = kwargs["row_index_align"]
 
@@ -183,6 +192,14 @@ class RowIndex(tk.Canvas):
             self.MT.recreate_all_selection_boxes()
         self.current_width = new_width
 
+    @property
+    def cell_options(self) -> OptionStore:
+        return self._cell_options
+
+    @cell_options.setter
+    def cell_options(self, options: Mapping) -> None:
+        self._cell_options = OptionStore.from_dict(options)
+
     def is_readonly(self, datarn: int) -> bool:
         return datarn in self.cell_options and "readonly" in self.cell_options[datarn]
 
@@ -603,7 +620,7 @@ class RowIndex(tk.Canvas):
                 if self.scroll_if_event_offscreen(event):
                     need_redraw = True
             if need_redraw:
-                self.MT.main_table_redraw_grid_and_text(redraw_header=False, redraw_row_index=True)
+                self.MT.redraw_after_input(redraw_header=False, redraw_row_index=True)
         try_binding(self.extra_b1_motion_func, event)
 
     def get_b1_motion_box(self, start_row: int, end_row: int) -> tuple[int, int, int, int, Literal["rows"]]:
@@ -780,7 +797,7 @@ class RowIndex(tk.Canvas):
 
     def drag_width_resize(self, width: int) -> None:
         self.set_width(width, set_TL=True)
-        self.MT.main_table_redraw_grid_and_text(redraw_header=False, redraw_row_index=True, redraw_table=False)
+        self.MT.redraw_after_input(redraw_header=False, redraw_row_index=True, redraw_table=False)
 
     def drag_height_resize(self) -> None:
         new_row_pos = int(self.coords("rhl")[1])
@@ -790,12 +807,8 @@ class RowIndex(tk.Canvas):
             new_row_pos = ceil(self.MT.row_positions[self.rsz_h - 1] + self.MT.min_row_height)
         elif size > self.ops.max_row_height:
             new_row_pos = int(self.MT.row_positions[self.rsz_h - 1] + self.ops.max_row_height)
-        increment = new_row_pos - self.MT.row_positions[self.rsz_h]
-        self.MT.row_positions[self.rsz_h + 1 :] = [
-            e + increment for e in islice(self.MT.row_positions, self.rsz_h + 1, None)
-        ]
-        self.MT.row_positions[self.rsz_h] = new_row_pos
-        new_height = self.MT.row_positions[self.rsz_h] - self.MT.row_positions[self.rsz_h - 1]
+        new_height = new_row_pos - self.MT.row_positions[self.rsz_h - 1]
+        self.MT.row_positions.set_size(self.rsz_h - 1, new_height)
         self.MT.allow_auto_resize_rows = False
         self.MT.recreate_all_selection_boxes()
         self.MT.main_table_redraw_grid_and_text(redraw_header=True, redraw_row_index=True, set_scrollregion=False)
@@ -1135,12 +1148,12 @@ class RowIndex(tk.Canvas):
             1,
             sum(
                 1
-                for _ in wrap_text(
+                for _ in self.MT.wrap_lines(
                     text=self.cell_str(datarn, fix=False),
                     max_width=self.current_width,
                     max_lines=float("inf"),
                     char_width_fn=self.char_width_fn,
-                    widths=self.MT.char_widths[self.index_font],
+                    font=self.index_font,
                     wrap=self.ops.index_wrap,
                 )
             ),
@@ -1204,12 +1217,7 @@ class RowIndex(tk.Canvas):
             height = int(self.ops.max_row_height)
         if only_if_too_small and height <= self.MT.row_positions[row + 1] - self.MT.row_positions[row]:
             return self.MT.row_positions[row + 1] - self.MT.row_positions[row]
-        new_row_pos = self.MT.row_positions[row] + height
-        increment = new_row_pos - self.MT.row_positions[row + 1]
-        self.MT.row_positions[row + 2 :] = [
-            e + increment for e in islice(self.MT.row_positions, row + 2, len(self.MT.row_positions))
-        ]
-        self.MT.row_positions[row + 1] = new_row_pos
+        self.MT.row_positions.set_size(row, height)
         if recreate:
             self.MT.recreate_all_selection_boxes()
         return height
@@ -1276,9 +1284,9 @@ class RowIndex(tk.Canvas):
             )
         elif height is not None:
             if self.MT.all_rows_displayed:
-                self.MT.set_row_positions(itr=repeat(height, len(self.MT.data)))
+                self.MT.reset_row_positions(nrows=len(self.MT.data), height=height)
             else:
-                self.MT.set_row_positions(itr=repeat(height, len(self.MT.displayed_rows)))
+                self.MT.reset_row_positions(nrows=len(self.MT.displayed_rows), height=height)
         if recreate:
             self.MT.recreate_all_selection_boxes()
 
@@ -1312,63 +1320,55 @@ class RowIndex(tk.Canvas):
         r: int,
         sel_cells_bg: str,
         sel_rows_bg: str,
-        selections: dict,
+        selections: SelectionIntervals,
         datarn: int,
         has_dd: bool,
         tags: str | tuple[str],
-    ) -> tuple[str, str, bool]:
-        redrawn = False
+    ) -> tuple[str, str, int | None]:
+        iid = None
         kwargs = self.get_cell_kwargs(datarn, key="highlight")
         if kwargs:
             high_bg = kwargs[0]
-            if high_bg and not high_bg.startswith("#"):
-                high_bg = color_map[high_bg]
-            if "rows" in selections and r in selections["rows"]:
+            if high_bg:
+                high_bg = self.MT.color_cache.hex(high_bg)
+            if selections.row(r):
                 txtfg = (
                     self.ops.index_selected_rows_fg
                     if kwargs[1] is None or self.ops.display_selected_fg_over_highlights
                     else kwargs[1]
                 )
-                redrawn = self.redraw_highlight(
+                iid = self.redraw_highlight(
                     0,
                     fr + 1,
                     self.current_width - 1,
                     sr,
                     fill=self.ops.index_selected_rows_bg
                     if high_bg is None
-                    else (
-                        f"#{int((int(high_bg[1:3], 16) + int(sel_rows_bg[1:3], 16)) / 2):02X}"
-                        + f"{int((int(high_bg[3:5], 16) + int(sel_rows_bg[3:5], 16)) / 2):02X}"
-                        + f"{int((int(high_bg[5:], 16) + int(sel_rows_bg[5:], 16)) / 2):02X}"
-                    ),
+                    else self.MT.color_cache.blend(high_bg, sel_rows_bg),
                     outline=self.ops.index_fg if has_dd and self.ops.show_dropdown_borders else "",
                     tags=tags,
                 )
-            elif "cells" in selections and r in selections["cells"]:
+            elif selections.cells_row(r):
                 txtfg = (
                     self.ops.index_selected_cells_fg
                     if kwargs[1] is None or self.ops.display_selected_fg_over_highlights
                     else kwargs[1]
                 )
-                redrawn = self.redraw_highlight(
+                iid = self.redraw_highlight(
                     0,
                     fr + 1,
                     self.current_width - 1,
                     sr,
                     fill=self.ops.index_selected_cells_bg
                     if high_bg is None
-                    else (
-                        f"#{int((int(high_bg[1:3], 16) + int(sel_cells_bg[1:3], 16)) / 2):02X}"
-                        + f"{int((int(high_bg[3:5], 16) + int(sel_cells_bg[3:5], 16)) / 2):02X}"
-                        + f"{int((int(high_bg[5:], 16) + int(sel_cells_bg[5:], 16)) / 2):02X}"
-                    ),
+                    else self.MT.color_cache.blend(high_bg, sel_cells_bg),
                     outline=self.ops.index_fg if has_dd and self.ops.show_dropdown_borders else "",
                     tags=tags,
                 )
             else:
                 txtfg = self.ops.index_fg if kwargs[1] is None else kwargs[1]
                 if high_bg:
-                    redrawn = self.redraw_highlight(
+                    iid = self.redraw_highlight(
                         0,
                         fr + 1,
                         self.current_width - 1,
@@ -1379,10 +1379,10 @@ class RowIndex(tk.Canvas):
                     )
             tree_arrow_fg = txtfg
         elif not kwargs:
-            if "rows" in selections and r in selections["rows"]:
+            if selections.row(r):
                 txtfg = self.ops.index_selected_rows_fg
                 tree_arrow_fg = self.ops.selected_rows_tree_arrow_fg
-                redrawn = self.redraw_highlight(
+                iid = self.redraw_highlight(
                     0,
                     fr + 1,
                     self.current_width - 1,
@@ -1391,10 +1391,10 @@ class RowIndex(tk.Canvas):
                     outline=self.ops.index_fg if has_dd and self.ops.show_dropdown_borders else "",
                     tags=tags,
                 )
-            elif "cells" in selections and r in selections["cells"]:
+            elif selections.cells_row(r):
                 txtfg = self.ops.index_selected_cells_fg
                 tree_arrow_fg = self.ops.selected_cells_tree_arrow_fg
-                redrawn = self.redraw_highlight(
+                iid = self.redraw_highlight(
                     0,
                     fr + 1,
                     self.current_width - 1,
@@ -1406,7 +1406,7 @@ class RowIndex(tk.Canvas):
             else:
                 txtfg = self.ops.index_fg
                 tree_arrow_fg = self.ops.tree_arrow_fg
-                redrawn = self.redraw_highlight(
+                iid = self.redraw_highlight(
                     0,
                     fr + 1,
                     self.current_width - 1,
@@ -1415,7 +1415,7 @@ class RowIndex(tk.Canvas):
                     outline=self.ops.index_fg if has_dd and self.ops.show_dropdown_borders else "",
                     tags=tags,
                 )
-        return txtfg, tree_arrow_fg, redrawn
+        return txtfg, tree_arrow_fg, iid
 
     def redraw_highlight(
         self,
@@ -1426,7 +1426,7 @@ class RowIndex(tk.Canvas):
         fill: str,
         outline: str,
         tags: str | tuple[str],
-    ) -> bool:
+    ) -> int:
         if not self.ops.show_horizontal_grid:
             y2 += 1
         if self.hidd_high:
@@ -1439,7 +1439,7 @@ class RowIndex(tk.Canvas):
         else:
             iid = self.create_rectangle(x1, y1, x2, y2, fill=fill, outline=outline, tags=tags)
         self.disp_high[iid] = True
-        return True
+        return iid
 
     def redraw_gridline(
         self,
@@ -1468,7 +1468,7 @@ class RowIndex(tk.Canvas):
         has_children: bool = False,
         open_: bool = False,
         level: int = 1,
-    ) -> None:
+    ) -> int:
         mod = (self.MT.index_txt_height - 1) if self.MT.index_txt_height % 2 else self.MT.index_txt_height
         small_mod = int(mod / 5)
         mid_y = int(self.MT.min_row_height / 2)
@@ -1547,6 +1547,7 @@ class RowIndex(tk.Canvas):
                 tag="lift",
             )
         self.disp_tree_arrow[t] = True
+        return t
 
     def redraw_dropdown(
         self,
@@ -1559,7 +1560,7 @@ class RowIndex(tk.Canvas):
         draw_outline: bool = True,
         draw_arrow: bool = True,
         open_: bool = False,
-    ) -> None:
+    ) -> int | None:
         # if draw_outline and self.ops.show_dropdown_borders:
         #     self.redraw_highlight(x1 + 1, y1 + 1, x2, y2, fill="", outline=self.ops.index_fg)
         if draw_arrow:
@@ -1603,6 +1604,8 @@ class RowIndex(tk.Canvas):
                     tag="lift",
                 )
             self.disp_dropdown[t] = True
+            return t
+        return None
 
     def redraw_checkbox(
         self,
@@ -1613,7 +1616,7 @@ class RowIndex(tk.Canvas):
         fill: str,
         outline: str,
         draw_check: bool = False,
-    ) -> None:
+    ) -> tuple[int, ...]:
         points = rounded_box_coords(x1, y1, x2, y2)
         if self.hidd_checkbox:
             t, sh = self.hidd_checkbox.popitem()
@@ -1625,6 +1628,7 @@ class RowIndex(tk.Canvas):
         else:
             t = self.create_polygon(points, fill=outline, outline=fill, smooth=True, tag="lift")
         self.disp_checkbox[t] = True
+        iids = (t,)
         if draw_check:
             # draw filled box
             x1 = x1 + 4
@@ -1642,6 +1646,8 @@ class RowIndex(tk.Canvas):
             else:
                 t = self.create_polygon(points, fill=fill, outline=outline, smooth=True, tag="lift")
             self.disp_checkbox[t] = True
+            iids += (t,)
+        return iids
 
     def configure_scrollregion(self, last_row_line_pos: float) -> bool:
         try:
@@ -1671,16 +1677,15 @@ class RowIndex(tk.Canvas):
             self.MT.char_widths[self.index_font][c] = wd
             return wd
 
-    def redraw_corner(self, x: float, y: float, tags: str | tuple[str]) -> None:
+    def redraw_corner(self, x: float, y: float, tags: str | tuple[str]) -> int:
         if self.hidd_corners:
             iid = self.hidd_corners.pop()
             self.coords(iid, x - 10, y, x, y, x, y + 10)
             self.itemconfig(iid, fill=self.ops.index_grid_fg, state="normal", tags=tags)
-            self.disp_corners.add(iid)
         else:
-            self.disp_corners.add(
-                self.create_polygon(x - 10, y, x, y, x, y + 10, fill=self.ops.index_grid_fg, tags=tags)
-            )
+            iid = self.create_polygon(x - 10, y, x, y, x, y + 10, fill=self.ops.index_grid_fg, tags=tags)
+        self.disp_corners.add(iid)
+        return iid
 
     def redraw_grid_and_text(
         self,
@@ -1694,23 +1699,38 @@ class RowIndex(tk.Canvas):
         scrollpos_bot: int,
         row_pos_exists: bool,
         set_scrollregion: bool,
+        keep_rows: range = range(0),
     ) -> bool:
+        """
+        keep_rows: displayed rows which are already drawn correctly
+                   e.g. after scrolling and are left as they are
+        """
         if set_scrollregion and not self.configure_scrollregion(last_row_line_pos=last_row_line_pos):
             return False
-        self.hidd_text.update(self.disp_text)
-        self.disp_text = {}
-        self.hidd_high.update(self.disp_high)
-        self.disp_high = {}
+        if keep_rows:
+            drawn_rows = {}
+            for r, items in self.drawn_rows.items():
+                if r in keep_rows:
+                    drawn_rows[r] = items
+                else:
+                    release_drawn_items(self, items)
+            self.drawn_rows = drawn_rows
+        else:
+            self.hidd_text.update(self.disp_text)
+            self.disp_text = {}
+            self.hidd_high.update(self.disp_high)
+            self.disp_high = {}
+            self.hidd_dropdown.update(self.disp_dropdown)
+            self.disp_dropdown = {}
+            self.hidd_checkbox.update(self.disp_checkbox)
+            self.disp_checkbox = {}
+            self.hidd_tree_arrow.update(self.disp_tree_arrow)
+            self.disp_tree_arrow = {}
+            self.hidd_corners.update(self.disp_corners)
+            self.disp_corners = set()
+            self.drawn_rows = {}
         self.hidd_grid.update(self.disp_grid)
         self.disp_grid = {}
-        self.hidd_dropdown.update(self.disp_dropdown)
-        self.disp_dropdown = {}
-        self.hidd_checkbox.update(self.disp_checkbox)
-        self.disp_checkbox = {}
-        self.hidd_tree_arrow.update(self.disp_tree_arrow)
-        self.disp_tree_arrow = {}
-        self.hidd_corners.update(self.disp_corners)
-        self.disp_corners = set()
         self.visible_row_dividers = {}
         self.row_width_resize_bbox = (
             self.current_width - 2,
@@ -1745,23 +1765,18 @@ class RowIndex(tk.Canvas):
                     )
                 )
             self.redraw_gridline(points=points, fill=self.ops.index_grid_fg, width=1)
-        sel_cells_bg = (
-            self.ops.index_selected_cells_bg
-            if self.ops.index_selected_cells_bg.startswith("#")
-            else color_map[self.ops.index_selected_cells_bg]
-        )
-        sel_rows_bg = (
-            self.ops.index_selected_rows_bg
-            if self.ops.index_selected_rows_bg.startswith("#")
-            else color_map[self.ops.index_selected_rows_bg]
-        )
+        sel_cells_bg = self.MT.color_cache.hex(self.ops.index_selected_cells_bg)
+        sel_rows_bg = self.MT.color_cache.hex(self.ops.index_selected_rows_bg)
         font = self.ops.index_font
-        selections = self.get_redraw_selections(text_start_row, grid_end_row)
+        selections = self.MT.get_redraw_selections()
         dd_coords = self.dropdown.get_coords()
         treeview = self.ops.treeview
         wrap = self.ops.index_wrap
         note_corners = self.ops.note_corners
         for r in range(text_start_row, text_end_row):
+            if r in keep_rows:
+                continue
+            self.drawn_rows[r] = items = []
             rtopgridln = self.MT.row_positions[r]
             rbotgridln = self.MT.row_positions[r + 1]
             if rbotgridln - rtopgridln < self.MT.index_txt_height:
@@ -1770,7 +1785,7 @@ class RowIndex(tk.Canvas):
             datarn = r if self.MT.all_rows_displayed else self.MT.displayed_rows[r]
             dropdown_kwargs = self.get_cell_kwargs(datarn, key="dropdown")
             tag = f"{r}"
-            fill, tree_arrow_fg, dd_drawn = self.redraw_highlight_get_text_fg(
+            fill, tree_arrow_fg, high_iid = self.redraw_highlight_get_text_fg(
                 fr=rtopgridln,
                 sr=rbotgridln,
                 r=r,
@@ -1781,6 +1796,8 @@ class RowIndex(tk.Canvas):
                 has_dd=bool(dropdown_kwargs),
                 tags=("h", "c", tag),
             )
+            if high_iid is not None:
+                items.append(("high", high_iid))
             if datarn in self.cell_options and "align" in self.cell_options[datarn]:
                 align = self.cell_options[datarn]["align"]
             else:
@@ -1793,17 +1810,19 @@ class RowIndex(tk.Canvas):
                     draw_x = self.current_width - 5 - self.MT.index_txt_height
                 elif align[-1] == "n":
                     draw_x = (self.current_width - self.MT.index_txt_height) / 2
-                self.redraw_dropdown(
+                dd_iid = self.redraw_dropdown(
                     0,
                     rtopgridln,
                     self.current_width - 1,
                     rbotgridln - 1,
                     fill=fill if dropdown_kwargs["state"] != "disabled" else self.ops.index_grid_fg,
                     outline=fill,
-                    draw_outline=not dd_drawn,
+                    draw_outline=high_iid is None,
                     draw_arrow=True,
                     open_=dd_coords == r,
                 )
+                if dd_iid is not None:
+                    items.append(("dropdown", dd_iid))
             else:
                 max_width = self.current_width - 2
                 if align[-1] == "w":
@@ -1831,14 +1850,17 @@ class RowIndex(tk.Canvas):
                         )
                     except Exception:
                         draw_check = False
-                    self.redraw_checkbox(
-                        2,
-                        rtopgridln + 2,
-                        self.MT.index_txt_height + 3,
-                        rtopgridln + self.MT.index_txt_height + 3,
-                        fill=fill if checkbox_kwargs["state"] == "normal" else self.ops.index_grid_fg,
-                        outline="",
-                        draw_check=draw_check,
+                    items.extend(
+                        ("checkbox", iid)
+                        for iid in self.redraw_checkbox(
+                            2,
+                            rtopgridln + 2,
+                            self.MT.index_txt_height + 3,
+                            rtopgridln + self.MT.index_txt_height + 3,
+                            fill=fill if checkbox_kwargs["state"] == "normal" else self.ops.index_grid_fg,
+                            outline="",
+                            draw_check=draw_check,
+                        )
                     )
             if treeview and isinstance(self.MT._row_index, list) and len(self.MT._row_index) > datarn:
                 iid = self.MT._row_index[datarn].iid
@@ -1847,19 +1869,24 @@ class RowIndex(tk.Canvas):
                     draw_x += self.MT.index_txt_height + 3
                 level, indent = self.get_iid_level_indent(iid)
                 draw_x += indent + 5
-                self.redraw_tree_arrow(
-                    2,
-                    rtopgridln,
-                    rbotgridln - 1,
-                    fill=tree_arrow_fg,
-                    indent=indent,
-                    has_children=bool(self.MT._row_index[datarn].children),
-                    open_=self.MT._row_index[datarn].iid in self.tree_open_ids,
-                    level=level,
+                items.append(
+                    (
+                        "tree_arrow",
+                        self.redraw_tree_arrow(
+                            2,
+                            rtopgridln,
+                            rbotgridln - 1,
+                            fill=tree_arrow_fg,
+                            indent=indent,
+                            has_children=bool(self.MT._row_index[datarn].children),
+                            open_=self.MT._row_index[datarn].iid in self.tree_open_ids,
+                            level=level,
+                        ),
+                    )
                 )
             tags = ("lift", "c", tag)
             if note_corners and max_width > 5 and datarn in self.cell_options and "note" in self.cell_options[datarn]:
-                self.redraw_corner(self.current_width, rtopgridln, tags)
+                items.append(("corners", self.redraw_corner(self.current_width, rtopgridln, tags)))
             if max_width <= 1:
                 continue
             text = self.cell_str(datarn, fix=False)
@@ -1867,12 +1894,12 @@ class RowIndex(tk.Canvas):
                 continue
             start_line = max(0, int((scrollpos_top - rtopgridln) / self.MT.index_txt_height))
             draw_y = rtopgridln + 3 + (start_line * self.MT.index_txt_height)
-            gen_lines = wrap_text(
+            gen_lines = self.MT.wrap_lines(
                 text=text,
                 max_width=max_width,
                 max_lines=int((rbotgridln - rtopgridln - 2) / self.MT.index_txt_height),
                 char_width_fn=self.char_width_fn,
-                widths=self.MT.char_widths[font],
+                font=font,
                 wrap=wrap,
                 start_line=start_line,
             )
@@ -1910,6 +1937,7 @@ class RowIndex(tk.Canvas):
                         tags=tags,
                     )
                 self.disp_text[iid] = True
+                items.append(("text", iid))
             else:
                 for line in gen_lines:
                     if self.hidd_text:
@@ -1945,6 +1973,7 @@ class RowIndex(tk.Canvas):
                             tags=tags,
                         )
                     self.disp_text[iid] = True
+                    items.append(("text", iid))
                     draw_y += self.MT.header_txt_height
 
         for dct in (
@@ -2069,15 +2098,6 @@ class RowIndex(tk.Canvas):
         self.hide_tooltip()
         self.focus_set()
 
-    def get_redraw_selections(self, startr: int, endr: int) -> dict[str, set[int]]:
-        d = defaultdict(set)
-        for _, box in self.MT.get_selection_items():
-            r1, _, r2, _ = box.coords
-            for r in range(startr, endr):
-                if r1 <= r and r2 > r:
-                    d[box.type_ if box.type_ != "columns" else "cells"].add(r)
-        return d
-
     def open_cell(self, event: Any = None, ignore_existing_editor: bool = False) -> None:
         if not self.MT.anything_selected() or (not ignore_existing_editor and self.text_editor.open):
             return
@@ -2733,6 +2753,7 @@ class RowIndex(tk.Canvas):
         if self.MT:
             self.MT.displayed_rows = []
             self.MT._row_index = []
+            self.MT.close_data()
             self.MT.data = []
             self.MT.row_positions = [0]
             self.MT.saved_row_heights = {}
@@ -3204,7 +3225,7 @@ class RowIndex(tk.Canvas):
             tree=False,
         )
         self.MT.all_rows_displayed = False
-        self.MT.displayed_rows = list(range(len(self.MT._row_index)))
+        self.MT.displayed_rows = range(len(self.MT._row_index))
         if open_ids:
             self.PAR.tree_set_open(open_ids=open_ids)
         else:
@@ -3348,7 +3369,7 @@ class RowIndex(tk.Canvas):
             tree=False,
         )
         self.MT.all_rows_displayed = False
-        self.MT.displayed_rows = list(range(len(self.MT._row_index)))
+        self.MT.displayed_rows = range(len(self.MT._row_index))
         if open_ids:
             self.PAR.tree_set_open(open_ids=open_ids)
         else:
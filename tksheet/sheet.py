@@ -7,7 +7,8 @@ from collections import deque
 from collections.abc import Callable, Generator, Hashable, Iterator, Sequence
 from contextlib import suppress
 from functools import partial
-from itertools import accumulate, chain, filterfalse, islice, product, repeat
+from itertools import accumulate, chain, filterfalse, islice, repeat
+from math import ceil
 from operator import attrgetter
 from re import IGNORECASE, escape, sub
 from timeit import default_timer
@@ -27,6 +28,7 @@ from .constants import (
     named_span_types,
     scrollbar_options_keys,
 )
+from .data_sources import CSVFileData, DataSource, VirtualData
 from .find_window import replacer
 from .functions import (
     add_highlight,
@@ -55,6 +57,7 @@ from .functions import (
     new_tk_event,
     num2alpha,
     pop_positions,
+    pop_uniform_positions,
     set_align,
     set_readonly,
     span_froms,
@@ -65,12 +68,14 @@ from .functions import (
     unpack,
 )
 from .main_table import MainTable
+from .option_store import CellRuns, IndexRuns, OptionStore, as_index_runs
 from .other_classes import (
     Box_nt,
     DotDict,
     EventDataDict,
     FontTuple,
     GeneratedMouseEvent,
+    Highlight,
     Node,
     ProgressBar,
     Selected,
@@ -112,7 +117,7 @@ class Sheet(tk.Frame):
         default_header: Literal["letters", "numbers", "both"] | None = "letters",
         default_row_index: Literal["letters", "numbers", "both"] | None = "numbers",
         data_reference: None | Sequence[Sequence[Any]] = None,
-        data: None | Sequence[Sequence[Any]] = None,
+        data: None | Sequence[Sequence[Any]] | DataSource = None,
         # either (start row, end row, "rows"), (start column, end column, "rows") or
         # (cells start row, cells start column, cells end row, cells end column, "cells")  # noqa: E501
         startup_select: tuple[int, int, str] | tuple[int, int, int, int, str] = None,
@@ -129,6 +134,9 @@ class Sheet(tk.Frame):
         max_header_height: float = float("inf"),
         max_index_width: float = float("inf"),
         after_redraw_time_ms: int = 16,
+        incremental_redraw: bool = False,
+        batched_redraw: bool = False,
+        max_redraw_fps: int = 0,
         set_all_heights_and_widths: bool = False,
         zoom: int = 100,
         align: str = "nw",
@@ -201,6 +209,10 @@ class Sheet(tk.Frame):
         table_wrap: Literal["", "w", "c"] = "c",
         index_wrap: Literal["", "w", "c"] = "c",
         header_wrap: Literal["", "w", "c"] = "c",
+        text_layout_cache_size: int = 10000,
+        display_string_cache_size: int = 10000,
+        char_widths_file: str = "",
+        compact_storage: bool = False,
         sort_key: Callable = natural_sort_key,
         tooltips: bool = False,
         user_can_create_notes: bool = False,
@@ -352,6 +364,9 @@ class Sheet(tk.Frame):
         self._dropdown_cls = Dropdown
         self.after_redraw_id = None
         self.after_redraw_time_ms = after_redraw_time_ms
+        self.pending_redraw = {"table": False, "index": False, "header": False, "scrolled": False}
+        self.last_redraw_time = 0.0
+        self.redraw_counts = {"scheduled": 0, "coalesced": 0, "dropped": 0}
         self.named_span_id = 0
         if width is not None or height is not None:
             self.grid_propagate(0)
@@ -1020,6 +1035,7 @@ class Sheet(tk.Frame):
                 range(rng_from_c, rng_upto_c),
                 type_,
             )
+            self.MT.range_options.delete(type_, rng_from_r, rng_from_c, rng_upto_r, rng_upto_c)
         del self.MT.named_spans[name]
         return self
 
@@ -1037,6 +1053,9 @@ class Sheet(tk.Frame):
     def get_named_spans(self) -> dict[str, Span]:
         return self.MT.named_spans
 
+    def get_named_spans_at(self, r: int, c: int) -> dict[str, Span]:
+        return {name: self.MT.named_spans[name] for name in self.MT.named_spans.covering(r, c)}
+
     # Getting Sheet Data
 
     def __getitem__(
@@ -1233,6 +1252,7 @@ class Sheet(tk.Frame):
     ) -> Sheet:
         if table:
             self.MT.hide_text_editor_and_dropdown(redraw=False)
+            self.MT.close_data()
             self.MT.data = []
         if header:
             self.CH.hide_text_editor_and_dropdown(redraw=False)
@@ -1271,7 +1291,7 @@ class Sheet(tk.Frame):
 
     def set_sheet_data(
         self,
-        data: list | tuple | None = None,
+        data: list | tuple | DataSource | None = None,
         reset_col_positions: bool = True,
         reset_row_positions: bool = True,
         redraw: bool = True,
@@ -1282,7 +1302,11 @@ class Sheet(tk.Frame):
     ) -> Any:
         if data is None:
             data = []
-        if verify and (not isinstance(data, list) or not all(isinstance(row, list) for row in data)):
+        if (
+            verify
+            and not isinstance(data, (DataSource, VirtualData))
+            and (not isinstance(data, list) or not all(isinstance(row, list) for row in data))
+        ):
             raise ValueError("Data argument must be a list of lists, sublists being rows")
         if delete_options:
             self.reset_all_options()
@@ -1297,6 +1321,55 @@ class Sheet(tk.Frame):
             keep_formatting=keep_formatting,
         )
 
+    def set_csv_file_data(
+        self,
+        path: str,
+        background: bool = True,
+        progress_bar: tuple[int, int] | None = None,
+        redraw: bool = True,
+        **kwargs,
+    ) -> CSVFileData:
+        """
+        Sets the table data to a memory mapped csv file, kwargs are passed to CSVFileData
+        background: index the file's rows in a thread, rows are added to the table as they are found
+        progress_bar: a (row, column) to show the indexing progress in while indexing in the background
+        """
+        source = CSVFileData(path, background=background, **kwargs)
+        self.set_sheet_data(source, redraw=False)
+        if source.header:
+            self.headers(source.header, redraw=False)
+        if not source.done:
+            if progress_bar is not None:
+                self.create_progress_bar(
+                    *progress_bar,
+                    bg=self.ops.table_selected_box_cells_fg,
+                    fg=self.ops.table_bg,
+                    name=source,
+                    percent=source.progress(),
+                    del_when_done=True,
+                )
+            self.after(100, self.csv_file_data_progress, source)
+        self.set_refresh_timer(redraw)
+        return source
+
+    def csv_file_data_progress(self, source: CSVFileData) -> None:
+        if not isinstance(self.MT.data, VirtualData) or self.MT.data.source is not source:
+            return
+        done = source.done
+        if self.MT.all_rows_displayed and (new := source.row_count() - len(self.MT.row_positions) + 1) > 0:
+            self.MT.insert_row_positions(heights=new)
+        if source.guess_columns():
+            # rows which were fetched before have too few columns
+            self.MT.data.invalidate()
+            if self.MT.all_columns_displayed and (new := source.column_count() - len(self.MT.col_positions) + 1) > 0:
+                self.MT.insert_col_positions(widths=new)
+        if any(bar.name is source for bar in self.MT.progress_bars.values()):
+            self.progress_bar(name=source, percent=source.progress())
+        else:
+            self.set_refresh_timer()
+        if not done:
+            self.after(100, self.csv_file_data_progress, source)
+
     @data.setter
     def data(self, value: list[list[Any]]) -> None:
         self.data_reference(value)
@@ -1581,7 +1654,10 @@ class Sheet(tk.Frame):
             self.MT.sheet_modified(
                 event_data, emit_event=emit_event is True or (emit_event is None and span.emit_event)
             )
-        self.set_refresh_timer(redraw)
+        self.set_refresh_timer(
+            redraw,
+            dirty=not event_data["added"]["columns"] and not event_data["added"]["rows"],
+        )
         return event_data
 
     def clear(
@@ -1622,7 +1698,7 @@ class Sheet(tk.Frame):
             self.MT.sheet_modified(
                 event_data, emit_event=emit_event is True or (emit_event is None and span.emit_event)
             )
-        self.set_refresh_timer(redraw)
+        self.set_refresh_timer(redraw, dirty=True)
         return event_data
 
     def event_data_set_table_cell(
@@ -1776,7 +1852,7 @@ class Sheet(tk.Frame):
         push_ops: bool = True,
         redraw: bool = True,
     ) -> EventDataDict:
-        old_total = self.MT.equalize_data_row_lengths()
+        old_total = self.MT.logical_data_cols()
         total_rows = self.MT.total_data_rows()
         if (idx := idx_param_to_int(idx)) is None:
             idx = old_total
@@ -1890,7 +1966,7 @@ class Sheet(tk.Frame):
         elif number < total_rows:
             if not self.MT.all_rows_displayed:
                 self.MT.display_rows(enable=False, reset_row_positions=False, deselect_all=True)
-            self.MT.row_positions[number + 1 :] = []
+            self.MT.row_positions.delete_sizes(number, len(self.MT.row_positions))
         if mod_data:
             self.MT.data_dimensions(total_rows=number)
         return self
@@ -1911,7 +1987,7 @@ class Sheet(tk.Frame):
         elif number < total_cols:
             if not self.MT.all_columns_displayed:
                 self.MT.display_columns(enable=False, reset_col_positions=False, deselect_all=True)
-            self.MT.col_positions[number + 1 :] = []
+            self.MT.col_positions.delete_sizes(number, len(self.MT.col_positions))
         if mod_data:
             self.MT.data_dimensions(total_columns=number)
         return self
@@ -2220,17 +2296,15 @@ class Sheet(tk.Frame):
                 start_c=0,
                 reverse=False,
             )
+        if within:
+            rows_idx, cols_idx = self.MT.displayed_rows_index(), self.MT.displayed_columns_index()
         for r, c in iterable:
             for find, replace in mapping.items():
                 m = self.MT.find_match(find, r, c)
                 if (
                     m
                     and not within
-                    or (
-                        within
-                        and (self.MT.all_rows_displayed or bisect_in(self.MT.displayed_rows, r))
-                        and (self.MT.all_columns_displayed or bisect_in(self.MT.displayed_columns, c))
-                    )
+                    or (within and (rows_idx is None or rows_idx[r] != -1) and (cols_idx is None or cols_idx[c] != -1))
                 ):
                     current = f"{self.MT.get_cell_data(r, c, True)}"
                     new = sub(escape(find), replacer(find, replace, current), current, flags=IGNORECASE)
@@ -2285,6 +2359,8 @@ class Sheet(tk.Frame):
                     mod_note(self.CH.cell_options, c, note, readonly)
                 if table:
                     mod_note(self.MT.col_options, c, note, readonly)
+        if table:
+            self.MT.dirty.add_span(span.kind, rows, cols)
         return span
 
     # Highlighting Cells
@@ -2307,12 +2383,28 @@ class Sheet(tk.Frame):
             if header:
                 for c in cols:
                     add_highlight(self.CH.cell_options, c, bg, fg, end, overwrite)
-            for r in rows:
-                if index:
+            if index:
+                for r in rows:
                     add_highlight(self.RI.cell_options, r, bg, fg, end, overwrite)
-                if table:
-                    for c in cols:
-                        add_highlight(self.MT.cell_options, (r, c), bg, fg, end, overwrite)
+            if table:
+                # a span of cells is stored as one range unless it has to be
+                # merged with the existing highlights of its cells
+                if len(rows) * len(cols) > 1 and (overwrite or not self.MT.area_has_option(rows, cols, "highlight")):
+                    self.MT.set_area_option(
+                        rows,
+                        cols,
+                        "highlight",
+                        Highlight(
+                            bg=None if bg is False else bg,
+                            fg=None if fg is False else fg,
+                            end=False if end is None else end,
+                        ),
+                    )
+                else:
+                    self.MT.unrange_options(rows, cols, "highlight")
+                    for r in rows:
+                        for c in cols:
+                            add_highlight(self.MT.cell_options, (r, c), bg, fg, end, overwrite)
         elif span.kind == "row":
             for r in rows:
                 if index:
@@ -2325,7 +2417,9 @@ class Sheet(tk.Frame):
                     add_highlight(self.CH.cell_options, c, bg, fg, end, overwrite)
                 if table:
                     add_highlight(self.MT.col_options, c, bg, fg, end, overwrite)
-        self.set_refresh_timer(redraw)
+        if table:
+            self.MT.dirty.add_span(span.kind, rows, cols)
+        self.set_refresh_timer(redraw, dirty=True)
         return span
 
     def dehighlight(
@@ -2334,8 +2428,8 @@ class Sheet(tk.Frame):
         redraw: bool = True,
     ) -> Span:
         span = self.span_from_key(*key)
-        self.del_options_using_span(span, "highlight")
-        self.set_refresh_timer(redraw)
+        self.del_options_using_span(span, "highlight", redraw=False)
+        self.set_refresh_timer(redraw, dirty=True)
         return span
 
     def dehighlight_all(
@@ -2349,6 +2443,7 @@ class Sheet(tk.Frame):
     ) -> Sheet:
         if cells:
             del_from_options(self.MT.cell_options, "highlight")
+            self.MT.range_options.clear("highlight")
         if rows:
             del_from_options(self.MT.row_options, "highlight")
         if columns:
@@ -2413,7 +2508,14 @@ class Sheet(tk.Frame):
                 if edit_data:
                     set_hdata(c, value=set_values.get(c, v))
         if table:
-            if span.kind == "cell":
+            if span.kind == "cell" and len(rows) * len(cols) > 1:
+                self.MT.hide_dropdown_window()
+                self.MT.set_area_option(rows, cols, "dropdown", d, replaces=("checkbox",))
+                if edit_data:
+                    for r in rows:
+                        for c in cols:
+                            set_tdata(r, c, value=set_values.get((r, c), v))
+            elif span.kind == "cell":
                 for r in rows:
                     for c in cols:
                         self.del_cell_options_dropdown_and_checkbox(r, c)
@@ -2515,6 +2617,8 @@ class Sheet(tk.Frame):
                     set_hdata(c, checked if isinstance(checked, bool) else force_bool(self.CH.get_cell_data(c)))
         if table:
             if span.kind == "cell":
+                for key in ("format", "dropdown"):
+                    self.MT.range_options.delete(key, rows.start, cols.start, rows.stop, cols.stop)
                 for r in rows:
                     for c in cols:
                         self.MT.delete_cell_format(r, c, clear_values=False)
@@ -2624,7 +2728,18 @@ class Sheet(tk.Frame):
         span = self.span_from_key(*key)
         rows, cols = self.ranges_from_span(span)
         kwargs = fix_format_kwargs({"formatter": formatter_class, **formatter_options, **kwargs})
-        if span.kind == "cell" and span.table:
+        if span.kind == "cell" and span.table and len(rows) * len(cols) > 1:
+            self.MT.set_area_option(rows, cols, "format", kwargs, replaces=("checkbox",))
+            if set_data:
+                for r in rows:
+                    for c in cols:
+                        self.MT.set_cell_data(
+                            r,
+                            c,
+                            value=kwargs["value"] if "value" in kwargs else self.MT.get_cell_data(r, c),
+                            kwargs=kwargs,
+                        )
+        elif span.kind == "cell" and span.table:
             for r in rows:
                 for c in cols:
                     self.del_cell_options_checkbox(r, c)
@@ -2662,7 +2777,8 @@ class Sheet(tk.Frame):
                             value=kwargs["value"] if "value" in kwargs else self.MT.get_cell_data(r, c),
                             kwargs=kwargs,
                         )
-        self.set_refresh_timer(redraw)
+        self.MT.dirty.add_span(span.kind, rows, cols)
+        self.set_refresh_timer(redraw, dirty=True)
         return span
 
     def del_format(
@@ -2684,7 +2800,8 @@ class Sheet(tk.Frame):
             elif span.kind == "column":
                 for c in cols:
                     self.MT.delete_column_format(c, clear_values=clear_values)
-            self.set_refresh_timer(redraw)
+            self.MT.dirty.add_span(span.kind, rows, cols)
+            self.set_refresh_timer(redraw, dirty=True)
         return span
 
     def reapply_formatting(self) -> Sheet:
@@ -2714,12 +2831,18 @@ class Sheet(tk.Frame):
             if header:
                 for c in cols:
                     set_readonly(self.CH.cell_options, c, readonly)
-            for r in rows:
-                if index:
+            if index:
+                for r in rows:
                     set_readonly(self.RI.cell_options, r, readonly)
-                if table:
-                    for c in cols:
-                        set_readonly(self.MT.cell_options, (r, c), readonly)
+            if table:
+                if not readonly:
+                    self.MT.del_area_option(rows, cols, "readonly")
+                elif len(rows) * len(cols) > 1:
+                    self.MT.set_area_option(rows, cols, "readonly", True)
+                else:
+                    for r in rows:
+                        for c in cols:
+                            set_readonly(self.MT.cell_options, (r, c), readonly)
         elif span.kind == "row":
             for r in rows:
                 if index:
@@ -2752,6 +2875,12 @@ class Sheet(tk.Frame):
             self.ops.popup_menu_font = FontTuple(*(newfont[0], int(round(newfont[1])), newfont[2]))
         return self.ops.popup_menu_font
 
+    def text_layout_cache_info(self) -> dict[str, int]:
+        return self.MT.text_layouts.info()
+
+    def display_string_cache_info(self) -> dict[str, int]:
+        return self.MT.display_strings.info()
+
     def table_align(
         self,
         align: str | None = None,
@@ -2807,12 +2936,18 @@ class Sheet(tk.Frame):
             if header:
                 for c in cols:
                     set_align(self.CH.cell_options, c, align)
-            for r in rows:
-                if index:
+            if index:
+                for r in rows:
                     set_align(self.RI.cell_options, r, align)
-                if table:
-                    for c in cols:
-                        set_align(self.MT.cell_options, (r, c), align)
+            if table:
+                if not align:
+                    self.MT.del_area_option(rows, cols, "align")
+                elif len(rows) * len(cols) > 1:
+                    self.MT.set_area_option(rows, cols, "align", align)
+                else:
+                    for r in rows:
+                        for c in cols:
+                            set_align(self.MT.cell_options, (r, c), align)
         elif span.kind == "row":
             for r in rows:
                 if index:
@@ -3214,7 +3349,7 @@ class Sheet(tk.Frame):
     ) -> tuple[list[float], list[float]]:
         self.MT.set_all_cell_sizes_to_text(width=width, slim=slim)
         self.set_refresh_timer(redraw)
-        return self.MT.row_positions, self.MT.col_positions
+        return list(self.MT.row_positions), list(self.MT.col_positions)
 
     def set_all_column_widths(
         self,
@@ -3330,12 +3465,12 @@ class Sheet(tk.Frame):
 
     def get_column_widths(self, canvas_positions: bool = False) -> list[float]:
         if canvas_positions:
-            return self.MT.col_positions
+            return list(self.MT.col_positions)
         return self.MT.get_column_widths()
 
     def get_row_heights(self, canvas_positions: bool = False) -> list[float]:
         if canvas_positions:
-            return self.MT.row_positions
+            return list(self.MT.row_positions)
         return self.MT.get_row_heights()
 
     def get_safe_row_heights(self) -> list[int]:
@@ -3501,11 +3636,9 @@ class Sheet(tk.Frame):
         if total_rows is None and total_columns is None:
             return len(self.MT.row_positions) - 1, len(self.MT.col_positions) - 1
         if isinstance(total_rows, int):
-            height = self.MT.get_default_row_height()
-            self.MT.row_positions = list(accumulate(chain([0], repeat(height, total_rows))))
+            self.MT.reset_row_positions(nrows=total_rows)
         if isinstance(total_columns, int):
-            width = self.ops.default_column_width
-            self.MT.col_positions = list(accumulate(chain([0], repeat(width, total_columns))))
+            self.MT.reset_col_positions(ncols=total_columns)
         return self
 
     def move_row_position(self, row: int, moveto: int) -> Sheet:
@@ -3761,11 +3894,11 @@ class Sheet(tk.Frame):
             if not columns:
                 return
         if self.MT.all_columns_displayed:
-            self.MT.displayed_columns = list(filterfalse(columns.__contains__, range(self.MT.total_data_cols())))
+            self.MT.displayed_columns = filterfalse(columns.__contains__, range(self.MT.total_data_cols()))
             to_pop = {c: c for c in columns}
         else:
             to_pop = {}
-            new_disp = []
+            new_disp = self.MT.displayed_storage(())
             if data_indexes:
                 for i, c in enumerate(self.MT.displayed_columns):
                     if c not in columns:
@@ -3780,13 +3913,21 @@ class Sheet(tk.Frame):
                         to_pop[i] = c
             self.MT.displayed_columns = new_disp
         self.MT.all_columns_displayed = False
-        self.MT.set_col_positions(
-            pop_positions(
-                itr=self.MT.gen_column_widths,
+        if self.MT.col_positions.is_uniform:
+            pop_uniform_positions(
+                positions=self.MT.col_positions,
                 to_pop=to_pop,
                 save_to=self.MT.saved_column_widths,
-            ),
-        )
+                default=self.ops.default_column_width,
+            )
+        else:
+            self.MT.set_col_positions(
+                pop_positions(
+                    itr=self.MT.gen_column_widths,
+                    to_pop=to_pop,
+                    save_to=self.MT.saved_column_widths,
+                ),
+            )
         if deselect_all:
             self.MT.deselect(redraw=False)
         return self.set_refresh_timer(redraw)
@@ -3805,14 +3946,20 @@ class Sheet(tk.Frame):
             return
         if isinstance(columns, int):
             columns = [columns]
-        cws = self.MT.get_column_widths()
+        positions = self.MT.col_positions
+        uniform = positions.is_uniform
+        cws = [] if uniform else self.MT.get_column_widths()
         default_col_w = self.ops.default_column_width
         for column in columns:
             idx = bisect_left(self.MT.displayed_columns, column)
             if len(self.MT.displayed_columns) == idx or self.MT.displayed_columns[idx] != column:
                 self.MT.displayed_columns.insert(idx, column)
-                cws.insert(idx, self.MT.saved_column_widths.pop(column, default_col_w))
-        self.MT.set_col_positions(cws)
+                if uniform:
+                    positions.insert_sizes(idx, [self.MT.saved_column_widths.pop(column, default_col_w)])
+                else:
+                    cws.insert(idx, self.MT.saved_column_widths.pop(column, default_col_w))
+        if not uniform:
+            self.MT.set_col_positions(cws)
         if deselect_all:
             self.MT.deselect(redraw=False)
         return self.set_refresh_timer(redraw)
@@ -3895,11 +4042,11 @@ class Sheet(tk.Frame):
             if not rows:
                 return
         if self.MT.all_rows_displayed:
-            self.MT.displayed_rows = list(filterfalse(rows.__contains__, range(self.MT.total_data_rows())))
+            self.MT.displayed_rows = filterfalse(rows.__contains__, range(self.MT.total_data_rows()))
             to_pop = {r: r for r in rows}
         else:
             to_pop = {}
-            new_disp = []
+            new_disp = self.MT.displayed_storage(())
             if data_indexes:
                 for i, r in enumerate(self.MT.displayed_rows):
                     if r not in rows:
@@ -3914,7 +4061,14 @@ class Sheet(tk.Frame):
                         to_pop[i] = r
             self.MT.displayed_rows = new_disp
         self.MT.all_rows_displayed = False
-        if row_heights:
+        if row_heights and self.MT.row_positions.is_uniform:
+            pop_uniform_positions(
+                positions=self.MT.row_positions,
+                to_pop=to_pop,
+                save_to=self.MT.saved_row_heights,
+                default=self.MT.get_default_row_height(),
+            )
+        elif row_heights:
             self.MT.set_row_positions(
                 pop_positions(
                     itr=self.MT.gen_row_heights,
@@ -3941,13 +4095,19 @@ class Sheet(tk.Frame):
         if isinstance(rows, int):
             rows = [rows]
         default_row_h = self.MT.get_default_row_height()
-        rhs = self.MT.get_row_heights()
+        positions = self.MT.row_positions
+        uniform = positions.is_uniform
+        rhs = [] if uniform else self.MT.get_row_heights()
         for row in rows:
             idx = bisect_left(self.MT.displayed_rows, row)
             if len(self.MT.displayed_rows) == idx or self.MT.displayed_rows[idx] != row:
                 self.MT.displayed_rows.insert(idx, row)
-                rhs.insert(idx, self.MT.saved_row_heights.pop(row, default_row_h))
-        self.MT.set_row_positions(rhs)
+                if uniform:
+                    positions.insert_sizes(idx, [self.MT.saved_row_heights.pop(row, default_row_h)])
+                else:
+                    rhs.insert(idx, self.MT.saved_row_heights.pop(row, default_row_h))
+        if not uniform:
+            self.MT.set_row_positions(rhs)
         if deselect_all:
             self.MT.deselect(redraw=False)
         return self.set_refresh_timer(redraw)
@@ -4200,6 +4360,18 @@ class Sheet(tk.Frame):
             self.MT.set_header_font(kwargs["header_font"])
         if "index_font" in kwargs:
             self.MT.set_index_font(kwargs["index_font"])
+        if "text_layout_cache_size" in kwargs:
+            self.MT.text_layouts.resize(kwargs["text_layout_cache_size"])
+        if "display_string_cache_size" in kwargs:
+            self.MT.display_strings.resize(kwargs["display_string_cache_size"])
+        if "char_widths_file" in kwargs:
+            self.MT.char_widths_file_data = None
+        if "compact_storage" in kwargs:
+            self.MT.displayed_rows = self.MT.displayed_rows
+            self.MT.displayed_columns = self.MT.displayed_columns
+            self.MT.row_positions.set_typecode(self.MT.positions_typecode)
+            self.MT.col_positions.set_typecode(self.MT.positions_typecode)
+        self.MT.color_cache.clear()
         if "theme" in kwargs:
             self.change_theme(kwargs["theme"])
         if "header_bg" in kwargs:
@@ -4337,33 +4509,41 @@ class Sheet(tk.Frame):
         self,
         key: None | CellPropertyKey = None,
         canvas: Literal["table", "row_index", "index", "header"] = "table",
-    ) -> dict:
+    ) -> dict | OptionStore:
         if canvas == "table":
             target = self.MT.cell_options
         elif canvas in ("row_index", "index"):
             target = self.RI.cell_options
         elif canvas == "header":
             target = self.CH.cell_options
+        if canvas == "table" and self.MT.range_options:
+            # the options of spans which are stored as ranges are merged into a new dict
+            if key is None:
+                options = self.MT.range_options.by_cell()
+                for k, v in target.items():
+                    options[k] = {**options[k], **v} if k in options else v
+                return options
+            return {**dict(self.MT.range_options.cells(key)), **{k: v[key] for k, v in target.items() if key in v}}
         if key is None:
             return target
         return {k: v[key] for k, v in target.items() if key in v}
 
-    def get_row_options(self, key: None | CellPropertyKey = None) -> dict:
+    def get_row_options(self, key: None | CellPropertyKey = None) -> dict | OptionStore:
         if key is None:
             return self.MT.row_options
         return {k: v[key] for k, v in self.MT.row_options.items() if key in v}
 
-    def get_column_options(self, key: None | CellPropertyKey = None) -> dict:
+    def get_column_options(self, key: None | CellPropertyKey = None) -> dict | OptionStore:
         if key is None:
             return self.MT.col_options
         return {k: v[key] for k, v in self.MT.col_options.items() if key in v}
 
-    def get_index_options(self, key: None | CellPropertyKey = None) -> dict:
+    def get_index_options(self, key: None | CellPropertyKey = None) -> dict | OptionStore:
         if key is None:
             return self.RI.cell_options
         return {k: v[key] for k, v in self.RI.cell_options.items() if key in v}
 
-    def get_header_options(self, key: None | CellPropertyKey = None) -> dict:
+    def get_header_options(self, key: None | CellPropertyKey = None) -> dict | OptionStore:
         if key is None:
             return self.CH.cell_options
         return {k: v[key] for k, v in self.CH.cell_options.items() if key in v}
@@ -4381,6 +4561,9 @@ class Sheet(tk.Frame):
             ):
                 self.del_named_span(name)
         self.MT.cell_options = {k: v for k, v in self.MT.cell_options.items() if k[0] < maxr and k[1] < maxc}
+        ranged = self.MT.range_options
+        ranged.delete(None, maxr, 0, ranged.max_row(maxr) + 1, ranged.max_column(maxc) + 1)
+        ranged.delete(None, 0, maxc, ranged.max_row(maxr) + 1, ranged.max_column(maxc) + 1)
         self.RI.cell_options = {k: v for k, v in self.RI.cell_options.items() if k < maxr}
         self.CH.cell_options = {k: v for k, v in self.CH.cell_options.items() if k < maxc}
         self.MT.col_options = {k: v for k, v in self.MT.col_options.items() if k < maxc}
@@ -4392,6 +4575,7 @@ class Sheet(tk.Frame):
     def reset_all_options(self) -> Sheet:
         self.MT.named_spans = {}
         self.MT.cell_options = {}
+        self.MT.range_options.clear()
         self.RI.cell_options = {}
         self.CH.cell_options = {}
         self.MT.col_options = {}
@@ -4499,20 +4683,18 @@ class Sheet(tk.Frame):
         if span.kind == "cell":
             for tag in tags:
                 if tag not in self.MT.tagged_cells:
-                    self.MT.tagged_cells[tag] = set()
-                for r in rows:
-                    for c in cols:
-                        self.MT.tagged_cells[tag].add((r, c))
+                    self.MT.tagged_cells[tag] = CellRuns()
+                self.MT.tagged_cells[tag].add_area(rows, cols)
         elif span.kind == "row":
             for tag in tags:
                 if tag not in self.MT.tagged_rows:
-                    self.MT.tagged_rows[tag] = set()
-                self.MT.tagged_rows[tag].update(set(rows))
+                    self.MT.tagged_rows[tag] = IndexRuns()
+                self.MT.tagged_rows[tag].update(rows)
         elif span.kind == "column":
             for tag in tags:
                 if tag not in self.MT.tagged_columns:
-                    self.MT.tagged_columns[tag] = set()
-                self.MT.tagged_columns[tag].update(set(cols))
+                    self.MT.tagged_columns[tag] = IndexRuns()
+                self.MT.tagged_columns[tag].update(cols)
         return self
 
     def tag_cell(
@@ -4529,7 +4711,7 @@ class Sheet(tk.Frame):
             raise ValueError("'cell' argument must be tuple[int, int].")
         for tag in unpack(tags):
             if tag not in self.MT.tagged_cells:
-                self.MT.tagged_cells[tag] = set()
+                self.MT.tagged_cells[tag] = CellRuns()
             self.MT.tagged_cells[tag].add(cell)
         return self
 
@@ -4542,7 +4724,7 @@ class Sheet(tk.Frame):
             rows = [rows]
         for tag in unpack(tags):
             if tag not in self.MT.tagged_rows:
-                self.MT.tagged_rows[tag] = set()
+                self.MT.tagged_rows[tag] = IndexRuns()
             self.MT.tagged_rows[tag].update(rows)
         return self
 
@@ -4555,7 +4737,7 @@ class Sheet(tk.Frame):
             columns = [columns]
         for tag in unpack(tags):
             if tag not in self.MT.tagged_columns:
-                self.MT.tagged_columns[tag] = set()
+                self.MT.tagged_columns[tag] = IndexRuns()
             self.MT.tagged_columns[tag].update(columns)
         return self
 
@@ -4571,15 +4753,17 @@ class Sheet(tk.Frame):
         if isinstance(rows, int):
             rows = (rows,)
         if is_iterable(rows):
+            rows = as_index_runs(rows)
             for tagged in self.MT.tagged_rows.values():
-                for row in rows:
-                    tagged.discard(row)
+                for start, stop in rows.runs():
+                    tagged.remove_run(start, stop)
         if isinstance(columns, int):
             columns = (columns,)
         if is_iterable(columns):
+            columns = as_index_runs(columns)
             for tagged in self.MT.tagged_columns.values():
-                for column in columns:
-                    tagged.discard(column)
+                for start, stop in columns.runs():
+                    tagged.remove_run(start, stop)
         return self
 
     def tag_del(
@@ -4601,16 +4785,43 @@ class Sheet(tk.Frame):
     def tag_has(
         self,
         *tags,
+        all_tags: bool = False,
     ) -> DotDict:
-        res = DotDict(
-            cells=set(),
-            rows=set(),
-            columns=set(),
+        if all_tags:
+            res = self.tag_runs(*tags, all_tags=True)
+            return DotDict(
+                cells=set(res.cells),
+                rows=set(res.rows),
+                columns=set(res.columns),
+            )
+        tags = tuple(unpack(tags))
+        return DotDict(
+            cells=set().union(*(self.MT.tagged_cells[tag].frozen() for tag in tags if tag in self.MT.tagged_cells)),
+            rows=set().union(*(self.MT.tagged_rows[tag].frozen() for tag in tags if tag in self.MT.tagged_rows)),
+            columns=set().union(
+                *(self.MT.tagged_columns[tag].frozen() for tag in tags if tag in self.MT.tagged_columns)
+            ),
         )
-        for tag in unpack(tags):
-            res.cells.update(self.MT.tagged_cells.get(tag, set()))
-            res.rows.update(self.MT.tagged_rows.get(tag, set()))
-            res.columns.update(self.MT.tagged_columns.get(tag, set()))
+
+    def tag_runs(
+        self,
+        *tags,
+        all_tags: bool = False,
+    ) -> DotDict:
+        tags = tuple(unpack(tags))
+        res = DotDict()
+        for key, tagged, empty in (
+            ("cells", self.MT.tagged_cells, CellRuns),
+            ("rows", self.MT.tagged_rows, IndexRuns),
+            ("columns", self.MT.tagged_columns, IndexRuns),
+        ):
+            found = [tagged[tag] for tag in tags if tag in tagged]
+            if not all_tags:
+                res[key] = empty().union(*found)
+            elif found and len(found) == len(tags):
+                res[key] = found[0].intersection(*found[1:])
+            else:
+                res[key] = empty()
         return res
 
     # Treeview Mode
@@ -5213,6 +5424,10 @@ class Sheet(tk.Frame):
     def event_generate(self, *args, **kwargs) -> None:
         self.MT.event_generate(*args, **kwargs)
 
+    def destroy(self) -> None:
+        self.MT.close_data()
+        super().destroy()
+
     def emit_event(
         self,
         event: str,
@@ -5230,16 +5445,84 @@ class Sheet(tk.Frame):
         redraw: bool = True,
         index: bool = True,
         header: bool = True,
+        dirty: bool = False,
     ) -> Sheet:
-        if redraw and self.after_redraw_id is None:
-            self.after_redraw_id = self.after(
-                self.after_redraw_time_ms, lambda: self.after_redraw(index=index, header=header)
-            )
+        """
+        dirty: the caller has added the table cells it changed to MT.dirty
+               and the rest of the table does not need redrawing
+        """
+        if not dirty or not redraw:
+            self.MT.dirty.all = True
+        if redraw:
+            self.schedule_redraw(index=index, header=header, delay=self.after_redraw_time_ms)
         return self
 
-    def after_redraw(self, index: bool = True, header: bool = True) -> None:
-        self.MT.main_table_redraw_grid_and_text(redraw_header=header, redraw_row_index=index)
+    def schedule_redraw(
+        self,
+        table: bool = True,
+        index: bool = True,
+        header: bool = True,
+        scrolled: bool = False,
+        delay: int = 0,
+    ) -> None:
+        """
+        Requests made before the pending redraw happens are merged into it,
+        with max_redraw_fps set redraws are kept at least 1000 / max_redraw_fps ms apart
+        scrolled: the view has only been scrolled, see MT.main_table_redraw_grid_and_text()
+        """
+        pending = self.pending_redraw
+        if self.after_redraw_id is not None:
+            pending["table"] |= table
+            pending["index"] |= index
+            pending["header"] |= header
+            pending["scrolled"] &= scrolled
+            self.redraw_counts["coalesced"] += 1
+            return
+        pending["table"], pending["index"], pending["header"], pending["scrolled"] = table, index, header, scrolled
+        if self.ops.max_redraw_fps > 0:
+            delay = max(
+                delay,
+                ceil(1000 / self.ops.max_redraw_fps - (default_timer() - self.last_redraw_time) * 1000),
+            )
+        if delay > 0:
+            self.after_redraw_id = self.after(delay, self.after_redraw)
+        else:
+            self.after_redraw_id = self.after_idle(self.after_redraw)
+        self.redraw_counts["scheduled"] += 1
+
+    def after_redraw(self) -> None:
         self.after_redraw_id = None
+        pending = self.pending_redraw
+        self.MT.main_table_redraw_grid_and_text(
+            redraw_header=pending["header"],
+            redraw_row_index=pending["index"],
+            redraw_table=pending["table"],
+            dirty_only=not self.MT.dirty.all,
+            scrolled=pending["scrolled"],
+        )
+
+    def redrawn(self, table: bool, index: bool, header: bool) -> None:
+        """
+        Called after every redraw, cancels the pending redraw
+        if everything it was going to redraw has just been redrawn
+        """
+        self.last_redraw_time = default_timer()
+        if self.after_redraw_id is not None:
+            pending = self.pending_redraw
+            if (
+                (table or not pending["table"])
+                and (index or not pending["index"])
+                and (header or not pending["header"])
+            ):
+                self.after_cancel(self.after_redraw_id)
+                self.after_redraw_id = None
+                self.redraw_counts["dropped"] += 1
+
+    def redraw_stats(self, reset: bool = False) -> dict[str, int]:
+        stats = dict(self.redraw_counts)
+        if reset:
+            self.redraw_counts = dict.fromkeys(stats, 0)
+        return stats
 
     def del_options_using_span(
         self,
@@ -5258,18 +5541,22 @@ class Sheet(tk.Frame):
             del_from_options(self.RI.cell_options, key, rows)
         # table
         if table and span.kind == "cell":
-            del_from_options(self.MT.cell_options, key, product(rows, cols))
+            del_from_options(self.MT.cell_options, key, self.MT.cells_with_options(rows, cols))
+            self.MT.range_options.delete(key, rows.start, cols.start, rows.stop, cols.stop)
         elif table and span.kind == "row":
             del_from_options(self.MT.row_options, key, rows)
         elif table and span.kind == "column":
             del_from_options(self.MT.col_options, key, cols)
-        self.set_refresh_timer(redraw)
+        if table:
+            self.MT.dirty.add_span(span.kind, rows, cols)
+        self.set_refresh_timer(redraw, dirty=True)
         return span
 
     #  ##########       TABLE       ##########
 
     def del_cell_options_dropdown(self, datarn: int, datacn: int) -> None:
         self.MT.hide_dropdown_window()
+        self.MT.range_options.delete("dropdown", datarn, datacn, datarn + 1, datacn + 1)
         if (datarn, datacn) in self.MT.cell_options and "dropdown" in self.MT.cell_options[(datarn, datacn)]:
             del self.MT.cell_options[(datarn, datacn)]["dropdown"]
 
@@ -5361,11 +5648,9 @@ class Sheet(tk.Frame):
         if r >= self.MT.total_data_rows():
             raise IndexError(f"Row #{r} is out of range.")
 
-        if r >= len(self.MT.data):
-            total_data_cols = self.MT.total_data_cols()
-            self.MT.fix_data_len(r, total_data_cols - 1)
-
-        iterable = only_columns if only_columns is not None else range(len(self.MT.data[r]))
+        if only_columns is None:
+            only_columns = range(self.MT.total_data_cols())
+        iterable = only_columns
         f = partial(self.MT.cell_str, get_displayed=True) if get_displayed else self.MT.get_cell_data
         row = [self.RI.get_cell_data(r, get_displayed=get_index_displayed)] if get_index else []
         row.extend(f(r, c) for c in iterable)
@@ -5410,23 +5695,22 @@ class Sheet(tk.Frame):
                 only_columns = (only_columns,)
             elif not is_iterable(only_columns):
                 raise ValueError(tksheet_type_error("only_columns", ["int", "iterable", "None"], only_columns))
+        else:
+            # short rows are padded with their empty cell values
+            only_columns = range(self.MT.total_data_cols(include_header=get_header))
 
         if get_header:
-            maxlen = len(self.MT._headers) if isinstance(self.MT._headers, (list, tuple)) else 0
             data = []
             for rn in only_rows if only_rows is not None else range(len(self.MT.data)):
                 r = self.get_row_data(rn, get_displayed=get_displayed, only_columns=only_columns)
-                if len(r) > maxlen:
-                    maxlen = len(r)
                 if get_index:
                     row = [self.RI.get_cell_data(rn, get_displayed=get_index_displayed)]
                     row.extend(r)
                     data.append(row)
                 else:
                     data.append(r)
-            iterable = only_columns if only_columns is not None else range(maxlen)
             header_row = [""] if get_index else []
-            header_row.extend(self.CH.get_cell_data(cn, get_displayed=get_header_displayed) for cn in iterable)
+            header_row.extend(self.CH.get_cell_data(cn, get_displayed=get_header_displayed) for cn in only_columns)
             result = [header_row]
             result.extend(data)
             return result
@@ -5464,9 +5748,12 @@ class Sheet(tk.Frame):
                 only_columns = (only_columns,)
             elif not is_iterable(only_columns):
                 raise ValueError(tksheet_type_error("only_columns", ["int", "iterable", "None"], only_columns))
+        else:
+            # short rows are padded with their empty cell values
+            only_columns = range(self.MT.total_data_cols(include_header=get_header))
 
         if get_header:
-            iterable = only_columns if only_columns is not None else range(self.MT.total_data_cols())
+            iterable = only_columns
             header_row = [""] if get_index else []
             header_row.extend(self.CH.get_cell_data(c, get_displayed=get_header_displayed) for c in iterable)
             yield header_row
@@ -5510,7 +5797,7 @@ class Sheet(tk.Frame):
         if not keep_formatting:
             self.MT.delete_cell_format(r, c, clear_values=False)
         self.MT.set_cell_data(r, c, value)
-        return self.set_refresh_timer(redraw)
+        return self.set_refresh_timer(redraw, dirty=True)
 
     def set_row_data(
         self,
@@ -5556,13 +5843,10 @@ class Sheet(tk.Frame):
             self.MT.delete_column_format(c, clear_values=False)
         if add_rows:
             maxidx = len(self.MT.data) - 1
-            total_cols = None
             height = self.MT.get_default_row_height()
             for rn, v in enumerate(values):
                 if rn > maxidx:
-                    if total_cols is None:
-                        total_cols = self.MT.total_data_cols()
-                    self.MT.fix_data_len(rn, total_cols - 1)
+                    self.MT.fix_data_len(rn)
                     if self.MT.all_rows_displayed:
                         self.MT.insert_row_positions(heights=height)
                     maxidx += 1
@@ -5689,11 +5973,13 @@ class Sheet(tk.Frame):
     ) -> Sheet:
         if bg is None and fg is None:
             return
-        for r in (rows,) if isinstance(rows, int) else rows:
+        rows = (rows,) if isinstance(rows, int) else tuple(rows)
+        for r in rows:
             add_highlight(self.MT.row_options, r, bg, fg, end_of_screen, overwrite)
+        self.MT.dirty.add_rows(rows)
         if highlight_index:
             self.highlight_cells(cells=rows, canvas="index", bg=bg, fg=fg, redraw=False)
-        return self.set_refresh_timer(redraw)
+        return self.set_refresh_timer(redraw, dirty=True)
 
     def highlight_columns(
         self,
@@ -5706,11 +5992,13 @@ class Sheet(tk.Frame):
     ) -> Sheet:
         if bg is False and fg is False:
             return
-        for c in (columns,) if isinstance(columns, int) else columns:
+        columns = (columns,) if isinstance(columns, int) else tuple(columns)
+        for c in columns:
             add_highlight(self.MT.col_options, c, bg, fg, None, overwrite)
+        self.MT.dirty.add_columns(columns)
         if highlight_header:
             self.highlight_cells(cells=columns, canvas="header", bg=bg, fg=fg, redraw=False)
-        return self.set_refresh_timer(redraw)
+        return self.set_refresh_timer(redraw, dirty=True)
 
     def highlight_cells(
         self,
@@ -5729,7 +6017,9 @@ class Sheet(tk.Frame):
             if cells:
                 for r_, c_ in cells:
                     add_highlight(self.MT.cell_options, (r_, c_), bg, fg, None, overwrite)
+                    self.MT.dirty.add_cell(r_, c_)
             else:
+                self.MT.dirty.all = True
                 if (
                     isinstance(row, str)
                     and row.lower() == "all"
@@ -5764,7 +6054,7 @@ class Sheet(tk.Frame):
                     add_highlight(self.CH.cell_options, c_, bg, fg, None, overwrite)
             else:
                 add_highlight(self.CH.cell_options, column, bg, fg, None, overwrite)
-        return self.set_refresh_timer(redraw)
+        return self.set_refresh_timer(redraw, dirty=True)
 
     def dehighlight_cells(
         self,
@@ -5776,6 +6066,7 @@ class Sheet(tk.Frame):
         redraw: bool = True,
     ) -> Sheet:
         if row == "all" and canvas == "table":
+            self.MT.range_options.clear("highlight")
             for k, v in self.MT.cell_options.items():
                 if "highlight" in v:
                     del self.MT.cell_options[k]["highlight"]
@@ -5790,17 +6081,21 @@ class Sheet(tk.Frame):
         if canvas == "table":
             if cells and not all_:
                 for t in cells:
+                    self.MT.range_options.delete("highlight", t[0], t[1], t[0] + 1, t[1] + 1)
                     try:
                         del self.MT.cell_options[t]["highlight"]
                     except Exception:
                         continue
             elif not all_:
+                if isinstance(row, int):
+                    self.MT.range_options.delete("highlight", row, column, row + 1, column + 1)
                 if (
                     row,
                     column,
                 ) in self.MT.cell_options and "highlight" in self.MT.cell_options[(row, column)]:
                     del self.MT.cell_options[(row, column)]["highlight"]
             elif all_:
+                self.MT.range_options.clear("highlight")
                 for k in self.MT.cell_options:
                     if "highlight" in self.MT.cell_options[k]:
                         del self.MT.cell_options[k]["highlight"]
@@ -5839,7 +6134,10 @@ class Sheet(tk.Frame):
         canvas: Literal["table", "row_index", "index", "header"] = "table",
     ) -> dict | None:
         if canvas == "table":
-            return {k: v["highlight"] for k, v in self.MT.cell_options.items() if "highlight" in v}
+            return {
+                **dict(self.MT.range_options.cells("highlight")),
+                **{k: v["highlight"] for k, v in self.MT.cell_options.items() if "highlight" in v},
+            }
         elif canvas in ("row_index", "index"):
             return {k: v["highlight"] for k, v in self.RI.cell_options.items() if "highlight" in v}
         elif canvas == "header":
@@ -5949,7 +6247,10 @@ class Sheet(tk.Frame):
         return self.set_refresh_timer(redraw)
 
     def get_cell_alignments(self) -> dict:
-        return {(r, c): v["align"] for (r, c), v in self.MT.cell_options.items() if "align" in v}
+        return {
+            **dict(self.MT.range_options.cells("align")),
+            **{(r, c): v["align"] for (r, c), v in self.MT.cell_options.items() if "align" in v},
+        }
 
     def get_column_alignments(self) -> dict:
         return {c: v["align"] for c, v in self.MT.col_options.items() if "align" in v}
@@ -6380,6 +6681,7 @@ class Sheet(tk.Frame):
                 if "dropdown" in self.MT.cell_options[(r, c_)]:
                     self.del_cell_options_dropdown(r, c_)
         elif isinstance(r, str) and r.lower() == "all" and isinstance(c, str) and c.lower() == "all":
+            self.MT.range_options.clear("dropdown")
             for r_, c_ in self.MT.cell_options:
                 if "dropdown" in self.MT.cell_options[(r_, c_)]:
                     self.del_cell_options_dropdown(r_, c_)
@@ -6445,6 +6747,7 @@ class Sheet(tk.Frame):
 
     def get_dropdowns(self) -> dict:
         d = {
+            **dict(self.MT.range_options.cells("dropdown")),
             **{k: v["dropdown"] for k, v in self.MT.cell_options.items() if "dropdown" in v},
             **{k: v["dropdown"] for k, v in self.MT.row_options.items() if "dropdown" in v},
             **{k: v["dropdown"] for k, v in self.MT.col_options.items() if "dropdown" in v},
@@ -358,9 +358,15 @@ def new_sheet_options() -> DotDict:
             "rounded_boxes": True,
             "alternate_color": "",
             "allow_cell_overflow": False,
+            "incremental_redraw": False,
+            "batched_redraw": False,
             "table_wrap": "c",
             "header_wrap": "c",
             "index_wrap": "c",
+            "text_layout_cache_size": 10000,
+            "display_string_cache_size": 10000,
+            "char_widths_file": "",
+            "compact_storage": False,
             "min_column_width": 1,
             "max_column_width": float("inf"),
             "max_header_height": float("inf"),
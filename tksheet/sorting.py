@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterator, Sequence
 from datetime import datetime
 from pathlib import Path
 from re import split
 from typing import Any
 
+from .data_sources import ColumnarData, VirtualData, VirtualRow
+
 # Possible date formats to try for the entire string
 date_formats = (
     # Common formats
@@ -335,6 +337,28 @@ def sort_row(
         return sorted(data, reverse=reverse, key=key)
 
 
+def sort_numeric_column(
+    values: Sequence[int | float],
+    nulls: Sequence[int] | None,
+    order: Sequence[int] | None,
+    reverse: bool = False,
+) -> list[int]:
+    """
+    Returns the row indexes sorted by a numeric column buffer in the same order
+    as the in-built sort keys would, Nones (nulls) before numbers
+    order maps the row indexes to indexes in values if the rows have been moved
+    """
+    if order is not None:
+        values = [values[i] for i in order]
+        if nulls is not None:
+            nulls = bytes(nulls[i] for i in order)
+    if nulls is None:
+        return sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+    nones = [i for i, null in enumerate(nulls) if null]
+    numbers = sorted((i for i, null in enumerate(nulls) if not null), key=values.__getitem__, reverse=reverse)
+    return numbers + nones if reverse else nones + numbers
+
+
 def sort_rows_by_column(
     data: list[list[Any]],
     column: int = 0,
@@ -345,12 +369,21 @@ def sort_rows_by_column(
         return data, {}
 
     # Check if data is a list of lists
-    if not isinstance(data[0], list):
+    if not isinstance(data[0], (list, VirtualRow)):
         raise ValueError("Data must be a list of lists for row sorting.")
 
     if key is None:
         key = natural_sort_key
 
+    if (
+        isinstance(data, VirtualData)
+        and isinstance(data.source, ColumnarData)
+        and key in (natural_sort_key, fast_sort_key, version_sort_key)
+        and (numeric := data.source.numeric_column(data.source_col(column)))
+    ):
+        sorted_indexed_data = [(i, VirtualRow(data, i)) for i in sort_numeric_column(*numeric, data.order, reverse)]
+        return sorted_indexed_data, {old: new for new, (old, _) in enumerate(sorted_indexed_data)}
+
     # Use a generator expression for sorting to avoid creating an intermediate list
     sorted_indexed_data = sorted(
         ((i, row) for i, row in enumerate(data)),
@@ -372,7 +405,7 @@ def sort_columns_by_row(
         return data, {}
 
     # Check if data is a list of lists
-    if not isinstance(data[0], list):
+    if not isinstance(data[0], (list, VirtualRow)):
         raise ValueError("Data must be a list of lists for column sorting.")
 
     if row >= len(data) or row < 0:
@@ -383,15 +416,6 @@ def sort_columns_by_row(
 
     # Get sorting indices based on the elements of the specified row
     sort_indices = sorted(range(len(data[row])), key=lambda i: key(data[row][i]), reverse=reverse)
-    sort_indices_set = set(sort_indices)
-
-    new_data = []
-    for row_data in data:
-        # Sort the columns based on sort_indices, then append any additional elements from longer rows
-        sorted_part = [row_data[i] for i in sort_indices if i < len(row_data)]
-        unsorted_part = [elem for idx, elem in enumerate(row_data) if idx not in sort_indices_set]
-        new_data.append(sorted_part + unsorted_part)
-
     return sort_indices, dict(zip(range(len(data[row])), sort_indices))
 
 